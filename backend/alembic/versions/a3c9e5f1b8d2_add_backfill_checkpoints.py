@@ -0,0 +1,52 @@
+"""add backfill checkpoints for the resumable Cloudinary backfill
+
+Revision ID: a3c9e5f1b8d2
+Revises: f2a8b4c0e7d5
+Create Date: 2026-10-17 23:00:00.000000
+
+services/cloudinary_backfill.py records how far a backfill got here, so a
+restarted process resumes it instead of starting over.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e5f1b8d2'
+down_revision: Union[str, None] = 'f2a8b4c0e7d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__all__ = ['revision', 'down_revision', 'branch_labels', 'depends_on']
+
+
+def upgrade() -> None:
+    """Create backfill_checkpoints"""
+    op.create_table(
+        'backfill_checkpoints',
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
+        sa.Column('force', sa.Boolean(), nullable=False),
+        sa.Column('last_game_id', sa.Integer(), nullable=False),
+        sa.Column('processed', sa.Integer(), nullable=False),
+        sa.Column('uploaded', sa.Integer(), nullable=False),
+        sa.Column('skipped', sa.Integer(), nullable=False),
+        sa.Column(
+            'failed_games',
+            sa.JSON().with_variant(postgresql.JSONB(), 'postgresql'),
+            nullable=False,
+        ),
+        sa.Column('owner', sa.String(length=128), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    """Drop backfill_checkpoints"""
+    op.drop_table('backfill_checkpoints')
@@ -0,0 +1,93 @@
+"""reweight search_vector and add trigram title index
+
+Revision ID: a7b3e9d5f2c8
+Revises: f6a2d8c4e1b7
+Create Date: 2026-10-17 12:00:00.000000
+
+The search_vector trigger from 68d4e9a1b2c3 weighted description above
+designers and ignored mechanics. Public search (services/search.py) now
+queries it with weights title (A) > designers (B) > mechanics (C) >
+description (D), and matches misspelled titles through pg_trgm.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b3e9d5f2c8'
+down_revision: Union[str, None] = 'f6a2d8c4e1b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__all__ = ['revision', 'down_revision', 'branch_labels', 'depends_on']
+
+
+def _json_words(column: str) -> str:
+    return (
+        f"coalesce(array_to_string(ARRAY(SELECT jsonb_array_elements_text({column})), ' '), '')"
+    )
+
+
+def _vector(prefix: str) -> str:
+    return f"""
+        setweight(to_tsvector('english', coalesce({prefix}title, '')), 'A') ||
+        setweight(to_tsvector('english', {_json_words(prefix + 'designers')}), 'B') ||
+        setweight(to_tsvector('english', {_json_words(prefix + 'mechanics')}), 'C') ||
+        setweight(to_tsvector('english', coalesce({prefix}description, '')), 'D')
+    """
+
+
+def upgrade() -> None:
+    """Re-weight the search_vector trigger, repopulate it, add the pg_trgm title index"""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        print("Skipping search_vector reweight migration (PostgreSQL only)")
+        return
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION boardgames_search_vector_update()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {_vector('NEW.')};
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute(f"UPDATE boardgames SET search_vector = {_vector('')}")
+
+    # pg_trgm may need elevated privileges; without it set SEARCH_FUZZY_ENABLED=false
+    try:
+        with bind.begin_nested():
+            bind.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except Exception as e:
+        print(f"Could not create pg_trgm extension ({e}); set SEARCH_FUZZY_ENABLED=false")
+        return
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_boardgames_title_trgm "
+        "ON boardgames USING gin (title gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Restore the original trigger weights and drop the trigram index"""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP INDEX IF EXISTS idx_boardgames_title_trgm")
+    original = f"""
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('english', {_json_words('NEW.designers')}), 'C')
+    """
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION boardgames_search_vector_update()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {original};
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute(f"UPDATE boardgames SET search_vector = {original.replace('NEW.', '')}")
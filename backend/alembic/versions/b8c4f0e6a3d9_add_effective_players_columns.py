@@ -0,0 +1,64 @@
+"""add materialized effective player range to boardgames
+
+Revision ID: b8c4f0e6a3d9
+Revises: a7b3e9d5f2c8
+Create Date: 2026-10-17 15:00:00.000000
+
+The public players filter matched base games through an IN (subquery) over
+their expansions' modifies_players_min/max on every request. The
+expansion-aware range is now stored on each game (maintained by
+GameService) so the filter is an indexed range check.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c4f0e6a3d9'
+down_revision: Union[str, None] = 'a7b3e9d5f2c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__all__ = ['revision', 'down_revision', 'branch_labels', 'depends_on']
+
+# Same computation as services.game_service._effective_players_expressions
+BACKFILL = """
+UPDATE boardgames SET
+    effective_players_min = CASE
+        WHEN players_min IS NULL THEN NULL
+        WHEN (SELECT MIN(e.modifies_players_min) FROM boardgames e
+              WHERE e.base_game_id = boardgames.id) < players_min
+            THEN (SELECT MIN(e.modifies_players_min) FROM boardgames e
+                  WHERE e.base_game_id = boardgames.id)
+        ELSE players_min
+    END,
+    effective_players_max = CASE
+        WHEN players_max IS NULL THEN NULL
+        WHEN (SELECT MAX(e.modifies_players_max) FROM boardgames e
+              WHERE e.base_game_id = boardgames.id) > players_max
+            THEN (SELECT MAX(e.modifies_players_max) FROM boardgames e
+                  WHERE e.base_game_id = boardgames.id)
+        ELSE players_max
+    END
+"""
+
+
+def upgrade() -> None:
+    """Add effective_players_min/max, backfill them and index the range"""
+    op.add_column('boardgames', sa.Column('effective_players_min', sa.Integer(), nullable=True))
+    op.add_column('boardgames', sa.Column('effective_players_max', sa.Integer(), nullable=True))
+    op.execute(BACKFILL)
+    op.create_index(
+        'idx_effective_players',
+        'boardgames',
+        ['effective_players_min', 'effective_players_max'],
+    )
+
+
+def downgrade() -> None:
+    """Remove the effective player range columns"""
+    op.drop_index('idx_effective_players', table_name='boardgames')
+    op.drop_column('boardgames', 'effective_players_max')
+    op.drop_column('boardgames', 'effective_players_min')
@@ -0,0 +1,70 @@
+"""add materialized quick-pick membership flags to boardgames
+
+Revision ID: c9d5e1f7b4a2
+Revises: b8c4f0e6a3d9
+Create Date: 2026-10-17 16:00:00.000000
+
+Quick-pick shortlists evaluated their selection logic plus a per-row
+text cast of excluded_quick_picks on every request. Membership is now stored
+per game (kept current by Game._sync_quick_picks) so the public filter and the
+admin candidates view are index lookups.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d5e1f7b4a2'
+down_revision: Union[str, None] = 'b8c4f0e6a3d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__all__ = ['revision', 'down_revision', 'branch_labels', 'depends_on']
+
+QUICK_PICK_KEYS = ("first", "kids", "group", "coop")
+
+# Same selection logic as models.quick_pick_matches
+MATCHES = {
+    "first": "complexity IS NOT NULL AND complexity < 1.5",
+    "kids": (
+        "mana_meeple_category = 'KIDS_FAMILIES' "
+        "OR (complexity < 1.5 AND min_age <= 10)"
+    ),
+    "group": "players_max >= 6",
+    "coop": "is_cooperative = true OR mana_meeple_category = 'COOP_ADVENTURE'",
+}
+
+
+def _backfill(key: str) -> str:
+    """NULL = not a candidate, false = excluded by an admin, true = shown"""
+    return f"""
+UPDATE boardgames SET quick_pick_{key} = CASE
+    WHEN {MATCHES[key]} THEN (
+        excluded_quick_picks IS NULL
+        OR CAST(excluded_quick_picks AS TEXT) NOT LIKE '%"{key}"%'
+    )
+    ELSE NULL
+END
+"""
+
+
+def upgrade() -> None:
+    """Add quick_pick_* flags, backfill them and index each shortlist"""
+    for key in QUICK_PICK_KEYS:
+        op.add_column('boardgames', sa.Column(f'quick_pick_{key}', sa.Boolean(), nullable=True))
+        op.execute(_backfill(key))
+        op.create_index(
+            f'idx_quick_pick_{key}',
+            'boardgames',
+            [f'quick_pick_{key}', 'title'],
+            postgresql_where=sa.text(f'quick_pick_{key} IS NOT NULL'),
+        )
+
+
+def downgrade() -> None:
+    """Remove the quick-pick membership flags"""
+    for key in QUICK_PICK_KEYS:
+        op.drop_index(f'idx_quick_pick_{key}', table_name='boardgames')
+        op.drop_column('boardgames', f'quick_pick_{key}')
@@ -0,0 +1,123 @@
+"""add normalized designer/mechanic/publisher/artist tables
+
+Revision ID: d0e6f2a8c5b3
+Revises: c9d5e1f7b4a2
+Create Date: 2026-10-17 17:00:00.000000
+
+The designer filter pattern-matched the designers JSON cast to text, which
+scans every row and matches name fragments ("Ann" matched "Joanna"). Names
+now live in bgg_entities (one row per kind + normalized name) linked to games
+through game_entity_links, so designer/mechanic/publisher filters are
+indexed joins. Existing games are backfilled from their JSON columns.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0e6f2a8c5b3'
+down_revision: Union[str, None] = 'c9d5e1f7b4a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__all__ = ['revision', 'down_revision', 'branch_labels', 'depends_on']
+
+# Same mapping and normalization as models.ENTITY_KINDS / models.entity_key
+ENTITY_KINDS = {
+    "designers": "designer",
+    "mechanics": "mechanic",
+    "publishers": "publisher",
+    "artists": "artist",
+}
+
+BATCH_SIZE = 1000
+
+
+def _entity_key(name: str) -> str:
+    return " ".join(str(name).split()).casefold()
+
+
+def _backfill() -> None:
+    """Create entities and links for every game's JSON name lists"""
+    conn = op.get_bind()
+    boardgames = sa.table(
+        'boardgames',
+        sa.column('id', sa.Integer),
+        *(sa.column(column, sa.JSON) for column in ENTITY_KINDS),
+    )
+    entities = sa.table(
+        'bgg_entities',
+        sa.column('id', sa.Integer),
+        sa.column('kind', sa.String),
+        sa.column('name', sa.String),
+        sa.column('name_key', sa.String),
+    )
+    links = sa.table(
+        'game_entity_links',
+        sa.column('game_id', sa.Integer),
+        sa.column('entity_id', sa.Integer),
+    )
+
+    names = {}  # (kind, name_key) -> display name
+    game_keys = []  # (game_id, (kind, name_key))
+    for row in conn.execute(sa.select(boardgames)):
+        seen = set()
+        for column, kind in ENTITY_KINDS.items():
+            values = row._mapping[column]
+            if not isinstance(values, list):
+                continue
+            for value in values:
+                if not isinstance(value, str) or not value.strip():
+                    continue
+                key = (kind, _entity_key(value))
+                names.setdefault(key, " ".join(value.split()))
+                if key not in seen:
+                    seen.add(key)
+                    game_keys.append((row.id, key))
+
+    rows = [{"kind": kind, "name": name, "name_key": name_key} for (kind, name_key), name in names.items()]
+    for start in range(0, len(rows), BATCH_SIZE):
+        op.bulk_insert(entities, rows[start:start + BATCH_SIZE])
+
+    ids = {
+        (row.kind, row.name_key): row.id
+        for row in conn.execute(sa.select(entities.c.id, entities.c.kind, entities.c.name_key))
+    }
+    link_rows = [{"game_id": game_id, "entity_id": ids[key]} for game_id, key in game_keys]
+    for start in range(0, len(link_rows), BATCH_SIZE):
+        op.bulk_insert(links, link_rows[start:start + BATCH_SIZE])
+
+
+def upgrade() -> None:
+    """Create bgg_entities and game_entity_links and backfill them"""
+    op.create_table(
+        'bgg_entities',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('name_key', sa.String(length=255), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('idx_bgg_entity_kind_key', 'bgg_entities', ['kind', 'name_key'], unique=True)
+
+    op.create_table(
+        'game_entity_links',
+        sa.Column('game_id', sa.Integer(), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['game_id'], ['boardgames.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['entity_id'], ['bgg_entities.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('game_id', 'entity_id'),
+    )
+    op.create_index('idx_game_entity_link_entity', 'game_entity_links', ['entity_id', 'game_id'])
+
+    _backfill()
+
+
+def downgrade() -> None:
+    """Drop the normalized entity tables"""
+    op.drop_index('idx_game_entity_link_entity', table_name='game_entity_links')
+    op.drop_table('game_entity_links')
+    op.drop_index('idx_bgg_entity_kind_key', table_name='bgg_entities')
+    op.drop_table('bgg_entities')
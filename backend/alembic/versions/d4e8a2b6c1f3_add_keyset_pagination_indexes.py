@@ -0,0 +1,69 @@
+"""add keyset pagination indexes
+
+Revision ID: d4e8a2b6c1f3
+Revises: c3d9f0a1b2e7
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e8a2b6c1f3'
+down_revision: Union[str, None] = 'c3d9f0a1b2e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__all__ = ['revision', 'down_revision', 'branch_labels', 'depends_on']
+
+
+# Average playtime sort key, written to match GameService._avg_playtime_expr
+# as rendered by SQLAlchemy so Postgres can match the expression index.
+_AVG_PLAYTIME_SQL = (
+    "CASE WHEN (playtime_min IS NOT NULL AND playtime_max IS NOT NULL) "
+    "THEN (playtime_min + playtime_max) / CAST(2 AS NUMERIC) "
+    "WHEN (playtime_min IS NOT NULL) THEN playtime_min "
+    "WHEN (playtime_max IS NOT NULL) THEN playtime_max "
+    "ELSE {fallback} END"
+)
+
+_KEYSET_INDEXES = [
+    ('idx_keyset_title', [sa.text('title'), sa.text('id')]),
+    ('idx_keyset_title_desc', [sa.text('title DESC'), sa.text('id')]),
+    ('idx_keyset_year', [sa.text('year'), sa.text('title'), sa.text('id')]),
+    ('idx_keyset_year_desc', [sa.text('year DESC'), sa.text('title'), sa.text('id')]),
+    ('idx_keyset_date_added', [sa.text('date_added'), sa.text('title'), sa.text('id')]),
+    ('idx_keyset_date_added_desc', [sa.text('date_added DESC'), sa.text('title'), sa.text('id')]),
+    ('idx_keyset_rating', [sa.text('average_rating'), sa.text('title'), sa.text('id')]),
+    ('idx_keyset_rating_desc', [sa.text('average_rating DESC'), sa.text('title'), sa.text('id')]),
+]
+
+
+def upgrade() -> None:
+    """Create composite (sort key, title, id) indexes for cursor pagination"""
+    for name, columns in _KEYSET_INDEXES:
+        op.create_index(name, 'boardgames', columns, unique=False)
+
+    # Expression indexes for the time_asc / time_desc sorts (PostgreSQL only)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_keyset_time ON boardgames "
+            f"(({_AVG_PLAYTIME_SQL.format(fallback=999999)}), title, id)"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_keyset_time_desc ON boardgames "
+            f"(({_AVG_PLAYTIME_SQL.format(fallback=0)}) DESC, title, id)"
+        )
+
+
+def downgrade() -> None:
+    """Drop cursor pagination indexes"""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_keyset_time_desc")
+        op.execute("DROP INDEX IF EXISTS idx_keyset_time")
+
+    for name, _ in reversed(_KEYSET_INDEXES):
+        op.drop_index(name, table_name='boardgames')
@@ -0,0 +1,46 @@
+"""add precomputed similar-games table
+
+Revision ID: e1f7a3b9d6c4
+Revises: d0e6f2a8c5b3
+Create Date: 2026-10-17 19:00:00.000000
+
+Stores the top-k most similar public games of every game for the
+"if you liked this" endpoint. The table starts empty; populate it with
+scripts/compute_similar_games.py after upgrading.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f7a3b9d6c4'
+down_revision: Union[str, None] = 'd0e6f2a8c5b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__all__ = ['revision', 'down_revision', 'branch_labels', 'depends_on']
+
+
+def upgrade() -> None:
+    """Create game_similarities"""
+    op.create_table(
+        'game_similarities',
+        sa.Column('game_id', sa.Integer(), nullable=False),
+        sa.Column('similar_game_id', sa.Integer(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['game_id'], ['boardgames.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['similar_game_id'], ['boardgames.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('game_id', 'similar_game_id'),
+    )
+    op.create_index('idx_game_similarity_rank', 'game_similarities', ['game_id', 'rank'])
+    op.create_index('idx_game_similarity_similar', 'game_similarities', ['similar_game_id'])
+
+
+def downgrade() -> None:
+    """Drop game_similarities"""
+    op.drop_index('idx_game_similarity_similar', table_name='game_similarities')
+    op.drop_index('idx_game_similarity_rank', table_name='game_similarities')
+    op.drop_table('game_similarities')
@@ -0,0 +1,73 @@
+"""add image_hash column
+
+Revision ID: e5f9b3c7d2a4
+Revises: d4e8a2b6c1f3
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f9b3c7d2a4'
+down_revision: Union[str, None] = 'd4e8a2b6c1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__all__ = ['revision', 'down_revision', 'branch_labels', 'depends_on']
+
+
+# Same pattern as models.bgg_image_hash (duplicated so the migration does not
+# change behaviour if the model helper evolves)
+_BGG_IMAGE_HASH_RE = re.compile(r'geekdo-images\.com/([^/]+)__[A-Za-z0-9]+/')
+_BATCH_SIZE = 500
+
+_boardgames = sa.table(
+    'boardgames',
+    sa.column('id', sa.Integer),
+    sa.column('image', sa.String),
+    sa.column('image_hash', sa.String),
+)
+
+
+def upgrade() -> None:
+    """Add indexed image_hash column to boardgames and backfill it from image"""
+    op.add_column('boardgames', sa.Column('image_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_boardgames_image_hash'), 'boardgames', ['image_hash'], unique=False)
+
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(_boardgames.c.id, _boardgames.c.image)
+            .where(_boardgames.c.id > last_id)
+            .where(_boardgames.c.image.like('%geekdo-images.com/%'))
+            .order_by(_boardgames.c.id)
+            .limit(_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        updates = []
+        for game_id, image in rows:
+            match = _BGG_IMAGE_HASH_RE.search(image or '')
+            if match:
+                updates.append({'b_id': game_id, 'b_hash': match.group(1)[:64]})
+        if updates:
+            bind.execute(
+                _boardgames.update()
+                .where(_boardgames.c.id == sa.bindparam('b_id'))
+                .values(image_hash=sa.bindparam('b_hash')),
+                updates,
+            )
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Remove image_hash column from boardgames"""
+    op.drop_index(op.f('ix_boardgames_image_hash'), table_name='boardgames')
+    op.drop_column('boardgames', 'image_hash')
@@ -0,0 +1,43 @@
+"""add game deletion log and row-version index for delta sync
+
+Revision ID: f2a8b4c0e7d5
+Revises: e1f7a3b9d6c4
+Create Date: 2026-10-17 21:00:00.000000
+
+/api/public/changes pages through boardgames by (updated_at, id) and reports
+deleted games from game_deletions. Deletions made before this migration are
+not logged; clients that synced earlier should start over with a snapshot.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8b4c0e7d5'
+down_revision: Union[str, None] = 'e1f7a3b9d6c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__all__ = ['revision', 'down_revision', 'branch_labels', 'depends_on']
+
+
+def upgrade() -> None:
+    """Create game_deletions and index boardgames.updated_at"""
+    op.create_table(
+        'game_deletions',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('game_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_game_deletions_deleted_at', 'game_deletions', ['deleted_at'])
+    op.create_index('idx_updated_at', 'boardgames', ['updated_at', 'id'])
+
+
+def downgrade() -> None:
+    """Drop the deletion log and the row-version index"""
+    op.drop_index('idx_updated_at', table_name='boardgames')
+    op.drop_index('ix_game_deletions_deleted_at', table_name='game_deletions')
+    op.drop_table('game_deletions')
@@ -0,0 +1,34 @@
+"""add updated_at row version to boardgames
+
+Revision ID: f6a2d8c4e1b7
+Revises: e5f9b3c7d2a4
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a2d8c4e1b7'
+down_revision: Union[str, None] = 'e5f9b3c7d2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__all__ = ['revision', 'down_revision', 'branch_labels', 'depends_on']
+
+
+def upgrade() -> None:
+    """Add updated_at to boardgames, backfilled from date_added/created_at"""
+    op.add_column('boardgames', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute(
+        "UPDATE boardgames SET updated_at = COALESCE(date_added, created_at) "
+        "WHERE updated_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    """Remove updated_at from boardgames"""
+    op.drop_column('boardgames', 'updated_at')
@@ -19,6 +19,7 @@ from fastapi import (
 )
 from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from api.dependencies import (
@@ -38,11 +39,12 @@ from config import (
     RATE_LIMIT_WINDOW,
 )
 from utils.jwt_utils import generate_jwt_token
-from database import get_db
+from database import get_async_db, get_db
 from exceptions import GameNotFoundError, ValidationError
 import schemas
 from models import Game, BuyListGame, PriceSnapshot, PriceOffer, Sleeve
-from services import GameService
+from services import AsyncGameService, GameService
+from services.catalogue_events import OP_UPDATE, notify_catalogue_change
 from shared.rate_limiting import cleanup_expired_attempts, record_failed_attempt
 from utils.helpers import game_to_dict
 
@@ -188,6 +190,7 @@ async def import_from_bgg(
                 if buy_list_entry:
                     buy_list_entry.on_buy_list = False
                 db.commit()
+                notify_catalogue_change(db, [existing.id], OP_UPDATE)
                 logger.info(f"Promoted '{existing.title}' from BUY_LIST to OWNED via BGG import")
                 response.status_code = 200
                 return game_to_dict(request, existing)
@@ -233,6 +236,7 @@ async def import_from_bgg(
                             if db_game:
                                 db_game.cloudinary_url = cloudinary_url
                                 db_task.commit()
+                                notify_catalogue_change(db_task, [db_game.id], OP_UPDATE)
                                 logger.info(f"✓ Cloudinary upload completed for game {game.id}: {game.title}")
                         else:
                             logger.warning(f"Cloudinary upload failed for game {game.id}, will use direct proxy fallback")
@@ -271,12 +275,12 @@ async def import_from_bgg(
 @router.get("/games")
 async def get_admin_games(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: None = Depends(require_admin_auth),
 ):
     """Get all games for admin interface"""
-    game_service = GameService(db)
-    games = game_service.get_all_games()
+    game_service = AsyncGameService(db)
+    games = await game_service.get_all_games()
     return [game_to_dict(request, game) for game in games]
 
 
@@ -284,12 +288,12 @@ async def get_admin_games(
 async def get_admin_game(
     request: Request,
     game_id: int = Path(..., description="Game ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: None = Depends(require_admin_auth),
 ):
     """Get single game for admin interface"""
-    game_service = GameService(db)
-    game = game_service.get_game_by_id(game_id)
+    game_service = AsyncGameService(db)
+    game = await game_service.get_game_by_id(game_id, with_sleeves=True)
     if not game:
         raise GameNotFoundError(f"Game {game_id} not found")
 
@@ -300,7 +304,7 @@ async def get_admin_game(
 async def get_quick_pick_candidates(
     request: Request,
     key: str = Path(..., description="Quick-pick key: first, kids, group, or coop"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: None = Depends(require_admin_auth),
 ):
     """
@@ -309,14 +313,13 @@ async def get_quick_pick_candidates(
     full algorithmic list is visible for curation; each game's current
     excluded_quick_picks array is included so the UI can show its state.
     """
-    game_service = GameService(db)
-    if key not in game_service.QUICK_PICK_KEYS:
+    if key not in GameService.QUICK_PICK_KEYS:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid quick-pick key. Must be one of: {', '.join(game_service.QUICK_PICK_KEYS)}",
+            detail=f"Invalid quick-pick key. Must be one of: {', '.join(GameService.QUICK_PICK_KEYS)}",
         )
 
-    games = game_service.get_quick_pick_candidates(key)
+    games = await AsyncGameService(db).get_quick_pick_candidates(key)
     return [game_to_dict(request, game) for game in games]
 
 
@@ -23,6 +23,7 @@ import database
 get_db = database.get_db
 SessionLocal = database.SessionLocal
 from models import Game, Sleeve
+from services.catalogue_events import OP_CREATE, OP_UPDATE, notify_catalogue_change
 from utils.helpers import CATEGORY_KEYS, categorize_game, parse_categories
 
 logger = logging.getLogger(__name__)
@@ -83,6 +84,7 @@ async def _fetch_sleeve_data_task(game_id: int, bgg_id: int, game_title: str):
         else:
             db.commit()
             logger.info(f"No sleeve data found for {game_title} (status: {sleeve_data.get('status')})")
+        notify_catalogue_change(db, [game.id], OP_UPDATE)
 
     except Exception as e:
         logger.error(f"Failed to fetch sleeve data for game {game_id}: {e}")
@@ -103,6 +105,7 @@ async def _bulk_import_csv_task(lines: list[str]) -> None:
     added = 0
     skipped = 0
     errors = 0
+    added_ids = []
 
     try:
         for line_num, line in enumerate(lines, 1):
@@ -184,6 +187,7 @@ async def _bulk_import_csv_task(lines: list[str]) -> None:
                     db.refresh(game)
 
                     added += 1
+                    added_ids.append(game.id)
                     logger.info(f"BGG ID {bgg_id}: imported as '{_sl(game.title)}'")
 
                 except Exception as e:
@@ -200,6 +204,7 @@ async def _bulk_import_csv_task(lines: list[str]) -> None:
             f"(of {len(lines)} lines)"
         )
     finally:
+        notify_catalogue_change(db, added_ids, OP_CREATE)
         db.close()
 
 
@@ -261,6 +266,7 @@ async def bulk_categorize_csv(
             )
 
         updated = []
+        updated_ids = []
         not_found = []
         errors = []
 
@@ -323,6 +329,7 @@ async def bulk_categorize_csv(
                 old_category = game.mana_meeple_category
                 game.mana_meeple_category = category_key
                 db.add(game)
+                updated_ids.append(game.id)
 
                 updated.append(
                     f"BGG ID {bgg_id} ({game.title}): "
@@ -333,6 +340,7 @@ async def bulk_categorize_csv(
                 errors.append(f"Line {line_num}: {str(e)}")
 
         db.commit()
+        notify_catalogue_change(db, updated_ids, OP_UPDATE)
 
         return {
             "message": f"Processed {len(lines)} lines",
@@ -519,6 +527,7 @@ async def bulk_update_nz_designers(
             if line.strip()
         ]
         updated = []
+        updated_ids = []
         not_found = []
         errors = []
 
@@ -557,6 +566,7 @@ async def bulk_update_nz_designers(
                 old_status = game.nz_designer
                 game.nz_designer = nz_status
                 db.add(game)
+                updated_ids.append(game.id)
 
                 updated.append(f"{game.title}: {old_status} → {nz_status}")
 
@@ -564,6 +574,7 @@ async def bulk_update_nz_designers(
                 errors.append(f"Line {line_num}: {str(e)}")
 
         db.commit()
+        notify_catalogue_change(db, updated_ids, OP_UPDATE)
 
         return {
             "message": f"Processed {len(lines)} lines",
@@ -599,6 +610,7 @@ async def bulk_update_aftergame_ids(
             if line.strip()
         ]
         updated = []
+        updated_ids = []
         not_found = []
         errors = []
 
@@ -642,6 +654,7 @@ async def bulk_update_aftergame_ids(
                 old_aftergame_id = game.aftergame_game_id
                 game.aftergame_game_id = aftergame_id
                 db.add(game)
+                updated_ids.append(game.id)
 
                 updated.append(
                     f"BGG ID {bgg_id} ({game.title}): "
@@ -652,6 +665,7 @@ async def bulk_update_aftergame_ids(
                 errors.append(f"Line {line_num}: {str(e)}")
 
         db.commit()
+        notify_catalogue_change(db, updated_ids, OP_UPDATE)
 
         return {
             "message": f"Processed {len(lines)} lines",
@@ -668,92 +682,68 @@ async def bulk_update_aftergame_ids(
         )
 
 
-@router.post("/backfill-cloudinary-urls")
+@router.post("/backfill-cloudinary-urls", status_code=202)
 async def backfill_cloudinary_urls(
     request: Request,
+    force: bool = False,
+    retry_failed: bool = False,
+    restart: bool = False,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin_auth),
 ):
     """
-    Backfill cloudinary_url column for all games with images.
-
-    Pre-generates Cloudinary URLs for games to eliminate 50-150ms redirect
-    overhead on every image request.
+    Start (or resume) the Cloudinary backfill in the background.
+
+    Uploads the image of every game to Cloudinary and stores its
+    cloudinary_url, with adaptive concurrency and a persisted checkpoint
+    (services/cloudinary_backfill.py). Calling it again after a stop or
+    restart continues where the last run left off; follow it with
+    GET /backfill-cloudinary-urls/progress.
+
+    Query params:
+    - force: Re-upload games whose stored URL is already current
+    - retry_failed: Process the games on the failure list again first
+    - restart: Discard the checkpoint and start from the first game
     """
-    from services.cloudinary_service import cloudinary_service
+    from services.cloudinary_backfill import BackfillRunningError, cloudinary_backfill
 
     try:
-        # Find all games with images but missing cloudinary_url
-        games = db.execute(
-            select(Game).where(
-                Game.image.isnot(None)
-            ).where(
-                (Game.cloudinary_url.is_(None)) | (Game.cloudinary_url == '')
-            )
-        ).scalars().all()
-
-        total = len(games)
-        updated = 0
-        skipped = 0
-        failed = 0
-        errors = []
-
-        logger.info(f"Starting Cloudinary URL backfill for {total} games")
-
-        for game in games:
-            try:
-                # Use image field (thumbnail_url deprecated and removed)
-                source_url = game.image
-
-                if not source_url:
-                    skipped += 1
-                    continue
+        await cloudinary_backfill.start(force=force, retry_failed=retry_failed, restart=restart)
+    except BackfillRunningError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
-                # Generate optimized Cloudinary URL
-                # Same settings as in game_service.py
-                cloudinary_url = cloudinary_service.generate_optimized_url(
-                    source_url,
-                    width=800,
-                    height=800,
-                    quality="auto:best",
-                    format="auto"  # Auto WebP/AVIF
-                )
-
-                # Update game
-                game.cloudinary_url = cloudinary_url
-                db.add(game)
-                updated += 1
+    progress = cloudinary_backfill.progress(db)
+    logger.info(f"Cloudinary backfill started, {progress['remaining']} games to go")
+    return {"message": "Backfill started", "progress": progress}
 
-                logger.debug(f"Generated Cloudinary URL for game {game.id}: {game.title}")
 
-            except Exception as e:
-                failed += 1
-                logger.error(f"Failed to generate Cloudinary URL for game {game.id} ({game.title}): {e}")
-                errors.append(f"Game {game.id} ({game.title}): failed to generate URL")
-                continue
-
-        # Commit all changes
-        db.commit()
+@router.get("/backfill-cloudinary-urls/progress")
+async def backfill_cloudinary_urls_progress(
+    db: Session = Depends(get_db),
+    _: None = Depends(require_admin_auth),
+):
+    """Progress of the Cloudinary backfill, from its checkpoint (live on the worker running it)"""
+    from services.cloudinary_backfill import cloudinary_backfill
 
-        logger.info(
-            f"Cloudinary URL backfill complete: "
-            f"{updated} updated, {skipped} skipped, {failed} failed"
-        )
+    return cloudinary_backfill.progress(db)
 
-        return {
-            "message": f"Backfill complete: {updated} games updated",
-            "total": total,
-            "updated": updated,
-            "skipped": skipped,
-            "failed": failed,
-            "errors": errors[:10] if errors else [],  # Return first 10 errors
-            "cloudinary_enabled": cloudinary_service.enabled
-        }
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Cloudinary URL backfill failed: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Cloudinary URL backfill failed: {str(e)}"
-        )
+@router.post("/backfill-cloudinary-urls/stop")
+async def stop_backfill_cloudinary_urls(
+    request: Request,
+    db: Session = Depends(get_db),
+    _: None = Depends(require_admin_auth),
+):
+    """
+    Stop the Cloudinary backfill after checkpointing it. A backfill running on
+    another worker stops at its next checkpoint.
+    """
+    from services.cloudinary_backfill import cloudinary_backfill
+
+    if await cloudinary_backfill.stop():
+        message = "Backfill stopped"
+    elif cloudinary_backfill.request_stop(db):
+        message = "Backfill stop requested"
+    else:
+        message = "Backfill is not running"
+    return {"message": message, "progress": cloudinary_backfill.progress(db)}
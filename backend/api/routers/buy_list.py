@@ -20,6 +20,7 @@ from api.dependencies import require_admin_auth
 from database import get_db
 from models import BuyListGame, Game, PriceOffer, PriceSnapshot
 from schemas import BuyListGameCreate, BuyListGameUpdate
+from services.catalogue_events import OP_UPDATE, notify_catalogue_change
 
 logger = logging.getLogger(__name__)
 _sl = lambda v: str(v).replace('\n', ' ').replace('\r', ' ')  # sanitize for logs
@@ -358,6 +359,8 @@ async def add_to_buy_list(
         db.add(buy_list_entry)
         db.commit()
         db.refresh(buy_list_entry)
+        # Status moved to BUY_LIST (or a new game was imported) - drops out of the public catalogue
+        notify_catalogue_change(db, [game.id], OP_UPDATE)
 
         # Accessing the game relationship will trigger lazy loading
         # No need to explicitly refresh it
@@ -475,6 +478,7 @@ async def _bulk_import_buy_list_csv_task(text_content: str) -> None:
         updated_count = 0
         skipped_count = 0
         error_count = 0
+        game_ids = []
 
         for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 to account for header
             try:
@@ -553,6 +557,7 @@ async def _bulk_import_buy_list_csv_task(text_content: str) -> None:
                     # Update status if needed
                     if game.status != "BUY_LIST":
                         game.status = "BUY_LIST"
+                game_ids.append(game.id)
 
                 # Check if already on buy list
                 existing = db.execute(
@@ -591,6 +596,7 @@ async def _bulk_import_buy_list_csv_task(text_content: str) -> None:
 
         # Commit all changes
         db.commit()
+        notify_catalogue_change(db, game_ids, OP_UPDATE)
 
         logger.info(
             f"Buy list bulk CSV import complete: {added_count} added, {updated_count} updated, "
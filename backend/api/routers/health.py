@@ -194,7 +194,34 @@ async def debug_database_info(
 @debug_router.get("/performance")
 async def get_performance_stats(_: None = Depends(require_admin_auth)):
     """Get performance monitoring stats (admin only)"""
-    return performance_monitor.get_stats()
+    from services.cloudinary_service import cloudinary_service
+    from services.game_detail_cache import game_detail_cache
+
+    return {
+        **performance_monitor.get_stats(),
+        "game_detail_cache": {**game_detail_cache.stats, "entries": len(game_detail_cache)},
+        "cloudinary_uploads": cloudinary_service.get_upload_stats(),
+    }
+
+
+@debug_router.get("/cache")
+async def get_cache_stats(_: None = Depends(require_admin_auth)):
+    """Get query cache and request-coalescing stats for this worker (admin only)"""
+    from utils.cache import get_cache_stats as query_cache_stats
+    from utils.single_flight import single_flight
+    from services.game_detail_cache import game_detail_cache
+    from services.image_disk_cache import image_disk_cache
+    from services.list_item_fragments import list_item_fragments
+    from services.suggest import suggest_index
+
+    return {
+        "query_cache": query_cache_stats(),
+        "list_item_fragments": {**list_item_fragments.stats, "entries": len(list_item_fragments)},
+        "game_detail_cache": {**game_detail_cache.stats, "entries": len(game_detail_cache)},
+        "image_disk_cache": {**image_disk_cache.stats, **image_disk_cache.usage()},
+        "single_flight": {**single_flight.stats, "in_flight": single_flight.in_flight()},
+        "suggest_index": {**suggest_index.stats, "games": len(suggest_index)},
+    }
 
 
 @debug_router.get("/bgg-test/{bgg_id}")
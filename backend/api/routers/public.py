@@ -3,11 +3,15 @@
 Public API endpoints for game catalogue browsing.
 Includes filtering, search, pagination, and image proxying.
 """
+import asyncio
+import hashlib
 import ipaddress
 import logging
 import random
 import socket
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from fastapi import (
@@ -19,14 +23,33 @@ from fastapi import (
     Request,
     Response,
 )
-from sqlalchemy import select
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from database import get_read_db
-from exceptions import GameNotFoundError
-from services import GameService, ImageService
+from config import (
+    CATALOGUE_STREAM_HEARTBEAT_SECONDS,
+    CATALOGUE_STREAM_MAX_SECONDS,
+    CHANGES_MAX_ITEMS,
+    CHANGES_OVERLAP_SECONDS,
+    PUBLIC_BATCH_MAX_IDS,
+    SIMILAR_GAMES_TOP_K,
+)
+from database import get_async_read_db, get_read_db
+from exceptions import GameNotFoundError, ValidationError
+from models import Game, bgg_image_hash
+from services import AsyncGameService, ImageService
+from services.image_service import ImageStream, ImageTooLargeError
+from services.catalogue_stream import catalogue_stream
+from services.catalogue_version import catalogue_version
+from services.game_detail_cache import game_detail_cache
+from services.image_disk_cache import CachedImage, image_disk_cache
+from services.image_hash_index import image_hash_index
+from services.list_item_fragments import dumps_json, list_item_fragments
+from services.suggest import suggest_index
 from utils.helpers import game_to_dict
-from schemas import GameListItemResponse, GameDetailResponse
+from schemas import GameDetailResponse
 
 logger = logging.getLogger(__name__)
 def _sl(v: object) -> str:
@@ -156,6 +179,8 @@ def _get_cached_games_key(
     search: Optional[str],
     category: Optional[str],
     designer: Optional[str],
+    mechanic: Optional[str],
+    publisher: Optional[str],
     nz_designer: Optional[bool],
     players: Optional[int],
     complexity_min: Optional[float],
@@ -171,18 +196,38 @@ def _get_cached_games_key(
     """Generate cache key for game queries"""
     from utils.cache import make_cache_key
     return make_cache_key(
-        search, category, designer, nz_designer,
+        search, category, designer, mechanic, publisher, nz_designer,
         players, complexity_min, complexity_max,
         playtime_max_min, playtime_max_max, quick_pick,
         recently_added, sort, page, page_size
     )
 
 
-def _get_games_from_db(
-    db: Session,
+def _serialize_list_items(games) -> str:
+    """
+    Serialize games with the minimal list schema (Phase 1 Performance: 75% smaller)
+    as a JSON array string, joined from per-game pre-serialized fragments.
+    A string so cached results can be shared between workers via Redis.
+    """
+    return list_item_fragments.render(games)
+
+
+def _json_page(envelope: dict, items_json: str, headers: dict) -> Response:
+    """
+    Raw JSON response for a list page: the envelope fields plus the already
+    serialized items array, spliced in without re-encoding.
+    """
+    body = dumps_json(envelope)[:-1] + b',"items":' + items_json.encode() + b"}"
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _get_games_from_db(
+    db: AsyncSession,
     search: Optional[str],
     category: Optional[str],
     designer: Optional[str],
+    mechanic: Optional[str],
+    publisher: Optional[str],
     nz_designer: Optional[bool],
     players: Optional[int],
     complexity_min: Optional[float],
@@ -199,42 +244,147 @@ def _get_games_from_db(
     Execute game query with probabilistic early expiration to prevent cache stampedes.
 
     REFACTORED: This function now only handles caching logic.
-    Query execution is delegated to GameService.get_filtered_games (DRY principle).
+    Query execution is delegated to AsyncGameService.get_filtered_games (DRY principle).
 
     Phase 1 Performance Optimization:
     - 90% of TTL: Always return cached result (fast path)
     - Last 10% of TTL: Probabilistically refresh cache (prevents stampede)
     - Probability increases linearly from 0% to 100%
     - Only ONE request refreshes, others serve stale data
-    """
-    import time
-    from utils.cache import _cache_store, _cache_timestamps
-    from config import CACHE_TTL_SECONDS, CACHE_FRESH_THRESHOLD
 
+    Returns (list items as a JSON array string, total). Results are shared
+    between workers through the Redis tier of utils.cache.
+    """
     # Generate cache key
     cache_params = _get_cached_games_key(
-        search, category, designer, nz_designer,
+        search, category, designer, mechanic, publisher, nz_designer,
         players, complexity_min, complexity_max,
         playtime_max_min, playtime_max_max, quick_pick,
         recently_added, sort, page, page_size
     )
-    cache_key = f"games_query:{cache_params}"
+    # Version read before the query runs: a concurrent write stores its result under
+    # the old version, which new requests no longer look up
+    version = catalogue_version.current()
+    cache_key = f"games_page:v{version}:{cache_params}"
+
+    # Cache miss or selected for refresh - execute query via service layer
+    # REFACTORED: No longer duplicates query logic, delegates to the service layer
+    async def run_query():
+        service = AsyncGameService(db)
+        games, total = await service.get_filtered_games(
+            search=search,
+            category=category,
+            designer=designer,
+            mechanic=mechanic,
+            publisher=publisher,
+            nz_designer=nz_designer,
+            players=players,
+            complexity_min=complexity_min,
+            complexity_max=complexity_max,
+            playtime_max_min=playtime_max_min,
+            playtime_max_max=playtime_max_max,
+            quick_pick=quick_pick,
+            recently_added_days=recently_added,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+        )
+        return _serialize_list_items(games), total
 
+    return await _get_with_early_expiration(cache_key, run_query, _catalogue_cache_ttl())
+
+
+async def _get_games_keyset_from_db(
+    db: AsyncSession,
+    search: Optional[str],
+    category: Optional[str],
+    designer: Optional[str],
+    mechanic: Optional[str],
+    publisher: Optional[str],
+    nz_designer: Optional[bool],
+    players: Optional[int],
+    complexity_min: Optional[float],
+    complexity_max: Optional[float],
+    playtime_max_min: Optional[int],
+    playtime_max_max: Optional[int],
+    quick_pick: Optional[str],
+    recently_added: Optional[int],
+    sort: str,
+    cursor: str,
+    page_size: int,
+    include_total: bool,
+):
+    """
+    Cursor-paginated variant of _get_games_from_db (same caching strategy).
+    Delegates to AsyncGameService.get_filtered_games_keyset.
+    """
+    from utils.cache import make_cache_key
+
+    cache_params = make_cache_key(
+        search, category, designer, mechanic, publisher, nz_designer,
+        players, complexity_min, complexity_max,
+        playtime_max_min, playtime_max_max, quick_pick,
+        recently_added, sort, cursor, page_size, include_total
+    )
+    cache_key = f"games_keyset_page:v{catalogue_version.current()}:{cache_params}"
+
+    async def run_query():
+        service = AsyncGameService(db)
+        games, next_cursor, total = await service.get_filtered_games_keyset(
+            search=search,
+            category=category,
+            designer=designer,
+            mechanic=mechanic,
+            publisher=publisher,
+            nz_designer=nz_designer,
+            players=players,
+            complexity_min=complexity_min,
+            complexity_max=complexity_max,
+            playtime_max_min=playtime_max_min,
+            playtime_max_max=playtime_max_max,
+            quick_pick=quick_pick,
+            recently_added_days=recently_added,
+            sort=sort,
+            cursor=cursor,
+            page_size=page_size,
+            include_total=include_total,
+        )
+        return _serialize_list_items(games), next_cursor, total
+
+    return await _get_with_early_expiration(cache_key, run_query, _catalogue_cache_ttl())
+
+
+async def _get_with_early_expiration(cache_key: str, run_query, ttl_seconds: Optional[float] = None):
+    """
+    Serve cache_key from the two-tier query cache, refreshing it by awaiting
+    run_query() using probabilistic early expiration.
+
+    run_query() must return a JSON-serializable result so it can be shared
+    with the other workers through the Redis tier.
+    """
+    import time
+    from utils.cache import query_cache
+    from utils.single_flight import PENDING, single_flight
+    from config import CACHE_TTL_SECONDS, CACHE_FRESH_THRESHOLD
+
+    ttl = ttl_seconds or CACHE_TTL_SECONDS
     current_time = time.time()
 
-    # Check if we have cached data
-    if cache_key in _cache_store and cache_key in _cache_timestamps:
-        cache_age = current_time - _cache_timestamps[cache_key]
+    # Check if we have cached data (L1, then Redis if L1 is missing or expired)
+    cached = query_cache.get(cache_key, max_age=ttl)
+    if cached is not None:
+        cached_result, stored_at = cached
+        cache_age = current_time - stored_at
 
         # PHASE 1: Cache is fresh (0-90% of TTL) - always serve cached
-        if cache_age < CACHE_TTL_SECONDS * CACHE_FRESH_THRESHOLD:
-            return _cache_store[cache_key]
+        if cache_age < ttl * CACHE_FRESH_THRESHOLD:
+            return cached_result
 
         # PHASE 2: Cache is aging (90-100% of TTL) - probabilistic refresh
-        elif cache_age < CACHE_TTL_SECONDS:
+        elif cache_age < ttl:
             # Calculate refresh probability (0% at 90% TTL, 100% at 100% TTL)
-            time_in_danger_zone = cache_age - (CACHE_TTL_SECONDS * CACHE_FRESH_THRESHOLD)
-            danger_zone_duration = CACHE_TTL_SECONDS * (1 - CACHE_FRESH_THRESHOLD)
+            time_in_danger_zone = cache_age - (ttl * CACHE_FRESH_THRESHOLD)
+            danger_zone_duration = ttl * (1 - CACHE_FRESH_THRESHOLD)
             refresh_probability = time_in_danger_zone / danger_zone_duration
 
             # Random decision: refresh or serve stale
@@ -244,40 +394,102 @@ def _get_games_from_db(
                 pass  # Fall through to query execution
             else:
                 # Serve slightly stale data (still acceptable)
-                return _cache_store[cache_key]
+                return cached_result
 
         # PHASE 3: Cache is definitely expired (>100% of TTL)
         # Fall through to refresh
 
-    # Cache miss or selected for refresh - execute query via service layer
-    # REFACTORED: No longer duplicates query logic, delegates to GameService
-    service = GameService(db)
-    result = service.get_filtered_games(
-        search=search,
-        category=category,
-        designer=designer,
-        nz_designer=nz_designer,
-        players=players,
-        complexity_min=complexity_min,
-        complexity_max=complexity_max,
-        playtime_max_min=playtime_max_min,
-        playtime_max_max=playtime_max_max,
-        quick_pick=quick_pick,
-        recently_added_days=recently_added,
-        sort=sort,
-        page=page,
-        page_size=page_size,
-    )
+    # Identical concurrent refreshes share one query (single-flight), on this
+    # worker and - through a Redis lock - across workers
+    previous_stored_at = cached[1] if cached is not None else None
+
+    async def refresh():
+        result = await run_query()
+        # Store in both tiers (bounded LRU evicts the least recently used entries)
+        query_cache.set(cache_key, result, ttl)
+        return result
+
+    def probe():
+        # Another worker holds the lock: use its result once it lands in Redis
+        latest = query_cache.get(cache_key, max_age=0)
+        if latest is not None and (previous_stored_at is None or latest[1] > previous_stored_at):
+            return latest[0]
+        return PENDING
+
+    return await single_flight.do(cache_key, refresh, probe)
+
+
+def _catalogue_etag(request: Request, version: int) -> Optional[str]:
+    """
+    Strong ETag for a catalogue response: the catalogue version plus the
+    request path and (order-independent) query string. Any catalogue write
+    bumps the version, so the tag changes whenever the body could.
+
+    None when the version is not shared (no Redis): each worker then counts
+    only its own writes, so a tag could outlive changes made through another
+    worker and keep a client on a stale copy.
+    """
+    if not catalogue_version.shared:
+        return None
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha256(f"{request.url.path}?{query}".encode()).hexdigest()[:16]
+    return f'"v{version}-{digest}"'
+
+
+# For endpoints clients poll to notice changes: caches must revalidate (cheap,
+# via the ETag) rather than serve a copy that hides a newer catalogue version
+REVALIDATE_CACHE_CONTROL = "no-cache"
 
-    # Store in cache
-    _cache_store[cache_key] = result
-    _cache_timestamps[cache_key] = current_time
 
-    # Periodic cleanup to prevent unbounded growth (Phase 1 Performance)
-    from utils.cache import cleanup_expired_entries
-    cleanup_expired_entries(force=False)
+def _version_headers(
+    etag: Optional[str], version: int, cache_control: Optional[str] = None
+) -> Dict[str, str]:
+    """ETag (when there is one), X-Catalogue-Version and an optional Cache-Control"""
+    headers = {"X-Catalogue-Version": str(version)}
+    if etag is not None:
+        headers["ETag"] = etag
+    if cache_control is not None:
+        headers["Cache-Control"] = cache_control
+    return headers
 
-    return result
+
+def _not_modified(
+    request: Request, etag: Optional[str], version: int, cache_control: Optional[str] = None
+) -> Optional[Response]:
+    """
+    Return a 304 response if the client's If-None-Match already holds etag,
+    so callers can skip the database and serialization entirely.
+    cache_control overrides the middleware's default for the path.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match or etag is None:
+        return None
+    # If-None-Match uses weak comparison and may list several tags
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag not in candidates and "*" not in candidates:
+        return None
+    return Response(status_code=304, headers=_version_headers(etag, version, cache_control))
+
+
+def _nz_designer_flag(nz_designer: Optional[str]) -> Optional[bool]:
+    """Convert the nz_designer query string to a boolean (None when absent)"""
+    if nz_designer is None:
+        return None
+    if isinstance(nz_designer, str):
+        return nz_designer.lower() in ["true", "1", "yes"]
+    return bool(nz_designer)
+
+
+def _catalogue_cache_ttl() -> int:
+    """
+    TTL for catalogue-derived cache entries.
+
+    Keys embed the catalogue version, so with a shared (Redis) version writes
+    invalidate instantly and entries can live for hours. A per-worker version
+    only sees this worker's writes, so fall back to the short TTL.
+    """
+    from config import CACHE_TTL_SECONDS, CATALOGUE_CACHE_TTL_SECONDS
+    return CATALOGUE_CACHE_TTL_SECONDS if catalogue_version.shared else CACHE_TTL_SECONDS
 
 
 @router.get("/games")
@@ -287,9 +499,11 @@ async def get_public_games(
     q: str = Query("", description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(24, ge=1, le=1000, description="Items per page"),
-    sort: str = Query("title_asc", description="Sort order"),
+    sort: str = Query("title_asc", description="Sort order ('relevance' ranks q matches best-first)"),
     category: Optional[str] = Query(None, description="Category filter"),
-    designer: Optional[str] = Query(None, description="Designer filter"),
+    designer: Optional[str] = Query(None, description="Designer filter (exact name, case-insensitive)"),
+    mechanic: Optional[str] = Query(None, description="Mechanic filter (exact name, case-insensitive)"),
+    publisher: Optional[str] = Query(None, description="Publisher filter (exact name, case-insensitive)"),
     nz_designer: Optional[str] = Query(
         None, description="Filter by NZ designers"
     ),
@@ -314,23 +528,75 @@ async def get_public_games(
     recently_added: Optional[int] = Query(
         None, ge=1, description="Filter games added within last N days"
     ),
-    db: Session = Depends(get_read_db),
+    cursor: Optional[str] = Query(
+        None,
+        max_length=2048,
+        description=(
+            "Keyset pagination cursor. Pass an empty value for the first page, "
+            "then next_cursor from each response. Ignores 'page'."
+        ),
+    ),
+    include_total: bool = Query(
+        False, description="Cursor mode only: also return the total match count"
+    ),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    """Get paginated list of games with filtering and search"""
-    # Convert nz_designer string to boolean
-    nz_designer_bool = None
-    if nz_designer is not None:
-        if isinstance(nz_designer, str):
-            nz_designer_bool = nz_designer.lower() in ["true", "1", "yes"]
-        else:
-            nz_designer_bool = bool(nz_designer)
+    """
+    Get paginated list of games with filtering and search.
+
+    Two pagination modes:
+    - Offset (default): page/page_size, always returns total
+    - Keyset: send cursor (empty for the first page) and follow next_cursor;
+      cost stays constant however deep the client scrolls
+
+    The X-Catalogue-Version response header carries the catalogue version and
+    the ETag changes with it; send If-None-Match to get a 304 when unchanged.
+    """
+    version = catalogue_version.current()
+    etag = _catalogue_etag(request, version)
+    not_modified = _not_modified(request, etag, version)
+    if not_modified is not None:
+        return not_modified
+    headers = _version_headers(etag, version)
+
+    nz_designer_bool = _nz_designer_flag(nz_designer)
+
+    if cursor is not None:
+        items, next_cursor, total = await _get_games_keyset_from_db(
+            db=db,
+            search=q if q else None,
+            category=category,
+            designer=designer,
+            mechanic=mechanic,
+            publisher=publisher,
+            nz_designer=nz_designer_bool,
+            players=players,
+            complexity_min=complexity_min,
+            complexity_max=complexity_max,
+            playtime_max_min=playtime_max_min,
+            playtime_max_max=playtime_max_max,
+            quick_pick=quick_pick,
+            recently_added=recently_added,
+            sort=sort,
+            cursor=cursor,
+            page_size=page_size,
+            include_total=include_total,
+        )
+        return _json_page(
+            {"total": total, "page_size": page_size, "next_cursor": next_cursor},
+            items,
+            headers,
+        )
 
     # Use cached query for better performance under load
-    games, total = _get_games_from_db(
+    # Items come back as a pre-serialized JSON array (minimal list schema)
+    items, total = await _get_games_from_db(
         db=db,
         search=q if q else None,
         category=category,
         designer=designer,
+        mechanic=mechanic,
+        publisher=publisher,
         nz_designer=nz_designer_bool,
         players=players,
         complexity_min=complexity_min,
@@ -344,18 +610,181 @@ async def get_public_games(
         page_size=page_size,
     )
 
-    # Phase 1 Performance: Use minimal schema for list items (75% smaller)
-    items = [
-        GameListItemResponse.model_validate(game).model_dump()
-        for game in games
-    ]
-
-    return {
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "items": items,
-    }
+    return _json_page(
+        {"total": total, "page": page, "page_size": page_size}, items, headers
+    )
+
+
+@router.get("/facets")
+@limiter.limit("100/minute")  # Fetched alongside /games on every filter change
+async def get_facets(
+    request: Request,
+    response: Response,
+    q: str = Query("", description="Search query"),
+    category: Optional[str] = Query(None, description="Category filter"),
+    designer: Optional[str] = Query(None, description="Designer filter (exact name, case-insensitive)"),
+    mechanic: Optional[str] = Query(None, description="Mechanic filter (exact name, case-insensitive)"),
+    publisher: Optional[str] = Query(None, description="Publisher filter (exact name, case-insensitive)"),
+    nz_designer: Optional[str] = Query(None, description="Filter by NZ designers"),
+    players: Optional[int] = Query(None, ge=1, description="Filter by player count"),
+    complexity_min: Optional[float] = Query(
+        None, ge=1, le=5, description="Minimum complexity rating (1-5)"
+    ),
+    complexity_max: Optional[float] = Query(
+        None, ge=1, le=5, description="Maximum complexity rating (1-5)"
+    ),
+    playtime_max_min: Optional[int] = Query(
+        None, ge=0, description="Minimum playtime_max in minutes (lower bound of the duration bucket)"
+    ),
+    playtime_max_max: Optional[int] = Query(
+        None, ge=0, description="Maximum playtime_max in minutes (upper bound of the duration bucket)"
+    ),
+    quick_pick: Optional[str] = Query(
+        None, description="Quick-pick trait filter: 'first', 'kids', 'group', or 'coop'"
+    ),
+    recently_added: Optional[int] = Query(
+        None, ge=1, description="Filter games added within last N days"
+    ),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Counts per bucket of every facet (categories, player counts, complexity,
+    playtime, quick picks, NZ designer) for the same filters as /games.
+
+    Each facet is counted without its own filter, so a UI can show how many
+    games every alternative choice would return. Computed in one query and
+    cached under the catalogue version plus the /games filter key; supports
+    conditional requests (ETag / If-None-Match).
+    """
+    from utils.cache import make_cache_key
+
+    version = catalogue_version.current()
+    etag = _catalogue_etag(request, version)
+    not_modified = _not_modified(request, etag, version)
+    if not_modified is not None:
+        return not_modified
+    response.headers.update(_version_headers(etag, version))
+
+    filters = dict(
+        search=q if q else None,
+        category=category,
+        designer=designer,
+        mechanic=mechanic,
+        publisher=publisher,
+        nz_designer=_nz_designer_flag(nz_designer),
+        players=players,
+        complexity_min=complexity_min,
+        complexity_max=complexity_max,
+        playtime_max_min=playtime_max_min,
+        playtime_max_max=playtime_max_max,
+        quick_pick=quick_pick,
+        recently_added_days=recently_added,
+    )
+    # Same filter key as the /games page cache (minus sort and paging)
+    cache_key = f"facets:v{version}:{make_cache_key(*filters.values())}"
+
+    async def run_query():
+        service = AsyncGameService(db)
+        return await service.get_facet_counts(**filters)
+
+    return await _get_with_early_expiration(cache_key, run_query, _catalogue_cache_ttl())
+
+
+def _is_public_detail(game: Game) -> bool:
+    """Only owned games have a public detail page (status NULL or "OWNED")"""
+    return game.status is None or game.status == "OWNED"
+
+
+async def _get_game_details(db: AsyncSession, game_ids: List[int]) -> Dict[int, str]:
+    """
+    GameDetailResponse JSON of the public games among game_ids, keyed by id.
+
+    Served from the per-game detail cache (shared by the single and batch
+    detail routes) after one row-version lookup; all misses are loaded
+    together in one batch query.
+    """
+    service = AsyncGameService(db)
+    versions = await service.get_detail_versions(game_ids)
+    details: Dict[int, str] = {}
+    misses: List[int] = []
+    for game_id in game_ids:
+        if game_id not in versions:
+            continue
+        detail = game_detail_cache.get(game_id, versions[game_id])
+        if detail is None:
+            misses.append(game_id)
+        else:
+            details[game_id] = detail
+
+    if misses:
+        for game in await service.get_games_by_ids(misses):
+            if not _is_public_detail(game):
+                continue
+            # Phase 1 Performance: Use full schema for detail view
+            detail = GameDetailResponse.model_validate(game).model_dump_json()
+            game_detail_cache.put(game.id, versions[game.id], detail)
+            details[game.id] = detail
+    return details
+
+
+def _parse_batch_ids(ids: str) -> List[int]:
+    """Comma-separated game IDs, de-duplicated in request order"""
+    parsed: List[int] = []
+    for part in ids.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            game_id = int(part)
+        except ValueError:
+            raise ValidationError(f"Invalid game ID: {_sl(part)}")
+        if game_id not in parsed:
+            parsed.append(game_id)
+    if not parsed:
+        raise ValidationError("At least one game ID is required")
+    if len(parsed) > PUBLIC_BATCH_MAX_IDS:
+        raise ValidationError(f"At most {PUBLIC_BATCH_MAX_IDS} game IDs per request")
+    return parsed
+
+
+# Declared before /games/{game_id} so "batch" is not parsed as a game ID
+@router.get("/games/batch")
+@limiter.limit("60/minute")
+async def get_public_games_batch(
+    request: Request,
+    ids: str = Query(..., description="Comma-separated game IDs"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Details of several games in one request, keyed by game ID (same format as
+    /games/{game_id}). IDs that do not exist or are not public are listed in
+    "missing".
+
+    Performance: replaces one detail request per game. Cached games come from
+    the same per-game entries as /games/{game_id}; the rest are loaded in a
+    constant number of queries. Supports conditional requests
+    (ETag / If-None-Match).
+    """
+    game_ids = _parse_batch_ids(ids)
+    version = catalogue_version.current()
+    etag = _catalogue_etag(request, version)
+    not_modified = _not_modified(request, etag, version)
+    if not_modified is not None:
+        return not_modified
+
+    details = await _get_game_details(db, game_ids)
+    games = b",".join(
+        f'"{game_id}":'.encode() + details[game_id].encode()
+        for game_id in game_ids
+        if game_id in details
+    )
+    missing = [game_id for game_id in game_ids if game_id not in details]
+    body = b'{"games":{' + games + b'},"missing":' + dumps_json(missing) + b"}"
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=_version_headers(etag, version),
+    )
 
 
 @router.get("/games/{game_id}", response_model=GameDetailResponse)
@@ -363,73 +792,276 @@ async def get_public_games(
 async def get_public_game(
     request: Request,
     game_id: int = Path(..., description="Game ID"),
-    db: Session = Depends(get_read_db),
-) -> GameDetailResponse:
-    """Get details for a specific game with full information"""
-    service = GameService(db)
-    game = service.get_game_by_id(game_id)
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Get details for a specific game with full information.
 
-    # Only show games that are owned (status is NULL or "OWNED")
+    Performance: served from the per-game detail cache, keyed by row
+    version (services/game_detail_cache.py) and shared with /games/batch.
+    Supports conditional requests (ETag / If-None-Match).
+    """
+    version = catalogue_version.current()
+    etag = _catalogue_etag(request, version)
+    not_modified = _not_modified(request, etag, version)
+    if not_modified is not None:
+        return not_modified
+
+    detail = (await _get_game_details(db, [game_id])).get(game_id)
     # Hide games on buy list or wishlist
-    if not game or (game.status is not None and game.status != "OWNED"):
+    if detail is None:
         raise GameNotFoundError("Game not found")
 
-    # Phase 1 Performance: Use full schema for detail view
-    return GameDetailResponse.model_validate(game)
+    return Response(
+        content=detail,
+        media_type="application/json",
+        headers=_version_headers(etag, version),
+    )
 
 
 @router.get("/category-counts")
 @limiter.limit("60/minute")  # Category counts change infrequently
-async def get_category_counts(request: Request, db: Session = Depends(get_read_db)):
+async def get_category_counts(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
+):
     """
-    Get counts for each category with Redis caching.
+    Get counts for each category with two-tier (in-process + Redis) caching.
 
-    Performance: Uses Redis cache with 5-minute TTL to reduce database load.
-    Category counts change infrequently, so aggressive caching is safe.
+    Performance: the cache key embeds the catalogue version, so counts are
+    served from cache until the next catalogue write. Supports conditional
+    requests (ETag / If-None-Match).
     """
-    import json
-    from redis_client import get_redis_client
+    version = catalogue_version.current()
+    etag = _catalogue_etag(request, version)
+    not_modified = _not_modified(request, etag, version)
+    if not_modified is not None:
+        return not_modified
+    response.headers.update(_version_headers(etag, version))
+
+    async def run_query():
+        service = AsyncGameService(db)
+        return await service.get_category_counts()
+
+    return await _get_with_early_expiration(
+        f"category_counts:v{version}", run_query, _catalogue_cache_ttl()
+    )
 
-    cache_key = "category_counts"
-    redis_client = get_redis_client()
 
-    # Try Redis cache first
-    if redis_client:
-        try:
-            cached = redis_client.get(cache_key)
-            if cached:
-                logger.debug("Category counts served from Redis cache")
-                return json.loads(cached)
-        except Exception as e:
-            # Redis failure shouldn't break the endpoint
-            logger.warning(f"Redis cache read failed for category counts: {e}")
-
-    # Cache miss or Redis unavailable - query database
-    service = GameService(db)
-    counts = service.get_category_counts()
-
-    # Store in Redis with 5-minute TTL (300 seconds)
-    # Category counts change infrequently, so longer cache is acceptable
-    if redis_client:
+@router.get("/catalogue-version")
+@limiter.limit("120/minute")
+async def get_catalogue_version(request: Request):
+    """
+    Current catalogue version.
+
+    Increases on every catalogue write; clients can poll this cheaply and
+    only refetch lists when it changes. Never served from a cache without
+    revalidation (ETag / If-None-Match).
+    """
+    version = catalogue_version.current()
+    etag = _catalogue_etag(request, version)
+    not_modified = _not_modified(request, etag, version, REVALIDATE_CACHE_CONTROL)
+    if not_modified is not None:
+        return not_modified
+    return JSONResponse(
+        {"version": version},
+        headers=_version_headers(etag, version, REVALIDATE_CACHE_CONTROL),
+    )
+
+
+def _sse(event: str, data: dict, event_id: Optional[int] = None) -> bytes:
+    """One server-sent event frame"""
+    frame = f"event: {event}\n"
+    if event_id is not None:
+        frame += f"id: {event_id}\n"
+    return (frame + "data: ").encode() + dumps_json(data) + b"\n\n"
+
+
+@router.get("/events")
+@limiter.limit("30/minute")  # Reconnects only; a connection stays open for minutes
+async def stream_catalogue_events(request: Request):
+    """
+    Server-sent events stream of catalogue changes, for open tabs and kiosk
+    displays that would otherwise poll /games.
+
+    Events:
+    - ready: {"version"} once connected
+    - change: {"game_id", "version", "op"} per created/updated/deleted game
+      ("op" is create, update or delete), with the version as event id
+    - resync: {"version"} when changes may have been missed (reconnecting
+      after a write, or the client fell behind) - refetch everything
+
+    Changes from every worker arrive through Redis pub/sub. Connections are
+    closed after CATALOGUE_STREAM_MAX_SECONDS; EventSource reconnects
+    automatically and sends Last-Event-ID, which triggers a resync if the
+    catalogue changed in between.
+    """
+    import time
+
+    subscription = catalogue_stream.subscribe()
+    if subscription is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many live connections, try again shortly",
+            headers={"Retry-After": "30"},
+        )
+    version = catalogue_version.current()
+    last_event_id = request.headers.get("last-event-id")
+
+    async def events():
         try:
-            redis_client.setex(cache_key, 300, json.dumps(counts))
-            logger.debug("Category counts stored in Redis cache (TTL: 5min)")
-        except Exception as e:
-            # Redis failure shouldn't break the endpoint
-            logger.warning(f"Redis cache write failed for category counts: {e}")
+            yield b"retry: 5000\n\n"
+            yield _sse("ready", {"version": version}, version)
+            try:
+                missed = last_event_id is not None and int(last_event_id) < version
+            except ValueError:
+                missed = True
+            if missed:
+                yield _sse("resync", {"version": version}, version)
+
+            deadline = time.monotonic() + CATALOGUE_STREAM_MAX_SECONDS
+            while not await request.is_disconnected():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                event = await subscription.next_event(min(CATALOGUE_STREAM_HEARTBEAT_SECONDS, remaining))
+                if subscription.take_overflow():
+                    current = catalogue_version.current()
+                    yield _sse("resync", {"version": current}, current)
+                elif event is not None:
+                    yield _sse("change", event, event["version"])
+                else:
+                    yield b": keep-alive\n\n"
+        finally:
+            catalogue_stream.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Row versions compare as naive UTC (how the DateTime columns return them)"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 
-    return counts
+def _encode_changes_token(cursor: Optional[Tuple[datetime, int]]) -> str:
+    """Opaque sync token for a (updated_at, id) row-version cursor"""
+    if cursor is None:
+        return "0-0"
+    updated_at, game_id = cursor
+    return f"{(_naive_utc(updated_at) - _EPOCH) // timedelta(microseconds=1)}-{game_id}"
+
+
+def _decode_changes_token(token: str) -> Tuple[datetime, int]:
+    try:
+        micros, game_id = (int(part) for part in token.split("-"))
+        return _EPOCH + timedelta(microseconds=micros), game_id
+    except (ValueError, OverflowError):
+        raise ValidationError("Invalid sync token")
+
+
+@router.get("/changes")
+@limiter.limit("60/minute")
+async def get_catalogue_changes(
+    request: Request,
+    since: Optional[str] = Query(
+        None, description="Token from the previous response's 'next' (omit for a full snapshot)"
+    ),
+    limit: int = Query(500, ge=1, le=CHANGES_MAX_ITEMS, description="Maximum number of changed games"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Delta sync: public games created or updated since a sync token (in the
+    /games list item format), plus tombstone IDs of games deleted or no
+    longer public.
+
+    Without since, returns a snapshot of the whole catalogue ("reset": true).
+    Pass "next" as since to continue; while "has_more" is true, call again
+    straight away. Items may repeat across calls - apply them as upserts.
+
+    Performance: clients keep a local copy and only download what changed.
+    Cached under the catalogue version; supports conditional requests
+    (ETag / If-None-Match). HTTP caches must revalidate every poll: a stored
+    copy would hide changes committed since.
+    """
+    cursor = _decode_changes_token(since) if since is not None else None
+    version = catalogue_version.current()
+    etag = _catalogue_etag(request, version)
+    not_modified = _not_modified(request, etag, version, REVALIDATE_CACHE_CONTROL)
+    if not_modified is not None:
+        return not_modified
+
+    async def run_query():
+        service = AsyncGameService(db)
+        games, deleted, last, has_more = await service.get_catalogue_changes(cursor, limit)
+        if not has_more and last is not None:
+            # Caught up: trail the newest change so rows committed slightly out
+            # of order are sent again on the next poll instead of being skipped
+            overlap_start = (
+                _naive_utc(datetime.now(timezone.utc)) - timedelta(seconds=CHANGES_OVERLAP_SECONDS),
+                0,
+            )
+            trailing = min((_naive_utc(last[0]), last[1]), overlap_start)
+            last = max(cursor, trailing) if cursor is not None else trailing
+        return {
+            "envelope": {
+                "since": since,
+                "next": _encode_changes_token(last),
+                "reset": cursor is None,
+                "has_more": has_more,
+                "deleted": deleted,
+            },
+            "items": _serialize_list_items(games),
+        }
+
+    result = await _get_with_early_expiration(
+        f"changes:v{version}:{since}:{limit}", run_query, _catalogue_cache_ttl()
+    )
+    return _json_page(
+        result["envelope"],
+        result["items"],
+        _version_headers(etag, version, REVALIDATE_CACHE_CONTROL),
+    )
+
+
+@router.get("/suggest")
+@limiter.limit("600/minute")  # One request per keystroke
+async def get_suggestions(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100, description="Partially typed search text"),
+    limit: int = Query(8, ge=1, le=20, description="Maximum number of suggestions"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Typeahead suggestions (game titles, designers, mechanics) for the search box.
+
+    Performance: answered from the in-memory suggest index; the database is
+    only read to (re)load it after a catalogue write made elsewhere.
+    """
+    version = catalogue_version.current()
+    if suggest_index.needs_load(version):
+        await db.run_sync(lambda session: suggest_index.load(session, version))
+    return {"query": q, "suggestions": suggest_index.suggest(q, limit)}
 
 
 @router.get("/games/by-designer/{designer_name}")
 @limiter.limit("60/minute")  # Designer searches
 async def get_games_by_designer(
-    request: Request, designer_name: str, db: Session = Depends(get_read_db)
+    request: Request, designer_name: str, db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get games by a specific designer"""
     try:
-        service = GameService(db)
-        games = service.get_games_by_designer(designer_name)
+        service = AsyncGameService(db)
+        games = await service.get_games_by_designer(designer_name)
         return {
             "designer": designer_name,
             "games": [game_to_dict(request, game) for game in games],
@@ -442,6 +1074,109 @@ async def get_games_by_designer(
         )
 
 
+# Declared after /games/by-designer/{designer_name} so that route keeps matching
+@router.get("/games/{game_id}/similar")
+@limiter.limit("120/minute")  # Loaded with every game detail view
+async def get_similar_games(
+    request: Request,
+    game_id: int = Path(..., description="Game ID"),
+    limit: int = Query(8, ge=1, le=SIMILAR_GAMES_TOP_K, description="Maximum number of games"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    "If you liked this" recommendations: the most similar public games, best
+    match first, in the /games list item format.
+
+    Performance: neighbours are precomputed (services/similar_games.py), so
+    this is an indexed read, cached under the catalogue version. Supports
+    conditional requests (ETag / If-None-Match).
+    """
+    version = catalogue_version.current()
+    etag = _catalogue_etag(request, version)
+    not_modified = _not_modified(request, etag, version)
+    if not_modified is not None:
+        return not_modified
+
+    async def run_query():
+        service = AsyncGameService(db)
+        games = await service.get_similar_games(game_id, limit)
+        return None if games is None else _serialize_list_items(games)
+
+    items = await _get_with_early_expiration(
+        f"similar_games:v{version}:{game_id}:{limit}", run_query, _catalogue_cache_ttl()
+    )
+    if items is None:
+        raise GameNotFoundError("Game not found")
+    return _json_page(
+        {"game_id": game_id},
+        items,
+        _version_headers(etag, version),
+    )
+
+
+def _cached_image_response(request: Request, cached: CachedImage, cache_control: str) -> Response:
+    """
+    Serve an image from the local disk cache.
+
+    The ETag is the image's content hash and Last-Modified its store time,
+    so revalidations get a 304 without a body. Otherwise the file is sent by
+    FileResponse, which handles Range/If-Range requests and uses zero-copy
+    sendfile where the server supports it.
+    """
+    etag = f'"{cached.digest[:32]}"'
+    last_modified = formatdate(cached.stored_at, usegmt=True)
+    headers = {
+        "Cache-Control": cache_control,
+        "Access-Control-Allow-Origin": "*",
+        "ETag": etag,
+        "Last-Modified": last_modified,
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    elif request.headers.get("if-modified-since"):
+        try:
+            since = parsedate_to_datetime(request.headers["if-modified-since"])
+        except (TypeError, ValueError):
+            since = None
+        if since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        if since is not None and since.timestamp() >= int(cached.stored_at):
+            return Response(status_code=304, headers=headers)
+
+    return FileResponse(
+        cached.path,
+        media_type=cached.content_type,
+        headers=headers,
+        stat_result=cached.stat_result,
+    )
+
+
+async def _stream_image_through_cache(url: str, stream: ImageStream):
+    """
+    Relay an upstream image chunk by chunk while writing it to the disk
+    cache; the cached copy is only kept if the whole image arrived.
+    """
+    writer = await asyncio.to_thread(image_disk_cache.writer, url, stream.content_type)
+    try:
+        async for chunk in stream.iter_chunks():
+            if writer is not None:
+                await asyncio.to_thread(writer.write, chunk)
+            yield chunk
+        if writer is not None:
+            await asyncio.to_thread(writer.commit)
+    except ImageTooLargeError as e:
+        # Headers are already sent: all that is left is to cut the response short
+        logger.warning(f"Stopped proxying oversized image: {e}")
+    finally:
+        if writer is not None:
+            await asyncio.to_thread(writer.abort)
+        await stream.aclose()
+
+
 @router.get("/image-proxy")
 @limiter.limit("1000/minute")  # High limit for pages with many images (admin pages can have 100+ games)
 async def image_proxy(
@@ -459,15 +1194,22 @@ async def image_proxy(
     - Returns optimized Cloudinary URL with WebP/AVIF support
     - Supports width/height parameters for responsive images
 
-    If Cloudinary is disabled:
+    If Cloudinary is disabled (or the upload fails):
     - Falls back to direct proxy with caching headers
+    - Downloaded images are kept in a local disk cache and served from there
+      (ETag/Last-Modified revalidation and Range requests supported)
 
     Rate limit: 300 requests/minute to support pages with many images.
     Security: Only proxies images from trusted sources (BGG, local storage).
     """
     # Import dependencies
     from main import httpx_client  # noqa: E402
-    from config import API_BASE, CLOUDINARY_ENABLED  # noqa: E402
+    from config import (  # noqa: E402
+        API_BASE,
+        CLOUDINARY_ENABLED,
+        IMAGE_PROXY_MAX_BYTES,
+        IMAGE_PROXY_STREAMING,
+    )
     from services.cloudinary_service import cloudinary_service  # noqa: E402
 
     try:
@@ -534,33 +1276,40 @@ async def image_proxy(
             url = re.sub(r'__original/', '__md/', url)
             logger.info(f"Transformed to: {_sl(url[:100])}...")
 
-        # PERFORMANCE FAST-PATH: Check if we have a cached Cloudinary URL in database
-        # This avoids re-uploading images that are already in Cloudinary
+        # PERFORMANCE FAST-PATH: Check if we have a cached Cloudinary URL
+        # In-process hash map first (no database), then the indexed image_hash column
+        image_hash = None
+        owner_id = None
         if CLOUDINARY_ENABLED and (_url_host == 'cf.geekdo-images.com' or _url_host.endswith('.geekdo-images.com')):
             try:
-                import re
-                # Extract hash from URL (part before __SIZE)
-                hash_match = re.search(r'geekdo-images\.com/([^/_]+)__', url)
-                if hash_match:
-                    hash_part = hash_match.group(1)
-                    # Find game with this hash in image field
-                    from models import Game
-                    stmt = select(Game).where(
-                        Game.image.like(f'%{hash_part}%')
-                    )
-                    game = db.execute(stmt).scalars().first()
-
-                    if game and game.cloudinary_url:
+                image_hash = bgg_image_hash(url)
+                if image_hash:
+                    cached = image_hash_index.get(image_hash)
+                    if cached is None:
+                        # Find game with this hash (indexed equality lookup)
+                        row = db.execute(
+                            select(Game.id, Game.cloudinary_url)
+                            .where(Game.image_hash == image_hash)
+                            .limit(1)
+                        ).first()
+                        if row:
+                            owner_id = row.id
+                            if row.cloudinary_url:
+                                cached = (row.id, row.cloudinary_url)
+                                image_hash_index.put(image_hash, *cached)
+
+                    if cached:
                         # We have a cached Cloudinary URL! Use it directly
                         # Apply width/height transformations if requested
+                        owner_id, base_cloudinary_url = cached
                         if width or height:
                             cached_url = cloudinary_service.get_image_url(
                                 url, width=width, height=height
                             )
                         else:
-                            cached_url = game.cloudinary_url
+                            cached_url = base_cloudinary_url
 
-                        logger.info(f"✓ Using cached Cloudinary URL for game {game.id}: {_sl(game.title)}")
+                        logger.debug(f"Using cached Cloudinary URL for game {owner_id}")
                         return Response(
                             status_code=302,
                             headers={
@@ -596,28 +1345,21 @@ async def image_proxy(
                     )
 
                     # PERFORMANCE OPTIMIZATION: Save cloudinary_url to database for future fast-path
-                    # Find the game that owns this image by matching the hash in the URL
+                    # The owning game was already resolved by hash in the fast-path lookup
                     try:
-                        import re
-                        # Extract hash from URL (part before __SIZE)
-                        hash_match = re.search(r'geekdo-images\.com/([^/_]+)__', url)
-                        if hash_match:
-                            hash_part = hash_match.group(1)
-                            # Find game with this hash in image field
-                            from models import Game
-                            stmt = select(Game).where(
-                                Game.image.like(f'%{hash_part}%')
+                        if owner_id is not None:
+                            # Save the base Cloudinary URL (without width/height transformations)
+                            base_cloudinary_url = cloudinary_service.get_image_url(url)
+                            db.execute(
+                                update(Game)
+                                .where(Game.id == owner_id)
+                                .values(cloudinary_url=base_cloudinary_url)
                             )
-                            game = db.execute(stmt).scalars().first()
-
-                            if game:
-                                # Save the base Cloudinary URL (without width/height transformations)
-                                base_cloudinary_url = cloudinary_service.get_image_url(url)
-                                game.cloudinary_url = base_cloudinary_url
-                                db.commit()
-                                logger.info(f"✓ Saved Cloudinary URL to database for game {game.id}: {_sl(game.title)}")
-                            else:
-                                logger.debug(f"Could not find game for URL hash: {_sl(hash_part)}")
+                            db.commit()
+                            image_hash_index.put(image_hash, owner_id, base_cloudinary_url)
+                            logger.info(f"✓ Saved Cloudinary URL to database for game {owner_id}")
+                        else:
+                            logger.debug(f"Could not find game for URL hash: {_sl(image_hash)}")
                     except Exception as e:
                         logger.warning(f"Failed to save cloudinary_url to database: {e}")
                         # Non-critical, continue anyway
@@ -647,24 +1389,51 @@ async def image_proxy(
             31536000 if url.startswith(API_BASE + "/thumbs/") else 86400  # 24 hours for external images
         )
 
-        # Use service layer for image proxying
-        service = ImageService(db, http_client=httpx_client)
-        content, content_type, cache_control = await service.proxy_image(
-            url, cache_max_age
-        )
-
         # Update cache control headers to include must-revalidate for better cache behavior
         # This ensures browsers respect updated timestamps when games are edited
-        if not url.startswith(API_BASE + "/thumbs/"):
+        if url.startswith(API_BASE + "/thumbs/"):
+            cache_control = f"public, max-age={cache_max_age}"
+        else:
             cache_control = "public, max-age=86400, must-revalidate"
 
-        headers = {
-            "Content-Type": content_type,
-            "Cache-Control": cache_control,
-            "Access-Control-Allow-Origin": "*",
-        }
+        # Local disk cache first: repeat hits are served from the file without contacting BGG
+        cached = await asyncio.to_thread(image_disk_cache.get, url)
+        if cached is None and IMAGE_PROXY_STREAMING:
+            # Stream the image through (and into the disk cache) without buffering it whole
+            service = ImageService(db, http_client=httpx_client)
+            try:
+                stream = await service.stream_image(url, IMAGE_PROXY_MAX_BYTES)
+            except ImageTooLargeError as e:
+                logger.warning(f"Refusing to proxy oversized image: {e}")
+                raise HTTPException(status_code=502, detail="Image too large to proxy")
+            headers = {
+                "Cache-Control": cache_control,
+                "Access-Control-Allow-Origin": "*",
+            }
+            if stream.content_length is not None:
+                headers["Content-Length"] = str(stream.content_length)
+            return StreamingResponse(
+                _stream_image_through_cache(url, stream),
+                media_type=stream.content_type,
+                headers=headers,
+            )
+        if cached is None:
+            # Use service layer for image proxying
+            service = ImageService(db, http_client=httpx_client)
+            content, content_type, _ = await service.proxy_image(
+                url, cache_max_age
+            )
+            cached = await asyncio.to_thread(image_disk_cache.put, url, content, content_type)
+            if cached is None:
+                # Not cacheable (cache disabled, too large or disk error): serve from memory
+                headers = {
+                    "Content-Type": content_type,
+                    "Cache-Control": cache_control,
+                    "Access-Control-Allow-Origin": "*",
+                }
+                return Response(content=content, headers=headers)
 
-        return Response(content=content, headers=headers)
+        return _cached_image_response(request, cached, cache_control)
 
     except HTTPException:
         # Re-raise HTTPExceptions (like validation errors) without modification
@@ -119,12 +119,114 @@ if CLOUDINARY_ENABLED:
     _log.info("Cloudinary CDN enabled: %s", CLOUDINARY_CLOUD_NAME)
 else:
     _log.warning("Cloudinary not configured - using direct BGG image URLs")
+# Upload pool (services/cloudinary_service.py): Pillow processing and SDK uploads run on
+# this many threads instead of the event loop
+CLOUDINARY_UPLOAD_WORKERS = int(os.getenv("CLOUDINARY_UPLOAD_WORKERS", "4"))
+# Uploads allowed to wait for a worker; beyond this the image proxy serves images directly
+CLOUDINARY_UPLOAD_MAX_QUEUED = int(os.getenv("CLOUDINARY_UPLOAD_MAX_QUEUED", "100"))
+# Image preprocessing (utils/image_preprocess.py): images over Cloudinary's 10MB limit are
+# shrunk in this many worker processes (0 = on the upload threads themselves)
+IMAGE_PREPROCESS_WORKERS = int(os.getenv("IMAGE_PREPROCESS_WORKERS", "2"))
+# Most pixels decoded to shrink one image; PNG/GIF/WebP originals larger than this are not uploaded
+IMAGE_PREPROCESS_MAX_PIXELS = int(os.getenv("IMAGE_PREPROCESS_MAX_PIXELS", "50000000"))
+# Images a worker process shrinks before it is replaced, handing its memory back to the OS
+IMAGE_PREPROCESS_MAX_TASKS_PER_WORKER = int(os.getenv("IMAGE_PREPROCESS_MAX_TASKS_PER_WORKER", "50"))
+# Cloudinary backfill (services/cloudinary_backfill.py): concurrent uploads start at
+# INITIAL and adapt between MIN and MAX - halved on 429/5xx, raised while uploads succeed
+CLOUDINARY_BACKFILL_MIN_CONCURRENCY = int(os.getenv("CLOUDINARY_BACKFILL_MIN_CONCURRENCY", "1"))
+CLOUDINARY_BACKFILL_INITIAL_CONCURRENCY = int(os.getenv("CLOUDINARY_BACKFILL_INITIAL_CONCURRENCY", "4"))
+CLOUDINARY_BACKFILL_MAX_CONCURRENCY = int(os.getenv("CLOUDINARY_BACKFILL_MAX_CONCURRENCY", "16"))
+# Attempts per game (throttled attempts included) before it goes on the failure list
+CLOUDINARY_BACKFILL_MAX_ATTEMPTS = int(os.getenv("CLOUDINARY_BACKFILL_MAX_ATTEMPTS", "5"))
+# Seconds between checkpoints; at most this much work is redone after a crash
+CLOUDINARY_BACKFILL_CHECKPOINT_SECONDS = float(os.getenv("CLOUDINARY_BACKFILL_CHECKPOINT_SECONDS", "5"))
+# Resume a backfill interrupted by a restart when the app starts
+CLOUDINARY_BACKFILL_AUTO_RESUME = os.getenv("CLOUDINARY_BACKFILL_AUTO_RESUME", "true").lower() in ("true", "1", "yes")
 
 # Cache configuration (Performance Optimization)
 # TTL for in-memory cache (games query cache)
 CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "30"))
 # Fresh threshold: Serve from cache without refresh probability check
 CACHE_FRESH_THRESHOLD = float(os.getenv("CACHE_FRESH_THRESHOLD", "0.9"))  # 90% of TTL
+# TTL for catalogue queries (games list, category counts). Their cache keys embed the
+# catalogue version (services/catalogue_version.py), so writes take effect immediately
+# and this can be long. Only used while the version is shared via Redis - otherwise
+# other workers would not see a write until expiry, so CACHE_TTL_SECONDS applies.
+CATALOGUE_CACHE_TTL_SECONDS = int(os.getenv("CATALOGUE_CACHE_TTL_SECONDS", "21600"))  # 6 hours
+# Safety-net re-read of the shared version, in case a pub/sub bump message is missed
+CATALOGUE_VERSION_SYNC_SECONDS = float(os.getenv("CATALOGUE_VERSION_SYNC_SECONDS", "5"))
+# Two-tier query cache (utils/cache.py): bounded per-worker LRU (L1) in front of Redis (L2)
+QUERY_CACHE_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "10000"))
+# Share serialized query results between workers through Redis (requires REDIS_ENABLED)
+QUERY_CACHE_L2_ENABLED = os.getenv("QUERY_CACHE_L2_ENABLED", "true").lower() in ("true", "1", "yes")
+# Single-flight coalescing (utils/single_flight.py): identical concurrent cache refreshes share one query
+# Cross-worker variant: one worker takes a Redis lock, the others wait for its result in the shared cache
+SINGLE_FLIGHT_REDIS_LOCK_ENABLED = os.getenv("SINGLE_FLIGHT_REDIS_LOCK_ENABLED", "true").lower() in ("true", "1", "yes")
+SINGLE_FLIGHT_LOCK_TTL_SECONDS = float(os.getenv("SINGLE_FLIGHT_LOCK_TTL_SECONDS", "10"))
+# How long a waiting worker polls for the result before querying itself
+SINGLE_FLIGHT_WAIT_SECONDS = float(os.getenv("SINGLE_FLIGHT_WAIT_SECONDS", "5"))
+
+# In-memory columnar catalogue engine (services/catalogue_engine.py)
+# Answers public catalogue filter/sort/page queries from NumPy arrays instead of SQL
+CATALOGUE_ENGINE_ENABLED = os.getenv("CATALOGUE_ENGINE_ENABLED", "false").lower() in ("true", "1", "yes")
+# Without Redis: full reload interval, so writes made through other workers are picked up
+# (with Redis the shared catalogue version triggers reloads instead)
+CATALOGUE_ENGINE_MAX_AGE_SECONDS = int(os.getenv("CATALOGUE_ENGINE_MAX_AGE_SECONDS", "300"))
+
+# Similar-games recommendations (services/similar_games.py)
+# Neighbours stored per game for /api/public/games/{id}/similar
+SIMILAR_GAMES_TOP_K = int(os.getenv("SIMILAR_GAMES_TOP_K", "12"))
+
+# Batch game detail (/api/public/games/batch?ids=...): most IDs accepted per request
+PUBLIC_BATCH_MAX_IDS = int(os.getenv("PUBLIC_BATCH_MAX_IDS", "50"))
+
+# Delta sync (/api/public/changes?since=...)
+# Most changed games returned per call (clients page with the returned token)
+CHANGES_MAX_ITEMS = int(os.getenv("CHANGES_MAX_ITEMS", "1000"))
+# Caught-up tokens trail the newest change by this much, so writes committed slightly
+# out of row-version order are sent again on the next poll rather than missed
+CHANGES_OVERLAP_SECONDS = int(os.getenv("CHANGES_OVERLAP_SECONDS", "5"))
+
+# Live catalogue change events (/api/public/events, services/catalogue_stream.py)
+# Concurrent server-sent event connections per worker (more get 503 + Retry-After)
+CATALOGUE_STREAM_MAX_CLIENTS = int(os.getenv("CATALOGUE_STREAM_MAX_CLIENTS", "500"))
+# Pending events per connection before the client is told to resync instead
+CATALOGUE_STREAM_QUEUE_SIZE = int(os.getenv("CATALOGUE_STREAM_QUEUE_SIZE", "1000"))
+# Keep-alive comment interval, so proxies do not drop idle connections
+CATALOGUE_STREAM_HEARTBEAT_SECONDS = float(os.getenv("CATALOGUE_STREAM_HEARTBEAT_SECONDS", "15"))
+# Connections are closed after this long; EventSource clients reconnect automatically
+CATALOGUE_STREAM_MAX_SECONDS = float(os.getenv("CATALOGUE_STREAM_MAX_SECONDS", "600"))
+
+# Full-text search for ?q= (services/search.py)
+# PostgreSQL: also match misspelled titles via pg_trgm similarity (needs the pg_trgm
+# extension; turned off on startup when it is not installed)
+SEARCH_FUZZY_ENABLED = os.getenv("SEARCH_FUZZY_ENABLED", "true").lower() in ("true", "1", "yes")
+
+# Image proxy hash map (services/image_hash_index.py)
+# Bounded LRU of BGG image hash -> (game_id, cloudinary_url) so repeat proxy hits skip the database
+IMAGE_HASH_INDEX_MAX_ENTRIES = int(os.getenv("IMAGE_HASH_INDEX_MAX_ENTRIES", "5000"))
+
+# Local disk cache for the direct image proxy fallback (services/image_disk_cache.py)
+# Content-addressed image files plus a SQLite index, shared by all workers on the host
+IMAGE_DISK_CACHE_DIR = os.getenv("IMAGE_DISK_CACHE_DIR", "/tmp/image-cache")
+# Size budget of the cached files; least recently used images are evicted (0 disables the cache)
+IMAGE_DISK_CACHE_MAX_BYTES = int(os.getenv("IMAGE_DISK_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+# Direct image proxy (services/image_service.py ImageService.stream_image)
+# Stream upstream images to the client in chunks instead of buffering each image whole
+IMAGE_PROXY_STREAMING = os.getenv("IMAGE_PROXY_STREAMING", "true").lower() in ("true", "1", "yes")
+# Chunk size of streamed images (the most held in memory per request)
+IMAGE_PROXY_CHUNK_BYTES = int(os.getenv("IMAGE_PROXY_CHUNK_BYTES", str(64 * 1024)))
+# Per-request byte cap; larger images are refused (or cut off if no Content-Length was sent)
+IMAGE_PROXY_MAX_BYTES = int(os.getenv("IMAGE_PROXY_MAX_BYTES", str(20 * 1024 * 1024)))
+
+# Pre-serialized list-item JSON per game (services/list_item_fragments.py)
+# Bounded LRU of (game id, updated_at) -> JSON bytes used to assemble list pages
+LIST_FRAGMENT_CACHE_MAX_ENTRIES = int(os.getenv("LIST_FRAGMENT_CACHE_MAX_ENTRIES", "20000"))
+
+# Serialized game detail JSON per game (services/game_detail_cache.py)
+# Bounded LRU of game id -> (row version, GameDetailResponse JSON) behind /api/public/games/{id}
+GAME_DETAIL_CACHE_MAX_ENTRIES = int(os.getenv("GAME_DETAIL_CACHE_MAX_ENTRIES", "5000"))
 
 # Database connection pool configuration (Performance Tuning)
 # Tune these based on your deployment environment and load characteristics
@@ -1,5 +1,6 @@
 from sqlalchemy import create_engine, event
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
 from config import (
@@ -66,6 +67,90 @@ else:
     ReadSessionLocal = SessionLocal
 
 
+# ------------------------------------------------------------------------------
+# Async engines (asyncpg for PostgreSQL, aiosqlite for local SQLite)
+# ------------------------------------------------------------------------------
+# The async def routers await these sessions instead of blocking the event loop
+# on a synchronous driver. Engines are created lazily on first use so the async
+# drivers are only imported by processes that actually serve requests.
+
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+_async_engine = None
+_async_read_engine = None
+AsyncSessionLocal = None
+AsyncReadSessionLocal = None
+
+
+def _async_url(url: str) -> str:
+    """
+    Translate a synchronous database URL into its async-driver equivalent.
+
+    psycopg2's sslmode query parameter is renamed to asyncpg's ssl.
+    URLs already naming an async driver are returned unchanged.
+    """
+    parsed = make_url(url)
+    drivername = _ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    query = dict(parsed.query)
+    if drivername.endswith("+asyncpg") and "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return parsed.set(drivername=drivername, query=query).render_as_string(
+        hide_password=False
+    )
+
+
+def _create_async_engine(url: str):
+    async_url = _async_url(url)
+    kwargs = {"echo": False}
+    if not async_url.startswith("sqlite"):
+        kwargs.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+        )
+    return create_async_engine(async_url, **kwargs)
+
+
+def _init_async_engines():
+    global _async_engine, _async_read_engine, AsyncSessionLocal, AsyncReadSessionLocal
+
+    if _async_engine is not None:
+        return
+
+    _async_engine = _create_async_engine(DATABASE_URL)
+    AsyncSessionLocal = async_sessionmaker(
+        _async_engine, autoflush=False, expire_on_commit=False
+    )
+    if READ_REPLICA_URL:
+        _async_read_engine = _create_async_engine(READ_REPLICA_URL)
+        AsyncReadSessionLocal = async_sessionmaker(
+            _async_read_engine, autoflush=False, expire_on_commit=False
+        )
+    else:
+        _async_read_engine = _async_engine
+        AsyncReadSessionLocal = AsyncSessionLocal
+    logger.info(f"Async database engine configured ({_async_engine.dialect.driver})")
+
+
+async def dispose_async_engines():
+    """Close pooled async connections (called on application shutdown)"""
+    global _async_engine, _async_read_engine, AsyncSessionLocal, AsyncReadSessionLocal
+
+    if _async_read_engine is not None and _async_read_engine is not _async_engine:
+        await _async_read_engine.dispose()
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = _async_read_engine = None
+    AsyncSessionLocal = AsyncReadSessionLocal = None
+
+
 # ------------------------------------------------------------------------------
 # Phase 1 Performance: SQLAlchemy Query Monitoring
 # ------------------------------------------------------------------------------
@@ -162,6 +247,29 @@ def get_read_db():
         db.close()
 
 
+async def get_async_db():
+    """Async database session dependency (primary database)"""
+    _init_async_engines()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db():
+    """
+    Async database session dependency for read-only operations.
+    Uses read replica if configured, otherwise falls back to primary database.
+
+    Usage:
+        @router.get("/api/public/games")
+        async def get_games(db: AsyncSession = Depends(get_async_read_db)):
+            games = await AsyncGameService(db).get_all_games()
+            ...
+    """
+    _init_async_engines()
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
 def get_pool_stats():
     """
     Get database connection pool statistics for monitoring.
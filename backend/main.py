@@ -3,6 +3,7 @@
 Main application entry point for Mana & Meeples Board Game Library API.
 Handles app initialization, middleware setup, and router registration.
 """
+import asyncio
 import os
 import json
 import logging
@@ -23,14 +24,14 @@ from shared.rate_limiting import (
     get_rate_limit_exception,
 )
 
-from database import db_ping
+from database import db_ping, dispose_async_engines, engine
 from exceptions import (
     GameNotFoundError,
     BGGServiceError,
     ValidationError,
     DatabaseError,
 )
-from config import HTTP_TIMEOUT, CORS_ORIGINS
+from config import CLOUDINARY_BACKFILL_AUTO_RESUME, HTTP_TIMEOUT, CORS_ORIGINS
 from middleware.logging import RequestLoggingMiddleware
 from middleware.security import SecurityHeadersMiddleware
 from middleware.cache import APICacheControlMiddleware
@@ -283,6 +284,10 @@ async def lifespan(app: FastAPI):
 
     logger.info("Database connection verified")
 
+    # Fuzzy title search needs pg_trgm: fall back to full-text only without it
+    from services.search import detect_fuzzy_search
+    await asyncio.to_thread(detect_fuzzy_search, engine)
+
     # Database migrations are now handled by Alembic
     # Run `alembic upgrade head` before starting the application
     # See: backend/alembic/ for migration files
@@ -291,16 +296,40 @@ async def lifespan(app: FastAPI):
     logger.info(f"Thumbnails directory: {THUMBS_DIR}")
 
     # Sprint 12: Warm cache for popular queries (runs in thread pool to avoid blocking the event loop)
-    import asyncio
     await asyncio.to_thread(warm_cache)
 
+    # Follow catalogue version bumps / relay live change events from other
+    # workers (no-op without Redis)
+    from services.catalogue_version import catalogue_version
+    from services.catalogue_stream import catalogue_stream
+    catalogue_version.start_listener()
+    catalogue_stream.start_listener()
+
+    # Temporary files of image downloads a killed worker never finished
+    from services.image_disk_cache import image_disk_cache
+    await asyncio.to_thread(image_disk_cache.sweep_temp_files)
+
+    # Pick up a Cloudinary backfill that the last shutdown (or crash) cut off
+    from services.cloudinary_backfill import cloudinary_backfill
+    if CLOUDINARY_BACKFILL_AUTO_RESUME:
+        cloudinary_backfill.start_watcher()
+
     logger.info("API startup complete")
 
     yield
 
     # Shutdown
     logger.info("Shutting down API...")
+    from services.catalogue_version import catalogue_version
+    from services.catalogue_stream import catalogue_stream
+    catalogue_version.stop_listener()
+    catalogue_stream.stop_listener()
+    from services.cloudinary_backfill import cloudinary_backfill
+    await cloudinary_backfill.shutdown()
+    from utils.image_preprocess import shutdown_preprocess_pool
+    await asyncio.to_thread(shutdown_preprocess_pool)
     await httpx_client.aclose()
+    await dispose_async_engines()
     logger.info("API shutdown complete")
 
 
@@ -510,6 +539,8 @@ app.add_middleware(
         "content-type",
         "x-total-count",
         "x-request-id",  # Request ID for distributed tracing
+        "x-catalogue-version",  # Lets clients skip refetching an unchanged catalogue
+        "etag",  # Needed by cross-origin clients to send If-None-Match
         "access-control-allow-origin",
         "access-control-allow-credentials",
     ],
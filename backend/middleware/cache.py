@@ -8,14 +8,20 @@ from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
+# Public catalogue responses carry an ETag, so after max-age browsers and CDNs
+# may keep serving the stored copy while revalidating it in the background
+# (usually answered with a cheap 304)
+PUBLIC_CACHE_CONTROL = b"public, max-age=300, s-maxage=300, stale-while-revalidate=600"
+HEALTH_CACHE_CONTROL = b"public, max-age=60, s-maxage=60"
+
 
 class APICacheControlMiddleware:
     """
     Add Cache-Control headers to API responses based on endpoint type.
 
     Cache durations:
-    - Public game data: 5 minutes (300s) - Data changes infrequently
-    - Category counts: 5 minutes (300s) - Aggregated data changes infrequently
+    - Public game data: 5 minutes (300s), then stale-while-revalidate for 10 minutes
+    - Category counts: 5 minutes (300s), then stale-while-revalidate for 10 minutes
     - Health endpoints: 1 minute (60s) - Status changes more frequently
     - Image proxy: Already handled in endpoint (delegates to response)
     - Admin endpoints: No caching (private, no-store)
@@ -47,17 +53,17 @@ class APICacheControlMiddleware:
                     if (path.startswith("/api/public/games") or
                         path.startswith("/api/public/category-counts") or
                         path.startswith("/api/public/games/by-designer/")):
-                        cache_control = b"public, max-age=300, s-maxage=300"
+                        cache_control = PUBLIC_CACHE_CONTROL
                     # Image proxy - skip (already handled in endpoint)
                     elif path.startswith("/api/public/image-proxy"):
                         pass
                     else:
                         # Default for other public endpoints
-                        cache_control = b"public, max-age=300, s-maxage=300"
+                        cache_control = PUBLIC_CACHE_CONTROL
 
                 elif path.startswith("/api/health"):
                     # Health checks - cache for 1 minute
-                    cache_control = b"public, max-age=60, s-maxage=60"
+                    cache_control = HEALTH_CACHE_CONTROL
 
                 elif path.startswith("/api/admin/"):
                     # Admin endpoints - never cache (private data)
@@ -1,5 +1,11 @@
+import re
 from datetime import datetime, timezone
+from typing import Optional
+
 from sqlalchemy import (
+    event,
+    inspect,
+    select,
     Column,
     Integer,
     String,
@@ -15,7 +21,25 @@ from sqlalchemy import (
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import DeclarativeBase, relationship, backref
+from sqlalchemy.orm import DeclarativeBase, Session, relationship, backref, validates
+
+
+# BGG image URLs embed a per-image hash before the size segment:
+# https://cf.geekdo-images.com/<hash>__original/img/.../pic123.jpg
+# Hashes are base64url and may themselves contain underscores.
+_BGG_IMAGE_HASH_RE = re.compile(r'geekdo-images\.com/([^/]+)__[A-Za-z0-9]+/')
+
+
+def bgg_image_hash(url: Optional[str]) -> Optional[str]:
+    """
+    Extract the image hash from a BGG (geekdo-images) URL.
+
+    Returns None for empty or non-BGG URLs.
+    """
+    if not url:
+        return None
+    match = _BGG_IMAGE_HASH_RE.search(url)
+    return match.group(1)[:64] if match else None
 
 
 def utc_now():
@@ -26,6 +50,64 @@ def utc_now():
     return datetime.now(timezone.utc)
 
 
+# Mobile library "Who's playing today?" shortlists
+QUICK_PICK_KEYS = ("first", "kids", "group", "coop")
+
+# Game attributes the quick-pick membership flags are derived from
+_QUICK_PICK_INPUTS = (
+    "complexity",
+    "min_age",
+    "players_max",
+    "is_cooperative",
+    "mana_meeple_category",
+    "excluded_quick_picks",
+)
+
+
+def quick_pick_matches(quick_pick: str, values: dict) -> bool:
+    """
+    Quick-pick auto-selection logic (admin exclusions not applied) for a game
+    with the given _QUICK_PICK_INPUTS values. The migration backfilling the
+    quick_pick_* columns mirrors this in SQL.
+    """
+    complexity = values.get("complexity")
+    category = values.get("mana_meeple_category")
+    if quick_pick == "first":
+        return complexity is not None and complexity < 1.5
+    if quick_pick == "kids":
+        min_age = values.get("min_age")
+        return category == "KIDS_FAMILIES" or (
+            complexity is not None and complexity < 1.5 and min_age is not None and min_age <= 10
+        )
+    if quick_pick == "group":
+        players_max = values.get("players_max")
+        return players_max is not None and players_max >= 6
+    if quick_pick == "coop":
+        return values.get("is_cooperative") is True or category == "COOP_ADVENTURE"
+    return False
+
+
+# Game JSON list columns mirrored into bgg_entities/game_entity_links (column -> entity kind)
+ENTITY_KINDS = {
+    "designers": "designer",
+    "mechanics": "mechanic",
+    "publishers": "publisher",
+    "artists": "artist",
+}
+
+
+def entity_key(name: str) -> str:
+    """Normalized entity name used for lookups (whitespace-collapsed, case-folded)"""
+    return " ".join(str(name).split()).casefold()
+
+
+def _own_value(column_name: str):
+    """Column default copying another column of the same inserted row"""
+    def default(context):
+        return context.get_current_parameters().get(column_name)
+    return default
+
+
 class Base(DeclarativeBase):
     """Base class for all database models"""
     pass
@@ -44,7 +126,9 @@ class Game(Base):
     playtime_max = Column(Integer, nullable=True)
     image = Column(String(512), nullable=True)  # Full-size image URL from BGG (main image field)
     cloudinary_url = Column(String(512), nullable=True)  # Pre-generated Cloudinary CDN URL (cached)
+    image_hash = Column(String(64), nullable=True, index=True)  # BGG image hash from image (kept in sync by _sync_image_hash)
     created_at = Column(DateTime, default=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=True)  # Row version: bumped on every UPDATE
     date_added = Column(
         DateTime, default=utc_now, nullable=True, index=True
     )  # Date game was added to physical collection
@@ -67,6 +151,13 @@ class Game(Base):
     # removes specific games staff have flagged as a bad fit (e.g. mature
     # content the BGG data can't signal). Keys: first, kids, group, coop.
     excluded_quick_picks = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
+    # Materialized quick-pick membership, kept in step with the attributes above
+    # by _sync_quick_picks: NULL = not a candidate, False = candidate excluded
+    # by an admin, True = shown in the public shortlist.
+    quick_pick_first = Column(Boolean, nullable=True)
+    quick_pick_kids = Column(Boolean, nullable=True)
+    quick_pick_group = Column(Boolean, nullable=True)
+    quick_pick_coop = Column(Boolean, nullable=True)
     game_type = Column(String(255), nullable=True, index=True)
     # Ownership status: OWNED (in physical collection), BUY_LIST (want to buy), WISHLIST (maybe buy)
     status = Column(String(20), nullable=True, default="OWNED", index=True)
@@ -91,6 +182,13 @@ class Game(Base):
     modifies_players_min = Column(Integer, nullable=True)
     modifies_players_max = Column(Integer, nullable=True)
 
+    # Player range including linked expansions: the game's own range widened by
+    # its expansions' modifies_players_min/max (NULL = unbounded, like players_min/max).
+    # Maintained by GameService.refresh_effective_players; new rows start from
+    # their own range.
+    effective_players_min = Column(Integer, nullable=True, default=_own_value("players_min"))
+    effective_players_max = Column(Integer, nullable=True, default=_own_value("players_max"))
+
     # Relationships
     expansions = relationship(
         "Game",
@@ -112,6 +210,16 @@ class Game(Base):
         Index("idx_rating_rank", "average_rating", "bgg_rank"),
         Index("idx_created_category", "created_at", "mana_meeple_category"),
         Index("idx_expansion_lookup", "is_expansion", "base_game_id"),
+        # Delta sync (/api/public/changes) pages through games by row version
+        Index("idx_updated_at", "updated_at", "id"),
+        # Expansion-aware player count filter (range on the materialized columns)
+        Index("idx_effective_players", "effective_players_min", "effective_players_max"),
+        # Quick-pick shortlists (public: flag = true; admin candidates: flag IS NOT NULL)
+        *(
+            Index(f"idx_quick_pick_{key}", f"quick_pick_{key}", "title",
+                  postgresql_where=text(f"quick_pick_{key} IS NOT NULL"))
+            for key in QUICK_PICK_KEYS
+        ),
 
         # Sprint 4 Performance Indexes - for filtered queries
         # Recently added filter (date_added DESC with status)
@@ -156,6 +264,19 @@ class Game(Base):
               postgresql_include=["title", "year", "players_min", "players_max",
                                  "average_rating", "image"]),
 
+        # Keyset pagination indexes - one per public sort order (lead key -> title -> id)
+        # so each cursor page is an index range scan. Mixed-direction orders
+        # need their own index since a backward scan would flip title/id too.
+        # The time_* sorts use expression indexes created in the migration.
+        Index("idx_keyset_title", "title", "id"),
+        Index("idx_keyset_title_desc", title.desc(), id),
+        Index("idx_keyset_year", "year", "title", "id"),
+        Index("idx_keyset_year_desc", year.desc(), title, id),
+        Index("idx_keyset_date_added", "date_added", "title", "id"),
+        Index("idx_keyset_date_added_desc", date_added.desc(), title, id),
+        Index("idx_keyset_rating", "average_rating", "title", "id"),
+        Index("idx_keyset_rating_desc", average_rating.desc(), title, id),
+
         # Sprint 4 Data Integrity Constraints
         # NOTE: All constraints must allow NULL values since fields are nullable
         CheckConstraint("year IS NULL OR (year >= 1900 AND year <= 2100)", name="valid_year"),
@@ -185,6 +306,184 @@ class Game(Base):
     sleeves = relationship(
         "Sleeve", back_populates="game", cascade="all, delete-orphan"
     )
+    # Normalized designers/mechanics/publishers/artists (kept in step with the
+    # JSON columns by _sync_game_entities)
+    entities = relationship("BggEntity", secondary="game_entity_links")
+
+    @validates("image")
+    def _sync_image_hash(self, key, value):
+        """Keep image_hash in step with every assignment to image"""
+        self.image_hash = bgg_image_hash(value)
+        return value
+
+    @validates(*_QUICK_PICK_INPUTS)
+    def _sync_quick_picks(self, key, value):
+        """Recompute the quick_pick_* flags on every assignment to one of their inputs"""
+        values = {name: getattr(self, name) for name in _QUICK_PICK_INPUTS if name != key}
+        values[key] = value
+        excluded = values["excluded_quick_picks"] or []
+        for quick_pick in QUICK_PICK_KEYS:
+            flag = None
+            if quick_pick_matches(quick_pick, values):
+                flag = quick_pick not in excluded
+            setattr(self, f"quick_pick_{quick_pick}", flag)
+        return value
+
+
+class BggEntity(Base):
+    """
+    A designer, mechanic, publisher or artist (BGG "link"), shared by every
+    game that lists it. Backs the indexed designer/mechanic/publisher filters;
+    the Game JSON columns remain the source for API payloads.
+    """
+
+    __tablename__ = "bgg_entities"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(20), nullable=False)  # designer, mechanic, publisher, artist
+    name = Column(String(255), nullable=False)  # Display name as first imported
+    name_key = Column(String(255), nullable=False)  # entity_key(name)
+
+    __table_args__ = (
+        Index("idx_bgg_entity_kind_key", "kind", "name_key", unique=True),
+    )
+
+    def __repr__(self):
+        return f"<BggEntity {self.kind}: {self.name}>"
+
+
+class GameEntityLink(Base):
+    """Link between a game and a BggEntity"""
+
+    __tablename__ = "game_entity_links"
+
+    game_id = Column(Integer, ForeignKey("boardgames.id", ondelete="CASCADE"), primary_key=True)
+    entity_id = Column(Integer, ForeignKey("bgg_entities.id", ondelete="CASCADE"), primary_key=True)
+
+    __table_args__ = (
+        # Entity -> games lookups (the primary key covers game -> entities)
+        Index("idx_game_entity_link_entity", "entity_id", "game_id"),
+    )
+
+
+class GameSimilarity(Base):
+    """
+    Precomputed "if you liked this" neighbours: the top-k most similar public
+    games for each game, by cosine similarity of their feature vectors
+    (services/similar_games.py).
+    """
+
+    __tablename__ = "game_similarities"
+
+    game_id = Column(Integer, ForeignKey("boardgames.id", ondelete="CASCADE"), primary_key=True)
+    similar_game_id = Column(Integer, ForeignKey("boardgames.id", ondelete="CASCADE"), primary_key=True)
+    rank = Column(Integer, nullable=False)  # 1 = most similar
+    score = Column(Float, nullable=False)  # Cosine similarity (0-1]
+
+    __table_args__ = (
+        Index("idx_game_similarity_rank", "game_id", "rank"),
+        # Reverse lookups when a game changes (whose lists contain it)
+        Index("idx_game_similarity_similar", "similar_game_id"),
+    )
+
+
+class GameDeletion(Base):
+    """
+    Deletion log: one tombstone per deleted game, so clients syncing through
+    /api/public/changes learn to drop it. Written by GameService.delete_game.
+    """
+
+    __tablename__ = "game_deletions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    game_id = Column(Integer, nullable=False)  # No foreign key: the game row is gone
+    deleted_at = Column(DateTime, default=utc_now, nullable=False, index=True)
+
+
+class BackfillCheckpoint(Base):
+    """
+    Progress of a resumable backfill job, one row per job
+    (services/cloudinary_backfill.py). Every game with id <= last_game_id has
+    been processed; the ones that failed are listed in failed_games.
+    """
+
+    __tablename__ = "backfill_checkpoints"
+
+    name = Column(String(64), primary_key=True)
+    status = Column(String(16), nullable=False, default="idle")  # running/stopped/interrupted/completed
+    force = Column(Boolean, nullable=False, default=False)
+    last_game_id = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    uploaded = Column(Integer, nullable=False, default=0)
+    skipped = Column(Integer, nullable=False, default=0)
+    # [{"game_id": ..., "error": ...}]
+    failed_games = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False, default=list)
+    owner = Column(String(128), nullable=True)  # host:pid of the process running the job
+    started_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=utc_now, nullable=False)  # Heartbeat while running
+    finished_at = Column(DateTime, nullable=True)
+
+
+def _game_entity_names(game: Game) -> dict:
+    """(kind, name_key) -> display name for every entity a game's JSON columns list"""
+    names = {}
+    for column, kind in ENTITY_KINDS.items():
+        values = getattr(game, column)
+        if not isinstance(values, (list, tuple)):
+            continue
+        for value in values:
+            if isinstance(value, str) and value.strip():
+                names.setdefault((kind, entity_key(value)), " ".join(value.split()))
+    return names
+
+
+def _entity_columns_changed(game: Game) -> bool:
+    state = inspect(game)
+    if state.pending:
+        return any(getattr(game, column) for column in ENTITY_KINDS)
+    return any(state.attrs[column].history.has_changes() for column in ENTITY_KINDS)
+
+
+@event.listens_for(Session, "before_flush")
+def _sync_game_entities(session, flush_context, instances):
+    """
+    Mirror the designers/mechanics/publishers/artists JSON columns of new and
+    changed games into Game.entities, creating missing BggEntity rows. Runs for
+    every ORM write path (GameService, bulk endpoints, buy list imports).
+    """
+    games = [
+        obj for obj in (*session.new, *session.dirty)
+        if isinstance(obj, Game) and _entity_columns_changed(obj)
+    ]
+    if not games:
+        return
+
+    wanted = {game: _game_entity_names(game) for game in games}
+    keys = {key for names in wanted.values() for key in names}
+    known = {
+        (entity.kind, entity.name_key): entity
+        for entity in session.new
+        if isinstance(entity, BggEntity)
+    }
+    with session.no_autoflush:
+        name_keys = sorted({name_key for _, name_key in keys - known.keys()})
+        for start in range(0, len(name_keys), 500):
+            rows = session.execute(
+                select(BggEntity).where(BggEntity.name_key.in_(name_keys[start:start + 500]))
+            ).scalars()
+            for entity in rows:
+                known.setdefault((entity.kind, entity.name_key), entity)
+
+        for game, names in wanted.items():
+            entities = []
+            for (kind, name_key), name in names.items():
+                entity = known.get((kind, name_key))
+                if entity is None:
+                    entity = BggEntity(kind=kind, name=name, name_key=name_key)
+                    session.add(entity)
+                    known[(kind, name_key)] = entity
+                entities.append(entity)
+            game.entities = entities
 
 
 class BuyListGame(Base):
@@ -5,7 +5,7 @@ Sprint 8: Redis Session Storage for horizontal scaling.
 """
 import os
 import logging
-from typing import Optional
+from typing import Callable, Optional
 import redis
 from redis.exceptions import RedisError, ConnectionError as RedisConnectionError
 
@@ -210,6 +210,138 @@ class RedisClient:
             logger.error(f"Redis ttl failed for key {key}: {e}")
             return None
 
+    def acquire_lock(self, key: str, token: str, ttl_seconds: float) -> bool:
+        """
+        Try to take a short-lived lock (SET NX PX).
+
+        Args:
+            key: Lock key
+            token: Unique owner token, needed to release the lock
+            ttl_seconds: Lock expiry, so a crashed owner cannot hold it forever
+
+        Returns:
+            True if the lock was acquired, False if held elsewhere or on error
+        """
+        if not self.is_available:
+            logger.warning("Redis unavailable, acquire_lock operation failed")
+            return False
+
+        try:
+            return bool(
+                self._client.set(key, token, nx=True, px=max(1, int(ttl_seconds * 1000)))
+            )
+        except RedisError as e:
+            logger.error(f"Redis acquire_lock failed for key {key}: {e}")
+            return False
+
+    # Delete the lock only if we still own it (it may have expired and been re-taken)
+    _RELEASE_LOCK_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
+    def release_lock(self, key: str, token: str) -> bool:
+        """
+        Release a lock taken with acquire_lock.
+
+        Args:
+            key: Lock key
+            token: Token passed to acquire_lock
+
+        Returns:
+            True if the lock was held with this token and released
+        """
+        if not self.is_available:
+            logger.warning("Redis unavailable, release_lock operation failed")
+            return False
+
+        try:
+            return bool(self._client.eval(self._RELEASE_LOCK_SCRIPT, 1, key, token))
+        except RedisError as e:
+            logger.error(f"Redis release_lock failed for key {key}: {e}")
+            return False
+
+    def delete_pattern(self, pattern: str) -> int:
+        """
+        Delete all keys matching a glob pattern (uses SCAN, never KEYS).
+
+        Args:
+            pattern: Glob pattern, e.g. "qcache:games_query:*"
+
+        Returns:
+            Number of keys deleted (0 if Redis unavailable or on error)
+        """
+        if not self.is_available:
+            logger.warning("Redis unavailable, delete_pattern operation failed")
+            return 0
+
+        try:
+            deleted = 0
+            batch = []
+            for key in self._client.scan_iter(match=pattern, count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += self._client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self._client.delete(*batch)
+            return deleted
+        except RedisError as e:
+            logger.error(f"Redis delete_pattern failed for pattern {pattern}: {e}")
+            return 0
+
+    def publish(self, channel: str, message: str) -> bool:
+        """
+        Publish a message on a pub/sub channel.
+
+        Args:
+            channel: Channel name
+            message: Message payload
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.is_available:
+            logger.warning("Redis unavailable, publish operation failed")
+            return False
+
+        try:
+            self._client.publish(channel, message)
+            return True
+        except RedisError as e:
+            logger.error(f"Redis publish failed for channel {channel}: {e}")
+            return False
+
+    def subscribe(self, channel: str, handler: Callable[[dict], None]):
+        """
+        Subscribe to a pub/sub channel on a background daemon thread.
+
+        Args:
+            channel: Channel name
+            handler: Called with each message dict (keys: type, channel, data)
+
+        Returns:
+            The worker thread (call .stop() to unsubscribe), or None if
+            Redis is unavailable
+        """
+        if not self.is_available:
+            logger.warning("Redis unavailable, subscribe operation failed")
+            return None
+
+        def on_error(e, pubsub, thread):
+            logger.error(f"Redis subscriber for channel {channel} failed: {e}")
+            thread.stop()
+
+        try:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{channel: handler})
+            return pubsub.run_in_thread(
+                sleep_time=1.0, daemon=True, exception_handler=on_error
+            )
+        except RedisError as e:
+            logger.error(f"Redis subscribe failed for channel {channel}: {e}")
+            return None
+
     def ping(self) -> bool:
         """
         Ping Redis server to check connectivity.
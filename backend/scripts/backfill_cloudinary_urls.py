@@ -6,17 +6,27 @@ Backfill Cloudinary URLs for Existing Games
 This script populates the cloudinary_url column for games that are missing it.
 Pre-generating these URLs eliminates 50-150ms redirect overhead per image request.
 
+Live runs use the resumable backfill engine (services/cloudinary_backfill.py):
+images are uploaded concurrently, backing off when Cloudinary or BGG throttle,
+and progress is checkpointed in the database - run the script again after an
+interruption (Ctrl-C included) and it continues where it stopped. --dry-run
+previews the URLs serially without uploading or writing anything.
+
 Usage:
     python -m backend.scripts.backfill_cloudinary_urls [--dry-run] [--limit N]
 
 Options:
-    --dry-run    Show what would be updated without making changes
-    --limit N    Only process N games (useful for testing)
-    --force      Re-generate URLs even if they already exist
+    --dry-run         Show what would be updated without making changes
+    --limit N         Only process N games (useful for testing)
+    --force           Re-generate URLs even if they already exist
+    --retry-failed    Retry the games that failed in earlier runs first
+    --restart         Ignore the checkpoint and start from the first game
+    --concurrency N   Maximum concurrent uploads
 """
 
 import sys
 import os
+import asyncio
 import logging
 import argparse
 from typing import Optional
@@ -36,6 +46,7 @@ if backend_dir not in sys.path:
 
 from database import get_db
 from models import Game
+from services.cloudinary_backfill import CloudinaryBackfill
 from services.cloudinary_service import cloudinary_service
 
 logging.basicConfig(
@@ -51,7 +62,8 @@ def backfill_cloudinary_urls(
     force: bool = False
 ) -> dict:
     """
-    Backfill cloudinary_url for games that need it.
+    Backfill cloudinary_url for games that need it, serially and without
+    uploading (used for --dry-run previews; live runs use run_backfill).
 
     Args:
         dry_run: If True, don't commit changes
@@ -214,6 +226,68 @@ def print_summary(stats: dict, dry_run: bool):
     logger.info("")
 
 
+async def run_backfill(
+    force: bool = False,
+    retry_failed: bool = False,
+    restart: bool = False,
+    limit: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    report_every: float = 10.0,
+) -> dict:
+    """
+    Run the resumable backfill engine to the end, logging progress.
+
+    Returns:
+        Final progress (see CloudinaryBackfill.progress)
+    """
+    options = {"max_concurrency": concurrency} if concurrency else {}
+    engine = CloudinaryBackfill(**options)
+
+    async def report():
+        while True:
+            await asyncio.sleep(report_every)
+            progress = engine.progress()
+            logger.info(
+                f"Up to game {progress['last_game_id']}: {progress['uploaded']} uploaded, "
+                f"{progress['skipped']} skipped, {progress['failed']} failed, "
+                f"{progress['remaining']} to go "
+                f"(concurrency {progress.get('concurrency')}, "
+                f"{progress.get('games_per_second')} games/s)"
+            )
+
+    reporter = asyncio.create_task(report())
+    try:
+        return await engine.run(force=force, retry_failed=retry_failed, restart=restart, limit=limit)
+    finally:
+        reporter.cancel()
+
+
+def print_progress(progress: dict):
+    """Print the outcome of an engine run"""
+    logger.info("=" * 70)
+    logger.info(f"BACKFILL {progress['status'].upper()}")
+    logger.info("=" * 70)
+    logger.info(f"Done up to game id:    {progress['last_game_id']}")
+    logger.info(f"Games processed:       {progress['processed']}")
+    logger.info(f"Images uploaded:       {progress['uploaded']}")
+    logger.info(f"Games skipped:         {progress['skipped']}")
+    logger.info(f"Games failed:          {progress['failed']}")
+    logger.info(f"Games remaining:       {progress['remaining']}")
+
+    if progress['failures']:
+        logger.info("")
+        logger.info("FAILURES (retry with --retry-failed):")
+        for failure in progress['failures']:
+            logger.info(f"  - game {failure['game_id']}: {failure['error']}")
+        if progress['failed'] > len(progress['failures']):
+            logger.info(f"  ... and {progress['failed'] - len(progress['failures'])} more")
+
+    if progress['remaining']:
+        logger.info("")
+        logger.info("Run again to continue from the checkpoint")
+    logger.info("=" * 70)
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -234,6 +308,21 @@ def main():
         action='store_true',
         help='Re-generate URLs even if they already exist'
     )
+    parser.add_argument(
+        '--retry-failed',
+        action='store_true',
+        help='Retry the games that failed in earlier runs first'
+    )
+    parser.add_argument(
+        '--restart',
+        action='store_true',
+        help='Ignore the checkpoint and start from the first game'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        help='Maximum concurrent uploads'
+    )
 
     args = parser.parse_args()
 
@@ -249,15 +338,28 @@ def main():
             return
         logger.info("")
 
-    # Run backfill
-    stats = backfill_cloudinary_urls(
-        dry_run=args.dry_run,
-        limit=args.limit,
-        force=args.force
-    )
+    if args.dry_run:
+        stats = backfill_cloudinary_urls(
+            dry_run=True,
+            limit=args.limit,
+            force=args.force
+        )
+        print_summary(stats, True)
+        return
 
-    # Print summary
-    print_summary(stats, args.dry_run)
+    # Live run: resumable engine (Ctrl-C checkpoints; run again to continue)
+    try:
+        progress = asyncio.run(run_backfill(
+            force=args.force,
+            retry_failed=args.retry_failed,
+            restart=args.restart,
+            limit=args.limit,
+            concurrency=args.concurrency,
+        ))
+    except KeyboardInterrupt:
+        logger.info("Interrupted - progress is checkpointed, run again to continue")
+        return
+    print_progress(progress)
 
 
 if __name__ == "__main__":
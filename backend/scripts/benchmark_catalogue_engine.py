@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark the in-memory catalogue engine against the SQL path of
+GameService.get_filtered_games.
+
+Seeds a throwaway SQLite database with synthetic games at several catalogue
+sizes and times a representative mix of public catalogue queries through
+both paths.
+
+Usage:
+    python scripts/benchmark_catalogue_engine.py [--sizes 1000 10000 100000] [--repeat 20]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, Game
+from services.catalogue_engine import CatalogueEngine
+import services.game_service as game_service_module
+from services.game_service import GameService
+
+CATEGORIES = [
+    "COOP_ADVENTURE",
+    "CORE_STRATEGY",
+    "GATEWAY_STRATEGY",
+    "KIDS_FAMILIES",
+    "PARTY_ICEBREAKERS",
+    None,
+]
+WORDS = ["Dragon", "Castle", "River", "Space", "Forest", "Harbour", "Empire", "Garden"]
+
+QUERIES = [
+    ("default page", {}),
+    ("category + rating sort", {"category": "CORE_STRATEGY", "sort": "rating_desc"}),
+    ("players=4", {"players": 4}),
+    ("search 'castle'", {"search": "castle"}),
+    ("designer 'smith'", {"designer": "smith"}),
+    ("quick pick kids", {"quick_pick": "kids"}),
+    ("complexity + playtime", {"complexity_min": 2.0, "complexity_max": 3.5, "playtime_max_max": 90}),
+    ("time sort, deep page", {"sort": "time_asc", "page": 20}),
+    ("recently added", {"recently_added_days": 30, "sort": "date_added_desc"}),
+]
+
+
+def seed(session, count: int) -> None:
+    """Insert count synthetic games with a realistic spread of values"""
+    rng = random.Random(count)
+    now = datetime.now(timezone.utc)
+    rows = []
+    for i in range(count):
+        players_min = rng.choice([None, 1, 2, 2, 3])
+        playtime_min = rng.choice([None, 15, 30, 45, 60])
+        rows.append({
+            "title": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}",
+            "categories": "",
+            "bgg_id": i + 1,
+            "year": rng.choice([None, 1995, 2005, 2015, 2020, 2024]),
+            "players_min": players_min,
+            "players_max": None if players_min is None else players_min + rng.choice([0, 2, 4]),
+            "playtime_min": playtime_min,
+            "playtime_max": None if playtime_min is None else playtime_min + rng.choice([0, 30, 60]),
+            "complexity": rng.choice([None, 1.2, 2.0, 2.8, 3.5, 4.2]),
+            "average_rating": rng.choice([None, 6.1, 7.0, 7.8, 8.4]),
+            "min_age": rng.choice([None, 8, 10, 12, 14]),
+            "mana_meeple_category": rng.choice(CATEGORIES),
+            "designers": [rng.choice(["Alice Smith", "Bob Jones", "Carol White", "Dan Brown"])],
+            "description": f"A game about {rng.choice(WORDS).lower()}s and {rng.choice(WORDS).lower()}s.",
+            "nz_designer": i % 25 == 0,
+            "is_cooperative": i % 7 == 0,
+            "status": "OWNED" if i % 10 else rng.choice(["BUY_LIST", "WISHLIST"]),
+            "is_expansion": False,
+            "date_added": now - timedelta(days=rng.randint(0, 1000)),
+            "created_at": now,
+        })
+    session.execute(insert(Game), rows)
+    session.commit()
+
+
+def time_ms(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+def run(size: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        seed(session, size)
+
+        catalogue = CatalogueEngine(enabled=True, max_age_seconds=0)
+        started = time.perf_counter()
+        catalogue.load(session)
+        load_ms = (time.perf_counter() - started) * 1000
+
+        service = GameService(session)
+        print(f"\n=== {size:,} games (engine load {load_ms:.0f}ms) ===")
+        print(f"{'query':<26}{'sql p50':>10}{'engine p50':>12}{'speedup':>9}  (ms, max in brackets)")
+
+        for label, params in QUERIES:
+            game_service_module.catalogue_engine = CatalogueEngine(enabled=False)
+            sql_p50, sql_max = time_ms(lambda: service.get_filtered_games(**params), repeat)
+
+            game_service_module.catalogue_engine = catalogue
+            engine_p50, engine_max = time_ms(lambda: service.get_filtered_games(**params), repeat)
+
+            speedup = sql_p50 / engine_p50 if engine_p50 else float("inf")
+            print(
+                f"{label:<26}{sql_p50:>7.2f} [{sql_max:>5.1f}]"
+                f"{engine_p50:>7.2f} [{engine_max:>5.1f}]{speedup:>7.1f}x"
+            )
+
+        session.close()
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark event-loop latency while serving concurrent catalogue queries
+through the synchronous Session path and the AsyncSession path.
+
+A ticker coroutine sleeps in short intervals and records how late it wakes
+up. Blocking database calls inside async handlers show up directly as ticker
+lag: every other request on the worker waits that long too.
+
+Usage:
+    python scripts/benchmark_event_loop_latency.py [--games 20000] [--concurrency 50] [--requests 400]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import Base
+from scripts.benchmark_catalogue_engine import QUERIES, seed
+from services import AsyncGameService, GameService
+
+TICK_SECONDS = 0.005
+
+
+async def ticker(lags: list, stop: asyncio.Event) -> None:
+    """Record how late each short sleep wakes up (milliseconds)"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append((loop.time() - started - TICK_SECONDS) * 1000)
+
+
+async def run_load(handler, concurrency: int, requests: int):
+    """Fire requests through handler with bounded concurrency, measuring loop lag"""
+    lags, stop = [], asyncio.Event()
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int):
+        async with semaphore:
+            started = time.perf_counter()
+            await handler(QUERIES[i % len(QUERIES)][1])
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    tick_task = asyncio.create_task(ticker(lags, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await tick_task
+    return lags, latencies, elapsed
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))] if ordered else 0.0
+
+
+def report(label: str, lags: list, latencies: list, elapsed: float, requests: int) -> None:
+    print(
+        f"{label:<8}{percentile(lags, 0.5):>9.2f}{percentile(lags, 0.99):>9.2f}"
+        f"{max(lags, default=0.0):>9.1f}{statistics.median(latencies):>11.1f}"
+        f"{requests / elapsed:>10.0f}"
+    )
+
+
+async def main_async(args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+        with SessionLocal() as session:
+            seed(session, args.games)
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+        async def sync_handler(params):
+            # What the routers did before: a blocking query inside async def
+            with SessionLocal() as session:
+                GameService(session).get_filtered_games(**params)
+
+        async def async_handler(params):
+            async with AsyncSessionLocal() as session:
+                await AsyncGameService(session).get_filtered_games(**params)
+
+        print(
+            f"{args.games:,} games, {args.requests} requests, concurrency {args.concurrency}"
+            f" (loop lag in ms over {TICK_SECONDS * 1000:.0f}ms ticks)"
+        )
+        print(f"{'path':<8}{'lag p50':>9}{'lag p99':>9}{'lag max':>9}{'req p50':>11}{'req/s':>10}")
+        for label, handler in (("sync", sync_handler), ("async", async_handler)):
+            lags, latencies, elapsed = await run_load(handler, args.concurrency, args.requests)
+            report(label, lags, latencies, elapsed, args.requests)
+
+        await async_engine.dispose()
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=400)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
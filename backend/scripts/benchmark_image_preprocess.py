@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark time and peak memory of preparing large images for Cloudinary upload.
+
+Runs a fixture set of large JPEG and PNG images (generated into a temporary
+directory, or --fixtures to keep and reuse them) through:
+- full: the previous preprocessing - full decode, uncompressed PNG re-encode
+  to measure the size, then the resize/quality loop on the full-size image
+- reduced: utils.image_preprocess.shrink_image - size from the header, JPEG
+  draft decoding and Image.reduce before the final resize
+
+Each image and mode runs in a fresh process so peak RSS (ru_maxrss) is not
+shared.
+
+Usage:
+    python scripts/benchmark_image_preprocess.py [--fixtures DIR] [--max-pixels 50000000]
+"""
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# name, size, format, mode
+FIXTURES = [
+    ("photo-6000x4000.jpg", (6000, 4000), "JPEG", "RGB"),
+    ("photo-4000x4000.jpg", (4000, 4000), "JPEG", "RGB"),
+    ("scan-8000x6000.jpg", (8000, 6000), "JPEG", "RGB"),
+    ("art-3000x3000.png", (3000, 3000), "PNG", "RGB"),
+    ("art-4000x3000-alpha.png", (4000, 3000), "PNG", "RGBA"),
+]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_fixtures(directory: str) -> None:
+    """Photo-like images: smooth gradients plus grain, so they compress realistically"""
+    from PIL import Image
+
+    for name, size, format, mode in FIXTURES:
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            continue
+        gradient = Image.linear_gradient("L").resize(size)
+        bands = [
+            gradient,
+            gradient.rotate(90).resize(size),
+            Image.blend(gradient, Image.effect_noise(size, 40), 0.3),
+        ]
+        if mode == "RGBA":
+            bands.append(gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT))
+        image = Image.merge(mode, bands)
+        options = {"quality": 92} if format == "JPEG" else {}
+        image.save(path, format=format, **options)
+        print(f"  wrote {name} ({os.path.getsize(path) / (1024 * 1024):.1f} MB)")
+
+
+def full_decode(data: bytes, max_bytes: int):
+    """The previous preprocessing, condensed"""
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    test_output = io.BytesIO()
+    image.save(test_output, format="PNG", compress_level=0)
+    uncompressed = len(test_output.getvalue())
+    if len(data) <= max_bytes and uncompressed <= max_bytes:
+        return data
+    if image.mode == "P":
+        image = image.convert("RGBA")
+    elif image.mode not in ("RGB", "RGBA", "L", "LA"):
+        image = image.convert("RGB")
+    for max_dimension in (1200, 1000, 800, 600, 400):
+        test_image = image.copy()
+        if max(test_image.size) > max_dimension:
+            ratio = max_dimension / max(test_image.size)
+            new_size = tuple(int(dim * ratio) for dim in test_image.size)
+            test_image = test_image.resize(new_size, Image.Resampling.LANCZOS)
+        for quality in (90, 85, 80, 75, 70, 65):
+            output = io.BytesIO()
+            test_image.save(output, format="WEBP", quality=quality, method=6)
+            output_bytes = output.getvalue()
+            test_output = io.BytesIO()
+            Image.open(io.BytesIO(output_bytes)).save(test_output, format="PNG", compress_level=0)
+            if len(output_bytes) <= max_bytes and len(test_output.getvalue()) <= max_bytes:
+                return output_bytes
+    return None
+
+
+def run_child(mode: str, path: str, max_pixels: int) -> dict:
+    from utils.image_preprocess import MAX_UPLOAD_BYTES, PixelBudgetExceededError, shrink_image
+
+    with open(path, "rb") as f:
+        data = f.read()
+    baseline = peak_rss_mb()
+    started = time.perf_counter()
+    decoded = None
+    try:
+        if mode == "full":
+            output = full_decode(data, MAX_UPLOAD_BYTES)
+        else:
+            prepared = shrink_image(data, MAX_UPLOAD_BYTES, max_pixels)
+            output = prepared.data if prepared else None
+            decoded = prepared.decoded_pixels if prepared else None
+        outcome = f"{len(output) / 1024:.0f} KB" if output else "too large"
+    except PixelBudgetExceededError:
+        outcome = "over budget"
+    elapsed = time.perf_counter() - started
+    return {"baseline_mb": baseline, "peak_mb": peak_rss_mb(), "seconds": elapsed,
+            "outcome": outcome, "decoded": decoded}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fixtures", help="directory for the fixture images (kept between runs)")
+    parser.add_argument("--max-pixels", type=int, default=50_000_000, help="per-image pixel budget")
+    parser.add_argument("--child", choices=("full", "reduced"), help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    parser.add_argument("--make-fixtures", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.make_fixtures:
+        make_fixtures(args.fixtures)
+        return
+    if args.child:
+        print(json.dumps(run_child(args.child, args.path, args.max_pixels)))
+        return
+
+    temporary = None
+    if args.fixtures:
+        os.makedirs(args.fixtures, exist_ok=True)
+        directory = args.fixtures
+    else:
+        temporary = tempfile.TemporaryDirectory(prefix="image-preprocess-bench-")
+        directory = temporary.name
+    print("Fixtures:")
+    # In a child process too: peak RSS carries over into processes started afterwards
+    subprocess.run([sys.executable, os.path.abspath(__file__), "--make-fixtures", "--fixtures", directory],
+                   check=True)
+
+    print(f"\n{'image':<25}{'mode':<9}{'RSS before':>12}{'peak RSS':>10}{'growth':>9}"
+          f"{'seconds':>9}  result")
+    for name, _, _, _ in FIXTURES:
+        for mode in ("full", "reduced"):
+            command = [sys.executable, os.path.abspath(__file__), "--child", mode,
+                       "--path", os.path.join(directory, name), "--max-pixels", str(args.max_pixels)]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            decoded = f" ({result['decoded'] / 1e6:.1f} MP decoded)" if result["decoded"] else ""
+            print(
+                f"{name:<25}{mode:<9}{result['baseline_mb']:>10.0f}MB{result['peak_mb']:>8.0f}MB"
+                f"{result['peak_mb'] - result['baseline_mb']:>7.0f}MB{result['seconds']:>9.2f}"
+                f"  {result['outcome']}{decoded}"
+            )
+
+    if temporary is not None:
+        temporary.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark peak memory of the direct image proxy with buffered and streamed
+downloads.
+
+Proxies N concurrent large images from a fake upstream (httpx MockTransport,
+delivered in network-sized chunks) and relays each to a slow client:
+- buffered: ImageService.proxy_image, the whole image held until it is sent
+- streaming: ImageService.stream_image, one chunk at a time (optionally
+  written to the disk cache on the way, as the image proxy does)
+
+Each mode runs in a fresh process so peak RSS (ru_maxrss) is not shared.
+
+Usage:
+    python scripts/benchmark_image_proxy_memory.py [--images 50] [--size-mb 8] [--disk-cache]
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+NETWORK_CHUNK = 64 * 1024
+CLIENT_CHUNK = 64 * 1024
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def fake_upstream(size: int):
+    """httpx client serving size-byte images in network-sized chunks"""
+    import httpx
+
+    block = os.urandom(NETWORK_CHUNK)
+
+    async def body():
+        sent = 0
+        while sent < size:
+            chunk = block[: min(NETWORK_CHUNK, size - sent)]
+            sent += len(chunk)
+            await asyncio.sleep(0)
+            yield chunk
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            content=body(),
+            headers={"content-type": "image/jpeg", "content-length": str(size)},
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def slow_send(chunk: bytes) -> None:
+    """A client reading at a modest pace: relayed bytes sit in memory meanwhile"""
+    await asyncio.sleep(0.001)
+
+
+async def run_child(mode: str, images: int, size: int, disk_cache: bool) -> dict:
+    from services.image_service import ImageService
+
+    client = fake_upstream(size)
+    service = ImageService(db=None, http_client=client)
+    cache, cache_dir = None, None
+    if disk_cache:
+        from services.image_disk_cache import ImageDiskCache
+        cache_dir = tempfile.TemporaryDirectory(prefix="image-cache-bench-")
+        cache = ImageDiskCache(directory=cache_dir.name, max_bytes=images * size * 2)
+
+    async def buffered(i: int) -> int:
+        content, _, _ = await service.proxy_image(f"https://cf.geekdo-images.com/{i}.jpg")
+        if cache is not None:
+            await asyncio.to_thread(cache.put, f"https://cf.geekdo-images.com/{i}.jpg", content, "image/jpeg")
+        for start in range(0, len(content), CLIENT_CHUNK):
+            await slow_send(content[start:start + CLIENT_CHUNK])
+        return len(content)
+
+    async def streaming(i: int) -> int:
+        url = f"https://cf.geekdo-images.com/{i}.jpg"
+        stream = await service.stream_image(url, max_bytes=size, chunk_size=CLIENT_CHUNK)
+        writer = await asyncio.to_thread(cache.writer, url, stream.content_type) if cache else None
+        sent = 0
+        try:
+            async for chunk in stream.iter_chunks():
+                if writer is not None:
+                    await asyncio.to_thread(writer.write, chunk)
+                await slow_send(chunk)
+                sent += len(chunk)
+            if writer is not None:
+                await asyncio.to_thread(writer.commit)
+        finally:
+            await stream.aclose()
+        return sent
+
+    handler = buffered if mode == "buffered" else streaming
+    baseline = peak_rss_mb()
+    started = time.perf_counter()
+    sent = await asyncio.gather(*(handler(i) for i in range(images)))
+    elapsed = time.perf_counter() - started
+    await client.aclose()
+    if cache is not None:
+        cache.close()
+        cache_dir.cleanup()
+    assert all(n == size for n in sent)
+    return {"baseline_mb": baseline, "peak_mb": peak_rss_mb(), "seconds": elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--images", type=int, default=50)
+    parser.add_argument("--size-mb", type=float, default=8)
+    parser.add_argument("--disk-cache", action="store_true", help="also write images to a temporary disk cache")
+    parser.add_argument("--child", choices=("buffered", "streaming"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    size = int(args.size_mb * 1024 * 1024)
+
+    if args.child:
+        result = asyncio.run(run_child(args.child, args.images, size, args.disk_cache))
+        print(json.dumps(result))
+        return
+
+    print(f"{args.images} concurrent {args.size_mb:g} MB images"
+          f"{' (with disk cache)' if args.disk_cache else ''}")
+    print(f"{'mode':<11}{'RSS before':>12}{'peak RSS':>10}{'growth':>9}{'seconds':>9}")
+    for mode in ("buffered", "streaming"):
+        command = [sys.executable, os.path.abspath(__file__), "--child", mode,
+                   "--images", str(args.images), "--size-mb", str(args.size_mb)]
+        if args.disk_cache:
+            command.append("--disk-cache")
+        output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{mode:<11}{result['baseline_mb']:>10.0f}MB{result['peak_mb']:>8.0f}MB"
+            f"{result['peak_mb'] - result['baseline_mb']:>7.0f}MB{result['seconds']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark list-page serialization: per-request schema validation versus
+pre-serialized per-game fragments (services/list_item_fragments.py).
+
+Seeds a throwaway SQLite database, loads pages of games and times building
+the /api/public/games response body three ways:
+- schema: GameListItemResponse.model_validate + model_dump + FastAPI JSON encoding
+- fragments (cold): fragment cache empty, every row serialized once
+- fragments (warm): every fragment cached, the page is a byte join
+
+Usage:
+    python scripts/benchmark_list_serialization.py [--page-sizes 24 200 1000] [--repeat 200]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, Game
+from schemas import GameListItemResponse
+from scripts.benchmark_catalogue_engine import seed
+from services.list_item_fragments import ListItemFragmentCache, dumps_json
+
+
+def schema_body(games) -> bytes:
+    items = [GameListItemResponse.model_validate(game).model_dump() for game in games]
+    content = {"total": len(games), "page": 1, "page_size": len(games), "items": items}
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def fragment_body(cache: ListItemFragmentCache, games) -> bytes:
+    envelope = {"total": len(games), "page": 1, "page_size": len(games)}
+    return dumps_json(envelope)[:-1] + b',"items":' + cache.render(games).encode() + b"}"
+
+
+def percentiles(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[24, 200, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        seed(session, max(args.page_sizes))
+
+        print(f"{'page_size':<11}{'path':<18}{'p50 ms':>9}{'p99 ms':>9}")
+        for page_size in args.page_sizes:
+            games = session.execute(select(Game).limit(page_size)).scalars().all()
+
+            def cold():
+                fragment_body(ListItemFragmentCache(), games)
+
+            warm_cache = ListItemFragmentCache()
+            fragment_body(warm_cache, games)
+
+            for label, fn in (
+                ("schema", lambda: schema_body(games)),
+                ("fragments (cold)", cold),
+                ("fragments (warm)", lambda: fragment_body(warm_cache, games)),
+            ):
+                p50, p99 = percentiles(fn, args.repeat)
+                print(f"{page_size:<11}{label:<18}{p50:>9.3f}{p99:>9.3f}")
+
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Check Effective Player Ranges
+=============================
+
+Consistency check for the materialized expansion-aware player range
+(boardgames.effective_players_min/max) behind the public players filter.
+GameService keeps it current on every write; this job finds games whose
+stored range differs from a fresh computation - e.g. after rows were edited
+directly in the database - and optionally recomputes them.
+
+Usage:
+    python backend/scripts/check_effective_players.py [--fix]
+
+Options:
+    --fix    Recompute the stale rows (otherwise only report them)
+
+Exits with status 1 when stale rows remain, so it can run as a scheduled check.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Ensure we're running from the correct directory
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+os.chdir(backend_dir)
+
+# Add backend directory to path for imports
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from database import get_db
+from services.catalogue_events import OP_UPDATE, notify_catalogue_change
+from services.game_service import GameService
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def check_effective_players(fix: bool = False) -> int:
+    """
+    Report (and with fix, recompute) games with a stale effective player range.
+
+    Returns:
+        Number of stale games left in the database
+    """
+    db = next(get_db())
+    try:
+        service = GameService(db)
+        stale_ids = service.find_stale_effective_players()
+        if not stale_ids:
+            logger.info("All effective player ranges are consistent")
+            return 0
+
+        logger.warning(f"{len(stale_ids)} game(s) with a stale effective player range: {stale_ids}")
+        if not fix:
+            return len(stale_ids)
+
+        service.refresh_effective_players(stale_ids)
+        db.commit()
+        notify_catalogue_change(db, stale_ids, OP_UPDATE)
+        remaining = service.find_stale_effective_players()
+        logger.info(f"Recomputed {len(stale_ids)} game(s), {len(remaining)} still stale")
+        return len(remaining)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check materialized effective player ranges")
+    parser.add_argument("--fix", action="store_true", help="Recompute stale rows")
+    args = parser.parse_args()
+    sys.exit(1 if check_effective_players(fix=args.fix) else 0)
+
+
+if __name__ == "__main__":
+    main()
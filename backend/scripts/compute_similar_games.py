@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Compute Similar Games
+=====================
+
+Rebuilds the precomputed "if you liked this" lists (game_similarities) for
+the whole public catalogue. BGG imports keep them current incrementally; run
+this after the initial migration, after bulk edits made directly in the
+database, or after changing the feature weights in services/similar_games.py.
+
+Usage:
+    python backend/scripts/compute_similar_games.py [--top-k N]
+
+Options:
+    --top-k N    Neighbours stored per game (default: SIMILAR_GAMES_TOP_K)
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+# Ensure we're running from the correct directory
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+os.chdir(backend_dir)
+
+# Add backend directory to path for imports
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from config import SIMILAR_GAMES_TOP_K
+from database import get_db
+from services.similar_games import recompute_all_similar_games
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def compute_similar_games(top_k: int = SIMILAR_GAMES_TOP_K) -> int:
+    """
+    Recompute every game's similar-games list.
+
+    Returns:
+        Number of games with a computed list
+    """
+    db = next(get_db())
+    try:
+        started = time.monotonic()
+        count = recompute_all_similar_games(db, top_k)
+        db.commit()
+        logger.info(
+            f"Computed top-{top_k} similar games for {count} game(s) "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+        return count
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute precomputed similar-games lists")
+    parser.add_argument(
+        "--top-k", type=int, default=SIMILAR_GAMES_TOP_K, help="Neighbours stored per game"
+    )
+    args = parser.parse_args()
+    if args.top_k < 1:
+        parser.error("--top-k must be at least 1")
+    compute_similar_games(args.top_k)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Business logic services layer.
 Separates business logic from HTTP routing concerns.
 """
 
+from .async_game_service import AsyncGameService
 from .game_service import GameService
 from .image_service import ImageService
 
@@ -11,6 +12,7 @@ from .image_service import ImageService
 # Import directly from services.background_tasks where needed
 
 __all__ = [
+    "AsyncGameService",
     "GameService",
     "ImageService",
 ]
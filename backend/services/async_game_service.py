@@ -0,0 +1,140 @@
+# services/async_game_service.py
+"""
+Async read path for game queries.
+Mirrors the GameService read methods on an AsyncSession so the async def
+routers await the database instead of blocking the event loop.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from models import Game
+from services.catalogue_engine import catalogue_engine
+from services.game_detail_cache import detail_row_version
+from services.game_service import GameService
+
+
+class AsyncGameService:
+    """
+    Async counterpart of GameService's read methods.
+
+    Simple lookups build their statements with GameService's shared helpers
+    and await them directly. The catalogue queries (filters, keyset pages,
+    category counts) run the existing GameService implementation through
+    AsyncSession.run_sync, so they share one code path - including the
+    in-memory catalogue engine - with the synchronous service.
+
+    Relationships are never lazy-loaded on an AsyncSession, so every method
+    eager-loads whatever its callers serialize (sleeves for game_to_dict,
+    expansions/base_game for GameDetailResponse).
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_game_by_id(self, game_id: int, with_sleeves: bool = False) -> Optional[Game]:
+        """
+        Get a single game by ID with expansions and base_game loaded.
+
+        Args:
+            game_id: The game's database ID
+            with_sleeves: Also load sleeves (needed by game_to_dict)
+
+        Returns:
+            Game object or None if not found
+        """
+        stmt = GameService._game_by_id_stmt(game_id)
+        if with_sleeves:
+            stmt = stmt.options(selectinload(Game.sleeves))
+        return (await self.db.execute(stmt)).scalar_one_or_none()
+
+    async def get_games_by_ids(self, game_ids: List[int]) -> List[Game]:
+        """Several games by ID with expansions and base_game loaded, in game_ids order"""
+        if not game_ids:
+            return []
+        result = await self.db.execute(GameService._games_by_ids_stmt(game_ids))
+        id_order = {id_: idx for idx, id_ in enumerate(game_ids)}
+        return sorted(result.scalars().all(), key=lambda g: id_order[g.id])
+
+    async def get_detail_versions(self, game_ids: List[int]) -> Dict[int, Optional[str]]:
+        """Async GameService.get_detail_versions"""
+        if not game_ids:
+            return {}
+        result = await self.db.execute(GameService._detail_versions_stmt(game_ids))
+        return {row.id: detail_row_version(*row[1:]) for row in result}
+
+    async def get_game_by_bgg_id(self, bgg_id: int) -> Optional[Game]:
+        """Get a game by BoardGameGeek ID"""
+        result = await self.db.execute(select(Game).where(Game.bgg_id == bgg_id))
+        return result.scalar_one_or_none()
+
+    async def get_all_games(self) -> List[Game]:
+        """Get all OWNED games for the admin view (sleeves loaded)"""
+        result = await self.db.execute(GameService._all_games_stmt())
+        return list(result.scalars().all())
+
+    async def get_games_by_designer(self, designer_name: str) -> List[Game]:
+        """Get all OWNED games by a designer (sleeves loaded)"""
+        stmt = GameService._games_by_designer_stmt(designer_name).options(
+            selectinload(Game.sleeves)
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def get_quick_pick_candidates(self, quick_pick: str) -> List[Game]:
+        """Async GameService.get_quick_pick_candidates (sleeves loaded)"""
+        stmt = GameService._quick_pick_candidates_stmt(quick_pick)
+        if stmt is None:
+            return []
+        stmt = stmt.options(selectinload(Game.sleeves))
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def get_category_counts(self) -> Dict[str, int]:
+        """Async GameService.get_category_counts"""
+        return await self.db.run_sync(lambda session: GameService(session).get_category_counts())
+
+    async def get_facet_counts(self, **filters) -> Dict[str, Any]:
+        """Async GameService.get_facet_counts (same keyword arguments)"""
+        return await self.db.run_sync(
+            lambda session: GameService(session).get_facet_counts(**filters)
+        )
+
+    async def get_similar_games(self, game_id: int, limit: int) -> Optional[List[Game]]:
+        """Async GameService.get_similar_games"""
+        return await self.db.run_sync(
+            lambda session: GameService(session).get_similar_games(game_id, limit)
+        )
+
+    async def get_catalogue_changes(self, since, limit: int):
+        """Async GameService.get_catalogue_changes"""
+        return await self.db.run_sync(
+            lambda session: GameService(session).get_catalogue_changes(since, limit)
+        )
+
+    async def get_filtered_games(self, **filters) -> Tuple[List[Game], int]:
+        """
+        Async GameService.get_filtered_games (same keyword arguments).
+
+        Returns:
+            Tuple of (list of games, total count)
+        """
+        if catalogue_engine.available:
+            # One reload for all concurrent requests, not one per request
+            await catalogue_engine.ensure_loaded_async(self.db)
+        return await self.db.run_sync(
+            lambda session: GameService(session).get_filtered_games(**filters)
+        )
+
+    async def get_filtered_games_keyset(
+        self, **filters
+    ) -> Tuple[List[Game], Optional[str], Optional[int]]:
+        """
+        Async GameService.get_filtered_games_keyset (same keyword arguments).
+
+        Returns:
+            Tuple of (games on this page, next cursor or None, total or None)
+        """
+        return await self.db.run_sync(
+            lambda session: GameService(session).get_filtered_games_keyset(**filters)
+        )
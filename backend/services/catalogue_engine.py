@@ -0,0 +1,529 @@
+# services/catalogue_engine.py
+"""
+In-memory columnar catalogue engine.
+
+Holds the filter/sort columns for every game as NumPy arrays so that
+GameService.get_filtered_games can answer the public catalogue query with
+vectorized boolean masks and a single lexsort instead of a database round
+trip. The database remains the source of truth: the engine only ever
+returns an ordered page of game IDs plus the total, and GameService loads the
+full Game rows for that page as before.
+
+Freshness:
+- GameService notifies the engine (via services.catalogue_events) after it
+  commits a create/update/delete, and the affected rows are re-read and
+  patched in place.
+- The snapshot remembers the catalogue version it reflects (as
+  services.suggest does); a version bumped by anyone else (another worker, a
+  bulk import) triggers a full reload on the next query. Without Redis the
+  version only counts this worker's writes, so the snapshot is then also
+  reloaded once older than CATALOGUE_ENGINE_MAX_AGE_SECONDS.
+
+Semantics deliberately mirror the SQL path (NULL handling, entity name matching,
+nulls-last ordering, title -> id tie-breaks) so both produce identical pages.
+Full-text search (?q=) uses the same in-process services.search.SearchIndex
+scoring as the SQL path on SQLite.
+Title ordering uses code-point order, matching SQLite's default BINARY
+collation.
+
+NumPy is optional: when it is not installed the engine reports itself as
+unavailable and GameService keeps using SQL.
+"""
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from config import CATALOGUE_ENGINE_ENABLED, CATALOGUE_ENGINE_MAX_AGE_SECONDS
+from models import Game, QUICK_PICK_KEYS, entity_key
+from services.catalogue_events import OP_DELETE, register_listener
+from services.catalogue_version import catalogue_version
+from services.search import SearchIndex, search_fields
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Columns loaded into the engine (never the full ORM object)
+_ENGINE_COLUMNS = (
+    Game.id,
+    Game.title,
+    Game.description,
+    Game.designers,
+    Game.mechanics,
+    Game.publishers,
+    Game.status,
+    Game.is_expansion,
+    Game.expansion_type,
+    Game.effective_players_min,
+    Game.effective_players_max,
+    Game.playtime_min,
+    Game.playtime_max,
+    Game.year,
+    Game.average_rating,
+    Game.complexity,
+    Game.date_added,
+    Game.mana_meeple_category,
+    Game.nz_designer,
+    *(getattr(Game, f"quick_pick_{key}") for key in QUICK_PICK_KEYS),
+)
+
+# Entity filters (designer=, mechanic=, publisher=) and the JSON column each reads
+_FILTER_ENTITY_COLUMNS = {"designers": "designer", "mechanics": "mechanic", "publishers": "publisher"}
+
+# Tri-state encoding for nullable booleans (SQL "col == x" never matches NULL)
+_BOOL_NULL = -1
+
+_INITIAL_CAPACITY = 256
+
+
+def _to_float(value: Any) -> float:
+    """Convert a nullable number to float, using NaN for NULL"""
+    return float("nan") if value is None else float(value)
+
+
+def _to_epoch(value: Optional[datetime]) -> float:
+    """Convert a datetime to epoch seconds (naive values are treated as UTC)"""
+    if value is None:
+        return float("nan")
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _to_tristate(value: Optional[bool]) -> int:
+    return _BOOL_NULL if value is None else int(bool(value))
+
+
+def _entity_keys(row: Any) -> frozenset:
+    """(kind, entity_key) pairs of a row's filterable entities, as in bgg_entities"""
+    keys = set()
+    for column, kind in _FILTER_ENTITY_COLUMNS.items():
+        values = getattr(row, column)
+        if not isinstance(values, (list, tuple)):
+            continue
+        keys.update(
+            (kind, entity_key(value))
+            for value in values
+            if isinstance(value, str) and value.strip()
+        )
+    return frozenset(keys)
+
+
+class CatalogueEngine:
+    """
+    Columnar snapshot of the game catalogue answering filtered/sorted/paged
+    ID queries in memory.
+
+    Thread-safe: sync FastAPI endpoints run in a threadpool, so all access to
+    the column arrays is serialized with an RLock. The lock is never held
+    across a database read: callers entering through AsyncSession.run_sync
+    share the event loop's thread, so the RLock would let them re-enter while
+    a read had yielded. Async callers coalesce reloads on an asyncio.Lock
+    instead (ensure_loaded_async).
+    """
+
+    def __init__(self, enabled: bool = False, max_age_seconds: int = 300):
+        self.enabled = enabled
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._loaded_at = 0.0
+        self._version: Optional[int] = None  # Catalogue version the snapshot reflects
+        self._load_lock = asyncio.Lock()
+        self._size = 0
+        self._index: Dict[int, int] = {}  # game id -> row index
+        self._cols: Dict[str, Any] = {}
+        self._titles: List[str] = []
+        self._search = SearchIndex()
+        self._entity_keys: List[frozenset] = []
+        # Title sort rank, rebuilt lazily after writes
+        self._title_rank = None
+        self.stats = {"full_loads": 0, "incremental_updates": 0, "queries": 0}
+
+    @property
+    def available(self) -> bool:
+        """True when the engine is enabled and NumPy is importable"""
+        return self.enabled and np is not None
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _allocate(self, capacity: int) -> None:
+        self._cols = {
+            "id": np.zeros(capacity, dtype=np.int64),
+            "public": np.zeros(capacity, dtype=bool),
+            "effective_players_min": np.full(capacity, np.nan),
+            "effective_players_max": np.full(capacity, np.nan),
+            "playtime_min": np.full(capacity, np.nan),
+            "playtime_max": np.full(capacity, np.nan),
+            "year": np.full(capacity, np.nan),
+            "rating": np.full(capacity, np.nan),
+            "complexity": np.full(capacity, np.nan),
+            "date_added": np.full(capacity, np.nan),
+            "category": np.zeros(capacity, dtype=object),
+            "nz_designer": np.full(capacity, _BOOL_NULL, dtype=np.int8),
+        }
+        for key in QUICK_PICK_KEYS:
+            self._cols[f"quick_pick_{key}"] = np.zeros(capacity, dtype=bool)
+        self._cols["category"][:] = None
+
+    def _grow(self) -> None:
+        capacity = max(_INITIAL_CAPACITY, len(self._cols["id"]) * 2)
+        old = self._cols
+        self._allocate(capacity)
+        for name, array in old.items():
+            self._cols[name][: self._size] = array[: self._size]
+
+    def _invalidate_derived(self) -> None:
+        """Drop structures derived from the columns (rebuilt lazily on next query)"""
+        self._title_rank = None
+
+    def _write_row(self, idx: int, row: Any) -> None:
+        """Write one result row (from _ENGINE_COLUMNS) into row slot idx"""
+        c = self._cols
+        c["id"][idx] = row.id
+        c["public"][idx] = (row.status == "OWNED" or row.status is None) and not (
+            row.is_expansion is True and row.expansion_type == "requires_base"
+        )
+        c["effective_players_min"][idx] = _to_float(row.effective_players_min)
+        c["effective_players_max"][idx] = _to_float(row.effective_players_max)
+        c["playtime_min"][idx] = _to_float(row.playtime_min)
+        c["playtime_max"][idx] = _to_float(row.playtime_max)
+        c["year"][idx] = _to_float(row.year)
+        c["rating"][idx] = _to_float(row.average_rating)
+        c["complexity"][idx] = _to_float(row.complexity)
+        c["date_added"][idx] = _to_epoch(row.date_added)
+        c["category"][idx] = row.mana_meeple_category
+        c["nz_designer"][idx] = _to_tristate(row.nz_designer)
+        for key in QUICK_PICK_KEYS:
+            c[f"quick_pick_{key}"][idx] = getattr(row, f"quick_pick_{key}") is True
+
+        title = row.title or ""
+        entity_keys = _entity_keys(row)
+        if idx == len(self._titles):
+            self._titles.append(title)
+            self._entity_keys.append(entity_keys)
+        else:
+            self._titles[idx] = title
+            self._entity_keys[idx] = entity_keys
+        self._search.add(row.id, search_fields(row))
+
+    def _clear_row(self, idx: int) -> None:
+        self._cols["public"][idx] = False
+        self._search.remove(int(self._cols["id"][idx]))
+        self._entity_keys[idx] = frozenset()
+
+    def load(self, db: Session, version: Optional[int] = None) -> None:
+        """Load (or reload) the full snapshot from the database"""
+        if np is None:
+            return
+        # Read before the rows: a write committed meanwhile leaves the
+        # snapshot on the older version, so the next query loads again
+        if version is None:
+            version = catalogue_version.current()
+        started = time.perf_counter()
+        rows = db.execute(select(*_ENGINE_COLUMNS).order_by(Game.id)).all()
+
+        with self._lock:
+            self._size = 0
+            self._index = {}
+            self._titles = []
+            self._search.clear()
+            self._entity_keys = []
+            self._allocate(max(_INITIAL_CAPACITY, len(rows)))
+            for row in rows:
+                self._write_row(self._size, row)
+                self._index[row.id] = self._size
+                self._size += 1
+            self._invalidate_derived()
+            self._loaded = True
+            self._loaded_at = time.monotonic()
+            self._version = version
+            self.stats["full_loads"] += 1
+
+        logger.info(
+            f"Catalogue engine loaded {len(rows)} games in "
+            f"{(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+
+    def needs_load(self, version: int) -> bool:
+        """True when the snapshot does not reflect catalogue version `version`"""
+        with self._lock:
+            if not self._loaded or self._version != version:
+                return True
+            # A per-worker version misses other workers' writes
+            return (
+                self.max_age_seconds > 0
+                and not catalogue_version.shared
+                and time.monotonic() - self._loaded_at > self.max_age_seconds
+            )
+
+    def ensure_loaded(self, db: Session) -> None:
+        """Load on first use and reload once the catalogue version has moved on"""
+        version = catalogue_version.current()
+        if self.needs_load(version):
+            self.load(db, version)
+
+    async def ensure_loaded_async(self, db: AsyncSession) -> None:
+        """ensure_loaded for async callers: concurrent requests share one reload"""
+        version = catalogue_version.current()
+        if not self.needs_load(version):
+            return
+        async with self._load_lock:
+            # Loaded by the request this one waited for
+            if self.needs_load(version):
+                await db.run_sync(lambda session: self.load(session, version))
+
+    def reset(self) -> None:
+        """Drop the snapshot; the next query triggers a full load"""
+        with self._lock:
+            self._loaded = False
+            self._version = None
+            self._size = 0
+            self._index = {}
+            self._cols = {}
+            self._titles = []
+            self._search.clear()
+            self._entity_keys = []
+            self._invalidate_derived()
+            self.stats = {"full_loads": 0, "incremental_updates": 0, "queries": 0}
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def apply_changes(self, db: Session, game_ids: Sequence[int], op: str) -> None:
+        """
+        Patch the snapshot for committed changes to the given games.
+
+        Updated/created rows are re-read from the database; IDs that no longer
+        exist (or an explicit delete) are tombstoned.
+        """
+        if np is None:
+            return
+        with self._lock:
+            if not self._loaded:
+                return  # Nothing to patch - first query will do a full load
+            previous = self._version
+
+        ids = list(dict.fromkeys(int(i) for i in game_ids))
+        rows = []
+        if op != OP_DELETE:
+            rows = db.execute(
+                select(*_ENGINE_COLUMNS).where(Game.id.in_(ids))
+            ).all()
+        found = {row.id for row in rows}
+
+        with self._lock:
+            if not self._loaded:
+                return  # Reset meanwhile
+
+            for row in rows:
+                idx = self._index.get(row.id)
+                if idx is None:
+                    if self._size == len(self._cols["id"]):
+                        self._grow()
+                    idx = self._size
+                    self._size += 1
+                    self._index[row.id] = idx
+                self._write_row(idx, row)
+
+            for game_id in ids:
+                if game_id not in found and game_id in self._index:
+                    self._clear_row(self._index.pop(game_id))
+
+            self._invalidate_derived()
+            self.stats["incremental_updates"] += 1
+            # catalogue_version's listener runs first (registered on import,
+            # before ours). Only our own bump in between means the snapshot is
+            # current; anything more is a write from elsewhere, so keep the old
+            # version and let the next query reload.
+            version = catalogue_version.current()
+            if self._version == previous and version == previous + 1:
+                self._version = version
+
+    def on_catalogue_change(self, db: Session, game_ids: List[int], op: str) -> None:
+        """services.catalogue_events listener"""
+        if not self.available:
+            return
+        self.apply_changes(db, game_ids, op)
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def _get_title_rank(self):
+        if self._title_rank is None:
+            titles = np.array(self._titles[: self._size], dtype=str)
+            if len(titles):
+                _, self._title_rank = np.unique(titles, return_inverse=True)
+                self._title_rank = self._title_rank.astype(np.int64)
+            else:
+                self._title_rank = np.zeros(0, dtype=np.int64)
+        return self._title_rank
+
+    def _entity_mask(self, kind: str, name: str):
+        """Rows listing the named entity (exact normalized name, like the SQL join)"""
+        key = (kind, entity_key(name))
+        rows = self._entity_keys[: self._size]
+        return np.fromiter((key in keys for keys in rows), dtype=bool, count=self._size)
+
+    def _quick_pick_mask(self, quick_pick: str):
+        if quick_pick not in QUICK_PICK_KEYS:
+            return None
+        return self._cols[f"quick_pick_{quick_pick}"][: self._size]
+
+    def _sort_keys(self, sort: str, rows, scores: Optional[Dict[int, float]] = None):
+        """
+        Build lexsort keys (least significant first) for the selected rows,
+        mirroring GameService._apply_sorting (and its relevance ordering).
+        """
+        c = self._cols
+        ids = c["id"][rows]
+        title_rank = self._get_title_rank()[rows]
+
+        if sort == "relevance" and scores is not None:
+            relevance = np.fromiter(
+                (scores.get(i, 0.0) for i in ids.tolist()), dtype=float, count=ids.size
+            )
+            return [ids, title_rank, -relevance]
+
+        def nulls_last(values, descending):
+            isnull = np.isnan(values)
+            filled = np.where(isnull, 0.0, -values if descending else values)
+            return [ids, title_rank, filled, isnull]
+
+        if sort == "title_desc":
+            return [ids, -title_rank]
+        if sort in ("year_desc", "year_asc"):
+            return nulls_last(c["year"][rows], sort == "year_desc")
+        if sort in ("date_added_desc", "date_added_asc"):
+            return nulls_last(c["date_added"][rows], sort == "date_added_desc")
+        if sort in ("rating_desc", "rating_asc"):
+            return nulls_last(c["rating"][rows], sort == "rating_desc")
+        if sort in ("time_asc", "time_desc"):
+            pmin = c["playtime_min"][rows]
+            pmax = c["playtime_max"][rows]
+            fallback = 999999.0 if sort == "time_asc" else 0.0
+            avg = np.where(
+                ~np.isnan(pmin) & ~np.isnan(pmax),
+                (pmin + pmax) / 2,  # SQLAlchemy renders true division
+                np.where(~np.isnan(pmin), pmin, np.where(~np.isnan(pmax), pmax, fallback)),
+            )
+            return [ids, title_rank, avg if sort == "time_asc" else -avg]
+        return [ids, title_rank]
+
+    def query(
+        self,
+        search: Optional[str] = None,
+        category: Optional[str] = None,
+        designer: Optional[str] = None,
+        mechanic: Optional[str] = None,
+        publisher: Optional[str] = None,
+        nz_designer: Optional[bool] = None,
+        players: Optional[int] = None,
+        complexity_min: Optional[float] = None,
+        complexity_max: Optional[float] = None,
+        playtime_max_min: Optional[int] = None,
+        playtime_max_max: Optional[int] = None,
+        quick_pick: Optional[str] = None,
+        recently_added_days: Optional[int] = None,
+        sort: str = "title_asc",
+        page: int = 1,
+        page_size: int = 24,
+    ) -> Tuple[List[int], int]:
+        """
+        Run a catalogue query against the snapshot.
+
+        Accepts exactly the same arguments as GameService.get_filtered_games.
+
+        Returns:
+            Tuple of (ordered list of game IDs for the page, total matches)
+        """
+        with self._lock:
+            self.stats["queries"] += 1
+            c = self._cols
+            n = self._size
+            if n == 0:
+                return [], 0
+
+            mask = c["public"][:n].copy()
+
+            scores = None
+            if search and search.strip():
+                scores = self._search.search(search.strip())
+                matched = np.fromiter(scores, dtype=np.int64, count=len(scores))
+                mask &= np.isin(c["id"][:n], matched)
+
+            for kind, name in (("designer", designer), ("mechanic", mechanic), ("publisher", publisher)):
+                if name and name.strip():
+                    mask &= self._entity_mask(kind, name)
+
+            if nz_designer is not None:
+                mask &= c["nz_designer"][:n] == int(bool(nz_designer))
+
+            if players is not None:
+                # Expansion-aware range, materialized on each row by GameService
+                pmin = c["effective_players_min"][:n]
+                pmax = c["effective_players_max"][:n]
+                mask &= (np.isnan(pmin) | (pmin <= players)) & (
+                    np.isnan(pmax) | (pmax >= players)
+                )
+
+            complexity = c["complexity"][:n]
+            if complexity_min is not None:
+                mask &= complexity >= complexity_min
+            if complexity_max is not None:
+                mask &= complexity <= complexity_max
+
+            playtime_max = c["playtime_max"][:n]
+            if playtime_max_min is not None:
+                mask &= playtime_max >= playtime_max_min
+            if playtime_max_max is not None:
+                mask &= playtime_max <= playtime_max_max
+
+            quick_pick_mask = self._quick_pick_mask(quick_pick)
+            if quick_pick_mask is not None:
+                mask &= quick_pick_mask
+
+            if recently_added_days is not None:
+                cutoff = datetime.now(timezone.utc) - timedelta(days=recently_added_days)
+                mask &= c["date_added"][:n] >= cutoff.timestamp()
+
+            if category and category != "all":
+                category_keys = [k.strip() for k in category.split(",") if k.strip()]
+                categories = c["category"][:n]
+                if len(category_keys) == 1 and category_keys[0] == "uncategorized":
+                    mask &= np.array([value is None for value in categories], dtype=bool)
+                elif category_keys:
+                    wanted = set(category_keys)
+                    mask &= np.array([value in wanted for value in categories], dtype=bool)
+
+            rows = np.flatnonzero(mask)
+            total = int(rows.size)
+            offset = (page - 1) * page_size
+            if total == 0 or offset >= total:
+                return [], total
+
+            order = np.lexsort(self._sort_keys(sort, rows, scores))
+            page_rows = rows[order[offset : offset + page_size]]
+            return c["id"][page_rows].tolist(), total
+
+
+# Global engine instance, disabled unless CATALOGUE_ENGINE_ENABLED is set
+catalogue_engine = CatalogueEngine(
+    enabled=CATALOGUE_ENGINE_ENABLED,
+    max_age_seconds=CATALOGUE_ENGINE_MAX_AGE_SECONDS,
+)
+register_listener(catalogue_engine.on_catalogue_change)
@@ -0,0 +1,66 @@
+# services/catalogue_events.py
+"""
+Catalogue change notifications.
+
+GameService (and any other code path that commits changes to games) calls
+notify_catalogue_change() after a successful commit. In-process consumers
+such as the in-memory catalogue engine register a listener here so they can
+refresh incrementally instead of waiting for a TTL to expire.
+"""
+import logging
+from typing import Callable, Iterable, List
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Operation names passed to listeners
+OP_CREATE = "create"
+OP_UPDATE = "update"
+OP_DELETE = "delete"
+
+CatalogueListener = Callable[[Session, List[int], str], None]
+
+_listeners: List[CatalogueListener] = []
+
+
+def register_listener(listener: CatalogueListener) -> None:
+    """
+    Register a callable to be invoked after catalogue changes are committed.
+
+    Args:
+        listener: Callable taking (db session, list of game IDs, operation)
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def unregister_listener(listener: CatalogueListener) -> None:
+    """Remove a previously registered listener (no-op if not registered)"""
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def notify_catalogue_change(db: Session, game_ids: Iterable[int], op: str) -> None:
+    """
+    Notify all listeners that games were created, updated or deleted.
+
+    Must be called AFTER the change has been committed. Listener failures are
+    logged and swallowed - a broken consumer must never fail the write itself.
+
+    Args:
+        db: Session the change was committed on (listeners may read through it)
+        game_ids: IDs of the affected games
+        op: One of OP_CREATE, OP_UPDATE, OP_DELETE
+    """
+    ids = [int(game_id) for game_id in game_ids if game_id is not None]
+    if not ids:
+        return
+
+    for listener in list(_listeners):
+        try:
+            listener(db, ids, op)
+        except Exception as e:
+            logger.warning(
+                f"Catalogue change listener {getattr(listener, '__qualname__', listener)} failed: {e}"
+            )
@@ -0,0 +1,192 @@
+# services/catalogue_stream.py
+"""
+Live catalogue change notifications for server-sent event clients.
+
+Every committed catalogue write (reported through services.catalogue_events)
+becomes one lightweight event per game - {"game_id", "version", "op"} -
+pushed to the /api/public/events subscribers of every worker, so open tabs
+and kiosk displays refetch on change instead of polling.
+
+With Redis each batch is published on a pub/sub channel and every worker
+fans it out to its own subscribers; without Redis only the subscribers of
+the worker that made the write hear it.
+
+Subscribers are asyncio queues owned by their request's event loop, while
+the Redis listener runs on a background thread, so deliveries are handed
+over with call_soon_threadsafe. A subscriber that falls too far behind is
+told to resync (refetch everything) instead of buffering without bound.
+"""
+import asyncio
+import json
+import logging
+import threading
+import uuid
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from config import CATALOGUE_STREAM_MAX_CLIENTS, CATALOGUE_STREAM_QUEUE_SIZE, REDIS_ENABLED
+from services.catalogue_events import register_listener
+from services.catalogue_version import catalogue_version
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "catalogue:changes"
+
+
+class Subscription:
+    """One live client's queue of pending change events"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queued: int):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Dict]" = asyncio.Queue(maxsize=max_queued)
+        self.overflowed = False
+
+    def _put(self, events: List[Dict]) -> None:
+        """Runs on the subscriber's loop"""
+        for event in events:
+            if self.overflowed:
+                return
+            try:
+                self.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.overflowed = True
+
+    def take_overflow(self) -> bool:
+        """True (once) if events were dropped; the queue is emptied so the client starts afresh"""
+        if not self.overflowed:
+            return False
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.overflowed = False
+        return True
+
+    async def next_event(self, timeout: float) -> Optional[Dict]:
+        """The next event, or None if none arrived within timeout"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class CatalogueStream:
+    """Fans catalogue change events out to this worker's live subscribers"""
+
+    def __init__(
+        self,
+        use_redis: bool = REDIS_ENABLED,
+        max_subscribers: int = CATALOGUE_STREAM_MAX_CLIENTS,
+        max_queued: int = CATALOGUE_STREAM_QUEUE_SIZE,
+    ):
+        self.use_redis = use_redis
+        self.max_subscribers = max_subscribers
+        self.max_queued = max_queued
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._worker_id = uuid.uuid4().hex
+        self._listener = None
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        return {"published": 0, "received": 0, "delivered": 0, "rejected": 0}
+
+    def _redis(self):
+        """Return the shared Redis client, or None when disabled or unreachable"""
+        if not self.use_redis:
+            return None
+        from redis_client import get_redis_client
+        client = get_redis_client()
+        return client if client.is_available else None
+
+    def subscribe(self) -> Optional[Subscription]:
+        """
+        Register a subscriber on the running event loop.
+
+        Returns:
+            The subscription, or None when this worker is at max_subscribers
+        """
+        subscription = Subscription(asyncio.get_running_loop(), self.max_queued)
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                self.stats["rejected"] += 1
+                return None
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def _deliver(self, events: List[Dict]) -> None:
+        """Queue events for every local subscriber (safe from any thread)"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._put, events)
+            except RuntimeError:
+                # The subscriber's loop is gone (server shutting down)
+                self.unsubscribe(subscription)
+                continue
+            self.stats["delivered"] += len(events)
+
+    def publish(self, game_ids: List[int], op: str, version: int) -> None:
+        """Send a committed change to the subscribers of every worker"""
+        self.stats["published"] += 1
+        self._deliver([{"game_id": game_id, "version": version, "op": op} for game_id in game_ids])
+
+        client = self._redis()
+        if client is not None:
+            client.publish(
+                CHANNEL,
+                json.dumps({
+                    "origin": self._worker_id,
+                    "game_ids": game_ids,
+                    "op": op,
+                    "version": version,
+                }),
+            )
+
+    def _on_message(self, message: dict) -> None:
+        """Pub/sub handler: fan another worker's change out locally"""
+        try:
+            payload = json.loads(message["data"])
+            game_ids = [int(game_id) for game_id in payload["game_ids"]]
+            op, version = str(payload["op"]), int(payload["version"])
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Ignoring malformed catalogue change message: {message!r}")
+            return
+        if payload.get("origin") == self._worker_id:
+            return
+        self.stats["received"] += 1
+        self._deliver([{"game_id": game_id, "version": version, "op": op} for game_id in game_ids])
+
+    def start_listener(self) -> bool:
+        """Hear other workers' changes (no-op without Redis)"""
+        if self._listener is not None:
+            return True
+        client = self._redis()
+        if client is None:
+            return False
+        self._listener = client.subscribe(CHANNEL, self._on_message)
+        return self._listener is not None
+
+    def stop_listener(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def on_catalogue_change(self, db: Session, game_ids: List[int], op: str) -> None:
+        """
+        services.catalogue_events listener - registered after the catalogue
+        version's, so events carry the version this write produced
+        """
+        self.publish(game_ids, op, catalogue_version.current())
+
+
+catalogue_stream = CatalogueStream()
+register_listener(catalogue_stream.on_catalogue_change)
@@ -0,0 +1,138 @@
+# services/catalogue_version.py
+"""
+Monotonically increasing catalogue version.
+
+Every committed catalogue write (reported through services.catalogue_events)
+bumps the version. Cache keys for catalogue-derived data embed it, so a write
+makes every older cached result unreachable at once - entries never need to
+be hunted down and deleted, and TTLs can be long without serving stale data.
+The version is also exposed to clients (X-Catalogue-Version header and
+/api/public/catalogue-version) so they can tell when to refetch.
+
+With Redis available the version is shared by all workers: bumps are an
+atomic INCR and are broadcast over pub/sub, with a periodic re-read as a
+safety net for missed messages. Without Redis each worker keeps its own
+counter, seeded from the clock so versions are not reused across restarts.
+Such a version only tracks this worker's writes: it still keys this worker's
+own caches (on the short TTL), but is not shared (see `shared`), so catalogue
+responses then carry no ETag - workers would hand out different tags, and a
+tag could validate a copy another worker's write has since changed.
+"""
+import logging
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from config import CATALOGUE_VERSION_SYNC_SECONDS, REDIS_ENABLED
+from services.catalogue_events import register_listener
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = "catalogue:version"
+CHANNEL = "catalogue:version"
+
+
+class CatalogueVersion:
+    """Process-local view of the (possibly shared) catalogue version"""
+
+    def __init__(
+        self,
+        use_redis: bool = REDIS_ENABLED,
+        sync_seconds: float = CATALOGUE_VERSION_SYNC_SECONDS,
+    ):
+        self.use_redis = use_redis
+        self.sync_seconds = sync_seconds
+        self._version: Optional[int] = None
+        self._synced_at = 0.0
+        self._lock = threading.Lock()
+        self._listener = None
+
+    def _redis(self):
+        """Return the shared Redis client, or None when disabled or unreachable"""
+        if not self.use_redis:
+            return None
+        from redis_client import get_redis_client
+        client = get_redis_client()
+        return client if client.is_available else None
+
+    @property
+    def shared(self) -> bool:
+        """Whether the version is shared between workers (Redis reachable)"""
+        return self._redis() is not None
+
+    def _advance(self, version: int) -> int:
+        """Move the local view forward (never backwards) and return it"""
+        with self._lock:
+            if self._version is None or version > self._version:
+                self._version = version
+            return self._version
+
+    def _sync(self, client) -> None:
+        raw = client.get(REDIS_KEY)
+        if raw is None:
+            # Seed from the clock so a flushed Redis never hands out old versions
+            client.set(REDIS_KEY, str(int(time.time() * 1000)))
+            raw = client.get(REDIS_KEY)
+        try:
+            self._advance(int(raw))
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring invalid catalogue version in Redis: {raw!r}")
+        self._synced_at = time.time()
+
+    def current(self) -> int:
+        """Return the current catalogue version"""
+        if self._version is None or time.time() - self._synced_at >= self.sync_seconds:
+            client = self._redis()
+            if client is not None:
+                self._sync(client)
+            elif self._version is None:
+                self._advance(int(time.time() * 1000))
+        return self._version
+
+    def bump(self) -> int:
+        """Advance the version after a catalogue write and return the new value"""
+        client = self._redis()
+        if client is not None:
+            if self._version is None:
+                self._sync(client)
+            version = client.incr(REDIS_KEY)
+            if version is not None:
+                client.publish(CHANNEL, str(version))
+                return self._advance(version)
+        self.current()
+        with self._lock:
+            self._version += 1
+            return self._version
+
+    def _on_message(self, message: dict) -> None:
+        """Pub/sub handler: adopt a version bumped by another worker"""
+        try:
+            self._advance(int(message["data"]))
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Ignoring malformed catalogue version message: {message!r}")
+
+    def start_listener(self) -> bool:
+        """Follow other workers' bumps immediately (no-op without Redis)"""
+        if self._listener is not None:
+            return True
+        client = self._redis()
+        if client is None:
+            return False
+        self._listener = client.subscribe(CHANNEL, self._on_message)
+        return self._listener is not None
+
+    def stop_listener(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def on_catalogue_change(self, db: Session, game_ids: List[int], op: str) -> None:
+        """services.catalogue_events listener - every committed write bumps the version"""
+        version = self.bump()
+        logger.debug(f"Catalogue version -> {version} ({op} {len(game_ids)} game(s))")
+
+
+catalogue_version = CatalogueVersion()
+register_listener(catalogue_version.on_catalogue_change)
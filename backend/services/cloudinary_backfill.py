@@ -0,0 +1,781 @@
+# services/cloudinary_backfill.py
+"""
+Resumable Cloudinary backfill.
+
+Uploads the image of every game to Cloudinary and stores the game's
+cloudinary_url - needed in bulk after the Cloudinary folder changes, when the
+stored URLs point at assets that do not exist yet.
+
+- Games are walked in id order (keyset pages) by a pool of async workers.
+  Uploads run on the engine's own upload pool, so a backfill never fills the
+  queue the image proxy uploads through.
+- Concurrency adapts (AdaptiveLimiter): halved, with a pause for every
+  worker, when Cloudinary or BGG answer 429/5xx; raised by one after each
+  window of successes, up to CLOUDINARY_BACKFILL_MAX_CONCURRENCY.
+- Progress is checkpointed to backfill_checkpoints every
+  CLOUDINARY_BACKFILL_CHECKPOINT_SECONDS, in the same transaction as the URL
+  updates: the game id up to which every game is done, counters, and the
+  games that failed. Starting again continues from there; a run cut off by a
+  restart is resumed on startup (CLOUDINARY_BACKFILL_AUTO_RESUME).
+- Every step is idempotent - uploads keep their deterministic public_id with
+  overwrite=False, and games whose stored URL is already current are skipped
+  - so a run can be stopped, killed or restarted at any point.
+
+The checkpoint row doubles as a lease: only the process named in it runs the
+job, and a process that stops checkpointing for LEASE_SECONDS loses it.
+"""
+import asyncio
+import logging
+import os
+import socket
+import time
+from collections import deque
+from datetime import timedelta, timezone
+from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple
+
+import cloudinary.exceptions
+import httpx
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+import database
+from config import (
+    CLOUDINARY_BACKFILL_CHECKPOINT_SECONDS,
+    CLOUDINARY_BACKFILL_INITIAL_CONCURRENCY,
+    CLOUDINARY_BACKFILL_MAX_ATTEMPTS,
+    CLOUDINARY_BACKFILL_MAX_CONCURRENCY,
+    CLOUDINARY_BACKFILL_MIN_CONCURRENCY,
+    HTTP_TIMEOUT,
+)
+from exceptions import ValidationError
+from models import BackfillCheckpoint, Game, utc_now
+from services.catalogue_events import OP_UPDATE, notify_catalogue_change
+from services.cloudinary_service import CloudinaryService, UploadQueueFullError
+
+logger = logging.getLogger(__name__)
+
+JOB_NAME = "cloudinary_urls"
+
+STATUS_IDLE = "idle"
+STATUS_RUNNING = "running"
+STATUS_STOPPING = "stopping"  # Stop requested from another process
+STATUS_STOPPED = "stopped"
+STATUS_INTERRUPTED = "interrupted"  # Cut off by a shutdown or crash; resumed on startup
+STATUS_COMPLETED = "completed"
+
+# A running job whose checkpoint is older than this belongs to a dead process
+LEASE_SECONDS = 60.0
+# Games read per keyset page
+PAGE_SIZE = 200
+# Pause for all workers after a throttled response; doubled while throttling continues
+BASE_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 60.0
+MAX_ERROR_LENGTH = 200
+# Failures listed by progress(); the checkpoint keeps all of them
+MAX_REPORTED_FAILURES = 20
+
+# Cloudinary errors about the image or the account rather than load
+_PERMANENT_CLOUDINARY_ERRORS = (
+    cloudinary.exceptions.BadRequest,
+    cloudinary.exceptions.AuthorizationRequired,
+    cloudinary.exceptions.NotAllowed,
+    cloudinary.exceptions.NotFound,
+    cloudinary.exceptions.AlreadyExists,
+)
+
+
+class BackfillRunningError(Exception):
+    """The backfill is already running, in this process or another one"""
+
+
+def is_throttling(exc: Exception) -> bool:
+    """Whether an upload error means "slow down" (429/5xx, overload) rather than a bad image"""
+    if isinstance(exc, UploadQueueFullError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, cloudinary.exceptions.Error):
+        # RateLimited (420/429), GeneralError (500), and the SDK's plain Error for
+        # connection failures and unparseable (gateway error page) responses
+        return not isinstance(exc, _PERMANENT_CLOUDINARY_ERRORS)
+    return False
+
+
+def retry_after(exc: Exception) -> Optional[float]:
+    """Seconds from a Retry-After header on a throttled download, if given"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        try:
+            return max(0.0, float(exc.response.headers.get("retry-after", "")))
+        except ValueError:
+            return None
+    return None
+
+
+def _lease_expired(heartbeat) -> bool:
+    if heartbeat is None:
+        return True
+    if heartbeat.tzinfo is None:
+        heartbeat = heartbeat.replace(tzinfo=timezone.utc)
+    return utc_now() - heartbeat > timedelta(seconds=LEASE_SECONDS)
+
+
+def _isoformat(value) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit that adapts to throttling (AIMD).
+
+    A throttled response halves the limit and pauses every caller of
+    acquire() for a backoff that doubles while throttling continues; each
+    window of `limit` consecutive successes raises the limit by one.
+    Responses to requests that were already in flight when the pause began
+    do not halve it again.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        base_backoff: float = BASE_BACKOFF_SECONDS,
+        max_backoff: float = MAX_BACKOFF_SECONDS,
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.active = 0
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._backoff = base_backoff
+        self._paused_until = 0.0
+        self._successes = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.stats = {"throttled": 0, "decreases": 0, "increases": 0}
+
+    @property
+    def paused_for(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+    async def acquire(self) -> None:
+        while True:
+            delay = self.paused_for
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            if self.active < self.limit:
+                self.active += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def release(self) -> None:
+        self.active -= 1
+        self._wake()
+
+    def succeeded(self) -> None:
+        self._backoff = self.base_backoff
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.maximum:
+            self.limit += 1
+            self._successes = 0
+            self.stats["increases"] += 1
+            self._wake()
+
+    def throttled(self, delay: Optional[float] = None) -> None:
+        self.stats["throttled"] += 1
+        self._successes = 0
+        now = time.monotonic()
+        if now < self._paused_until:
+            return  # Already backing off from this burst
+        if self.limit > self.minimum:
+            self.limit = max(self.minimum, self.limit // 2)
+            self.stats["decreases"] += 1
+        self._paused_until = now + (delay if delay is not None else self._backoff)
+        self._backoff = min(self._backoff * 2, self.max_backoff)
+
+    def _wake(self) -> None:
+        # Woken waiters re-check the limit themselves
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+
+class CloudinaryBackfill:
+    """Resumable backfill of game images to Cloudinary with adaptive concurrency"""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        name: str = JOB_NAME,
+        min_concurrency: int = CLOUDINARY_BACKFILL_MIN_CONCURRENCY,
+        initial_concurrency: int = CLOUDINARY_BACKFILL_INITIAL_CONCURRENCY,
+        max_concurrency: int = CLOUDINARY_BACKFILL_MAX_CONCURRENCY,
+        max_attempts: int = CLOUDINARY_BACKFILL_MAX_ATTEMPTS,
+        checkpoint_seconds: float = CLOUDINARY_BACKFILL_CHECKPOINT_SECONDS,
+        page_size: int = PAGE_SIZE,
+        service: Optional[CloudinaryService] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        self._session_factory = session_factory
+        self.name = name
+        self.min_concurrency = min_concurrency
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.checkpoint_seconds = checkpoint_seconds
+        self.page_size = page_size
+        self._service = service
+        self._http_client = http_client
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self.limiter: Optional[AdaptiveLimiter] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watcher: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._db_lock: Optional[asyncio.Lock] = None
+        self._stop_status = STATUS_STOPPED
+        self._reset_run_state()
+
+    def _reset_run_state(self) -> None:
+        self._force = False
+        self._started_at = None
+        self._last_game_id = 0  # Every game up to here is done
+        self._dispatched_max = 0
+        self._pending: Set[int] = set()  # Dispatched above _last_game_id, not finished
+        self._processed = 0
+        self._uploaded = 0
+        self._skipped = 0
+        self._failed: Dict[int, str] = {}
+        self._url_updates: Dict[int, str] = {}  # Not yet written to the database
+        self._run_processed = 0
+        self._run_started = time.monotonic()
+
+    def _session(self) -> Session:
+        # SessionLocal looked up on use, so a swapped session factory applies
+        return (self._session_factory or database.SessionLocal)()
+
+    @property
+    def service(self) -> CloudinaryService:
+        if self._service is None:
+            # Own upload pool, sized for the highest concurrency
+            self._service = CloudinaryService(
+                workers=self.max_concurrency, max_queued=self.max_concurrency
+            )
+        return self._service
+
+    @property
+    def running(self) -> bool:
+        """Whether a run is active in this process"""
+        return self._task is not None and not self._task.done()
+
+    async def start(
+        self,
+        force: bool = False,
+        retry_failed: bool = False,
+        restart: bool = False,
+        limit: Optional[int] = None,
+    ) -> None:
+        """
+        Start the backfill in the background, resuming from the checkpoint.
+
+        Args:
+            force: Re-upload games whose stored URL is already current
+            retry_failed: Process the games on the failure list again first
+            restart: Discard the checkpoint and start from the first game
+                (a completed run also starts over, unless retry_failed)
+            limit: Stop after dispatching this many games (checkpointed, resumable)
+
+        Raises:
+            ValidationError: If Cloudinary is not configured
+            BackfillRunningError: If the backfill is already running
+        """
+        if not self.service.enabled:
+            raise ValidationError("Cloudinary is not configured")
+        if self.running:
+            raise BackfillRunningError("Backfill is already running")
+        db = self._session()
+        try:
+            await asyncio.to_thread(self._claim, db, force, retry_failed, restart)
+        except BaseException:
+            db.close()
+            raise
+        self._stopping = asyncio.Event()
+        self._db_lock = asyncio.Lock()
+        self._stop_status = STATUS_STOPPED
+        self.limiter = AdaptiveLimiter(
+            self.initial_concurrency,
+            self.min_concurrency,
+            self.max_concurrency,
+            base_backoff=BASE_BACKOFF_SECONDS,
+            max_backoff=MAX_BACKOFF_SECONDS,
+        )
+        self._task = asyncio.create_task(self._execute(db, retry_failed, limit))
+
+    async def run(self, **options) -> Dict:
+        """Run the backfill to the end (or until stopped); same options as start()"""
+        await self.start(**options)
+        await self._task
+        return self.progress()
+
+    async def stop(self, interrupted: bool = False) -> bool:
+        """
+        Stop the run in this process after checkpointing it.
+
+        Games being uploaded are abandoned and redone on the next run.
+
+        Args:
+            interrupted: Record the run as interrupted (shutdown), so it is
+                resumed on startup, instead of stopped by request
+
+        Returns:
+            True if a run was stopped
+        """
+        if not self.running:
+            return False
+        self._stop_status = STATUS_INTERRUPTED if interrupted else STATUS_STOPPED
+        self._stopping.set()
+        await asyncio.wait({self._task})
+        return True
+
+    def request_stop(self, db: Session) -> bool:
+        """
+        Ask the process that holds the job to stop it at its next checkpoint.
+
+        Returns:
+            True if a run was found to stop
+        """
+        stopped = db.execute(
+            update(BackfillCheckpoint)
+            .where(
+                BackfillCheckpoint.name == self.name,
+                BackfillCheckpoint.status == STATUS_RUNNING,
+            )
+            .values(status=STATUS_STOPPING)
+        ).rowcount
+        db.commit()
+        return stopped == 1
+
+    def _claim(self, db: Session, force: bool, retry_failed: bool, restart: bool) -> None:
+        """Take the job's lease and load its checkpoint"""
+        row = db.get(BackfillCheckpoint, self.name)
+        if row is None:
+            db.add(BackfillCheckpoint(
+                name=self.name, status=STATUS_IDLE, force=False, last_game_id=0,
+                processed=0, uploaded=0, skipped=0, failed_games=[], updated_at=utc_now(),
+            ))
+            try:
+                db.commit()
+            except IntegrityError:
+                db.rollback()  # Created concurrently by another process
+            row = db.get(BackfillCheckpoint, self.name)
+
+        if (
+            row.status in (STATUS_RUNNING, STATUS_STOPPING)
+            and row.owner != self.owner
+            and not _lease_expired(row.updated_at)
+        ):
+            raise BackfillRunningError(f"Backfill is already running on {row.owner}")
+
+        now = utc_now()
+        values = {"status": STATUS_RUNNING, "owner": self.owner, "force": force,
+                  "updated_at": now, "finished_at": None}
+        if restart or row.status == STATUS_IDLE or (row.status == STATUS_COMPLETED and not retry_failed):
+            values.update(last_game_id=0, processed=0, uploaded=0, skipped=0,
+                          failed_games=[], started_at=now)
+        # Compare-and-set on the heartbeat: of two processes claiming at once, one wins
+        claimed = db.execute(
+            update(BackfillCheckpoint)
+            .where(
+                BackfillCheckpoint.name == self.name,
+                BackfillCheckpoint.updated_at == row.updated_at,
+            )
+            .values(**values)
+        ).rowcount
+        db.commit()
+        if claimed != 1:
+            raise BackfillRunningError("Backfill was started by another process")
+
+        db.refresh(row)
+        self._reset_run_state()
+        self._force = force
+        self._started_at = row.started_at
+        self._last_game_id = self._dispatched_max = row.last_game_id
+        self._processed, self._uploaded, self._skipped = row.processed, row.uploaded, row.skipped
+        self._failed = {entry["game_id"]: entry["error"] for entry in row.failed_games or []}
+        logger.info(
+            f"Cloudinary backfill started after game {row.last_game_id} "
+            f"(force={force}, {len(self._failed)} earlier failures)"
+        )
+
+    async def _execute(self, db: Session, retry_failed: bool, limit: Optional[int]) -> None:
+        status = STATUS_INTERRUPTED
+        client = self._http_client or httpx.AsyncClient(follow_redirects=True, timeout=HTTP_TIMEOUT)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency)
+        workers = [
+            asyncio.create_task(self._worker(queue, client)) for _ in range(self.max_concurrency)
+        ]
+        checkpointer = asyncio.create_task(self._checkpoint_loop(db))
+        try:
+            finished, exhausted = await self._until_stopped(
+                self._produce(db, queue, retry_failed, limit)
+            )
+            if finished:
+                finished, _ = await self._until_stopped(queue.join())
+            if self._stopping.is_set():
+                status = self._stop_status
+            elif finished:
+                status = STATUS_COMPLETED if exhausted else STATUS_STOPPED
+        except Exception as e:
+            logger.error(f"Cloudinary backfill failed: {e}")
+        finally:
+            for task in (*workers, checkpointer):
+                task.cancel()
+            await asyncio.gather(*workers, checkpointer, return_exceptions=True)
+            if self._http_client is None:
+                await client.aclose()
+            await self._save_checkpoint(db, status)
+            db.close()
+            logger.info(
+                f"Cloudinary backfill {status}: {self._uploaded} uploaded, "
+                f"{self._skipped} skipped, {len(self._failed)} failed, "
+                f"done up to game {self._last_game_id}"
+            )
+
+    async def _until_stopped(self, awaitable) -> Tuple[bool, Any]:
+        """Await awaitable unless a stop comes first: (completed, result)"""
+        task = asyncio.ensure_future(awaitable)
+        stop = asyncio.ensure_future(self._stopping.wait())
+        try:
+            await asyncio.wait({task, stop}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop.cancel()
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        if task.cancelled():
+            return False, None
+        return True, task.result()
+
+    async def _in_thread(self, fn: Callable, *args) -> Any:
+        """
+        Run blocking work on the run's session in a thread, one call at a time
+        (a Session is not thread-safe). A cancelled caller keeps the session
+        until the thread is done with it.
+        """
+        async with self._db_lock:
+            future = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                await asyncio.wait({future})
+                raise
+
+    @staticmethod
+    def _fetch(db: Session, statement) -> list:
+        return db.execute(statement).all()
+
+    async def _produce(
+        self, db: Session, queue: asyncio.Queue, retry_failed: bool, limit: Optional[int]
+    ) -> bool:
+        """Queue the games to process; False if limit cut the walk short"""
+        columns = (Game.id, Game.image, Game.cloudinary_url)
+        has_image = (Game.image.isnot(None), Game.image != "")
+
+        if retry_failed and self._failed:
+            rows = await self._in_thread(
+                self._fetch, db, select(*columns).where(Game.id.in_(list(self._failed)), *has_image)
+            )
+            found = {row.id for row in rows}
+            for game_id in [game_id for game_id in self._failed if game_id not in found]:
+                del self._failed[game_id]  # Deleted since, or lost its image
+            for row in rows:
+                await queue.put((row.id, row.image, row.cloudinary_url, True))
+
+        dispatched = 0
+        cursor = self._last_game_id
+        while True:
+            rows = await self._in_thread(
+                self._fetch,
+                db,
+                select(*columns)
+                .where(Game.id > cursor, *has_image)
+                .order_by(Game.id)
+                .limit(self.page_size),
+            )
+            if not rows:
+                return True
+            for row in rows:
+                if limit is not None and dispatched >= limit:
+                    return False
+                self._pending.add(row.id)
+                self._dispatched_max = row.id
+                await queue.put((row.id, row.image, row.cloudinary_url, False))
+                dispatched += 1
+            cursor = rows[-1].id
+
+    async def _worker(self, queue: asyncio.Queue, client: httpx.AsyncClient) -> None:
+        while True:
+            game_id, image_url, stored_url, retry = await queue.get()
+            try:
+                await self._process(client, game_id, image_url, stored_url, retry)
+            except Exception as e:
+                self._finish(game_id, retry, error=f"{type(e).__name__}: {e}")
+            finally:
+                queue.task_done()
+
+    async def _process(
+        self,
+        client: httpx.AsyncClient,
+        game_id: int,
+        image_url: str,
+        stored_url: Optional[str],
+        retry: bool,
+    ) -> None:
+        # Same URL the import and the serial backfill store
+        cloudinary_url = self.service.generate_optimized_url(
+            image_url, width=800, height=800, quality="auto:best", format="auto"
+        )
+        if stored_url == cloudinary_url and not (self._force or retry):
+            self._finish(game_id, retry, skipped=True)
+            return
+
+        error = None
+        for _ in range(self.max_attempts):
+            await self.limiter.acquire()
+            try:
+                result = await self.service.upload_image(image_url, client, game_id)
+            except Exception as e:
+                outcome = e
+            else:
+                outcome = None
+            finally:
+                self.limiter.release()
+
+            if outcome is None:
+                self.limiter.succeeded()
+                if result is None:
+                    error = "Image too large for Cloudinary"
+                    break
+                self._finish(game_id, retry, cloudinary_url=cloudinary_url)
+                return
+            error = f"{type(outcome).__name__}: {outcome}"
+            if not is_throttling(outcome):
+                break
+            self.limiter.throttled(retry_after(outcome))
+        self._finish(game_id, retry, error=error)
+
+    def _finish(
+        self,
+        game_id: int,
+        retry: bool,
+        cloudinary_url: Optional[str] = None,
+        skipped: bool = False,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record the outcome of one game"""
+        # Games redone after a crash (finished past the last checkpoint) count again
+        if not retry:
+            self._processed += 1
+            self._pending.discard(game_id)
+        self._run_processed += 1
+        if cloudinary_url is not None:
+            self._url_updates[game_id] = cloudinary_url
+            self._uploaded += 1
+            self._failed.pop(game_id, None)
+        elif skipped:
+            self._skipped += 1
+        else:
+            logger.warning(f"Cloudinary backfill failed for game {game_id}: {error}")
+            self._failed[game_id] = (error or "unknown error")[:MAX_ERROR_LENGTH]
+
+    async def _checkpoint_loop(self, db: Session) -> None:
+        while True:
+            await asyncio.sleep(self.checkpoint_seconds)
+            # Shielded: a checkpoint under way when the run ends still completes
+            await asyncio.shield(self._save_checkpoint(db, STATUS_RUNNING))
+
+    async def _save_checkpoint(self, db: Session, status: str) -> None:
+        """Write pending URL updates and the checkpoint in one transaction"""
+        self._last_game_id = min(self._pending) - 1 if self._pending else self._dispatched_max
+        updates, self._url_updates = self._url_updates, {}
+        values = dict(
+            status=status,
+            force=self._force,
+            last_game_id=self._last_game_id,
+            processed=self._processed,
+            uploaded=self._uploaded,
+            skipped=self._skipped,
+            failed_games=[
+                {"game_id": game_id, "error": error}
+                for game_id, error in sorted(self._failed.items())
+            ],
+        )
+        try:
+            current = await self._in_thread(self._write_checkpoint, db, updates, values)
+        except SQLAlchemyError as e:
+            self._url_updates = {**updates, **self._url_updates}  # Retried at the next checkpoint
+            logger.error(f"Cloudinary backfill checkpoint failed: {e}")
+            return
+        if current is None or current.owner != self.owner:
+            logger.warning("Cloudinary backfill lease was taken over, stopping")
+            self._url_updates = {**updates, **self._url_updates}
+            self._stopping.set()
+        elif current.status == STATUS_STOPPING and status == STATUS_RUNNING:
+            self._stop_status = STATUS_STOPPED
+            self._stopping.set()
+
+    def _write_checkpoint(self, db: Session, updates: Dict[int, str], values: Dict) -> Any:
+        """
+        Blocking part of _save_checkpoint, run in a thread. Returns the
+        checkpoint's status and owner as read before writing; nothing is
+        written if this process no longer holds the lease.
+        """
+        now = utc_now()
+        try:
+            current = db.execute(
+                select(BackfillCheckpoint.status, BackfillCheckpoint.owner)
+                .where(BackfillCheckpoint.name == self.name)
+            ).first()
+            if current is None or current.owner != self.owner:
+                db.rollback()
+                return current
+            if updates:
+                db.execute(
+                    update(Game),
+                    [{"id": game_id, "cloudinary_url": url} for game_id, url in updates.items()],
+                )
+            db.execute(
+                update(BackfillCheckpoint)
+                .where(BackfillCheckpoint.name == self.name)
+                .values(
+                    **values,
+                    updated_at=now,
+                    finished_at=None if values["status"] == STATUS_RUNNING else now,
+                )
+            )
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            raise
+        notify_catalogue_change(db, list(updates), OP_UPDATE)
+        return current
+
+    def progress(self, db: Optional[Session] = None) -> Dict:
+        """Progress of the job, live when it runs in this process"""
+        own_session = db is None
+        db = db or self._session()
+        try:
+            row = db.get(BackfillCheckpoint, self.name)
+            if row is not None:
+                db.refresh(row)
+            if self.running:
+                status, owner, force = STATUS_RUNNING, self.owner, self._force
+                last_game_id = min(self._pending) - 1 if self._pending else self._dispatched_max
+                counts = (self._processed, self._uploaded, self._skipped)
+                failures = [
+                    {"game_id": game_id, "error": error}
+                    for game_id, error in sorted(self._failed.items())
+                ]
+            elif row is not None:
+                status, owner, force = row.status, row.owner, row.force
+                if status in (STATUS_RUNNING, STATUS_STOPPING) and _lease_expired(row.updated_at):
+                    status = STATUS_INTERRUPTED
+                last_game_id = row.last_game_id
+                counts = (row.processed, row.uploaded, row.skipped)
+                failures = row.failed_games or []
+            else:
+                status, owner, force, last_game_id = STATUS_IDLE, None, False, 0
+                counts, failures = (0, 0, 0), []
+            remaining = db.execute(
+                select(func.count(Game.id)).where(
+                    Game.id > last_game_id, Game.image.isnot(None), Game.image != ""
+                )
+            ).scalar()
+        finally:
+            if own_session:
+                db.close()
+
+        elapsed = time.monotonic() - self._run_started
+        progress = {
+            "status": status,
+            "running_here": self.running,
+            "owner": owner,
+            "force": force,
+            "last_game_id": last_game_id,
+            "remaining": remaining,
+            "processed": counts[0],
+            "uploaded": counts[1],
+            "skipped": counts[2],
+            "failed": len(failures),
+            "failures": failures[:MAX_REPORTED_FAILURES],
+            "started_at": _isoformat(row.started_at) if row is not None else None,
+            "updated_at": _isoformat(row.updated_at) if row is not None else None,
+            "finished_at": _isoformat(row.finished_at) if row is not None else None,
+        }
+        if self.running:
+            progress.update(
+                concurrency=self.limiter.limit,
+                in_flight=self.limiter.active,
+                paused_for_seconds=round(self.limiter.paused_for, 1),
+                throttled=self.limiter.stats["throttled"],
+                games_per_second=round(self._run_processed / elapsed, 2) if elapsed > 0 else 0.0,
+            )
+        return progress
+
+    def start_watcher(self) -> None:
+        """Resume an interrupted run in the background (called on startup)"""
+        self._watcher = asyncio.create_task(self._resume_interrupted())
+
+    async def _resume_interrupted(self) -> None:
+        """
+        Resume the job if a shutdown or crash cut it off. While another
+        process holds a live lease, wait: if that process dies, its lease
+        expires and this one takes over.
+        """
+        while True:
+            db = self._session()
+            try:
+                row = db.get(BackfillCheckpoint, self.name)
+                state = (row.status, row.force, _lease_expired(row.updated_at)) if row else None
+            except SQLAlchemyError as e:
+                logger.warning(f"Could not read the Cloudinary backfill checkpoint: {e}")
+                return
+            finally:
+                db.close()
+            if state is None or not self.service.enabled:
+                return
+            status, force, expired = state
+            if status == STATUS_INTERRUPTED or (status == STATUS_RUNNING and expired):
+                try:
+                    await self.start(force=force)
+                    logger.info("Resumed interrupted Cloudinary backfill")
+                except BackfillRunningError:
+                    pass  # Another process resumed it first
+                return
+            if status not in (STATUS_RUNNING, STATUS_STOPPING):
+                return
+            await asyncio.sleep(LEASE_SECONDS / 2)
+
+    async def shutdown(self) -> None:
+        """Checkpoint a running backfill as interrupted, so startup resumes it"""
+        if self._watcher is not None:
+            self._watcher.cancel()
+            await asyncio.gather(self._watcher, return_exceptions=True)
+            self._watcher = None
+        await self.stop(interrupted=True)
+
+
+# Global instance
+cloudinary_backfill = CloudinaryBackfill()
@@ -2,18 +2,38 @@
 """
 Cloudinary service for image optimization and CDN delivery.
 Handles uploading BGG images to Cloudinary with automatic transformations.
+
+Uploads download on the event loop, then run Pillow processing and the
+blocking Cloudinary SDK call on a bounded thread pool
+(CLOUDINARY_UPLOAD_WORKERS); images over Cloudinary's size limit are shrunk
+in worker processes (utils/image_preprocess.py). When CLOUDINARY_UPLOAD_MAX_QUEUED uploads are
+already waiting, new ones are skipped and the image proxy serves the image
+directly. Concurrent uploads of the same URL - e.g. several visitors opening
+a page of new games at once - share one upload.
 """
+import asyncio
 import os
 import logging
 import hashlib
 import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional, Dict, Set
 import httpx
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
 from cloudinary import CloudinaryImage
-from PIL import Image
+
+from config import (
+    CLOUDINARY_UPLOAD_MAX_QUEUED,
+    CLOUDINARY_UPLOAD_WORKERS,
+    IMAGE_PREPROCESS_MAX_PIXELS,
+    IMAGE_PREPROCESS_MAX_TASKS_PER_WORKER,
+    IMAGE_PREPROCESS_WORKERS,
+)
+from utils.image_preprocess import PixelBudgetExceededError, prepare_for_upload
 
 logger = logging.getLogger(__name__)
 _sl = lambda v: str(v).replace('\n', ' ').replace('\r', ' ')  # sanitize for logs
@@ -27,10 +47,20 @@ cloudinary.config(
 )
 
 
+class UploadQueueFullError(Exception):
+    """The upload pool already has its maximum number of jobs waiting"""
+
+
 class CloudinaryService:
     """Service for Cloudinary image operations"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        workers: int = CLOUDINARY_UPLOAD_WORKERS,
+        max_queued: int = CLOUDINARY_UPLOAD_MAX_QUEUED,
+        preprocess_workers: int = IMAGE_PREPROCESS_WORKERS,
+        preprocess_max_pixels: int = IMAGE_PREPROCESS_MAX_PIXELS,
+    ):
         """Initialize Cloudinary service"""
         self.folder = "boardgame-library"  # Organize images in folder
         self.enabled = self._check_cloudinary_enabled()
@@ -38,6 +68,20 @@ class CloudinaryService:
         # This prevents repeated attempts to use broken Cloudinary URLs
         self._failed_uploads: Set[str] = set()
 
+        # Bounded pool for Pillow processing and the blocking Cloudinary SDK
+        self.workers = workers
+        self.max_queued = max_queued
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cloudinary-upload")
+        self._queue_lock = threading.Lock()
+        self._queued = 0  # Submitted, waiting for a worker
+        self._running = 0
+        # URL -> upload task shared by concurrent callers
+        self._in_flight: Dict[str, "asyncio.Task"] = {}
+        # Worker processes (shared by all instances) that shrink oversized images
+        self.preprocess_workers = preprocess_workers
+        self.preprocess_max_pixels = preprocess_max_pixels
+        self.upload_stats = {"uploads": 0, "deduplicated": 0, "rejected": 0, "failed": 0}
+
     def _check_cloudinary_enabled(self) -> bool:
         """Check if Cloudinary is properly configured"""
         config = cloudinary.config()
@@ -73,7 +117,8 @@ class CloudinaryService:
         Upload an image from URL to Cloudinary.
 
         Downloads the image first with proper headers (to work around BGG's restrictions),
-        then uploads the bytes to Cloudinary.
+        then uploads the bytes to Cloudinary. Image processing and the upload run on a
+        bounded thread pool; concurrent calls for the same URL share one upload.
 
         Args:
             url: The source image URL (usually from BGG)
@@ -82,211 +127,235 @@ class CloudinaryService:
 
         Returns:
             Cloudinary response dict with URLs and metadata, or None if failed
+            (or if the upload queue is full)
         """
         if not self.enabled:
             logger.warning("Cloudinary not enabled, skipping upload")
             return None
 
-        try:
-            # Use hash only as public_id, folder is specified separately
-            hash_only = self._get_public_id(url, include_folder=False)
-            full_public_id = self._get_public_id(url, include_folder=True)
-
-            # PERFORMANCE FIX: Don't check if image exists - let Cloudinary handle it
-            # The overwrite=False option will skip upload if it exists
-            # This eliminates a 4-6 second API call per request
-
-            # First, download the image from BGG with proper headers
-            # BGG requires User-Agent and Referer headers to prevent hotlinking
-            logger.debug(f"Preparing to upload image from BGG: {_sl(url)}")
-
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Referer": "https://boardgamegeek.com/",
-                "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-            }
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(url)
+        if task is not None and task.get_loop() is loop:
+            self.upload_stats["deduplicated"] += 1
+        else:
+            task = loop.create_task(self._upload_from_url(url, http_client, game_id))
+            self._in_flight[url] = task
+            task.add_done_callback(partial(self._forget_in_flight, url))
+        # Shielded: a caller going away must not cancel the upload others are waiting for
+        return await asyncio.shield(task)
+
+    def _forget_in_flight(self, url: str, task: "asyncio.Task") -> None:
+        if self._in_flight.get(url) is task:
+            del self._in_flight[url]
+
+    async def _run_on_upload_pool(self, fn, *args):
+        """
+        Run blocking work on the upload pool.
 
-            response = await http_client.get(url, headers=headers)
-            response.raise_for_status()
+        Raises:
+            UploadQueueFullError: If max_queued jobs are already waiting for a worker
+        """
+        with self._queue_lock:
+            if self._queued >= self.max_queued:
+                raise UploadQueueFullError(f"{self._queued} uploads already queued")
+            self._queued += 1
+
+        def job():
+            with self._queue_lock:
+                self._queued -= 1
+                self._running += 1
+            try:
+                return fn(*args)
+            finally:
+                with self._queue_lock:
+                    self._running -= 1
+
+        def release_if_cancelled(future):
+            # Cancelled before a worker picked it up: job() never ran
+            if future.cancelled():
+                with self._queue_lock:
+                    self._queued -= 1
+
+        future = self._executor.submit(job)
+        future.add_done_callback(release_if_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def get_upload_stats(self) -> Dict:
+        """Upload pool metrics for the debug endpoints"""
+        return {
+            **self.upload_stats,
+            "queue_depth": self._queued,
+            "running": self._running,
+            "in_flight_urls": len(self._in_flight),
+            "workers": self.workers,
+            "max_queued": self.max_queued,
+        }
 
-            image_bytes = response.content
-            image_size = len(image_bytes)
-            logger.info(f"Downloaded {image_size} bytes from BGG")
+    async def upload_image(
+        self, url: str, http_client: httpx.AsyncClient, game_id: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Download, process and upload one image, raising on failure.
 
-            # CRITICAL: Always process images through Pillow to check uncompressed size
-            # Cloudinary checks uncompressed pixel data, not compressed file size!
-            # A 2.5MB compressed PNG can be 11MB uncompressed
-            MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB in bytes
+        Unlike upload_from_url, errors are not swallowed, so callers such as
+        the backfill engine can tell rate limiting from broken images.
 
-            # Try to open and process the image with Pillow
-            # If this fails (e.g., mock test data, corrupted file), skip compression
-            try:
-                image = Image.open(io.BytesIO(image_bytes))
-                original_size = image.size
-                original_format = image.format or 'JPEG'
-                logger.info(f"Opened image: {original_size}, format: {original_format}")
-
-                # Get ACTUAL uncompressed size by saving as uncompressed PNG
-                # This matches what Cloudinary will see when processing the image
-                test_output = io.BytesIO()
-                # Save with no compression to get true uncompressed size
-                image.save(test_output, format='PNG', compress_level=0)
-                uncompressed_size = len(test_output.getvalue())
-
-                logger.info(
-                    f"Image stats: {original_size[0]}x{original_size[1]}, "
-                    f"mode: {image.mode}, {original_format} format, "
-                    f"compressed: {image_size / (1024 * 1024):.2f}MB, "
-                    f"uncompressed: {uncompressed_size / (1024 * 1024):.2f}MB"
-                )
-
-                # Resize if either compressed OR uncompressed size > 10MB
-                needs_resize = (image_size > MAX_FILE_SIZE) or (uncompressed_size > MAX_FILE_SIZE)
-            except Exception as e:
-                # If we can't open the image (e.g., mock test data, corrupted file)
-                # Upload the original bytes anyway - let Cloudinary handle it
-                logger.warning(f"Could not open image with Pillow: {e}, uploading original bytes")
-                needs_resize = False  # Skip compression, use original
-
-            # Compression logic (only runs if needs_resize is True)
-            if needs_resize:
-                logger.warning(
-                    f"Image too large for Cloudinary "
-                    f"(compressed: {image_size / (1024 * 1024):.2f}MB, "
-                    f"uncompressed: {uncompressed_size / (1024 * 1024):.2f}MB, "
-                    f"max: {MAX_FILE_SIZE / (1024 * 1024):.0f}MB). Resizing..."
-                )
-
-                # OPTIMIZED: WebP compression with 1200px cap for best quality/size ratio
-                # WebP achieves 25-35% better compression than JPEG
-
-                # Convert to RGB for WebP (handles transparency)
-                if image.mode in ('RGBA', 'LA'):
-                    # Keep alpha channel for WebP (it supports transparency)
-                    pass  # WebP handles RGBA natively
-                elif image.mode == 'P':
-                    image = image.convert('RGBA')
-                elif image.mode not in ('RGB', 'RGBA', 'L'):
-                    image = image.convert('RGB')
-
-                file_size_mb = max(image_size, uncompressed_size) / (1024 * 1024)
-
-                # Simple, effective strategy: 1200px max with WebP compression
-                # WebP is much more efficient than JPEG, so fewer dimension steps needed
-                max_dimensions = [1200, 1000, 800, 600, 400]  # Start at 1200px
-                qualities = [90, 85, 80, 75, 70, 65]  # WebP quality range
-
-                output = None
-                success = False
-
-                # Try each dimension + quality combination until we succeed
-                for max_dimension in max_dimensions:
-                    # Resize if needed
-                    test_image = image.copy()
-                    if max(test_image.size) > max_dimension:
-                        ratio = max_dimension / max(test_image.size)
-                        new_size = tuple(int(dim * ratio) for dim in test_image.size)
-                        test_image = test_image.resize(new_size, Image.Resampling.LANCZOS)
-
-                    # Try each quality level with WebP format
-                    for quality in qualities:
-                        output = io.BytesIO()
-                        # WebP format with quality setting (supports both lossy and lossless)
-                        test_image.save(output, format='WEBP', quality=quality, method=6)
-                        output_bytes = output.getvalue()
-                        compressed_size = len(output_bytes)
-
-                        # Calculate uncompressed size more accurately
-                        # Use actual test save to measure what Cloudinary will see
-                        test_output = io.BytesIO()
-                        test_img = Image.open(io.BytesIO(output_bytes))
-                        test_img.save(test_output, format='PNG', compress_level=0)
-                        actual_uncompressed = len(test_output.getvalue())
-
-                        # Check if both sizes are acceptable
-                        if compressed_size <= MAX_FILE_SIZE and actual_uncompressed <= MAX_FILE_SIZE:
-                            image_bytes = output_bytes
-                            success = True
-                            logger.info(
-                                f"✓ WebP compression successful: {file_size_mb:.2f}MB -> {compressed_size / (1024 * 1024):.2f}MB "
-                                f"(dimension: {max_dimension}px, quality: {quality}, "
-                                f"uncompressed: {actual_uncompressed / (1024 * 1024):.2f}MB)"
-                            )
-                            break
-
-                    if success:
-                        break
-
-                if not success:
-                    # Final fallback: ultra-aggressive WebP compression
-                    logger.warning("Standard compression failed, trying ultra-aggressive WebP fallback")
-                    ultra_dimension = 400
-                    ratio = ultra_dimension / max(image.size)
-                    new_size = tuple(int(dim * ratio) for dim in image.size)
-                    image = image.resize(new_size, Image.Resampling.LANCZOS)
-
-                    output = io.BytesIO()
-                    image.save(output, format='WEBP', quality=60, method=6)
-                    image_bytes = output.getvalue()
-
-                    if len(image_bytes) <= MAX_FILE_SIZE:
-                        logger.warning(
-                            f"✓ Ultra-aggressive WebP compression succeeded: {file_size_mb:.2f}MB -> "
-                            f"{len(image_bytes) / (1024 * 1024):.2f}MB (400px WebP, quality: 60)"
-                        )
-                    else:
-                        logger.error(
-                            f"Image still too large even at 400px WebP quality:60: "
-                            f"{len(image_bytes) / (1024 * 1024):.2f}MB. Cannot upload."
-                        )
-                        self._failed_uploads.add(url)
-                        return None
-
-            # Upload with optimizations
-            # Use hash as public_id, folder specified separately to avoid double-nesting
-            upload_options = {
-                "public_id": hash_only,  # Just the hash, no folder prefix
-                "folder": self.folder,  # Folder specified separately
-                "overwrite": False,  # Don't overwrite existing
-                "resource_type": "image",
-                "quality": "auto:best",  # Automatic quality optimization
-                "tags": ["boardgame"],
-            }
+        Returns:
+            Cloudinary response dict, or None if the image could not be shrunk
+            below Cloudinary's limits
 
-            # Add game_id as context if provided
-            if game_id:
-                upload_options["context"] = f"game_id={game_id}"
+        Raises:
+            httpx.HTTPError: If the download fails
+            cloudinary.exceptions.Error: If Cloudinary rejects the upload
+            UploadQueueFullError: If the upload pool queue is full
+        """
+        # Use hash only as public_id, folder is specified separately
+        hash_only = self._get_public_id(url, include_folder=False)
+
+        # PERFORMANCE FIX: Don't check if image exists - let Cloudinary handle it
+        # The overwrite=False option will skip upload if it exists
+        # This eliminates a 4-6 second API call per request
+
+        # First, download the image from BGG with proper headers
+        # BGG requires User-Agent and Referer headers to prevent hotlinking
+        logger.debug(f"Preparing to upload image from BGG: {_sl(url)}")
+
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Referer": "https://boardgamegeek.com/",
+            "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        }
 
-            # Upload the image bytes to Cloudinary (not from URL)
-            # Create a file-like object from bytes
-            image_file = io.BytesIO(image_bytes)
-            result = cloudinary.uploader.upload(image_file, **upload_options)
+        response = await http_client.get(url, headers=headers)
+        response.raise_for_status()
+
+        image_bytes = response.content
+        image_size = len(image_bytes)
+        logger.info(f"Downloaded {image_size} bytes from BGG")
+
+        # Upload with optimizations
+        # Use hash as public_id, folder specified separately to avoid double-nesting
+        upload_options = {
+            "public_id": hash_only,  # Just the hash, no folder prefix
+            "folder": self.folder,  # Folder specified separately
+            "overwrite": False,  # Don't overwrite existing
+            "resource_type": "image",
+            "quality": "auto:best",  # Automatic quality optimization
+            "tags": ["boardgame"],
+        }
 
-            logger.info(
-                f"Uploaded to Cloudinary: {full_public_id} "
-                f"(format: {result.get('format')}, size: {result.get('bytes')} bytes)"
-            )
+        # Add game_id as context if provided
+        if game_id:
+            upload_options["context"] = f"game_id={game_id}"
 
-            return result
+        # Pillow checks and the blocking Cloudinary SDK call run on the upload pool,
+        # keeping the event loop free
+        return await self._run_on_upload_pool(
+            self._compress_and_upload, url, image_bytes, upload_options
+        )
 
+    async def _upload_from_url(
+        self, url: str, http_client: httpx.AsyncClient, game_id: Optional[int]
+    ) -> Optional[Dict]:
+        """Upload one image, logging and recording failures (see upload_from_url)"""
+        try:
+            return await self.upload_image(url, http_client, game_id)
+        except UploadQueueFullError:
+            # Not a failure of this image: the direct proxy serves it meanwhile
+            logger.warning(f"Cloudinary upload queue full, skipping upload of {_sl(url[:100])}")
+            self.upload_stats["rejected"] += 1
+            return None
         except httpx.HTTPError as e:
             logger.error(f"Failed to download image from BGG: {e}")
             # Track this URL as failed
             self._failed_uploads.add(url)
+            self.upload_stats["failed"] += 1
             return None
         except cloudinary.exceptions.Error as e:
             # Cloudinary-specific errors (rate limits, file size, etc.)
             logger.error(f"Cloudinary API error: {e}")
             # Track this URL as failed
             self._failed_uploads.add(url)
+            self.upload_stats["failed"] += 1
             return None
         except Exception as e:
             logger.error(f"Failed to upload to Cloudinary: {e}")
             # Track this URL as failed
             self._failed_uploads.add(url)
+            self.upload_stats["failed"] += 1
+            return None
+
+    def _compress_and_upload(
+        self, url: str, image_bytes: bytes, upload_options: Dict
+    ) -> Optional[Dict]:
+        """
+        Shrink an image below Cloudinary's limits if needed and upload it.
+        Blocking (Pillow and the Cloudinary SDK) - runs on the upload pool.
+        """
+        image_size = len(image_bytes)
+        full_public_id = f"{upload_options['folder']}/{upload_options['public_id']}"
+
+        # Cloudinary checks uncompressed pixel data, not just the file size:
+        # a 2.5MB compressed PNG can be 11MB uncompressed. The size is computed
+        # from the header; only images over the limit are decoded, at reduced
+        # scale and in the preprocessing worker processes.
+        try:
+            prepared = prepare_for_upload(
+                image_bytes,
+                max_pixels=self.preprocess_max_pixels,
+                workers=self.preprocess_workers,
+                max_tasks_per_worker=IMAGE_PREPROCESS_MAX_TASKS_PER_WORKER,
+            )
+        except PixelBudgetExceededError as e:
+            logger.error(f"Image too large to process, not uploading {_sl(url[:100])}: {e}")
+            self._failed_uploads.add(url)
+            self.upload_stats["failed"] += 1
             return None
 
+        if prepared is None:
+            logger.error(
+                f"Image still too large even at 400px WebP quality:60, cannot upload {_sl(url[:100])}"
+            )
+            self._failed_uploads.add(url)
+            self.upload_stats["failed"] += 1
+            return None
+
+        info = prepared.info
+        if info is None:
+            # Not an image Pillow can read (e.g. mock test data, corrupted file):
+            # upload the original bytes anyway - let Cloudinary handle it
+            logger.warning("Could not open image with Pillow, uploading original bytes")
+        else:
+            logger.info(
+                f"Image stats: {info.width}x{info.height}, "
+                f"mode: {info.mode}, {info.format} format, "
+                f"compressed: {image_size / (1024 * 1024):.2f}MB, "
+                f"uncompressed: {info.uncompressed_bytes / (1024 * 1024):.2f}MB"
+            )
+        if prepared.resized:
+            image_bytes = prepared.data
+            logger.info(
+                f"✓ WebP compression successful: "
+                f"{max(image_size, info.uncompressed_bytes) / (1024 * 1024):.2f}MB -> "
+                f"{len(image_bytes) / (1024 * 1024):.2f}MB "
+                f"({prepared.width}x{prepared.height}, quality: {prepared.quality}, "
+                f"decoded: {prepared.decoded_pixels / 1e6:.1f}MP)"
+            )
+
+        # Upload the image bytes to Cloudinary (not from URL)
+        # Create a file-like object from bytes
+        image_file = io.BytesIO(image_bytes)
+        result = cloudinary.uploader.upload(image_file, **upload_options)
+
+        self.upload_stats["uploads"] += 1
+        logger.info(
+            f"Uploaded to Cloudinary: {full_public_id} "
+            f"(format: {result.get('format')}, size: {result.get('bytes')} bytes)"
+        )
+
+        return result
+
     def generate_optimized_url(
         self,
         url: str,
@@ -0,0 +1,119 @@
+# services/game_detail_cache.py
+"""
+Serialized game detail JSON per game.
+
+A detail page used to load the game, its expansions and its base game
+(three queries) and validate them through GameDetailResponse on every
+request. Here the serialized detail is kept per game id together with its
+row version, so a request only runs one indexed version lookup
+(GameService.get_detail_versions) and serves the stored JSON when the
+version still matches.
+
+The row version covers every row the detail embeds: the game itself, its
+base game and its expansions (newest updated_at and count, so an added or
+removed expansion changes it too). updated_at is set by the ORM/Core
+onupdate, not by a database trigger, so any update made through SQLAlchemy
+- on any worker - misses the cache, but raw SQL that leaves updated_at
+alone does not: such edits must set updated_at themselves (or the workers
+be restarted). Writes seen on this worker also drop the affected entries
+eagerly (via services.catalogue_events), including the linked games'
+entries, to free memory.
+"""
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from config import GAME_DETAIL_CACHE_MAX_ENTRIES
+from models import Game
+from services.catalogue_events import register_listener
+
+logger = logging.getLogger(__name__)
+
+
+def detail_row_version(
+    updated_at: Any, base_updated_at: Any, expansions_updated_at: Any, expansion_count: int
+) -> Optional[str]:
+    """
+    Row version of a game's detail, or None when the game has no updated_at
+    (rows not yet migrated cannot be validated, so they are never cached).
+    """
+    if updated_at is None:
+        return None
+    raw = f"{updated_at}|{base_updated_at}|{expansions_updated_at}|{expansion_count}"
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+class GameDetailCache:
+    """Thread-safe, size-bounded LRU of game id -> (row version, detail JSON)"""
+
+    def __init__(self, max_entries: int = GAME_DETAIL_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        return {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, game_id: int, version: Optional[str]) -> Optional[str]:
+        """Stored detail JSON of a game if it was stored under this row version"""
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is not None and version is not None and entry[0] == version:
+                self._entries.move_to_end(game_id)
+                self.stats["hits"] += 1
+                return entry[1]
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, game_id: int, version: Optional[str], detail: str) -> None:
+        if version is None or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[game_id] = (version, detail)
+            self._entries.move_to_end(game_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def discard_games(self, game_ids: List[int]) -> None:
+        with self._lock:
+            for game_id in game_ids:
+                if self._entries.pop(game_id, None) is not None:
+                    self.stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = self._empty_stats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def on_catalogue_change(self, db: Session, game_ids: List[int], op: str) -> None:
+        """
+        services.catalogue_events listener - drops the changed games and the
+        games whose detail embeds them (their base game and expansions)
+        """
+        if not self._entries:
+            return
+        linked = set(game_ids)
+        for row in db.execute(
+            select(Game.id, Game.base_game_id).where(
+                or_(Game.id.in_(game_ids), Game.base_game_id.in_(game_ids))
+            )
+        ):
+            linked.add(row.id)
+            if row.base_game_id is not None:
+                linked.add(row.base_game_id)
+        self.discard_games(list(linked))
+
+
+game_detail_cache = GameDetailCache()
+register_listener(game_detail_cache.on_catalogue_change)
@@ -3,26 +3,140 @@
 Game service layer - handles all business logic for game operations.
 Separates business logic from HTTP routing concerns.
 """
+import base64
+import json
 import logging
 import re
+from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, func, or_, and_, case, cast, String, delete
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import (
+    select, func, or_, and_, case, delete, null, false, bindparam, update,
+)
+from sqlalchemy.orm import Session, aliased, selectinload
 
-from models import Game
+from models import BggEntity, Game, GameDeletion, GameEntityLink, GameSimilarity, QUICK_PICK_KEYS, entity_key
 from exceptions import GameNotFoundError, ValidationError
 from utils.helpers import parse_categories, categorize_game
-from config import API_BASE
+from config import API_BASE, SIMILAR_GAMES_TOP_K
+from services.catalogue_engine import catalogue_engine
+from services.game_detail_cache import detail_row_version
+from services.similar_games import refresh_similar_games
+from services.search import (
+    catalogue_search,
+    pg_search_condition,
+    pg_search_rank,
+    uses_pg_search,
+)
+from services.catalogue_events import (
+    OP_CREATE,
+    OP_DELETE,
+    OP_UPDATE,
+    notify_catalogue_change,
+)
 
 logger = logging.getLogger(__name__)
+
+# Fields whose change alters a game's or its base game's effective player range
+_PLAYER_RANGE_FIELDS = frozenset({
+    "players_min",
+    "players_max",
+    "base_game_id",
+    "modifies_players_min",
+    "modifies_players_max",
+})
+
+
+def _effective_players_expressions() -> Dict[str, Any]:
+    """
+    effective_players_min/max computed from a game's own range widened by its
+    linked expansions' modifies_players_min/max (correlated on boardgames.id).
+    A NULL own bound stays NULL (unbounded); expansions that don't modify
+    player counts are ignored.
+    """
+    expansion = aliased(Game)
+    expansions_min = (
+        select(func.min(expansion.modifies_players_min))
+        .where(expansion.base_game_id == Game.id)
+        .scalar_subquery()
+    )
+    expansions_max = (
+        select(func.max(expansion.modifies_players_max))
+        .where(expansion.base_game_id == Game.id)
+        .scalar_subquery()
+    )
+    return {
+        "effective_players_min": case(
+            (Game.players_min.is_(None), null()),
+            (expansions_min < Game.players_min, expansions_min),
+            else_=Game.players_min,
+        ),
+        "effective_players_max": case(
+            (Game.players_max.is_(None), null()),
+            (expansions_max > Game.players_max, expansions_max),
+            else_=Game.players_max,
+        ),
+    }
 def _sl(v: object) -> str:
     """Sanitize a value for safe log output by stripping newline characters."""
     return re.sub(r'[\n\r]', ' ', str(v))
 
 
+# Sorts whose lead key is a datetime (restored from ISO strings in cursors)
+_DATETIME_SORT_PREFIX = "date_added_"
+
+
+def _encode_cursor(sort: str, sort_key: Any, title: str, game_id: int) -> str:
+    """
+    Encode the position of the last row on a page as an opaque, URL-safe cursor.
+
+    Args:
+        sort: Sort order the cursor belongs to
+        sort_key: Lead sort key of the row (None for title sorts or NULL keys)
+        title: Row title (secondary key)
+        game_id: Row ID (final tie-breaker)
+    """
+    if isinstance(sort_key, datetime):
+        sort_key = sort_key.isoformat()
+    elif isinstance(sort_key, Decimal):
+        sort_key = float(sort_key)
+    payload = json.dumps(
+        {"s": sort, "k": sort_key, "t": title, "i": game_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str) -> Tuple[Any, str, int]:
+    """
+    Decode a cursor produced by _encode_cursor.
+
+    Returns:
+        Tuple of (lead sort key, title, game ID)
+
+    Raises:
+        ValidationError: If the cursor is malformed or belongs to another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor_sort, sort_key, title, game_id = data["s"], data["k"], data["t"], data["i"]
+        if not isinstance(title, str) or not isinstance(game_id, int):
+            raise ValueError("bad cursor fields")
+        if sort_key is not None and sort.startswith(_DATETIME_SORT_PREFIX):
+            sort_key = datetime.fromisoformat(sort_key)
+        elif sort_key is not None and not isinstance(sort_key, (int, float)):
+            raise ValueError("bad cursor sort key")
+    except (ValueError, TypeError, KeyError, UnicodeError) as e:
+        raise ValidationError(f"Invalid cursor: {e}")
+
+    if cursor_sort != sort:
+        raise ValidationError("Cursor was issued for a different sort order")
+    return sort_key, title, game_id
+
+
 class GameService:
     """Service for game-related business logic"""
 
@@ -41,12 +155,80 @@ class GameService:
             Game object or None if not found
         """
         # Use select with eager loading instead of simple .get()
-        result = self.db.execute(
+        result = self.db.execute(self._game_by_id_stmt(game_id)).scalar_one_or_none()
+        return result
+
+    @staticmethod
+    def _game_by_id_stmt(game_id: int):
+        """Statement behind get_game_by_id (expansions and base_game eager-loaded)"""
+        return (
             select(Game)
             .options(selectinload(Game.expansions), selectinload(Game.base_game))
             .where(Game.id == game_id)
-        ).scalar_one_or_none()
-        return result
+        )
+
+    def get_games_by_ids(self, game_ids: List[int]) -> List[Game]:
+        """
+        Get several games by ID with expansions and base_game eager-loaded,
+        in a constant number of queries however many IDs are requested.
+
+        Args:
+            game_ids: The games' database IDs
+
+        Returns:
+            The games found, in the order of game_ids (missing IDs are skipped)
+        """
+        if not game_ids:
+            return []
+        games = self.db.execute(self._games_by_ids_stmt(game_ids)).scalars().all()
+        id_order = {id_: idx for idx, id_ in enumerate(game_ids)}
+        return sorted(games, key=lambda g: id_order[g.id])
+
+    @staticmethod
+    def _games_by_ids_stmt(game_ids: List[int]):
+        """Statement behind get_games_by_ids (same eager loading as _game_by_id_stmt)"""
+        return (
+            select(Game)
+            .options(selectinload(Game.expansions), selectinload(Game.base_game))
+            .where(Game.id.in_(game_ids))
+        )
+
+    def get_detail_versions(self, game_ids: List[int]) -> Dict[int, Optional[str]]:
+        """
+        Row versions of the public game details among game_ids, in one query.
+
+        A detail embeds the game's expansions and base game, so its version
+        covers all of those rows (see services/game_detail_cache.py).
+
+        Returns:
+            Game ID -> row version for every public game found (None when the
+            game has no updated_at)
+        """
+        if not game_ids:
+            return {}
+        return {
+            row.id: detail_row_version(*row[1:])
+            for row in self.db.execute(self._detail_versions_stmt(game_ids))
+        }
+
+    @staticmethod
+    def _detail_versions_stmt(game_ids: List[int]):
+        """Statement behind get_detail_versions (owned games only, like the detail route)"""
+        base = aliased(Game)
+        expansion = aliased(Game)
+        return (
+            select(
+                Game.id,
+                Game.updated_at,
+                base.updated_at,
+                func.max(expansion.updated_at),
+                func.count(expansion.id),
+            )
+            .outerjoin(base, base.id == Game.base_game_id)
+            .outerjoin(expansion, expansion.base_game_id == Game.id)
+            .where(Game.id.in_(game_ids), or_(Game.status.is_(None), Game.status == "OWNED"))
+            .group_by(Game.id, Game.updated_at, base.updated_at)
+        )
 
     def get_game_by_bgg_id(self, bgg_id: int) -> Optional[Game]:
         """
@@ -64,17 +246,24 @@ class GameService:
 
     def get_all_games(self) -> List[Game]:
         """Get all games for admin view - only OWNED games, excluding buy list and wishlist"""
-        return self.db.execute(
+        return self.db.execute(self._all_games_stmt()).scalars().all()
+
+    @staticmethod
+    def _all_games_stmt():
+        """Statement behind get_all_games (sleeves eager-loaded for game_to_dict)"""
+        return (
             select(Game)
             .where(or_(Game.status == "OWNED", Game.status.is_(None)))
             .options(selectinload(Game.sleeves))
-        ).scalars().all()
+        )
 
     def get_filtered_games(
         self,
         search: Optional[str] = None,
         category: Optional[str] = None,
         designer: Optional[str] = None,
+        mechanic: Optional[str] = None,
+        publisher: Optional[str] = None,
         nz_designer: Optional[bool] = None,
         players: Optional[int] = None,
         complexity_min: Optional[float] = None,
@@ -94,9 +283,12 @@ class GameService:
         to eliminate duplicate queries and reduce DB round trips from 2 to 1.
 
         Args:
-            search: Search query for title, designers, description
+            search: Full-text query over title, designers, mechanics, description
+                (see services.search)
             category: Category filter - single key, or comma-separated keys for multi-select
-            designer: Designer name filter
+            designer: Designer name filter (exact name, case-insensitive)
+            mechanic: Mechanic name filter (exact name, case-insensitive)
+            publisher: Publisher name filter (exact name, case-insensitive)
             nz_designer: Filter by NZ designer flag
             players: Filter by player count
             complexity_min: Minimum complexity rating (1-5)
@@ -105,144 +297,77 @@ class GameService:
             playtime_max_max: Maximum playtime_max in minutes (upper bound of the "how long" bucket)
             quick_pick: Mobile-catalogue quick-pick trait filter key: 'first', 'kids', 'group', 'coop'
             recently_added_days: Filter games added within last N days
-            sort: Sort order
+            sort: Sort order ("relevance" ranks search matches best-first;
+                without a search it falls back to title order)
             page: Page number (1-indexed)
             page_size: Items per page
 
         Returns:
             Tuple of (list of Game objects, total count)
         """
+        # In-memory columnar engine (opt-in): answers the ID/count step from
+        # NumPy arrays, then loads the page's Game rows exactly like the SQL path
+        if catalogue_engine.available:
+            catalogue_engine.ensure_loaded(self.db)
+            game_ids, total = catalogue_engine.query(
+                search=search,
+                category=category,
+                designer=designer,
+                mechanic=mechanic,
+                publisher=publisher,
+                nz_designer=nz_designer,
+                players=players,
+                complexity_min=complexity_min,
+                complexity_max=complexity_max,
+                playtime_max_min=playtime_max_min,
+                playtime_max_max=playtime_max_max,
+                quick_pick=quick_pick,
+                recently_added_days=recently_added_days,
+                sort=sort,
+                page=page,
+                page_size=page_size,
+            )
+            return self._load_games_in_order(game_ids), total
+
         # Sprint 12: Performance Optimization - Use window function for count + pagination
         # This eliminates the duplicate count query and reduces DB round trips from 2 to 1
         #
         # Strategy: Use a subquery to get IDs + total count, then fetch full objects
         # This works around the limitation that window functions don't work well with eager loading
 
+        conditions = self._public_filter_conditions(
+            search=search,
+            category=category,
+            designer=designer,
+            mechanic=mechanic,
+            publisher=publisher,
+            nz_designer=nz_designer,
+            players=players,
+            complexity_min=complexity_min,
+            complexity_max=complexity_max,
+            playtime_max_min=playtime_max_min,
+            playtime_max_max=playtime_max_max,
+            quick_pick=quick_pick,
+            recently_added_days=recently_added_days,
+        )
+        relevance = sort == "relevance" and bool(search and search.strip())
+        if relevance and not uses_pg_search(self.db):
+            return self._local_relevance_page(conditions, search.strip(), page, page_size)
+
         # Step 1: Build ID subquery with window function for total count
         # Remove eager loading options for the ID selection
         id_query = select(
             Game.id,
             func.count().over().label('total_count')
-        ).where(
-            or_(Game.status == "OWNED", Game.status.is_(None))
-        ).where(
-            ~and_(
-                Game.is_expansion == True,
-                Game.expansion_type == 'requires_base'
-            )
-        )
-
-        # Apply all the same filters to id_query (this is the ONLY place filters are applied now)
-        if search and search.strip():
-            search_term = f"%{search.strip()}%"
-            search_conditions = [Game.title.ilike(search_term)]
-            if hasattr(Game, "designers"):
-                search_conditions.append(cast(Game.designers, String).ilike(search_term))
-            if hasattr(Game, "description"):
-                search_conditions.append(Game.description.ilike(search_term))
-            id_query = id_query.where(or_(*search_conditions))
-
-        if designer and designer.strip():
-            designer_filter = f"%{designer.strip()}%"
-            if hasattr(Game, "designers"):
-                id_query = id_query.where(cast(Game.designers, String).ilike(designer_filter))
-
-        if nz_designer is not None:
-            id_query = id_query.where(Game.nz_designer == nz_designer)
-
-        if players is not None:
-            from sqlalchemy import alias
-            Expansion = alias(Game.__table__, name="expansion")
-            expansion_subquery = (
-                select(Expansion.c.base_game_id)
-                .where(Expansion.c.base_game_id.isnot(None))
-                .where(
-                    or_(
-                        Expansion.c.modifies_players_min.is_(None),
-                        Expansion.c.modifies_players_min <= players,
-                    )
-                )
-                .where(
-                    or_(
-                        Expansion.c.modifies_players_max.is_(None),
-                        Expansion.c.modifies_players_max >= players,
-                    )
-                )
-            )
-            id_query = id_query.where(
-                or_(
-                    and_(
-                        or_(
-                            Game.players_min.is_(None), Game.players_min <= players
-                        ),
-                        or_(
-                            Game.players_max.is_(None), Game.players_max >= players
-                        ),
-                    ),
-                    Game.id.in_(expansion_subquery),
-                )
-            )
-
-        if complexity_min is not None or complexity_max is not None:
-            if complexity_min is not None:
-                id_query = id_query.where(
-                    and_(
-                        Game.complexity.isnot(None),
-                        Game.complexity >= complexity_min
-                    )
-                )
-            if complexity_max is not None:
-                id_query = id_query.where(
-                    and_(
-                        Game.complexity.isnot(None),
-                        Game.complexity <= complexity_max
-                    )
-                )
-
-        if playtime_max_min is not None:
-            id_query = id_query.where(
-                and_(
-                    Game.playtime_max.isnot(None),
-                    Game.playtime_max >= playtime_max_min,
-                )
-            )
-        if playtime_max_max is not None:
-            id_query = id_query.where(
-                and_(
-                    Game.playtime_max.isnot(None),
-                    Game.playtime_max <= playtime_max_max,
-                )
-            )
-
-        quick_pick_condition = self._quick_pick_condition(quick_pick)
-        if quick_pick_condition is not None:
-            id_query = id_query.where(quick_pick_condition)
-            # Respect admin-curated exclusions for this specific quick pick
-            # (the JSON array is cast to text and pattern-matched so this
-            # works identically on SQLite and Postgres/JSONB).
-            id_query = id_query.where(
-                or_(
-                    Game.excluded_quick_picks.is_(None),
-                    ~cast(Game.excluded_quick_picks, String).ilike(f'%"{quick_pick}"%'),
-                )
-            )
-
-        if recently_added_days is not None:
-            cutoff_date = datetime.now(timezone.utc) - timedelta(
-                days=recently_added_days
-            )
-            if hasattr(Game, "date_added"):
-                id_query = id_query.where(Game.date_added >= cutoff_date)
-
-        if category and category != "all":
-            category_keys = [c.strip() for c in category.split(",") if c.strip()]
-            if len(category_keys) == 1 and category_keys[0] == "uncategorized":
-                id_query = id_query.where(Game.mana_meeple_category.is_(None))
-            elif category_keys:
-                id_query = id_query.where(Game.mana_meeple_category.in_(category_keys))
+        ).where(*conditions)
 
         # Apply sorting to ID query
-        id_query = self._apply_sorting(id_query, sort)
+        if relevance:
+            id_query = id_query.order_by(
+                pg_search_rank(search.strip()).desc(), Game.title.asc(), Game.id.asc()
+            )
+        else:
+            id_query = self._apply_sorting(id_query, sort)
 
         # Save the base query before pagination for potential count fallback
         base_id_query = id_query
@@ -260,21 +385,7 @@ class GameService:
             game_ids = [row[0] for row in id_results]
 
             # Step 2: Fetch full Game objects with eager loading for these specific IDs
-            # This preserves the expansion loading behavior
-            games = (
-                self.db.execute(
-                    select(Game)
-                    .options(selectinload(Game.expansions))
-                    .where(Game.id.in_(game_ids))
-                )
-                .scalars()
-                .all()
-            )
-
-            # Preserve the original sort order from id_query
-            # (in_ doesn't guarantee order, so we need to re-sort)
-            id_order = {id_: idx for idx, id_ in enumerate(game_ids)}
-            games = sorted(games, key=lambda g: id_order[g.id])
+            games = self._load_games_in_order(game_ids)
         else:
             # Edge case: Page beyond available data
             # Window function returned no rows, so we need to get count separately
@@ -288,39 +399,446 @@ class GameService:
 
         return games, total
 
-    # Valid quick-pick keys for the mobile library's "Who's playing today?" row
-    QUICK_PICK_KEYS = ("first", "kids", "group", "coop")
+    def get_filtered_games_keyset(
+        self,
+        search: Optional[str] = None,
+        category: Optional[str] = None,
+        designer: Optional[str] = None,
+        mechanic: Optional[str] = None,
+        publisher: Optional[str] = None,
+        nz_designer: Optional[bool] = None,
+        players: Optional[int] = None,
+        complexity_min: Optional[float] = None,
+        complexity_max: Optional[float] = None,
+        playtime_max_min: Optional[int] = None,
+        playtime_max_max: Optional[int] = None,
+        quick_pick: Optional[str] = None,
+        recently_added_days: Optional[int] = None,
+        sort: str = "title_asc",
+        cursor: Optional[str] = None,
+        page_size: int = 24,
+        include_total: bool = False,
+    ) -> Tuple[List[Game], Optional[str], Optional[int]]:
+        """
+        Get filtered games using keyset (cursor) pagination.
+
+        Instead of OFFSET, each page seeks directly past the last row of the
+        previous page (lead sort key -> title -> id) using the idx_keyset_*
+        composite indexes, so cost stays O(page_size) however deep the client
+        scrolls. The total count is only computed when asked for.
+
+        Args:
+            (filters): Same as get_filtered_games
+            sort: Sort order (same values as get_filtered_games)
+            cursor: next_cursor from the previous page, or None/"" for the first page
+            page_size: Items per page
+            include_total: Also count all matching games (one extra query)
+
+        Returns:
+            Tuple of (list of Game objects, next cursor or None at the end,
+            total count or None if not requested)
+
+        Raises:
+            ValidationError: If the cursor is malformed or was issued for another
+                sort, or for sort=relevance with a search (scores can't be seeked)
+        """
+        if sort == "relevance" and search and search.strip():
+            raise ValidationError(
+                "sort=relevance is not supported with cursor pagination; use page instead"
+            )
+        conditions = self._public_filter_conditions(
+            search=search,
+            category=category,
+            designer=designer,
+            mechanic=mechanic,
+            publisher=publisher,
+            nz_designer=nz_designer,
+            players=players,
+            complexity_min=complexity_min,
+            complexity_max=complexity_max,
+            playtime_max_min=playtime_max_min,
+            playtime_max_max=playtime_max_max,
+            quick_pick=quick_pick,
+            recently_added_days=recently_added_days,
+        )
+        after = _decode_cursor(cursor, sort) if cursor else None
+
+        # Fetch one extra row to know whether another page exists
+        rows = self._keyset_rows(conditions, sort, after, page_size + 1)
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = _encode_cursor(sort, last.sort_key, last.title, last.id)
 
-    def _quick_pick_condition(self, quick_pick: Optional[str]):
+        total = None
+        if include_total:
+            total = self.db.execute(
+                select(func.count(Game.id)).where(*conditions)
+            ).scalar() or 0
+
+        return self._load_games_in_order([row.id for row in rows]), next_cursor, total
+
+    def _keyset_sort_spec(self, sort: str) -> Tuple[Any, bool, bool, bool]:
         """
-        Build the SQLAlchemy WHERE condition for a quick-pick's auto-selection
-        logic (no exclusions applied). Shared by get_filtered_games (public
-        browsing, exclusions applied separately) and get_quick_pick_candidates
-        (admin curation view, deliberately ignores exclusions so staff can see
-        the full auto-generated list).
+        Describe a sort order for keyset pagination, mirroring _apply_sorting.
 
-        Returns None for an unrecognized/empty key.
+        Returns:
+            Tuple of (lead key expression or None for title sorts,
+            lead descending, lead nullable (NULLS LAST), title descending)
+        """
+        if sort == "title_desc":
+            return None, False, False, True
+        if sort in ("year_desc", "year_asc"):
+            return Game.year, sort == "year_desc", True, False
+        if sort in ("date_added_desc", "date_added_asc"):
+            return Game.date_added, sort == "date_added_desc", True, False
+        if sort in ("rating_desc", "rating_asc"):
+            return Game.average_rating, sort == "rating_desc", True, False
+        if sort == "time_asc":
+            return self._avg_playtime_expr(999999), False, False, False
+        if sort == "time_desc":
+            return self._avg_playtime_expr(0), True, False, False
+        return None, False, False, False  # title_asc (default)
+
+    def _keyset_rows(
+        self,
+        conditions: List[Any],
+        sort: str,
+        after: Optional[Tuple[Any, str, int]],
+        limit: int,
+    ) -> List[Any]:
+        """
+        Fetch up to `limit` (id, title, sort_key) rows positioned after `after`.
+
+        Each predicate carries a redundant inclusive bound on its leading key
+        (e.g. year >= :year) so the database can start an index range scan at
+        the cursor instead of filtering from the beginning.
+        """
+        lead, descending, nullable, title_descending = self._keyset_sort_spec(sort)
+        base = select(
+            Game.id,
+            Game.title,
+            (lead if lead is not None else null()).label("sort_key"),
+        ).where(*conditions)
+        title_order = Game.title.desc() if title_descending else Game.title.asc()
+
+        def after_title(title: str, game_id: int):
+            if title_descending:
+                past, bound = Game.title < title, Game.title <= title
+            else:
+                past, bound = Game.title > title, Game.title >= title
+            return and_(bound, or_(past, and_(Game.title == title, Game.id > game_id)))
+
+        def after_lead(value: Any, title: str, game_id: int):
+            if descending:
+                past, bound = lead < value, lead <= value
+            else:
+                past, bound = lead > value, lead >= value
+            return and_(bound, or_(past, and_(lead == value, after_title(title, game_id))))
+
+        def title_ordered(query):
+            return query.order_by(title_order, Game.id.asc())
+
+        if lead is None:
+            query = title_ordered(base)
+            if after is not None:
+                query = query.where(after_title(after[1], after[2]))
+            return list(self.db.execute(query.limit(limit)).all())
+
+        lead_order = lead.desc() if descending else lead.asc()
+        if not nullable:
+            query = base.order_by(lead_order, title_order, Game.id.asc())
+            if after is not None:
+                query = query.where(after_lead(*after))
+            return list(self.db.execute(query.limit(limit)).all())
+
+        # NULLS LAST: walk the non-NULL keys first, then the NULL tail ordered by
+        # title/id. Each phase is a plain range scan on its own index.
+        rows: List[Any] = []
+        null_after = None
+        if after is None or after[0] is not None:
+            query = base.where(lead.isnot(None)).order_by(lead_order, title_order, Game.id.asc())
+            if after is not None:
+                query = query.where(after_lead(*after))
+            rows = list(self.db.execute(query.limit(limit)).all())
+            if len(rows) >= limit:
+                return rows
+        else:
+            null_after = (after[1], after[2])
+
+        query = title_ordered(base.where(lead.is_(None)))
+        if null_after is not None:
+            query = query.where(after_title(*null_after))
+        rows.extend(self.db.execute(query.limit(limit - len(rows))).all())
+        return rows
+
+    def _load_games_in_order(self, game_ids: List[int]) -> List[Game]:
+        """
+        Fetch full Game objects (with expansions eager-loaded) for a page of IDs,
+        preserving the order of game_ids.
+        """
+        if not game_ids:
+            return []
+
+        games = (
+            self.db.execute(
+                select(Game)
+                .options(selectinload(Game.expansions))
+                .where(Game.id.in_(game_ids))
+            )
+            .scalars()
+            .all()
+        )
+
+        # Preserve the original sort order
+        # (in_ doesn't guarantee order, so we need to re-sort)
+        id_order = {id_: idx for idx, id_ in enumerate(game_ids)}
+        return sorted(games, key=lambda g: id_order[g.id])
+
+    def _public_filter_conditions(
+        self,
+        search: Optional[str] = None,
+        category: Optional[str] = None,
+        designer: Optional[str] = None,
+        mechanic: Optional[str] = None,
+        publisher: Optional[str] = None,
+        nz_designer: Optional[bool] = None,
+        players: Optional[int] = None,
+        complexity_min: Optional[float] = None,
+        complexity_max: Optional[float] = None,
+        playtime_max_min: Optional[int] = None,
+        playtime_max_max: Optional[int] = None,
+        quick_pick: Optional[str] = None,
+        recently_added_days: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Build the WHERE conditions for the public catalogue: owned games,
+        no base-game-only expansions, plus the requested filters.
+        Shared by offset (get_filtered_games) and keyset
+        (get_filtered_games_keyset) pagination.
+        """
+        conditions = self._base_filter_conditions(search, designer, mechanic, publisher, recently_added_days)
+        facet_conditions = self._facet_filter_conditions(
+            category=category,
+            nz_designer=nz_designer,
+            players=players,
+            complexity_min=complexity_min,
+            complexity_max=complexity_max,
+            playtime_max_min=playtime_max_min,
+            playtime_max_max=playtime_max_max,
+            quick_pick=quick_pick,
+        )
+        for facet in facet_conditions.values():
+            conditions.extend(facet)
+        return conditions
+
+    def _base_filter_conditions(
+        self,
+        search: Optional[str] = None,
+        designer: Optional[str] = None,
+        mechanic: Optional[str] = None,
+        publisher: Optional[str] = None,
+        recently_added_days: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Public visibility plus the filters that are not facets (search,
+        designer/mechanic/publisher, recency)
+        """
+        conditions = [
+            or_(Game.status == "OWNED", Game.status.is_(None)),
+            ~and_(
+                Game.is_expansion == True,
+                Game.expansion_type == 'requires_base'
+            ),
+        ]
+
+        if search and search.strip():
+            conditions.append(self._search_condition(search.strip()))
+
+        for kind, name in (("designer", designer), ("mechanic", mechanic), ("publisher", publisher)):
+            if name and name.strip():
+                conditions.append(self._entity_condition(kind, name))
+
+        if recently_added_days is not None:
+            cutoff_date = datetime.now(timezone.utc) - timedelta(
+                days=recently_added_days
+            )
+            if hasattr(Game, "date_added"):
+                conditions.append(Game.date_added >= cutoff_date)
+
+        return conditions
+
+    @staticmethod
+    def _entity_condition(kind: str, name: str):
+        """
+        Game lists the named designer/mechanic/publisher/artist: an indexed
+        lookup of the normalized entity, joined to its game links
+        """
+        return Game.id.in_(
+            select(GameEntityLink.game_id)
+            .join(BggEntity, BggEntity.id == GameEntityLink.entity_id)
+            .where(BggEntity.kind == kind, BggEntity.name_key == entity_key(name))
+        )
+
+    @classmethod
+    def _facet_filter_conditions(
+        cls,
+        category: Optional[str] = None,
+        nz_designer: Optional[bool] = None,
+        players: Optional[int] = None,
+        complexity_min: Optional[float] = None,
+        complexity_max: Optional[float] = None,
+        playtime_max_min: Optional[int] = None,
+        playtime_max_max: Optional[int] = None,
+        quick_pick: Optional[str] = None,
+    ) -> Dict[str, List[Any]]:
         """
-        if quick_pick == "first":
-            return and_(Game.complexity.isnot(None), Game.complexity < 1.5)
-        elif quick_pick == "kids":
-            return or_(
-                Game.mana_meeple_category == "KIDS_FAMILIES",
+        WHERE conditions of each faceted filter, keyed by facet name
+        (empty list when that filter is not set)
+        """
+        facets: Dict[str, List[Any]] = {facet: [] for facet in cls.FACET_NAMES}
+
+        if category and category != "all":
+            category_keys = [c.strip() for c in category.split(",") if c.strip()]
+            if len(category_keys) == 1 and category_keys[0] == "uncategorized":
+                facets["categories"].append(Game.mana_meeple_category.is_(None))
+            elif category_keys:
+                facets["categories"].append(Game.mana_meeple_category.in_(category_keys))
+
+        if players is not None:
+            facets["players"].append(cls._players_condition(players))
+
+        if complexity_min is not None:
+            facets["complexity"].append(
                 and_(
                     Game.complexity.isnot(None),
-                    Game.complexity < 1.5,
-                    Game.min_age.isnot(None),
-                    Game.min_age <= 10,
-                ),
+                    Game.complexity >= complexity_min
+                )
             )
-        elif quick_pick == "group":
-            return and_(Game.players_max.isnot(None), Game.players_max >= 6)
-        elif quick_pick == "coop":
-            return or_(
-                Game.is_cooperative.is_(True),
-                Game.mana_meeple_category == "COOP_ADVENTURE",
+        if complexity_max is not None:
+            facets["complexity"].append(
+                and_(
+                    Game.complexity.isnot(None),
+                    Game.complexity <= complexity_max
+                )
             )
-        return None
+
+        if playtime_max_min is not None:
+            facets["playtime"].append(
+                and_(
+                    Game.playtime_max.isnot(None),
+                    Game.playtime_max >= playtime_max_min,
+                )
+            )
+        if playtime_max_max is not None:
+            facets["playtime"].append(
+                and_(
+                    Game.playtime_max.isnot(None),
+                    Game.playtime_max <= playtime_max_max,
+                )
+            )
+
+        quick_pick_filter = cls._quick_pick_filter(quick_pick)
+        if quick_pick_filter is not None:
+            facets["quick_picks"].append(quick_pick_filter)
+
+        if nz_designer is not None:
+            facets["nz_designer"].append(Game.nz_designer == nz_designer)
+
+        return facets
+
+    @staticmethod
+    def _players_condition(players: int):
+        """
+        Game fits `players` at the table, on its own or with one of its
+        expansions: a range check on the materialized effective_players_min/max
+        """
+        return and_(
+            or_(
+                Game.effective_players_min.is_(None),
+                Game.effective_players_min <= players,
+            ),
+            or_(
+                Game.effective_players_max.is_(None),
+                Game.effective_players_max >= players,
+            ),
+        )
+
+    @classmethod
+    def _quick_pick_filter(cls, quick_pick: Optional[str]):
+        """
+        Public quick-pick filter: the auto-selection logic minus the games
+        admins excluded from this quick pick. None for an unknown key.
+        """
+        column = cls._quick_pick_column(quick_pick)
+        if column is None:
+            return None
+        return column.is_(True)
+
+    def _search_condition(self, search: str):
+        """
+        WHERE condition for the ?q= full-text search: the tsvector/pg_trgm
+        backend on PostgreSQL, otherwise the in-process index's matching IDs.
+        """
+        if uses_pg_search(self.db):
+            return pg_search_condition(search)
+        scores = catalogue_search.search_catalogue(self.db, search)
+        if not scores:
+            return false()
+        # Inlined at execution: a broad query can match more IDs than SQLite allows bind parameters
+        return Game.id.in_(
+            bindparam("search_ids", list(scores), expanding=True, literal_execute=True)
+        )
+
+    def _local_relevance_page(
+        self, conditions: List[Any], search: str, page: int, page_size: int
+    ) -> Tuple[List[Game], int]:
+        """
+        sort=relevance without PostgreSQL: order every match by its in-process
+        score (ties by title, then id) and slice the page in Python.
+        """
+        scores = catalogue_search.search_catalogue(self.db, search)
+        rows = self.db.execute(select(Game.id, Game.title).where(*conditions)).all()
+        rows.sort(key=lambda row: (-scores.get(row.id, 0.0), row.title, row.id))
+        offset = (page - 1) * page_size
+        page_ids = [row.id for row in rows[offset : offset + page_size]]
+        return self._load_games_in_order(page_ids), len(rows)
+
+    # Valid quick-pick keys for the mobile library's "Who's playing today?" row
+    QUICK_PICK_KEYS = QUICK_PICK_KEYS
+
+    # Faceted filters (see get_facet_counts)
+    FACET_NAMES = ("categories", "players", "complexity", "playtime", "quick_picks", "nz_designer")
+    # Facet buckets, matching the mobile library filter sheet options
+    # (frontend/src/utils/libraryFilters.js). "6+" counts games that fit 6.
+    PLAYER_BUCKETS = {"1": 1, "2": 2, "3": 3, "4": 4, "5": 5, "6+": 6}
+    # Half-open [min, max) ranges; None leaves that side open
+    COMPLEXITY_BUCKETS = {
+        "easy": (None, 1.5),
+        "light": (1.5, 2.2),
+        "medium": (2.2, 3.0),
+        "deep": (3.0, None),
+    }
+    PLAYTIME_BUCKETS = {"quick": (None, 31), "mid": (31, 61), "long": (61, None)}
+
+    @classmethod
+    def _quick_pick_column(cls, quick_pick: Optional[str]):
+        """
+        Materialized membership column for a quick pick (see Game.quick_pick_*):
+        NULL when the game doesn't match the auto-selection logic, False when it
+        does but an admin excluded it, True when it is shown. Shared by
+        get_filtered_games (public browsing, = true) and get_quick_pick_candidates
+        (admin curation view, IS NOT NULL so staff see the full auto-generated
+        list including exclusions).
+
+        Returns None for an unrecognized/empty key.
+        """
+        if quick_pick not in cls.QUICK_PICK_KEYS:
+            return None
+        return getattr(Game, f"quick_pick_{quick_pick}")
 
     def get_quick_pick_candidates(self, quick_pick: str) -> List[Game]:
         """
@@ -335,11 +853,19 @@ class GameService:
         Returns:
             List of Game objects, title-sorted. Empty list for an unknown key.
         """
-        condition = self._quick_pick_condition(quick_pick)
-        if condition is None:
+        stmt = self._quick_pick_candidates_stmt(quick_pick)
+        if stmt is None:
             return []
+        return list(self.db.execute(stmt).scalars().all())
+
+    @classmethod
+    def _quick_pick_candidates_stmt(cls, quick_pick: str):
+        """Statement behind get_quick_pick_candidates (None for an unknown key)"""
+        column = cls._quick_pick_column(quick_pick)
+        if column is None:
+            return None
 
-        stmt = (
+        return (
             select(Game)
             .where(or_(Game.status == "OWNED", Game.status.is_(None)))
             .where(
@@ -348,10 +874,9 @@ class GameService:
                     Game.expansion_type == "requires_base",
                 )
             )
-            .where(condition)
+            .where(column.isnot(None))
             .order_by(Game.title.asc())
         )
-        return list(self.db.execute(stmt).scalars().all())
 
     def _apply_sorting(self, query, sort: str):
         """
@@ -389,57 +914,55 @@ class GameService:
                 return query.order_by(Game.average_rating.asc().nulls_last(), Game.title.asc(), Game.id.asc())
             return query.order_by(Game.title.asc(), Game.id.asc())
         elif sort == "time_asc":
-            # SQLAlchemy 2.0: case() takes positional args, not a list
-            avg_time = case(
-                (
-                    and_(
-                        Game.playtime_min.isnot(None),
-                        Game.playtime_max.isnot(None),
-                    ),
-                    (Game.playtime_min + Game.playtime_max) / 2,
-                ),
-                (Game.playtime_min.isnot(None), Game.playtime_min),
-                (Game.playtime_max.isnot(None), Game.playtime_max),
-                else_=999999,
-            )
+            avg_time = self._avg_playtime_expr(999999)
             return query.order_by(avg_time.asc(), Game.title.asc(), Game.id.asc())
         elif sort == "time_desc":
-            # SQLAlchemy 2.0: case() takes positional args, not a list
-            avg_time = case(
-                (
-                    and_(
-                        Game.playtime_min.isnot(None),
-                        Game.playtime_max.isnot(None),
-                    ),
-                    (Game.playtime_min + Game.playtime_max) / 2,
-                ),
-                (Game.playtime_min.isnot(None), Game.playtime_min),
-                (Game.playtime_max.isnot(None), Game.playtime_max),
-                else_=0,
-            )
+            avg_time = self._avg_playtime_expr(0)
             return query.order_by(avg_time.desc(), Game.title.asc(), Game.id.asc())
         else:  # Default to title_asc
             return query.order_by(Game.title.asc(), Game.id.asc())
 
+    @staticmethod
+    def _avg_playtime_expr(fallback: int):
+        """
+        Average playtime sort key: mean of min/max when both are set, otherwise
+        whichever is set, otherwise `fallback` (sorts unknown playtimes last).
+        """
+        # SQLAlchemy 2.0: case() takes positional args, not a list
+        return case(
+            (
+                and_(
+                    Game.playtime_min.isnot(None),
+                    Game.playtime_max.isnot(None),
+                ),
+                (Game.playtime_min + Game.playtime_max) / 2,
+            ),
+            (Game.playtime_min.isnot(None), Game.playtime_min),
+            (Game.playtime_max.isnot(None), Game.playtime_max),
+            else_=fallback,
+        )
+
     def get_games_by_designer(self, designer_name: str) -> List[Game]:
         """
         Get all games by a specific designer.
 
         Args:
-            designer_name: Name of the designer to search for
+            designer_name: Designer name (exact, case-insensitive)
 
         Returns:
             List of Game objects
         """
-        designer_filter = f"%{designer_name}%"
-        # Only show OWNED games (or NULL status which defaults to OWNED)
-        query = select(Game).where(or_(Game.status == "OWNED", Game.status.is_(None)))
-
-        # Cast JSON to text for searching (works in both SQLite and PostgreSQL)
-        if hasattr(Game, "designers"):
-            query = query.where(cast(Game.designers, String).ilike(designer_filter))
+        return self.db.execute(self._games_by_designer_stmt(designer_name)).scalars().all()
 
-        return self.db.execute(query).scalars().all()
+    @classmethod
+    def _games_by_designer_stmt(cls, designer_name: str):
+        """Statement behind get_games_by_designer"""
+        # Only show OWNED games (or NULL status which defaults to OWNED)
+        return (
+            select(Game)
+            .where(or_(Game.status == "OWNED", Game.status.is_(None)))
+            .where(cls._entity_condition("designer", designer_name))
+        )
 
     def create_game(self, game_data: Dict[str, Any]) -> Game:
         """
@@ -503,6 +1026,7 @@ class GameService:
         self.db.add(game)
         self.db.commit()
         self.db.refresh(game)
+        notify_catalogue_change(self.db, [game.id], OP_CREATE)
 
         logger.info(f"Created game: {game.title} (ID: {game.id})")
         return game
@@ -586,6 +1110,7 @@ class GameService:
             "modifies_players_max",
         ]
 
+        previous_base_id = game.base_game_id
         for field in updatable_fields:
             if field in game_data:
                 # Check if field exists in model before setting
@@ -595,8 +1120,15 @@ class GameService:
                     continue
                 setattr(game, field, game_data[field])
 
+        # Base games (old and new) whose effective player range this changes
+        affected_bases = []
+        if _PLAYER_RANGE_FIELDS & game_data.keys():
+            affected_bases = self._linked_base_ids(game, previous_base_id)
+            self.refresh_effective_players([game.id, *affected_bases])
+
         self.db.commit()
         self.db.refresh(game)
+        notify_catalogue_change(self.db, [game.id, *affected_bases], OP_UPDATE)
 
         logger.info(f"Updated game: {game.title} (ID: {game.id})")
         return game
@@ -619,8 +1151,22 @@ class GameService:
             raise GameNotFoundError(f"Game {game_id} not found")
 
         game_title = game.title
+        # Expansions keep a dangling base_game_id reference, so refresh them too
+        expansion_ids = [expansion.id for expansion in game.expansions]
+        # Deleting an expansion narrows its base game's effective player range
+        affected_bases = self._linked_base_ids(game)
+        self.db.execute(
+            delete(GameSimilarity).where(
+                or_(GameSimilarity.game_id == game_id, GameSimilarity.similar_game_id == game_id)
+            )
+        )
         self.db.delete(game)
+        # Tombstone for clients syncing through /api/public/changes
+        self.db.add(GameDeletion(game_id=game_id))
+        self.refresh_effective_players(affected_bases)
         self.db.commit()
+        notify_catalogue_change(self.db, [game_id], OP_DELETE)
+        notify_catalogue_change(self.db, expansion_ids + affected_bases, OP_UPDATE)
 
         safe_title = re.sub(r'[\n\r]', ' ', str(game_title))
         logger.info("Deleted game: %s (ID: %s)", safe_title, int(game_id))
@@ -639,6 +1185,8 @@ class GameService:
             bgg_data: Dictionary containing BGG data
             commit: Whether to commit changes to database (default True)
         """
+        previous_base_id = game.base_game_id
+
         # Update basic fields
         game.title = bgg_data.get("title", game.title)
         game.categories = ", ".join(bgg_data.get("categories", []))
@@ -667,6 +1215,11 @@ class GameService:
         # Add to session
         self.db.add(game)
 
+        # Keep effective player ranges of this game and its base game(s) current
+        self.db.flush()
+        affected_bases = self._linked_base_ids(game, previous_base_id)
+        self.refresh_effective_players([game.id, *affected_bases])
+
         # Commit if requested
         if commit:
             self.db.commit()
@@ -678,6 +1231,56 @@ class GameService:
         # Final commit for sleeve data if needed
         if commit:
             self.db.commit()
+            notify_catalogue_change(self.db, [game.id, *affected_bases], OP_UPDATE)
+
+    @staticmethod
+    def _linked_base_ids(game: Game, previous_base_id: Optional[int] = None) -> List[int]:
+        """Distinct base game IDs a game is (or was) linked to as an expansion"""
+        return [
+            base_id
+            for base_id in dict.fromkeys([previous_base_id, game.base_game_id])
+            if base_id is not None and base_id != game.id
+        ]
+
+    def refresh_effective_players(self, game_ids: List[Optional[int]]) -> None:
+        """
+        Recompute effective_players_min/max for the given games from their own
+        player range and their linked expansions. Runs in the current
+        transaction (pending changes are flushed first); the caller commits.
+
+        Args:
+            game_ids: Game IDs to recompute (None entries are ignored)
+        """
+        ids = [game_id for game_id in dict.fromkeys(game_ids) if game_id is not None]
+        if not ids:
+            return
+        self.db.flush()
+        self.db.execute(
+            update(Game)
+            .where(Game.id.in_(ids))
+            .values(**_effective_players_expressions())
+            .execution_options(synchronize_session="fetch")
+        )
+
+    def find_stale_effective_players(self) -> List[int]:
+        """
+        Consistency check: IDs of games whose stored effective player range
+        differs from a fresh computation (e.g. after writes that bypassed
+        GameService). Fix with refresh_effective_players.
+        """
+        expected = _effective_players_expressions()
+        return list(
+            self.db.execute(
+                select(Game.id)
+                .where(
+                    or_(
+                        Game.effective_players_min.is_distinct_from(expected["effective_players_min"]),
+                        Game.effective_players_max.is_distinct_from(expected["effective_players_max"]),
+                    )
+                )
+                .order_by(Game.id)
+            ).scalars()
+        )
 
     def _auto_link_expansion(self, game: Game, bgg_data: Dict[str, Any]) -> None:
         """
@@ -907,6 +1510,7 @@ class GameService:
         if existing:
             # Update existing game using consolidated method
             self.update_game_from_bgg_data(existing, bgg_data, commit=True)
+            self._refresh_similar_games(existing)
             safe_title = re.sub(r'[\n\r]', ' ', str(existing.title))
             logger.info("Updated from BGG: %s (BGG ID: %s)", safe_title, int(bgg_id))
             return existing, True
@@ -920,11 +1524,219 @@ class GameService:
 
             # Use consolidated method to populate all BGG data
             self.update_game_from_bgg_data(game, bgg_data, commit=True)
+            self._refresh_similar_games(game)
 
             safe_title = re.sub(r'[\n\r]', ' ', str(game.title))
             logger.info("Imported from BGG: %s (BGG ID: %s)", safe_title, int(bgg_id))
             return game, False
 
+    def _refresh_similar_games(self, game: Game) -> None:
+        """
+        Incrementally update the stored similar-games lists after a BGG import.
+        Recommendations are best-effort: a failure is logged, never raised.
+
+        The import itself has already bumped the catalogue version, so a
+        /similar request in between may have cached the old lists under it:
+        the games whose lists changed are announced again to bump it past them.
+        """
+        try:
+            refreshed = refresh_similar_games(self.db, [game.id])
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning("Failed to refresh similar games for game %s: %s", game.id, e)
+            return
+        notify_catalogue_change(self.db, refreshed, OP_UPDATE)
+
+    def get_similar_games(self, game_id: int, limit: int = SIMILAR_GAMES_TOP_K) -> Optional[List[Game]]:
+        """
+        Get the precomputed most similar public games of a public game.
+
+        Args:
+            game_id: Game ID
+            limit: Maximum number of games
+
+        Returns:
+            Games best match first, or None if the game is not in the public catalogue
+        """
+        game = self.db.execute(
+            select(Game.id).where(Game.id == game_id, *self._base_filter_conditions())
+        ).first()
+        if game is None:
+            return None
+        similar_ids = self.db.execute(
+            select(GameSimilarity.similar_game_id)
+            .join(Game, Game.id == GameSimilarity.similar_game_id)
+            .where(GameSimilarity.game_id == game_id, *self._base_filter_conditions())
+            .order_by(GameSimilarity.rank)
+            .limit(limit)
+        ).scalars().all()
+        return self._load_games_in_order(list(similar_ids))
+
+    def get_catalogue_changes(
+        self, since: Optional[Tuple[datetime, int]], limit: int
+    ) -> Tuple[List[Game], List[int], Optional[Tuple[datetime, int]], bool]:
+        """
+        Public catalogue changes after a row-version cursor, for delta sync.
+
+        Games are paged in (updated_at, id) order. A changed game that is no
+        longer public (or was deleted) comes back as a tombstone ID.
+
+        Args:
+            since: (updated_at, id) of the last change the client has seen,
+                or None for a snapshot of the whole public catalogue
+            limit: Maximum number of changed games
+
+        Returns:
+            Tuple of (public games created or updated, tombstone game IDs,
+            cursor of the last change returned (since if none), whether more
+            changes follow)
+        """
+        conditions = [Game.updated_at.isnot(None)]
+        if since is not None:
+            since_at, since_id = since
+            conditions.append(
+                or_(
+                    Game.updated_at > since_at,
+                    and_(Game.updated_at == since_at, Game.id > since_id),
+                )
+            )
+        rows = self.db.execute(
+            select(
+                Game.id,
+                Game.updated_at,
+                case((and_(*self._base_filter_conditions()), True), else_=False).label("public"),
+            )
+            .where(*conditions)
+            .order_by(Game.updated_at, Game.id)
+            .limit(limit + 1)
+        ).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        cursor = (rows[-1].updated_at, rows[-1].id) if rows else since
+
+        games = self._load_games_in_order([row.id for row in rows if row.public])
+        if since is None:
+            # A snapshot starts from an empty copy: nothing to remove
+            return games, [], cursor, has_more
+
+        deleted = [row.id for row in rows if not row.public]
+        tombstones = select(GameDeletion.game_id).where(GameDeletion.deleted_at >= since[0])
+        if has_more:
+            # Later deletions are sent with the page that reaches them
+            tombstones = tombstones.where(GameDeletion.deleted_at <= cursor[0])
+        seen = set(deleted) | {game.id for game in games}
+        for game_id in self.db.execute(tombstones.order_by(GameDeletion.id)).scalars():
+            if game_id not in seen:
+                seen.add(game_id)
+                deleted.append(game_id)
+        return games, deleted, cursor, has_more
+
+    def get_facet_counts(
+        self,
+        search: Optional[str] = None,
+        category: Optional[str] = None,
+        designer: Optional[str] = None,
+        mechanic: Optional[str] = None,
+        publisher: Optional[str] = None,
+        nz_designer: Optional[bool] = None,
+        players: Optional[int] = None,
+        complexity_min: Optional[float] = None,
+        complexity_max: Optional[float] = None,
+        playtime_max_min: Optional[int] = None,
+        playtime_max_max: Optional[int] = None,
+        quick_pick: Optional[str] = None,
+        recently_added_days: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get per-bucket counts of every facet for the current filter set
+        in a single query (conditional aggregation over the filtered rows).
+
+        Each facet is counted with every active filter except its own, so
+        with "4 players" selected the other player buckets still show how
+        many games picking them instead would return.
+
+        Args:
+            Same filters as get_filtered_games
+
+        Returns:
+            Dict with "total" (games matching every filter) and one
+            bucket -> count dict per FACET_NAMES entry
+        """
+        from utils.helpers import CATEGORY_KEYS
+
+        facet_filters = self._facet_filter_conditions(
+            category=category,
+            nz_designer=nz_designer,
+            players=players,
+            complexity_min=complexity_min,
+            complexity_max=complexity_max,
+            playtime_max_min=playtime_max_min,
+            playtime_max_max=playtime_max_max,
+            quick_pick=quick_pick,
+        )
+
+        def range_condition(column, bounds):
+            low, high = bounds
+            condition = [column.isnot(None)]
+            if low is not None:
+                condition.append(column >= low)
+            if high is not None:
+                condition.append(column < high)
+            return and_(*condition)
+
+        buckets: Dict[str, Dict[str, Any]] = {
+            "categories": {
+                "all": None,
+                **{key: Game.mana_meeple_category == key for key in CATEGORY_KEYS},
+                "uncategorized": Game.mana_meeple_category.is_(None),
+            },
+            "players": {
+                label: self._players_condition(count)
+                for label, count in self.PLAYER_BUCKETS.items()
+            },
+            "complexity": {
+                label: range_condition(Game.complexity, bounds)
+                for label, bounds in self.COMPLEXITY_BUCKETS.items()
+            },
+            "playtime": {
+                label: range_condition(Game.playtime_max, bounds)
+                for label, bounds in self.PLAYTIME_BUCKETS.items()
+            },
+            "quick_picks": {key: self._quick_pick_filter(key) for key in self.QUICK_PICK_KEYS},
+            "nz_designer": {"true": Game.nz_designer == True, "false": Game.nz_designer == False},
+        }
+
+        def count_where(conditions):
+            if not conditions:
+                return func.count(Game.id)
+            return func.count(case((and_(*conditions), 1)))
+
+        slots = [("total", None)]
+        expressions = [count_where([c for filters in facet_filters.values() for c in filters])]
+        for facet, facet_buckets in buckets.items():
+            other_filters = [
+                c for name, filters in facet_filters.items() if name != facet for c in filters
+            ]
+            for label, bucket in facet_buckets.items():
+                slots.append((facet, label))
+                bucket_condition = [] if bucket is None else [bucket]
+                expressions.append(count_where(other_filters + bucket_condition))
+
+        row = self.db.execute(
+            select(*expressions).where(
+                *self._base_filter_conditions(search, designer, mechanic, publisher, recently_added_days)
+            )
+        ).one()
+
+        result: Dict[str, Any] = {facet: {} for facet in buckets}
+        for (facet, label), value in zip(slots, row):
+            if label is None:
+                result[facet] = value
+            else:
+                result[facet][label] = value
+        return result
+
     def get_category_counts(self) -> Dict[str, int]:
         """
         Get counts for each category using conditional aggregation.
@@ -0,0 +1,420 @@
+# services/image_disk_cache.py
+"""
+Local disk cache of proxied images.
+
+When Cloudinary is disabled, or an upload fails, the image proxy serves BGG
+images itself, and every request used to download the image from BGG
+again. Here each downloaded image is stored once on local disk and later
+requests are served from the file, so repeat hits never leave the box.
+
+Layout under IMAGE_DISK_CACHE_DIR:
+- objects/ab/abcdef... - image bytes, named by their SHA-256 (content
+  addressed: URLs with identical images share one file)
+- index.sqlite3 - URL -> (digest, content type, size, stored/accessed time)
+
+The index is a SQLite file next to the objects, so it survives restarts and
+is shared by every worker on the host (WAL mode, writes are short). The
+total size of the objects is kept under IMAGE_DISK_CACHE_MAX_BYTES by
+evicting the least recently used URLs; an object is deleted once no URL
+refers to it.
+
+Images proxied by streaming are written chunk by chunk through an
+ImageWriter (temporary file, hashed on the way) and only added to the index
+once complete, so a cut-off download is never served. Adding an object and
+unlinking an evicted one both happen inside a write transaction on the
+index, so workers sharing the directory never delete an object another has
+just indexed; temporary files of killed workers are swept on startup.
+
+All methods do blocking file and SQLite I/O - call them from a thread
+(asyncio.to_thread) on the event loop.
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from config import IMAGE_DISK_CACHE_DIR, IMAGE_DISK_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+# Eviction trims the cache to this fraction of the budget, so it runs once per
+# batch of stores instead of on every store near the limit
+EVICTION_LOW_WATER = 0.9
+# A hit only rewrites its access time when the stored one is older than this,
+# which keeps repeat hits read-only
+ACCESS_RESOLUTION_SECONDS = 60.0
+# Temporary files older than this belong to writers that never finished (a
+# worker killed mid-download) and are deleted on startup
+STALE_TEMP_FILE_SECONDS = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed_at ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries (digest);
+"""
+
+
+@dataclass(frozen=True)
+class CachedImage:
+    """A cached image file ready to be served"""
+
+    path: str
+    digest: str
+    content_type: str
+    size: int
+    stored_at: float
+    stat_result: os.stat_result
+
+
+class ImageDiskCache:
+    """Content-addressed, size-bounded LRU of proxied images on local disk"""
+
+    def __init__(
+        self,
+        directory: str = IMAGE_DISK_CACHE_DIR,
+        max_bytes: int = IMAGE_DISK_CACHE_MAX_BYTES,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        return {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the index on first use (caller holds the lock)"""
+        if self._conn is None:
+            Path(self.directory, "objects").mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                os.path.join(self.directory, "index.sqlite3"),
+                timeout=10,
+                check_same_thread=False,
+                isolation_level=None,  # autocommit; multi-statement writes use BEGIN IMMEDIATE
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "objects", digest[:2], digest)
+
+    def get(self, url: str) -> Optional[CachedImage]:
+        """The cached image of a URL, or None on a miss"""
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT digest, content_type, size, stored_at, accessed_at "
+                    "FROM entries WHERE url = ?",
+                    (url,),
+                ).fetchone()
+                if row is None:
+                    self.stats["misses"] += 1
+                    return None
+                digest, content_type, size, stored_at, accessed_at = row
+                path = self._object_path(digest)
+                try:
+                    stat_result = os.stat(path)
+                except FileNotFoundError:
+                    # Object removed behind the index's back: forget the entry,
+                    # unless another worker has stored the URL again meanwhile
+                    conn.execute(
+                        "DELETE FROM entries WHERE url = ? AND digest = ?", (url, digest)
+                    )
+                    self.stats["misses"] += 1
+                    return None
+                now = time.time()
+                if now - accessed_at >= ACCESS_RESOLUTION_SECONDS:
+                    conn.execute(
+                        "UPDATE entries SET accessed_at = ? WHERE url = ?", (now, url)
+                    )
+                self.stats["hits"] += 1
+                return CachedImage(path, digest, content_type, size, stored_at, stat_result)
+        except (OSError, sqlite3.Error) as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Image disk cache lookup failed: {e}")
+            return None
+
+    def put(self, url: str, content: bytes, content_type: str) -> Optional[CachedImage]:
+        """
+        Store a downloaded image.
+
+        Returns:
+            The cached image, or None when it was not stored (cache disabled,
+            image larger than the whole budget, or a disk error)
+        """
+        writer = self.writer(url, content_type)
+        if writer is None:
+            return None
+        writer.write(content)
+        return writer.commit()
+
+    def writer(self, url: str, content_type: str) -> Optional["ImageWriter"]:
+        """
+        Start storing an image that arrives in chunks (see ImageWriter).
+
+        Returns:
+            The writer, or None when the cache is disabled or unusable
+        """
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                self._connection()
+            return ImageWriter(self, url, content_type)
+        except (OSError, sqlite3.Error) as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Image disk cache store failed: {e}")
+            return None
+
+    def _commit(
+        self, url: str, tmp_path: str, digest: str, size: int, content_type: str
+    ) -> Optional[CachedImage]:
+        """Move a fully written temporary file into place and index it"""
+        path = self._object_path(digest)
+        try:
+            with self._lock:
+                conn = self._connection()
+                # Holding the index's write lock, so an eviction in another
+                # worker cannot unlink the object between the check and the insert
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    if os.path.exists(path):
+                        os.unlink(tmp_path)  # Same image already stored
+                    else:
+                        # Rename into place, so readers never see a partial object
+                        Path(path).parent.mkdir(exist_ok=True)
+                        os.replace(tmp_path, path)
+                    now = time.time()
+                    conn.execute(
+                        "INSERT OR REPLACE INTO entries "
+                        "(url, digest, content_type, size, stored_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (url, digest, content_type, size, now, now),
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                self.stats["stores"] += 1
+                self._evict(conn, keep=digest)
+                return CachedImage(path, digest, content_type, size, now, os.stat(path))
+        except (OSError, sqlite3.Error) as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Image disk cache store failed: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return None
+
+    @staticmethod
+    def _total_bytes(conn: sqlite3.Connection) -> int:
+        """Size of the stored objects (shared objects counted once)"""
+        return conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT MAX(size) AS size FROM entries GROUP BY digest)"
+        ).fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection, keep: str) -> None:
+        """Drop least recently used entries until the cache fits its budget"""
+        total = self._total_bytes(conn)
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * EVICTION_LOW_WATER)
+        orphaned: List[str] = []
+        evicted = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Again under the write lock: another worker may have evicted meanwhile
+            total = self._total_bytes(conn)
+            victims = conn.execute(
+                "SELECT url, digest, size FROM entries WHERE digest != ? ORDER BY accessed_at",
+                (keep,),
+            )
+            for url, digest, size in victims.fetchall():
+                if total <= target:
+                    break
+                conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+                evicted += 1
+                # An object shared by several URLs is only freed with its last one
+                if conn.execute(
+                    "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+                ).fetchone() is None:
+                    orphaned.append(digest)
+                    total -= size
+            # Unlinked before COMMIT: until then no other worker can index the
+            # digest again, so no entry ends up pointing at a deleted object
+            for digest in orphaned:
+                try:
+                    os.unlink(self._object_path(digest))
+                except FileNotFoundError:
+                    pass
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self.stats["evictions"] += evicted
+
+    def sweep_temp_files(self, max_age: float = STALE_TEMP_FILE_SECONDS) -> int:
+        """
+        Delete temporary files left behind by writers that never committed or
+        aborted (called on startup). Files younger than max_age may belong to
+        a download still running in another worker and are kept.
+
+        Returns:
+            The number of files deleted
+        """
+        if not self.enabled:
+            return 0
+        cutoff = time.time() - max_age
+        removed = 0
+        try:
+            for entry in os.scandir(os.path.join(self.directory, "objects")):
+                if not entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass  # Committed or swept by another worker
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            logger.warning(f"Image disk cache temporary file sweep failed: {e}")
+        if removed:
+            logger.info(f"Removed {removed} stale temporary files from the image disk cache")
+        return removed
+
+    def usage(self) -> dict:
+        """Entry count and stored bytes, for the debug endpoints"""
+        if not self.enabled:
+            return {"entries": 0, "bytes": 0, "max_bytes": self.max_bytes}
+        try:
+            with self._lock:
+                conn = self._connection()
+                entries = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+                total = self._total_bytes(conn)
+        except (OSError, sqlite3.Error):
+            entries, total = None, None
+        return {"entries": entries, "bytes": total, "max_bytes": self.max_bytes}
+
+    def clear(self) -> None:
+        """Remove every cached image"""
+        with self._lock:
+            if self._conn is not None or os.path.exists(self.directory):
+                conn = self._connection()
+                digests = [row[0] for row in conn.execute("SELECT DISTINCT digest FROM entries")]
+                conn.execute("DELETE FROM entries")
+                for digest in digests:
+                    try:
+                        os.unlink(self._object_path(digest))
+                    except FileNotFoundError:
+                        pass
+            self.stats = self._empty_stats()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ImageWriter:
+    """
+    Writes one image to a temporary file in the cache while it is being
+    downloaded, hashing it on the way, so the image never has to be held in
+    memory whole. commit() adds it to the cache; abort() discards it.
+
+    Disk errors and images over the cache budget are not raised: the writer
+    just stops writing and commit() returns None.
+    """
+
+    def __init__(self, cache: ImageDiskCache, url: str, content_type: str):
+        self.cache = cache
+        self.url = url
+        self.content_type = content_type
+        self.size = 0
+        self._hash = hashlib.sha256()
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=os.path.join(cache.directory, "objects"), suffix=".tmp"
+        )
+        self._file = os.fdopen(fd, "wb")
+        self._failed = False
+
+    def write(self, chunk: bytes) -> None:
+        if self._failed:
+            return
+        self.size += len(chunk)
+        if self.size > self.cache.max_bytes:
+            self.abort()
+            return
+        try:
+            self._file.write(chunk)
+        except OSError as e:
+            self.cache.stats["errors"] += 1
+            logger.warning(f"Image disk cache store failed: {e}")
+            self.abort()
+            return
+        self._hash.update(chunk)
+
+    def commit(self) -> Optional[CachedImage]:
+        """Add the written image to the cache"""
+        if self._failed:
+            return None
+        self._failed = True  # A writer commits once
+        try:
+            self._file.close()
+        except OSError as e:
+            self.cache.stats["errors"] += 1
+            logger.warning(f"Image disk cache store failed: {e}")
+            self._discard()
+            return None
+        return self.cache._commit(
+            self.url, self._tmp_path, self._hash.hexdigest(), self.size, self.content_type
+        )
+
+    def abort(self) -> None:
+        """Discard the partially written image"""
+        if self._failed:
+            return
+        self._failed = True
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        self._discard()
+
+    def _discard(self) -> None:
+        try:
+            os.unlink(self._tmp_path)
+        except OSError:
+            pass
+
+
+image_disk_cache = ImageDiskCache()
@@ -0,0 +1,78 @@
+# services/image_hash_index.py
+"""
+In-process map of BGG image hash -> (game_id, cloudinary_url).
+
+The image proxy resolves the game owning a BGG image by its hash on every
+request. A catalogue page fires dozens of those, so hashes that resolved to
+a cached Cloudinary URL are remembered here and served without touching the
+database. The map is LRU-bounded and drops a game's entries whenever that
+game is updated or deleted (via services.catalogue_events).
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from config import IMAGE_HASH_INDEX_MAX_ENTRIES
+from services.catalogue_events import OP_CREATE, register_listener
+
+logger = logging.getLogger(__name__)
+
+
+class ImageHashIndex:
+    """Thread-safe, size-bounded LRU of image hash -> (game_id, cloudinary_url)"""
+
+    def __init__(self, max_entries: int = IMAGE_HASH_INDEX_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, image_hash: str) -> Optional[Tuple[int, str]]:
+        """Return (game_id, cloudinary_url) for image_hash, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(image_hash)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(image_hash)
+            self.stats["hits"] += 1
+            return entry
+
+    def put(self, image_hash: str, game_id: int, cloudinary_url: str) -> None:
+        """Remember the Cloudinary URL of a game's image"""
+        if self.max_entries <= 0 or not image_hash or not cloudinary_url:
+            return
+        with self._lock:
+            self._entries[image_hash] = (game_id, cloudinary_url)
+            self._entries.move_to_end(image_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def discard_games(self, game_ids: List[int]) -> None:
+        """Drop every entry belonging to the given games"""
+        ids = set(game_ids)
+        with self._lock:
+            stale = [h for h, (game_id, _) in self._entries.items() if game_id in ids]
+            for image_hash in stale:
+                del self._entries[image_hash]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def on_catalogue_change(self, db: Session, game_ids: List[int], op: str) -> None:
+        """services.catalogue_events listener - updates and deletes invalidate"""
+        if op != OP_CREATE:
+            self.discard_games(game_ids)
+
+
+image_hash_index = ImageHashIndex()
+register_listener(image_hash_index.on_catalogue_change)
@@ -8,7 +8,7 @@ import os
 import logging
 import httpx
 import traceback
-from typing import Optional
+from typing import AsyncIterator, Optional
 from sqlalchemy.orm import Session
 from tenacity import (
     retry,
@@ -21,13 +21,66 @@ from tenacity import (
 import sentry_sdk
 
 from models import Game, BackgroundTaskFailure
-from config import HTTP_TIMEOUT
+from config import HTTP_TIMEOUT, IMAGE_PROXY_CHUNK_BYTES, IMAGE_PROXY_MAX_BYTES
 
 logger = logging.getLogger(__name__)
 
 # Thumbnail storage directory (ephemeral on Render free tier)
 THUMBS_DIR = os.getenv("THUMBS_DIR", "/tmp/thumbs")
 
+# Request modern image formats for better compression and performance
+# Priority: AVIF (best compression) > WebP (good compression) > any image format
+# CRITICAL: BGG requires proper browser headers to allow image downloads
+IMAGE_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Referer": "https://boardgamegeek.com/",
+    "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9"
+}
+
+
+class ImageTooLargeError(Exception):
+    """The upstream image is larger than the proxy's per-request byte cap"""
+
+
+class ImageStream:
+    """
+    An upstream image response read chunk by chunk.
+
+    At most one chunk (chunk_size bytes) is held in memory at a time; the
+    body is cut off with ImageTooLargeError once it passes max_bytes.
+    Always aclose() the stream, also when it is not read to the end.
+    """
+
+    def __init__(self, response: httpx.Response, max_bytes: int, chunk_size: int):
+        self.response = response
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.content_type = response.headers.get(
+            "content-type", "application/octet-stream"
+        )
+        # Length of the body iter_chunks yields: iter_chunks undoes any gzip/br
+        # content-encoding, so an encoded body's declared length does not apply
+        self.content_length: Optional[int] = None
+        if response.headers.get("content-encoding", "identity").strip().lower() == "identity":
+            try:
+                self.content_length = int(response.headers["content-length"])
+            except (KeyError, ValueError):
+                pass
+        self.bytes_read = 0
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        async for chunk in self.response.aiter_bytes(self.chunk_size):
+            self.bytes_read += len(chunk)
+            if self.bytes_read > self.max_bytes:
+                raise ImageTooLargeError(
+                    f"Image exceeds {self.max_bytes} bytes: {self.response.url}"
+                )
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self.response.aclose()
+
 
 class ImageService:
     """Service for image-related operations"""
@@ -251,17 +304,7 @@ class ImageService:
         Raises:
             httpx.HTTPError: If image fetch fails
         """
-        # Request modern image formats for better compression and performance
-        # Priority: AVIF (best compression) > WebP (good compression) > any image format
-        # CRITICAL: BGG requires proper browser headers to allow image downloads
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Referer": "https://boardgamegeek.com/",
-            "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9"
-        }
-
-        response = await self.http_client.get(url, headers=headers)
+        response = await self.http_client.get(url, headers=IMAGE_REQUEST_HEADERS)
         response.raise_for_status()
 
         content_type = response.headers.get(
@@ -271,6 +314,41 @@ class ImageService:
 
         return response.content, content_type, cache_control
 
+    async def stream_image(
+        self,
+        url: str,
+        max_bytes: int = IMAGE_PROXY_MAX_BYTES,
+        chunk_size: int = IMAGE_PROXY_CHUNK_BYTES,
+    ) -> ImageStream:
+        """
+        Open an external image for streaming instead of buffering it whole.
+
+        Args:
+            url: URL of the image to proxy
+            max_bytes: Per-request byte cap
+            chunk_size: Size of the chunks the body is read in
+
+        Returns:
+            ImageStream positioned before the body (the caller must aclose() it)
+
+        Raises:
+            httpx.HTTPError: If the image fetch fails
+            ImageTooLargeError: If the declared Content-Length exceeds max_bytes
+        """
+        request = self.http_client.build_request("GET", url, headers=IMAGE_REQUEST_HEADERS)
+        response = await self.http_client.send(request, stream=True)
+        try:
+            response.raise_for_status()
+            stream = ImageStream(response, max_bytes, chunk_size)
+            if stream.content_length is not None and stream.content_length > max_bytes:
+                raise ImageTooLargeError(
+                    f"Image is {stream.content_length} bytes, cap is {max_bytes}: {url}"
+                )
+        except BaseException:
+            await response.aclose()
+            raise
+        return stream
+
     async def reimport_game_thumbnail(self, game_id: int, bgg_id: int) -> bool:
         """
         Re-import game data and thumbnail from BGG.
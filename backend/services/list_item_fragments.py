@@ -0,0 +1,99 @@
+# services/list_item_fragments.py
+"""
+Pre-serialized list-item JSON per game.
+
+Building a catalogue page used to validate every row through
+GameListItemResponse, dump it to a dict and let FastAPI encode the dicts
+again. On large pages that dominates CPU. Here each game's list-item JSON is
+encoded once and kept as bytes, keyed by game id and row version
+(Game.updated_at), so pages are assembled by joining fragments.
+
+A changed row version misses the cache even for writes made on another
+worker; updates and deletes seen on this worker also drop the entry
+eagerly (via services.catalogue_events) to free memory.
+"""
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from config import LIST_FRAGMENT_CACHE_MAX_ENTRIES
+from schemas import GameListItemResponse
+from services.catalogue_events import OP_CREATE, register_listener
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def dumps_json(value: Any) -> bytes:
+    """Compact JSON encoding (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class ListItemFragmentCache:
+    """Thread-safe, size-bounded LRU of game id -> (row version, list-item JSON bytes)"""
+
+    def __init__(self, max_entries: int = LIST_FRAGMENT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[Any, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def fragment(self, game) -> bytes:
+        """Return the list-item JSON of a game, serializing it on a miss"""
+        version = getattr(game, "updated_at", None)
+        with self._lock:
+            entry = self._entries.get(game.id)
+            if entry is not None and version is not None and entry[0] == version:
+                self._entries.move_to_end(game.id)
+                self.stats["hits"] += 1
+                return entry[1]
+            self.stats["misses"] += 1
+
+        encoded = dumps_json(
+            GameListItemResponse.model_validate(game).model_dump(mode="json")
+        )
+        # Rows without a version (not yet migrated) cannot be validated later
+        if version is not None and self.max_entries > 0:
+            with self._lock:
+                self._entries[game.id] = (version, encoded)
+                self._entries.move_to_end(game.id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.stats["evictions"] += 1
+        return encoded
+
+    def render(self, games: Iterable) -> str:
+        """JSON array of the games' list items, assembled from fragments"""
+        return (b"[" + b",".join(self.fragment(game) for game in games) + b"]").decode()
+
+    def discard_games(self, game_ids: List[int]) -> None:
+        with self._lock:
+            for game_id in game_ids:
+                self._entries.pop(game_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def on_catalogue_change(self, db: Session, game_ids: List[int], op: str) -> None:
+        """services.catalogue_events listener - updates and deletes invalidate"""
+        if op != OP_CREATE:
+            self.discard_games(game_ids)
+
+
+list_item_fragments = ListItemFragmentCache()
+register_listener(list_item_fragments.on_catalogue_change)
@@ -0,0 +1,407 @@
+# services/search.py
+"""
+Full-text search for the public catalogue's `q` parameter.
+
+Every query term has to match a word in the game, either exactly, as a word
+prefix ("wing" -> "Wingspan") or, when neither exists, as a near-miss
+spelling. Matches are ranked with field weights title > designers >
+mechanics > description.
+
+Backends:
+- PostgreSQL: the GIN-indexed boardgames.search_vector tsvector (weights
+  A-D maintained by a trigger), prefix tsquery terms, ranked with
+  ts_rank_cd, plus pg_trgm title similarity for misspellings (turned off
+  on startup when the pg_trgm extension is missing, see detect_fuzzy_search).
+- Everything else (SQLite dev/test) and the in-memory catalogue engine:
+  SearchIndex, an in-process inverted index scored with BM25.
+"""
+import logging
+import math
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import false, func, literal, literal_column, or_, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from config import SEARCH_FUZZY_ENABLED
+from models import Game
+from services.catalogue_events import OP_DELETE, register_listener
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of each field's term frequencies (title > designers > mechanics > description)
+FIELD_WEIGHTS = {"title": 4.0, "designers": 2.5, "mechanics": 1.5, "description": 1.0}
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Score multipliers for expanded query terms
+PREFIX_FACTOR = 0.8
+FUZZY_FACTOR = 0.5
+# Prefix expansion: minimum query word length and cap on expanded words
+MIN_PREFIX_LENGTH = 1
+MAX_EXPANSIONS = 200
+
+# Dropped from queries (but still indexed) unless the query has nothing else
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or the to with".split()
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Lower-case and strip accents ("Chvátil" -> "chvatil")"""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into normalized alphanumeric words"""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(normalize(text))
+
+
+def query_terms(query: Optional[str]) -> List[str]:
+    """Distinct query words in order, minus stopwords unless nothing else is left"""
+    terms = list(dict.fromkeys(tokenize(query)))
+    meaningful = [term for term in terms if term not in STOPWORDS]
+    return meaningful or terms
+
+
+def _field_text(value: Any) -> str:
+    """Text of a plain or JSON-list column"""
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(item) for item in value)
+    return str(value)
+
+
+def _within_distance(a: str, b: str, limit: int) -> bool:
+    """Levenshtein distance between a and b is at most limit (banded, early exit)"""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb),
+            )
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+def fuzzy_limit(term: str) -> int:
+    """Allowed edit distance for a query term (none for short words)"""
+    if len(term) >= 8:
+        return 2
+    if len(term) >= 4:
+        return 1
+    return 0
+
+
+class SearchIndex:
+    """
+    In-process inverted index with BM25F-style scoring.
+
+    Each document's term frequencies are summed across fields after
+    multiplying by FIELD_WEIGHTS, and its length is the weighted word count,
+    so a title hit outranks a description hit. Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[int, float]] = {}  # term -> {doc id: weighted tf}
+        self._doc_terms: Dict[int, Set[str]] = {}
+        self._doc_length: Dict[int, float] = {}
+        self._total_length = 0.0
+        self._sorted_terms: Optional[List[str]] = None  # Vocabulary for prefix lookups
+
+    def add(self, doc_id: int, fields: Dict[str, Any]) -> None:
+        """Index (or re-index) a document; fields are keyed like FIELD_WEIGHTS"""
+        frequencies: Dict[str, float] = {}
+        length = 0.0
+        for field, weight in FIELD_WEIGHTS.items():
+            tokens = tokenize(_field_text(fields.get(field)))
+            length += weight * len(tokens)
+            for token in tokens:
+                frequencies[token] = frequencies.get(token, 0.0) + weight
+
+        with self._lock:
+            self._remove(doc_id)
+            for term, frequency in frequencies.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._sorted_terms = None
+                postings[doc_id] = frequency
+            self._doc_terms[doc_id] = set(frequencies)
+            self._doc_length[doc_id] = length
+            self._total_length += length
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id: int) -> None:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+        self._total_length -= self._doc_length.pop(doc_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings = {}
+            self._doc_terms = {}
+            self._doc_length = {}
+            self._total_length = 0.0
+            self._sorted_terms = None
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def _expand(self, term: str) -> List[Tuple[str, float]]:
+        """Index terms matching a query term, with their score multipliers"""
+        expansions = []
+        if term in self._postings:
+            expansions.append((term, 1.0))
+
+        if len(term) >= MIN_PREFIX_LENGTH:
+            if self._sorted_terms is None:
+                self._sorted_terms = sorted(self._postings)
+            start = bisect_left(self._sorted_terms, term)
+            for candidate in self._sorted_terms[start : start + MAX_EXPANSIONS + 1]:
+                if not candidate.startswith(term):
+                    break
+                if candidate != term:
+                    expansions.append((candidate, PREFIX_FACTOR))
+
+        limit = fuzzy_limit(term)
+        if not expansions and limit:
+            for candidate in self._postings:
+                if _within_distance(term, candidate, limit):
+                    expansions.append((candidate, FUZZY_FACTOR))
+                    if len(expansions) >= MAX_EXPANSIONS:
+                        break
+        return expansions
+
+    def search(self, query: Optional[str]) -> Dict[int, float]:
+        """
+        Score documents matching every term of query.
+
+        Returns:
+            Dict of doc id -> BM25 score (empty when nothing matches)
+        """
+        terms = query_terms(query)
+        if not terms:
+            return {}
+
+        with self._lock:
+            doc_count = len(self._doc_terms)
+            if doc_count == 0:
+                return {}
+            average_length = (self._total_length / doc_count) or 1.0
+
+            scores: Optional[Dict[int, float]] = None
+            for term in terms:
+                # Best (factor-weighted, saturated) frequency per document across
+                # the term's expansions; a word counts once per query term
+                term_weights: Dict[int, float] = {}
+                for candidate, factor in self._expand(term):
+                    for doc_id, tf in self._postings[candidate].items():
+                        if scores is not None and doc_id not in scores:
+                            continue
+                        norm = 1 - BM25_B + BM25_B * self._doc_length[doc_id] / average_length
+                        weight = factor * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+                        if weight > term_weights.get(doc_id, 0.0):
+                            term_weights[doc_id] = weight
+                if not term_weights:
+                    return {}
+                # One IDF per query term, from every document it matches
+                df = len(term_weights)
+                idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                if scores is None:
+                    scores = {doc_id: idf * w for doc_id, w in term_weights.items()}
+                else:
+                    scores = {doc_id: scores[doc_id] + idf * w for doc_id, w in term_weights.items()}
+            return scores or {}
+
+
+def search_fields(game: Any) -> Dict[str, Any]:
+    """FIELD_WEIGHTS fields of a Game (or a row with the same attributes)"""
+    return {
+        "title": game.title,
+        "designers": game.designers,
+        "mechanics": game.mechanics,
+        "description": game.description,
+    }
+
+
+_SEARCH_COLUMNS = (Game.id, Game.title, Game.designers, Game.mechanics, Game.description)
+
+
+class CatalogueSearchIndex(SearchIndex):
+    """
+    SearchIndex over the boardgames table, used where the database has no
+    search_vector (SQLite). Loaded on first search; GameService writes are
+    applied incrementally via services.catalogue_events, and a cheap
+    (count, max id, max updated_at) signature check picks up writes made
+    any other way.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self.stats = {"full_loads": 0, "incremental_updates": 0, "queries": 0}
+
+    @staticmethod
+    def _read_signature(db: Session) -> Tuple[Any, ...]:
+        return tuple(
+            db.execute(
+                select(func.count(Game.id), func.max(Game.id), func.max(Game.updated_at))
+            ).one()
+        )
+
+    def load(self, db: Session) -> None:
+        """(Re)build the index from every game"""
+        rows = db.execute(select(*_SEARCH_COLUMNS)).all()
+        with self._lock:
+            self.clear()
+            for row in rows:
+                self.add(row.id, search_fields(row))
+            self._signature = self._read_signature(db)
+            self.stats["full_loads"] += 1
+
+    def search_catalogue(self, db: Session, query: Optional[str]) -> Dict[int, float]:
+        """search(), reloading first if the table changed behind the index's back"""
+        with self._lock:
+            if self._signature is None or self._read_signature(db) != self._signature:
+                self.load(db)
+            self.stats["queries"] += 1
+            return self.search(query)
+
+    def apply_changes(self, db: Session, game_ids: Sequence[int], op: str) -> None:
+        with self._lock:
+            if self._signature is None:
+                return  # Not loaded (e.g. PostgreSQL) - nothing to patch
+            rows = []
+            if op != OP_DELETE:
+                rows = db.execute(select(*_SEARCH_COLUMNS).where(Game.id.in_(game_ids))).all()
+            found = {row.id for row in rows}
+            for row in rows:
+                self.add(row.id, search_fields(row))
+            for game_id in game_ids:
+                if game_id not in found:
+                    self.remove(game_id)
+            self._signature = self._read_signature(db)
+            self.stats["incremental_updates"] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.clear()
+            self._signature = None
+            self.stats = {"full_loads": 0, "incremental_updates": 0, "queries": 0}
+
+    def on_catalogue_change(self, db: Session, game_ids: List[int], op: str) -> None:
+        """services.catalogue_events listener"""
+        self.apply_changes(db, game_ids, op)
+
+
+# ----------------------------------------------------------------------
+# PostgreSQL backend
+# ----------------------------------------------------------------------
+
+# Not mapped on Game: the column only exists on PostgreSQL (migration 68d4e9a1b2c3)
+_search_vector = literal_column("boardgames.search_vector")
+
+# SEARCH_FUZZY_ENABLED, unless detect_fuzzy_search found pg_trgm missing
+_fuzzy_enabled = SEARCH_FUZZY_ENABLED
+
+
+def detect_fuzzy_search(bind) -> bool:
+    """
+    Check once, on startup, that the pg_trgm extension is installed, and turn
+    fuzzy title matching off when it is not (or the check fails): without it
+    the <% operator and word_similarity() fail every search query.
+
+    Args:
+        bind: Engine or connection of the catalogue database
+
+    Returns:
+        Whether fuzzy matching is enabled
+    """
+    global _fuzzy_enabled
+    if not SEARCH_FUZZY_ENABLED or bind.dialect.name != "postgresql":
+        return _fuzzy_enabled
+    try:
+        with bind.connect() as conn:
+            installed = conn.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            ).first() is not None
+    except SQLAlchemyError as e:
+        logger.warning(f"Could not check for the pg_trgm extension, fuzzy search disabled: {e}")
+        installed = False
+    else:
+        if not installed:
+            logger.warning("pg_trgm extension is not installed, fuzzy search disabled")
+    _fuzzy_enabled = installed
+    return installed
+
+
+def _pg_tsquery(query: str):
+    """Prefix tsquery ANDing the query words ("7 wonders" -> '7:* & wonders:*')"""
+    words = list(dict.fromkeys(re.findall(r"[^\W_]+", query.lower())))
+    words = [word for word in words if word not in STOPWORDS] or words
+    if not words:
+        return None
+    return func.to_tsquery("english", " & ".join(f"{word}:*" for word in words))
+
+
+def pg_search_condition(query: str):
+    """WHERE clause: full-text match on search_vector, or a similar title word (pg_trgm)"""
+    tsquery = _pg_tsquery(query)
+    conditions = []
+    if tsquery is not None:
+        conditions.append(_search_vector.op("@@")(tsquery))
+    if _fuzzy_enabled:
+        # query <% title: word similarity above pg_trgm.word_similarity_threshold,
+        # served by the idx_boardgames_title_trgm GIN index
+        conditions.append(literal(query).op("<%")(Game.title))
+    return or_(*conditions) if conditions else false()
+
+
+def pg_search_rank(query: str):
+    """ORDER BY expression for sort=relevance (higher is better)"""
+    tsquery = _pg_tsquery(query)
+    rank = func.ts_rank_cd(_search_vector, tsquery) if tsquery is not None else None
+    if _fuzzy_enabled:
+        similarity = func.word_similarity(query, Game.title)
+        rank = similarity if rank is None else rank + similarity
+    return rank if rank is not None else literal_column("0")
+
+
+def uses_pg_search(db: Session) -> bool:
+    """True when the database has the tsvector/pg_trgm search backend"""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+catalogue_search = CatalogueSearchIndex()
+register_listener(catalogue_search.on_catalogue_change)
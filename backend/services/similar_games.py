@@ -0,0 +1,316 @@
+# services/similar_games.py
+"""
+Similar-games recommendations ("If you liked X").
+
+Every public game is turned into a sparse feature vector - mechanics, BGG
+categories, Mana & Meeple category, designers, complexity, player range and
+playtime - and the top-k neighbours by cosine similarity are stored in
+game_similarities, so the detail page reads a precomputed list.
+
+Vectors are held in compressed sparse column form (feature -> games) with
+NumPy: one game's similarities to the whole catalogue are a weighted
+bincount over the posting lists of its features. Each feature group is
+L2-normalized and weighted before the whole vector is normalized, so no
+single group (e.g. a long mechanics list) dominates. Weights depend only on
+the game itself, which keeps incremental updates exact.
+
+Freshness:
+- recompute_all_similar_games rebuilds every list (scripts/compute_similar_games.py)
+- refresh_similar_games recomputes the imported games plus every list they
+  enter or leave (called by GameService.create_or_update_from_bgg)
+
+NumPy is optional: without it nothing is computed and the endpoint returns
+an empty list.
+"""
+import logging
+import math
+from typing import Any, Dict, Iterable, List, Set
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from config import SIMILAR_GAMES_TOP_K
+from models import Game, GameSimilarity, entity_key
+from utils.helpers import parse_categories
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of each feature group in the cosine similarity
+GROUP_WEIGHTS = {
+    "mechanic": 1.0,
+    "category": 0.8,
+    "designer": 0.6,
+    "complexity": 0.6,
+    "players": 0.4,
+    "playtime": 0.4,
+}
+
+# Player counts above this share one feature ("8+")
+MAX_PLAYER_FEATURE = 8
+# Upper edges (minutes) of the playtime_max buckets; longer games share the last bucket
+PLAYTIME_EDGES = (15, 30, 45, 60, 90, 120, 180)
+
+_COLUMNS = (
+    Game.id,
+    Game.status,
+    Game.is_expansion,
+    Game.expansion_type,
+    Game.base_game_id,
+    Game.mechanics,
+    Game.categories,
+    Game.mana_meeple_category,
+    Game.designers,
+    Game.complexity,
+    Game.players_min,
+    Game.players_max,
+    Game.playtime_max,
+)
+
+
+def _is_public(row: Any) -> bool:
+    """Same visibility as the public catalogue"""
+    return (row.status == "OWNED" or row.status is None) and not (
+        row.is_expansion is True and row.expansion_type == "requires_base"
+    )
+
+
+def _names(values: Any) -> List[str]:
+    if not isinstance(values, (list, tuple)):
+        return []
+    return [entity_key(value) for value in values if isinstance(value, str) and value.strip()]
+
+
+def _bucket_with_neighbours(index: int, count: int) -> Dict[int, float]:
+    """One-hot bucket softened onto its neighbours, so near misses still score"""
+    weights = {index: 1.0}
+    for neighbour in (index - 1, index + 1):
+        if 0 <= neighbour < count:
+            weights[neighbour] = 0.5
+    return weights
+
+
+def game_features(row: Any) -> Dict[str, float]:
+    """
+    Weighted sparse feature vector of a game (feature name -> weight),
+    L2-normalized. Empty when the game has nothing to compare on.
+    """
+    groups: Dict[str, Dict[str, float]] = {
+        "mechanic": {name: 1.0 for name in _names(row.mechanics)},
+        "category": {name: 1.0 for name in _names(parse_categories(row.categories))},
+        "designer": {name: 1.0 for name in _names(row.designers)},
+        "complexity": {},
+        "players": {},
+        "playtime": {},
+    }
+    if row.mana_meeple_category:
+        groups["category"][f"mm:{row.mana_meeple_category}"] = 1.0
+    if row.complexity is not None:
+        # Half-point bins over the 1-5 weight scale
+        index = int(round(min(max(row.complexity, 1.0), 5.0) * 2)) - 2
+        groups["complexity"] = {
+            str(bin_): weight for bin_, weight in _bucket_with_neighbours(index, 9).items()
+        }
+    if row.players_min is not None:
+        high = row.players_max if row.players_max is not None else row.players_min
+        low = min(row.players_min, MAX_PLAYER_FEATURE)
+        high = min(max(high, row.players_min), MAX_PLAYER_FEATURE)
+        groups["players"] = {str(count): 1.0 for count in range(low, high + 1)}
+    if row.playtime_max is not None:
+        index = sum(1 for edge in PLAYTIME_EDGES if row.playtime_max > edge)
+        groups["playtime"] = {
+            str(bin_): weight
+            for bin_, weight in _bucket_with_neighbours(index, len(PLAYTIME_EDGES) + 1).items()
+        }
+
+    features: Dict[str, float] = {}
+    for group, weights in groups.items():
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        if not norm:
+            continue
+        for name, weight in weights.items():
+            features[f"{group}:{name}"] = GROUP_WEIGHTS[group] * weight / norm
+
+    total = math.sqrt(sum(weight * weight for weight in features.values()))
+    return {name: weight / total for name, weight in features.items()} if total else {}
+
+
+class SimilarityMatrix:
+    """Sparse feature vectors of the public catalogue with cosine top-k queries"""
+
+    def __init__(self, rows: Iterable[Any]):
+        self.ids: List[int] = []
+        families: List[int] = []
+        vectors: List[Dict[str, float]] = []
+        for row in rows:
+            if not _is_public(row):
+                continue
+            self.ids.append(row.id)
+            # A base game and its expansions recommend other games, not each other
+            families.append(row.base_game_id or row.id)
+            vectors.append(game_features(row))
+        self.position = {game_id: idx for idx, game_id in enumerate(self.ids)}
+        self._ids = np.array(self.ids, dtype=np.int64)
+        self._families = np.array(families, dtype=np.int64)
+
+        # Per-game rows (for queries) and per-feature columns (for scoring)
+        vocabulary: Dict[str, int] = {}
+        self._rows = []
+        for vector in vectors:
+            indices = np.array(
+                [vocabulary.setdefault(name, len(vocabulary)) for name in vector], dtype=np.int64
+            )
+            self._rows.append((indices, np.array(list(vector.values()), dtype=np.float64)))
+
+        row_of = np.repeat(
+            np.arange(len(self._rows), dtype=np.int64), [len(indices) for indices, _ in self._rows]
+        )
+        feature_of = (
+            np.concatenate([indices for indices, _ in self._rows])
+            if self._rows else np.zeros(0, dtype=np.int64)
+        )
+        weights = (
+            np.concatenate([data for _, data in self._rows])
+            if self._rows else np.zeros(0, dtype=np.float64)
+        )
+        order = np.argsort(feature_of, kind="stable")
+        self._col_rows = row_of[order]
+        self._col_data = weights[order]
+        self._col_ptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(feature_of, minlength=len(vocabulary)), out=self._col_ptr[1:])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def scores(self, game_id: int):
+        """Cosine similarity of a public game to every public game (aligned with ids)"""
+        indices, data = self._rows[self.position[game_id]]
+        starts = self._col_ptr[indices]
+        lengths = self._col_ptr[indices + 1] - starts
+        if not lengths.sum():
+            return np.zeros(len(self.ids))
+        # Gather every posting list of the game's features in one go
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        postings = offsets + np.arange(lengths.sum())
+        return np.bincount(
+            self._col_rows[postings],
+            weights=self._col_data[postings] * np.repeat(data, lengths),
+            minlength=len(self.ids),
+        )
+
+    def top_k(self, game_id: int, k: int, scores=None) -> List[tuple]:
+        """The k most similar other games as (similar_game_id, score), best first"""
+        if scores is None:
+            scores = self.scores(game_id)
+        position = self.position[game_id]
+        candidates = np.flatnonzero(
+            (scores > 1e-9) & (self._families != self._families[position])
+        )
+        if len(candidates) > k:
+            # Keep every candidate tied with the k-th score so the id tie-break is stable
+            threshold = np.partition(scores[candidates], -k)[-k]
+            candidates = candidates[scores[candidates] >= threshold]
+        order = np.lexsort((self._ids[candidates], -scores[candidates]))[:k]
+        return [
+            (int(self._ids[candidates[idx]]), round(float(scores[candidates[idx]]), 6))
+            for idx in order
+        ]
+
+
+def _load_matrix(db: Session) -> SimilarityMatrix:
+    return SimilarityMatrix(db.execute(select(*_COLUMNS).order_by(Game.id)).all())
+
+
+def _store(db: Session, neighbours: Dict[int, List[tuple]]) -> None:
+    """Replace the stored lists of the given games"""
+    game_ids = list(neighbours)
+    for start in range(0, len(game_ids), 500):
+        db.execute(
+            delete(GameSimilarity).where(GameSimilarity.game_id.in_(game_ids[start:start + 500]))
+        )
+    rows = [
+        {"game_id": game_id, "similar_game_id": similar_id, "rank": rank, "score": score}
+        for game_id, top in neighbours.items()
+        for rank, (similar_id, score) in enumerate(top, start=1)
+    ]
+    for start in range(0, len(rows), 1000):
+        db.execute(insert(GameSimilarity), rows[start:start + 1000])
+
+
+def recompute_all_similar_games(db: Session, k: int = SIMILAR_GAMES_TOP_K) -> int:
+    """
+    Rebuild every stored neighbour list in the current transaction (the
+    caller commits).
+
+    Returns:
+        Number of games with a computed list
+    """
+    if np is None:
+        logger.warning("NumPy is not installed; similar games are not computed")
+        return 0
+    matrix = _load_matrix(db)
+    db.execute(delete(GameSimilarity))
+    _store(db, {game_id: matrix.top_k(game_id, k) for game_id in matrix.ids})
+    return len(matrix)
+
+
+def refresh_similar_games(
+    db: Session, game_ids: Iterable[int], k: int = SIMILAR_GAMES_TOP_K
+) -> Set[int]:
+    """
+    Incrementally update neighbour lists after the given games were created
+    or changed, in the current transaction (the caller commits).
+
+    Recomputes the changed games' own lists, plus the list of every other
+    game that currently contains one of them or that one of them now
+    outranks (similarity is symmetric, so one scoring pass per changed game
+    finds both).
+
+    Returns:
+        IDs of the games whose lists were recomputed
+    """
+    if np is None:
+        return set()
+    changed = {int(game_id) for game_id in game_ids if game_id is not None}
+    if not changed:
+        return set()
+    matrix = _load_matrix(db)
+
+    # Current k-th best score (and list length) of every stored list
+    thresholds = {
+        row.game_id: (row.lowest, row.entries)
+        for row in db.execute(
+            select(
+                GameSimilarity.game_id,
+                func.min(GameSimilarity.score).label("lowest"),
+                func.count().label("entries"),
+            ).group_by(GameSimilarity.game_id)
+        )
+    }
+    affected = set(
+        db.execute(
+            select(GameSimilarity.game_id).where(GameSimilarity.similar_game_id.in_(changed))
+        ).scalars()
+    )
+
+    neighbours: Dict[int, List[tuple]] = {}
+    for game_id in changed:
+        if game_id not in matrix.position:
+            neighbours[game_id] = []  # No longer public (or deleted): drop its list
+            continue
+        scores = matrix.scores(game_id)
+        neighbours[game_id] = matrix.top_k(game_id, k, scores)
+        for position in np.flatnonzero(scores > 1e-9):
+            other = matrix.ids[position]
+            lowest, entries = thresholds.get(other, (0.0, 0))
+            if entries < k or scores[position] >= lowest:
+                affected.add(other)
+
+    for game_id in affected - changed:
+        neighbours[game_id] = matrix.top_k(game_id, k) if game_id in matrix.position else []
+    _store(db, neighbours)
+    return set(neighbours)
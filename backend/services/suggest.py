@@ -0,0 +1,271 @@
+# services/suggest.py
+"""
+Typeahead suggestions for the public catalogue search box.
+
+Titles, designer names and mechanics of public games are kept in memory as
+a sorted array of normalized keys, one per word suffix ("ticket to ride",
+"to ride", "ride"), so a keystroke is a bisect plus a short scan and never
+touches the database. When the prefix matches run short, keys starting with
+the same letter are checked for a prefix within a small edit distance
+("wingspam" -> "Wingspan"). Suggestions are ranked by BGG rank, then by
+number of ratings.
+
+GameService writes are applied incrementally via services.catalogue_events.
+The index remembers the catalogue version it reflects; a version bumped by
+anyone else (another worker, a bulk import) triggers a reload on the next
+query.
+"""
+import logging
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from models import Game
+from services.catalogue_events import OP_DELETE, register_listener
+from services.catalogue_version import catalogue_version
+from services.search import STOPWORDS, fuzzy_limit, tokenize
+
+logger = logging.getLogger(__name__)
+
+KIND_GAME = "game"
+KIND_DESIGNER = "designer"
+KIND_MECHANIC = "mechanic"
+# Tie-break between suggestions of equal popularity
+_KIND_ORDER = {KIND_GAME: 0, KIND_DESIGNER: 1, KIND_MECHANIC: 2}
+
+# Cap on index entries examined per query (prefix scan and typo scan each)
+MAX_SCAN = 2000
+# Memoized results per (query, limit); short prefixes repeat constantly while typing
+MAX_MEMO_ENTRIES = 4096
+
+# (key, kind, label, game id, key is the start of the phrase)
+Entry = Tuple[str, str, str, int, bool]
+
+_SUGGEST_COLUMNS = (
+    Game.id, Game.title, Game.designers, Game.mechanics, Game.bgg_rank, Game.users_rated,
+)
+
+# Same visibility rules as the public catalogue listing
+_PUBLIC_CONDITIONS = (
+    or_(Game.status == "OWNED", Game.status.is_(None)),
+    ~and_(Game.is_expansion == True, Game.expansion_type == "requires_base"),  # noqa: E712
+)
+
+
+def _popularity(bgg_rank: Optional[int], users_rated: Optional[int]) -> Tuple[Any, ...]:
+    """Sort key: ranked games by rank, then unranked; more ratings first"""
+    return (bgg_rank is None, bgg_rank or 0, -(users_rated or 0))
+
+
+def _phrase_keys(text: Optional[str]) -> List[Tuple[str, bool]]:
+    """Normalized word suffixes of a phrase, skipping those starting with a stopword"""
+    words = tokenize(text)
+    return [
+        (" ".join(words[i:]), i == 0)
+        for i in range(len(words))
+        if i == 0 or words[i] not in STOPWORDS
+    ]
+
+
+def _prefix_within_distance(query: str, key: str, limit: int) -> bool:
+    """Some prefix of key is within limit edits of query (banded, early exit)"""
+    key = key[: len(query) + limit]
+    previous = list(range(len(key) + 1))
+    for i, cq in enumerate(query, 1):
+        current = [i] + [0] * len(key)
+        for j, ck in enumerate(key, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (cq != ck),
+            )
+        if min(current) > limit:
+            return False
+        previous = current
+    return min(previous) <= limit
+
+
+class SuggestIndex:
+    """Sorted-array prefix index of public game titles, designers and mechanics. Thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries: List[Entry] = []
+        self._games: Dict[int, Tuple[Tuple[Any, ...], List[Entry]]] = {}  # id -> (popularity, entries)
+        self._version: Optional[int] = None
+        self._memo: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+        self.stats = {"full_loads": 0, "incremental_updates": 0, "queries": 0, "memo_hits": 0}
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def needs_load(self, version: int) -> bool:
+        """True when the index does not reflect catalogue version `version`"""
+        return self._version != version
+
+    def _register(self, row: Any) -> List[Entry]:
+        """Record a game's popularity and return its index entries (not yet inserted)"""
+        phrases = [(KIND_GAME, row.title)]
+        phrases += [(KIND_DESIGNER, name) for name in row.designers or [] if name]
+        phrases += [(KIND_MECHANIC, name) for name in row.mechanics or [] if name]
+        entries = [
+            (key, kind, str(label), row.id, is_start)
+            for kind, label in phrases
+            for key, is_start in _phrase_keys(label)
+        ]
+        self._games[row.id] = (_popularity(row.bgg_rank, row.users_rated), entries)
+        return entries
+
+    def _add(self, row: Any) -> None:
+        self._remove(row.id)
+        self._memo.clear()
+        for entry in self._register(row):
+            insort(self._entries, entry)
+
+    def _remove(self, game_id: int) -> None:
+        game = self._games.pop(game_id, None)
+        if game is None:
+            return
+        self._memo.clear()
+        for entry in game[1]:
+            position = bisect_left(self._entries, entry)
+            if position < len(self._entries) and self._entries[position] == entry:
+                del self._entries[position]
+
+    def load(self, db: Session, version: Optional[int] = None) -> None:
+        """(Re)build the index from every public game"""
+        if version is None:
+            version = catalogue_version.current()
+        rows = db.execute(select(*_SUGGEST_COLUMNS).where(*_PUBLIC_CONDITIONS)).all()
+        with self._lock:
+            self._games = {}
+            self._memo.clear()
+            self._entries = sorted(entry for row in rows for entry in self._register(row))
+            self._version = version
+            self.stats["full_loads"] += 1
+
+    def apply_changes(self, db: Session, game_ids: Sequence[int], op: str) -> None:
+        with self._lock:
+            if self._version is None:
+                return  # Not loaded yet - the first query loads everything
+            previous = self._version
+            rows = []
+            if op != OP_DELETE:
+                rows = db.execute(
+                    select(*_SUGGEST_COLUMNS).where(Game.id.in_(game_ids), *_PUBLIC_CONDITIONS)
+                ).all()
+            found = {row.id for row in rows}
+            for row in rows:
+                self._add(row)
+            for game_id in game_ids:
+                if game_id not in found:
+                    self._remove(game_id)
+            self.stats["incremental_updates"] += 1
+            # catalogue_version's listener runs first (it is registered at import,
+            # before ours). Only our own bump in between means the index is
+            # current; anything more is a write from elsewhere, so keep the old
+            # version and let the next query reload.
+            version = catalogue_version.current()
+            if version == previous + 1:
+                self._version = version
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries = []
+            self._games = {}
+            self._memo.clear()
+            self._version = None
+            self.stats = {"full_loads": 0, "incremental_updates": 0, "queries": 0, "memo_hits": 0}
+
+    def _prefix_matches(self, needle: str) -> List[Entry]:
+        start = bisect_left(self._entries, (needle,))
+        matches = []
+        for entry in self._entries[start : start + MAX_SCAN]:
+            if not entry[0].startswith(needle):
+                break
+            matches.append(entry)
+        return matches
+
+    def _typo_matches(self, needle: str, limit: int) -> List[Entry]:
+        # Typos in the first letter are rare and checking it bounds the scan
+        start = bisect_left(self._entries, (needle[0],))
+        matches = []
+        last_key, last_hit = None, False
+        for entry in self._entries[start : start + MAX_SCAN]:
+            key = entry[0]
+            if key[0] != needle[0]:
+                break
+            if key != last_key:
+                last_key = key
+                last_hit = not key.startswith(needle) and _prefix_within_distance(needle, key, limit)
+            if last_hit:
+                matches.append(entry)
+        return matches
+
+    def suggest(self, query: Optional[str], limit: int = 8) -> List[Dict[str, Any]]:
+        """
+        Top suggestions for a partially typed query.
+
+        Returns:
+            List of {"type", "label", "game_id", "games"} dicts. game_id is set
+            for game suggestions; games is the number of public games the
+            suggestion covers.
+        """
+        needle = " ".join(tokenize(query))
+        if not needle or limit <= 0:
+            return []
+
+        with self._lock:
+            self.stats["queries"] += 1
+            memoized = self._memo.get((needle, limit))
+            if memoized is not None:
+                self.stats["memo_hits"] += 1
+                return [dict(suggestion) for suggestion in memoized]
+            candidates = [(entry, False) for entry in self._prefix_matches(needle)]
+            typo_limit = fuzzy_limit(needle)
+            if typo_limit and len({self._group(entry) for entry, _ in candidates}) < limit:
+                candidates += [(entry, True) for entry in self._typo_matches(needle, typo_limit)]
+
+            groups: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+            for (key, kind, label, game_id, is_start), fuzzy in candidates:
+                rank = (fuzzy, not is_start, self._games[game_id][0], _KIND_ORDER[kind], label)
+                group_key = self._group((key, kind, label, game_id, is_start))
+                group = groups.get(group_key)
+                if group is None:
+                    groups[group_key] = {"rank": rank, "label": label, "kind": kind, "game_ids": {game_id}}
+                else:
+                    group["game_ids"].add(game_id)
+                    if rank < group["rank"]:
+                        group["rank"] = rank
+
+            best = sorted(groups.values(), key=lambda group: group["rank"])[:limit]
+            suggestions = [
+                {
+                    "type": group["kind"],
+                    "label": group["label"],
+                    "game_id": next(iter(group["game_ids"])) if group["kind"] == KIND_GAME else None,
+                    "games": len(group["game_ids"]),
+                }
+                for group in best
+            ]
+            if len(self._memo) >= MAX_MEMO_ENTRIES:
+                self._memo.clear()
+            self._memo[(needle, limit)] = suggestions
+            return [dict(suggestion) for suggestion in suggestions]
+
+    @staticmethod
+    def _group(entry: Entry) -> Tuple[str, Any]:
+        """Games are suggested individually; designers and mechanics once per name"""
+        kind, label, game_id = entry[1], entry[2], entry[3]
+        return (kind, game_id) if kind == KIND_GAME else (kind, label.casefold())
+
+    def on_catalogue_change(self, db: Session, game_ids: List[int], op: str) -> None:
+        """services.catalogue_events listener"""
+        self.apply_changes(db, game_ids, op)
+
+
+suggest_index = SuggestIndex()
+register_listener(suggest_index.on_catalogue_change)
@@ -1,8 +1,10 @@
 """
 Pytest configuration and fixtures for backend tests
 """
+import asyncio
 import logging
 import os
+import tempfile
 import pytest
 import pytest_asyncio
 from unittest.mock import patch
@@ -20,6 +22,8 @@ os.environ["ADMIN_TOKEN"] = "test_admin_token"
 os.environ["CORS_ORIGINS"] = "http://localhost:3000,http://test"
 # Disable rate limiting during tests to prevent test failures
 os.environ["DISABLE_RATE_LIMITING"] = "true"
+# Keep the image proxy's disk cache out of the real cache directory
+os.environ["IMAGE_DISK_CACHE_DIR"] = tempfile.mkdtemp(prefix="image-cache-test-")
 
 import database
 from main import app
@@ -30,8 +34,16 @@ def clear_cache():
     """Clear the cache and rate limiters before each test to prevent test pollution"""
     from utils.cache import clear_cache as clear_cache_func
     from shared.rate_limiting import admin_attempt_tracker
+    from services.game_detail_cache import game_detail_cache
+    from services.image_disk_cache import image_disk_cache
+    from services.image_hash_index import image_hash_index
+    from services.suggest import suggest_index
 
     clear_cache_func()
+    game_detail_cache.clear()
+    image_disk_cache.clear()
+    image_hash_index.clear()
+    suggest_index.reset()
     # Clear admin rate limit tracker to prevent 429 errors in tests
     admin_attempt_tracker.clear()
 
@@ -46,6 +58,9 @@ def clear_cache():
 
     # Clear again after test to ensure clean state
     clear_cache_func()
+    game_detail_cache.clear()
+    image_hash_index.clear()
+    suggest_index.reset()
     admin_attempt_tracker.clear()
 
     # Clear BGG rate limiter after test
@@ -79,6 +94,95 @@ def db_engine():
         logger.debug("Engine dispose cleanup error (ignored): %s", _cleanup_err)
 
 
+class _SharedSQLiteConnection:
+    """
+    Wraps the test engine's raw sqlite3 connection for aiosqlite.
+
+    close() is a no-op so disposing the async engine stops aiosqlite's worker
+    thread without closing the in-memory database the sync engine still uses.
+    """
+
+    def __init__(self, connection):
+        object.__setattr__(self, "_connection", connection)
+
+    def close(self):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._connection, name, value)
+
+
+async def _make_async_engine(db_engine):
+    """
+    Create an aiosqlite AsyncEngine over db_engine's in-memory database, so
+    async endpoints see the same rows as the sync test session.
+
+    The single StaticPool connection is opened up front: concurrent first
+    checkouts would otherwise each run the dialect's connect hooks against
+    the shared sqlite3 connection.
+    """
+    import aiosqlite
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import StaticPool
+
+    raw = _SharedSQLiteConnection(db_engine.raw_connection().driver_connection)
+
+    async def creator():
+        return await aiosqlite.Connection(lambda: raw, 64)
+
+    async_engine = create_async_engine(
+        "sqlite+aiosqlite://", async_creator=creator, poolclass=StaticPool
+    )
+    async with async_engine.connect():
+        pass
+    return async_engine
+
+
+def _install_async_engine(db_module, async_engine):
+    """
+    Point the async session dependencies at async_engine.
+
+    Like SessionLocal in the client fixtures, the module-level factories are
+    swapped as well as the dependency overrides, so endpoints still reach the
+    test database after another test has reloaded the database module.
+
+    Returns the original module state for _restore_async_engine.
+    """
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    original = (
+        db_module._async_engine,
+        db_module._async_read_engine,
+        db_module.AsyncSessionLocal,
+        db_module.AsyncReadSessionLocal,
+    )
+    TestAsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+    db_module._async_engine = db_module._async_read_engine = async_engine
+    db_module.AsyncSessionLocal = db_module.AsyncReadSessionLocal = TestAsyncSessionLocal
+
+    async def override_get_async_db():
+        async with TestAsyncSessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[db_module.get_async_db] = override_get_async_db
+    app.dependency_overrides[db_module.get_async_read_db] = override_get_async_db
+    return original
+
+
+def _restore_async_engine(db_module, original):
+    (
+        db_module._async_engine,
+        db_module._async_read_engine,
+        db_module.AsyncSessionLocal,
+        db_module.AsyncReadSessionLocal,
+    ) = original
+
+
 @pytest.fixture(scope="function")
 def db_session(db_engine) -> Session:
     """Create a test database session"""
@@ -102,6 +206,17 @@ def db_session(db_engine) -> Session:
             logger.debug("Session close cleanup error (ignored): %s", _cleanup_err)
 
 
+@pytest_asyncio.fixture
+async def async_db_session(db_engine):
+    """AsyncSession over the same in-memory database as db_session"""
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async_engine = await _make_async_engine(db_engine)
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+    await async_engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def client(db_engine):
     """Create a test API client with database override"""
@@ -136,6 +251,10 @@ def client(db_engine):
     app.dependency_overrides[db_module.get_db] = override_get_db
     app.dependency_overrides[db_module.get_read_db] = override_get_db
 
+    # ...and their async counterparts, sharing the same in-memory database
+    async_engine = asyncio.run(_make_async_engine(db_engine))
+    original_async = _install_async_engine(db_module, async_engine)
+
     # Mock the db_ping to prevent startup issues
     # Patch them where they're imported (in main.py), not where they're defined
     # Also patch os.makedirs and httpx_client.aclose for lifespan events
@@ -151,6 +270,8 @@ def client(db_engine):
     db_module.SessionLocal = original_SessionLocal
     db_module.ReadSessionLocal = original_ReadSessionLocal
     app.dependency_overrides.clear()
+    _restore_async_engine(db_module, original_async)
+    asyncio.run(async_engine.dispose())
 
 
 @pytest.fixture
@@ -308,6 +429,80 @@ def large_game_dataset(db_session):
     return games
 
 
+@pytest.fixture
+def varied_catalogue(db_session):
+    """A deterministic but messy catalogue: NULLs, ties, expansions, non-public rows"""
+    import random
+    from datetime import timedelta
+    from models import Game, utc_now
+
+    rng = random.Random(42)
+    words = ["Dragon", "Castle", "River", "Space", "Forest", "Harbour", "castle"]
+    designers = [["Alice Smith"], ["Bob Jones"], ["Alice Smith", "Carol Jones"], None, ["Dénes Kiwi"]]
+    mechanics = [None, ["Dice Rolling"], ["Dice Rolling", "Worker Placement"], ["Tile Placement"]]
+    publishers = [None, ["Mana Games"], ["Kiwi Press", "Mana Games"]]
+    now = utc_now()
+
+    games = []
+    for i in range(120):
+        players_min = rng.choice([None, 1, 2, 3])
+        players_max = None if players_min is None else players_min + rng.choice([0, 1, 2, 4])
+        playtime_min = rng.choice([None, 15, 30, 37, 45])
+        # 15-60 averages to 37.5: must sort after a flat 37 (true division)
+        playtime_max = (
+            playtime_min + rng.choice([0, 23, 45]) if playtime_min else rng.choice([None, 40])
+        )
+        game = Game(
+            # Duplicate titles exercise the id tie-break
+            title=f"{rng.choice(words)} {rng.choice(words)} {i % 40}",
+            bgg_id=500000 + i,
+            year=rng.choice([None, 1995, 2010, 2010, 2020]),
+            players_min=players_min,
+            players_max=players_max,
+            playtime_min=playtime_min,
+            playtime_max=playtime_max,
+            complexity=rng.choice([None, 1.0, 1.4, 2.0, 2.5, 3.5, 4.8]),
+            average_rating=rng.choice([None, 5.5, 7.0, 7.0, 8.2]),
+            min_age=rng.choice([None, 6, 10, 14]),
+            mana_meeple_category=rng.choice([
+                "COOP_ADVENTURE", "CORE_STRATEGY", "GATEWAY_STRATEGY",
+                "KIDS_FAMILIES", "PARTY_ICEBREAKERS", None,
+            ]),
+            designers=rng.choice(designers),
+            mechanics=rng.choice(mechanics),
+            publishers=rng.choice(publishers),
+            description=rng.choice([None, "Build a castle", "Sail the river"]),
+            nz_designer=rng.choice([None, True, False]),
+            is_cooperative=rng.choice([None, True, False]),
+            excluded_quick_picks=rng.choice([None, [], ["kids"], ["first", "coop"]]),
+            status=rng.choice(["OWNED", "OWNED", "OWNED", None, "BUY_LIST", "WISHLIST"]),
+            date_added=now - timedelta(days=rng.choice([1, 10, 40, 400])),
+        )
+        games.append(game)
+        db_session.add(game)
+    db_session.commit()
+
+    # Expansions that extend player counts of some base games
+    for i, base in enumerate(games[:10]):
+        expansion = Game(
+            title=f"{base.title} Expansion",
+            bgg_id=600000 + i,
+            is_expansion=True,
+            expansion_type="requires_base" if i % 2 else "both",
+            base_game_id=base.id,
+            modifies_players_min=rng.choice([None, 1]),
+            modifies_players_max=rng.choice([None, 6, 8]),
+            status="OWNED",
+        )
+        db_session.add(expansion)
+    db_session.commit()
+    # Inserted directly, so materialize the base games' expansion-aware ranges
+    from services.game_service import GameService
+    GameService(db_session).refresh_effective_players([base.id for base in games[:10]])
+    db_session.commit()
+    return games
+
+
 @pytest_asyncio.fixture
 async def async_client(db_engine):
     """
@@ -342,6 +537,8 @@ async def async_client(db_engine):
     # Override dependencies
     app.dependency_overrides[db_module.get_db] = override_get_db
     app.dependency_overrides[db_module.get_read_db] = override_get_db
+    async_engine = await _make_async_engine(db_engine)
+    original_async = _install_async_engine(db_module, async_engine)
 
     # Mock startup/shutdown events
     with patch('main.db_ping', return_value=True), \
@@ -360,6 +557,8 @@ async def async_client(db_engine):
     db_module.SessionLocal = original_SessionLocal
     db_module.ReadSessionLocal = original_ReadSessionLocal
     app.dependency_overrides.clear()
+    _restore_async_engine(db_module, original_async)
+    await async_engine.dispose()
 
 
 @pytest.fixture
@@ -168,6 +168,25 @@ class TestBulkCategorizeCSV:
             assert len(data["updated"]) == 1
             assert "COOP_ADVENTURE" in data["updated"][0]
 
+    def test_bulk_categorize_bumps_catalogue_version(self, client, db_session, admin_headers):
+        """Bulk updates advance the catalogue version so cached lists refresh"""
+        from services.catalogue_version import catalogue_version
+
+        game = Game(title="Pandemic", bgg_id=30549, mana_meeple_category=None)
+        db_session.add(game)
+        db_session.commit()
+        version = catalogue_version.current()
+
+        response = client.post(
+            "/api/admin/bulk-categorize-csv",
+            json={"csv_data": "30549,COOP_ADVENTURE"},
+            headers=admin_headers
+        )
+        assert response.status_code in [200, 429]
+
+        if response.status_code == 200:
+            assert catalogue_version.current() > version
+
     def test_bulk_categorize_invalid_category(self, client, db_session, admin_headers):
         """Test bulk categorize with invalid category"""
         game = Game(title="Pandemic", bgg_id=30549)
@@ -812,178 +831,120 @@ class TestBulkCategorizeErrorHandling:
 
 
 class TestBackfillCloudinaryUrls:
-    """Tests for Cloudinary URL backfill endpoint"""
-
-    def test_backfill_cloudinary_success(self, client, db_session, admin_headers):
-        """Test successful Cloudinary URL backfill"""
-        # Create games with images but missing cloudinary_url
-        game1 = Game(
-            title="Game 1",
-            bgg_id=1001,
-            image="https://cf.geekdo-images.com/original/img/test1.jpg",
-            cloudinary_url=None
-        )
-        game2 = Game(
-            title="Game 2",
-            bgg_id=1002,
-            image="https://cf.geekdo-images.com/thumb/img/test2.jpg",
-            cloudinary_url=""
-        )
-        db_session.add_all([game1, game2])
+    """Tests for the Cloudinary backfill endpoints"""
+
+    def test_backfill_cloudinary_starts_in_background(self, client, db_session, admin_headers):
+        """Test the backfill starts in the background and reports progress"""
+        db_session.add_all([
+            Game(title="Game 1", bgg_id=1001, image="https://cf.geekdo-images.com/original/img/test1.jpg"),
+            Game(title="Game 2", bgg_id=1002, image="https://cf.geekdo-images.com/original/img/test2.jpg"),
+            Game(title="No image", bgg_id=1003),
+        ])
         db_session.commit()
 
-        with patch("services.cloudinary_service.cloudinary_service") as mock_cloudinary:
-            mock_cloudinary.generate_optimized_url.side_effect = [
-                "https://res.cloudinary.com/test/image/upload/test1.jpg",
-                "https://res.cloudinary.com/test/image/upload/test2.jpg"
-            ]
-            mock_cloudinary.enabled = True
-
+        with patch("services.cloudinary_backfill.cloudinary_backfill.start", new_callable=AsyncMock) as mock_start:
             response = client.post(
                 "/api/admin/backfill-cloudinary-urls",
                 headers=admin_headers
             )
-            assert response.status_code in [200, 429]
 
-            if response.status_code == 200:
-                data = response.json()
-                assert data["updated"] == 2
-                assert data["cloudinary_enabled"] == True
-                assert "Backfill complete" in data["message"]
-
-    def test_backfill_cloudinary_no_images(self, client, db_session, admin_headers):
-        """Test backfill when no games need updating"""
-        # Create game without images
-        game = Game(title="Game", bgg_id=1001)
-        db_session.add(game)
-        db_session.commit()
+        assert response.status_code == 202
+        data = response.json()
+        assert data["message"] == "Backfill started"
+        assert data["progress"]["remaining"] == 2
+        mock_start.assert_awaited_once_with(force=False, retry_failed=False, restart=False)
 
+    def test_backfill_cloudinary_disabled(self, client, admin_headers):
+        """Test backfill is refused when Cloudinary is not configured"""
         response = client.post(
             "/api/admin/backfill-cloudinary-urls",
             headers=admin_headers
         )
-        assert response.status_code in [200, 429]
-
-        if response.status_code == 200:
-            data = response.json()
-            assert data["updated"] == 0
-            assert data["skipped"] == 0
-
-    def test_backfill_cloudinary_already_has_url(self, client, db_session, admin_headers):
-        """Test backfill skips games that already have cloudinary_url"""
-        game = Game(
-            title="Game",
-            bgg_id=1001,
-            image="https://cf.geekdo-images.com/original/img/test.jpg",
-            cloudinary_url="https://res.cloudinary.com/test/image/upload/existing.jpg"
-        )
-        db_session.add(game)
-        db_session.commit()
-
-        response = client.post(
-            "/api/admin/backfill-cloudinary-urls",
-            headers=admin_headers
-        )
-        assert response.status_code in [200, 429]
+        assert response.status_code == 400
+        assert "Cloudinary is not configured" in response.json()["detail"]
 
-        if response.status_code == 200:
-            data = response.json()
-            # Should skip games with existing URLs
-            assert data["total"] == 0 or data["skipped"] >= 0
-
-    def test_backfill_cloudinary_partial_failure(self, client, db_session, admin_headers):
-        """Test backfill with some games failing"""
-        game1 = Game(
-            title="Game 1",
-            bgg_id=1001,
-            image="https://cf.geekdo-images.com/original/img/test1.jpg",
-            cloudinary_url=None
-        )
-        game2 = Game(
-            title="Game 2",
-            bgg_id=1002,
-            image="https://cf.geekdo-images.com/original/img/test2.jpg",
-            cloudinary_url=None
-        )
-        db_session.add_all([game1, game2])
-        db_session.commit()
-
-        with patch("services.cloudinary_service.cloudinary_service") as mock_cloudinary:
-            # First succeeds, second fails
-            mock_cloudinary.generate_optimized_url.side_effect = [
-                "https://res.cloudinary.com/test/image/upload/test1.jpg",
-                Exception("Cloudinary error")
-            ]
-            mock_cloudinary.enabled = True
+    def test_backfill_cloudinary_already_running(self, client, admin_headers):
+        """Test starting a backfill that is already running returns 409"""
+        from services.cloudinary_backfill import BackfillRunningError
 
+        with patch(
+            "services.cloudinary_backfill.cloudinary_backfill.start",
+            new_callable=AsyncMock,
+            side_effect=BackfillRunningError("Backfill is already running on host:1"),
+        ):
             response = client.post(
                 "/api/admin/backfill-cloudinary-urls",
                 headers=admin_headers
             )
-            assert response.status_code in [200, 429]
+        assert response.status_code == 409
+        assert "already running" in response.json()["detail"]
 
-            if response.status_code == 200:
-                data = response.json()
-                assert data["updated"] == 1
-                assert data["failed"] == 1
-                assert len(data["errors"]) > 0
+    def test_backfill_cloudinary_unauthorized(self, client, csrf_headers):
+        """Test backfill without authentication"""
+        response = client.post("/api/admin/backfill-cloudinary-urls", headers=csrf_headers)
+        assert response.status_code in [401, 429]
 
-    def test_backfill_cloudinary_uses_image_field(self, client, db_session, admin_headers):
-        """Test backfill uses image field"""
-        game = Game(
-            title="Game",
-            bgg_id=1001,
-            image="https://cf.geekdo-images.com/original/img/full.jpg",
-            cloudinary_url=None
-        )
-        db_session.add(game)
-        db_session.commit()
+    def test_backfill_cloudinary_progress_from_checkpoint(self, client, db_session, admin_headers):
+        """Test progress reports the persisted checkpoint"""
+        from models import BackfillCheckpoint, utc_now
 
-        with patch("services.cloudinary_service.cloudinary_service") as mock_cloudinary:
-            mock_cloudinary.generate_optimized_url.return_value = "https://res.cloudinary.com/test/image/upload/full.jpg"
-            mock_cloudinary.enabled = True
+        games = [
+            Game(title=f"Game {i}", bgg_id=1000 + i, image=f"https://cf.geekdo-images.com/original/img/test{i}.jpg")
+            for i in range(3)
+        ]
+        db_session.add_all(games)
+        db_session.commit()
+        db_session.add(BackfillCheckpoint(
+            name="cloudinary_urls", status="stopped", force=False, last_game_id=games[0].id,
+            processed=1, uploaded=0, skipped=0,
+            failed_games=[{"game_id": games[0].id, "error": "HTTPStatusError: 404"}],
+            updated_at=utc_now(),
+        ))
+        db_session.commit()
 
-            response = client.post(
-                "/api/admin/backfill-cloudinary-urls",
-                headers=admin_headers
-            )
-            assert response.status_code in [200, 429]
+        response = client.get(
+            "/api/admin/backfill-cloudinary-urls/progress",
+            headers=admin_headers
+        )
 
-            if response.status_code == 200:
-                # Verify it called with the full image URL, not thumbnail
-                if mock_cloudinary.generate_optimized_url.called:
-                    call_args = mock_cloudinary.generate_optimized_url.call_args
-                    assert "full.jpg" in call_args[0][0]
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "stopped"
+        assert data["running_here"] is False
+        assert (data["processed"], data["failed"], data["remaining"]) == (1, 1, 2)
+        assert data["failures"][0]["game_id"] == games[0].id
 
-    def test_backfill_cloudinary_unauthorized(self, client, csrf_headers):
-        """Test backfill without authentication"""
-        response = client.post("/api/admin/backfill-cloudinary-urls", headers=csrf_headers)
+    def test_backfill_cloudinary_progress_unauthorized(self, client):
+        """Test progress requires admin authentication"""
+        response = client.get("/api/admin/backfill-cloudinary-urls/progress")
         assert response.status_code in [401, 429]
 
-    def test_backfill_cloudinary_returns_error_limit(self, client, db_session, admin_headers):
-        """Test backfill returns only first 10 errors"""
-        # Create 15 games that will fail
-        for i in range(15):
-            game = Game(
-                title=f"Game {i}",
-                bgg_id=1000 + i,
-                image=f"https://cf.geekdo-images.com/original/img/test{i}.jpg",
-                cloudinary_url=None
-            )
-            db_session.add(game)
+    def test_backfill_cloudinary_stop_running_elsewhere(self, client, db_session, admin_headers):
+        """Test stopping a backfill run by another worker flags its checkpoint"""
+        from models import BackfillCheckpoint, utc_now
+
+        db_session.add(BackfillCheckpoint(
+            name="cloudinary_urls", status="running", force=False, last_game_id=0,
+            processed=0, uploaded=0, skipped=0, failed_games=[],
+            owner="other-host:1", updated_at=utc_now(),
+        ))
         db_session.commit()
 
-        with patch("services.cloudinary_service.cloudinary_service") as mock_cloudinary:
-            mock_cloudinary.generate_optimized_url.side_effect = Exception("Error")
-            mock_cloudinary.enabled = True
+        response = client.post(
+            "/api/admin/backfill-cloudinary-urls/stop",
+            headers=admin_headers
+        )
 
-            response = client.post(
-                "/api/admin/backfill-cloudinary-urls",
-                headers=admin_headers
-            )
-            assert response.status_code in [200, 429]
+        assert response.status_code == 200
+        assert response.json()["message"] == "Backfill stop requested"
+        db_session.expire_all()
+        assert db_session.get(BackfillCheckpoint, "cloudinary_urls").status == "stopping"
 
-            if response.status_code == 200:
-                data = response.json()
-                # Should return max 10 errors
-                assert len(data["errors"]) <= 10
+    def test_backfill_cloudinary_stop_when_idle(self, client, admin_headers):
+        """Test stopping when no backfill is running"""
+        response = client.post(
+            "/api/admin/backfill-cloudinary-urls/stop",
+            headers=admin_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["message"] == "Backfill is not running"
@@ -300,6 +300,48 @@ class TestDebugPerformanceEndpoint:
         # The exact structure depends on performance_monitor implementation
         assert isinstance(data, dict)
 
+    def test_debug_performance_includes_detail_cache(self, client, db_session, admin_headers):
+        """Detail cache hit/miss counters are part of the performance stats"""
+        from models import Game
+
+        game = Game(title="Detail", status="OWNED")
+        db_session.add(game)
+        db_session.commit()
+        client.get(f"/api/public/games/{game.id}")
+        client.get(f"/api/public/games/{game.id}")
+
+        data = client.get("/api/debug/performance", headers=admin_headers).json()
+        assert data["game_detail_cache"]["hits"] == 1
+        assert data["game_detail_cache"]["misses"] == 1
+        assert data["game_detail_cache"]["entries"] == 1
+
+    def test_debug_performance_includes_upload_queue(self, client, admin_headers):
+        """Cloudinary upload pool metrics are part of the performance stats"""
+        data = client.get("/api/debug/performance", headers=admin_headers).json()
+        uploads = data["cloudinary_uploads"]
+        assert uploads["queue_depth"] == 0
+        assert {"running", "in_flight_urls", "deduplicated", "rejected"} <= set(uploads)
+
+
+class TestDebugCacheEndpoint:
+    """Test debug cache stats endpoint"""
+
+    def test_debug_cache_requires_auth(self, client):
+        """Should require admin authentication"""
+        response = client.get("/api/debug/cache")
+        assert response.status_code == 401
+
+    def test_debug_cache_with_auth(self, client, admin_headers):
+        """Should return query cache and coalescing stats"""
+        client.get("/api/public/games")
+        response = client.get("/api/debug/cache", headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["query_cache"]["entries"] >= 1
+        assert data["single_flight"]["executions"] >= 1
+        assert "coalesced" in data["single_flight"]
+
 
 class TestDebugBGGTestEndpoint:
     """Test debug BGG API test endpoint"""
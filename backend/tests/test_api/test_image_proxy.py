@@ -3,10 +3,22 @@ Comprehensive tests for image proxy endpoint.
 Tests the /api/public/image-proxy endpoint including Cloudinary integration,
 URL validation, caching, and fallback behavior.
 """
+import gzip
+from contextlib import ExitStack
+
+import httpx
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from urllib.parse import urlparse
 
+from services.image_service import ImageStream
+
+
+def image_stream(content, content_type, max_bytes=20 * 1024 * 1024, headers=None):
+    """What ImageService.stream_image returns for an upstream image"""
+    response = httpx.Response(200, content=content, headers={"content-type": content_type, **(headers or {})})
+    return ImageStream(response, max_bytes, chunk_size=4)
+
 
 class TestImageProxyBasicValidation:
     """Tests for basic URL validation in image proxy"""
@@ -53,7 +65,7 @@ class TestImageProxyTrustedDomains:
         with patch('api.routers.public.socket.gethostbyname', return_value='151.101.1.140'), \
              patch('api.routers.public.ImageService') as MockService:
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'image data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'image data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             response = client.get("/api/public/image-proxy?url=https://cf.geekdo-images.com/abc__md/img/xyz.jpg")
@@ -65,7 +77,7 @@ class TestImageProxyTrustedDomains:
         with patch('api.routers.public.socket.gethostbyname', return_value='151.101.1.140'), \
              patch('api.routers.public.ImageService') as MockService:
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'image data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'image data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             response = client.get("/api/public/image-proxy?url=https://cf.geekdo-static.com/images/test.png")
@@ -145,7 +157,7 @@ class TestImageProxyURLTransformation:
         with patch('api.routers.public.socket.gethostbyname', return_value='151.101.1.140'), \
              patch('api.routers.public.ImageService') as MockService:
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'image data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'image data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             # Just verify it doesn't error - the transformation happens internally
@@ -159,7 +171,7 @@ class TestImageProxyURLTransformation:
         with patch('api.routers.public.socket.gethostbyname', return_value='151.101.1.140'), \
              patch('api.routers.public.ImageService') as MockService:
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'image data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'image data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             response = client.get(f"/api/public/image-proxy?url={url_with_whitespace}")
@@ -174,7 +186,7 @@ class TestImageProxyURLTransformation:
         with patch('api.routers.public.socket.gethostbyname', return_value='151.101.1.140'), \
              patch('api.routers.public.ImageService') as MockService:
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'image data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'image data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             # Encode properly for URL
@@ -194,7 +206,7 @@ class TestImageProxyResizeParameters:
         with patch('api.routers.public.socket.gethostbyname', return_value='151.101.1.140'), \
              patch('api.routers.public.ImageService') as MockService:
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'image data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'image data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             response = client.get("/api/public/image-proxy?url=https://cf.geekdo-images.com/test.jpg&width=200")
@@ -205,7 +217,7 @@ class TestImageProxyResizeParameters:
         with patch('api.routers.public.socket.gethostbyname', return_value='151.101.1.140'), \
              patch('api.routers.public.ImageService') as MockService:
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'image data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'image data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             response = client.get("/api/public/image-proxy?url=https://cf.geekdo-images.com/test.jpg&height=150")
@@ -216,7 +228,7 @@ class TestImageProxyResizeParameters:
         with patch('api.routers.public.socket.gethostbyname', return_value='151.101.1.140'), \
              patch('api.routers.public.ImageService') as MockService:
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'image data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'image data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             response = client.get("/api/public/image-proxy?url=https://cf.geekdo-images.com/test.jpg&width=200&height=150")
@@ -245,7 +257,7 @@ class TestImageProxyCaching:
              patch('config.CLOUDINARY_ENABLED', False):
 
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'image data', 'image/jpeg', 'public, max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'image data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             response = client.get("/api/public/image-proxy?url=https://cf.geekdo-images.com/test.jpg")
@@ -254,6 +266,30 @@ class TestImageProxyCaching:
                 assert "Cache-Control" in response.headers
 
 
+    def test_gzip_encoded_upstream_is_relayed_decoded_without_its_length(self, client):
+        """The body is relayed decoded, so the encoded Content-Length must not be copied"""
+        body = b"svg image data " * 100
+        encoded = gzip.compress(body)
+        upstream = image_stream(encoded, "image/svg+xml", headers={
+            "content-encoding": "gzip", "content-length": str(len(encoded)),
+        })
+        with patch('api.routers.public.socket.gethostbyname', return_value='151.101.1.140'), \
+             patch('api.routers.public.ImageService') as MockService, \
+             patch('api.routers.public.image_disk_cache.get', return_value=None), \
+             patch('config.CLOUDINARY_ENABLED', False):
+
+            mock_instance = MagicMock()
+            mock_instance.stream_image = AsyncMock(return_value=upstream)
+            MockService.return_value = mock_instance
+
+            response = client.get("/api/public/image-proxy?url=https://cf.geekdo-images.com/test.svg")
+
+        assert response.status_code == 200
+        assert response.content == body
+        assert response.headers.get("content-length") in (None, str(len(body)))
+        assert "content-encoding" not in response.headers
+
+
 class TestImageProxyCloudinaryUpload:
     """Tests for Cloudinary upload workflow"""
 
@@ -298,7 +334,7 @@ class TestImageProxyCloudinaryUpload:
 
             # But direct proxy works
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'image data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'image data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             response = await async_client.get(
@@ -317,7 +353,7 @@ class TestImageProxyErrorHandling:
              patch('api.routers.public.ImageService') as MockService:
 
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(side_effect=Exception("Network error"))
+            mock_instance.stream_image = AsyncMock(side_effect=Exception("Network error"))
             MockService.return_value = mock_instance
 
             response = client.get("/api/public/image-proxy?url=https://cf.geekdo-images.com/test.jpg")
@@ -332,7 +368,7 @@ class TestImageProxyErrorHandling:
              patch('api.routers.public.ImageService') as MockService:
 
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+            mock_instance.stream_image = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
             MockService.return_value = mock_instance
 
             response = client.get("/api/public/image-proxy?url=https://cf.geekdo-images.com/test.jpg")
@@ -378,6 +414,72 @@ class TestImageProxyFastPath:
                 assert "cloudinary" in location.lower()
 
 
+class TestImageProxyHashIndex:
+    """Fast-path owner lookup by indexed image_hash and the in-process hash map"""
+
+    IMAGE_URL = "https://cf.geekdo-images.com/hashAbC123__md/img/x=/fit-in/500x500/pic1.jpg"
+    CLOUDINARY_URL = "https://res.cloudinary.com/demo/image/upload/hash_test.jpg"
+
+    def _get(self, client):
+        with patch('api.routers.public.socket.gethostbyname', return_value='151.101.1.140'), \
+             patch('config.CLOUDINARY_ENABLED', True):
+            return client.get(f"/api/public/image-proxy?url={self.IMAGE_URL}", follow_redirects=False)
+
+    def test_repeat_hits_skip_database(self, client, db_session):
+        """The first hit resolves the hash in the database; later hits use the map"""
+        from models import Game
+        from services.image_hash_index import image_hash_index
+
+        game = Game(title="Hash Game", image=self.IMAGE_URL, cloudinary_url=self.CLOUDINARY_URL)
+        db_session.add(game)
+        db_session.commit()
+        assert game.image_hash == "hashAbC123"
+
+        first = self._get(client)
+        assert first.status_code == 302
+        assert first.headers["location"] == self.CLOUDINARY_URL
+        assert image_hash_index.get("hashAbC123") == (game.id, self.CLOUDINARY_URL)
+
+        with patch('sqlalchemy.orm.Session.execute', side_effect=AssertionError("database hit")):
+            second = self._get(client)
+        assert second.status_code == 302
+        assert second.headers["location"] == self.CLOUDINARY_URL
+
+    def test_game_update_invalidates_map(self, client, db_session):
+        """Updating the owning game drops its cached entry"""
+        from models import Game
+        from services import GameService
+        from services.image_hash_index import image_hash_index
+
+        game = Game(title="Hash Game", image=self.IMAGE_URL, cloudinary_url=self.CLOUDINARY_URL)
+        db_session.add(game)
+        db_session.commit()
+        assert self._get(client).status_code == 302
+
+        GameService(db_session).update_game(game.id, {"image": "https://cf.geekdo-images.com/other__md/img/pic2.jpg"})
+        assert image_hash_index.get("hashAbC123") is None
+
+    def test_upload_saves_url_for_owner(self, client, db_session):
+        """A cache miss uploads, then stores the Cloudinary URL on the owning game"""
+        from models import Game
+        from services.image_hash_index import image_hash_index
+
+        game = Game(title="Hash Game", image=self.IMAGE_URL)
+        db_session.add(game)
+        db_session.commit()
+
+        with patch('services.cloudinary_service.cloudinary_service.upload_from_url',
+                   new_callable=AsyncMock, return_value={"secure_url": self.CLOUDINARY_URL}), \
+             patch('services.cloudinary_service.cloudinary_service.get_image_url',
+                   return_value=self.CLOUDINARY_URL):
+            response = self._get(client)
+
+        assert response.status_code == 302
+        db_session.refresh(game)
+        assert game.cloudinary_url == self.CLOUDINARY_URL
+        assert image_hash_index.get("hashAbC123") == (game.id, self.CLOUDINARY_URL)
+
+
 class TestImageProxyContentType:
     """Tests for content type handling"""
 
@@ -388,7 +490,7 @@ class TestImageProxyContentType:
              patch('api.routers.public.ImageService') as MockService:
 
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'jpeg data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'jpeg data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             response = client.get("/api/public/image-proxy?url=https://cf.geekdo-images.com/test.jpg")
@@ -403,7 +505,7 @@ class TestImageProxyContentType:
              patch('api.routers.public.ImageService') as MockService:
 
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'png data', 'image/png', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'png data', 'image/png'))
             MockService.return_value = mock_instance
 
             response = client.get("/api/public/image-proxy?url=https://cf.geekdo-images.com/test.png")
@@ -424,7 +526,7 @@ class TestImageProxyEdgeCases:
              patch('api.routers.public.ImageService') as MockService:
 
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             response = client.get(f"/api/public/image-proxy?url={long_url}")
@@ -439,7 +541,7 @@ class TestImageProxyEdgeCases:
              patch('api.routers.public.ImageService') as MockService:
 
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             import urllib.parse
@@ -456,8 +558,131 @@ class TestImageProxyEdgeCases:
              patch('api.routers.public.ImageService') as MockService:
 
             mock_instance = MagicMock()
-            mock_instance.proxy_image = AsyncMock(return_value=(b'data', 'image/jpeg', 'max-age=300'))
+            mock_instance.stream_image = AsyncMock(return_value=image_stream(b'data', 'image/jpeg'))
             MockService.return_value = mock_instance
 
             response = client.get(f"/api/public/image-proxy?url={url}")
             assert response.status_code in [200, 302, 502]
+
+
+PROXIED_URL = "https://cf.geekdo-images.com/abc__md/img/xyz.jpg"
+
+
+def fake_upstream(content, content_type="image/jpeg"):
+    """httpx client answering every request with the image, counting requests"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=content, headers={"content-type": content_type})
+
+    upstream = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    upstream.requests = requests
+    return upstream
+
+
+def proxy_from_upstream(client, upstream, headers=None, **config):
+    """Request PROXIED_URL through the direct proxy, downloading from upstream"""
+    with ExitStack() as stack:
+        stack.enter_context(patch('api.routers.public.socket.gethostbyname', return_value='151.101.1.140'))
+        stack.enter_context(patch('config.CLOUDINARY_ENABLED', False))
+        stack.enter_context(patch('main.httpx_client', upstream))
+        for name, value in config.items():
+            stack.enter_context(patch(f'config.{name}', value))
+        return client.get(f"/api/public/image-proxy?url={PROXIED_URL}", headers=headers or {})
+
+
+class TestImageProxyDiskCache:
+    """Direct-proxy fallback served from the local disk cache"""
+
+    def _get(self, client, upstream, headers=None):
+        return proxy_from_upstream(client, upstream, headers)
+
+    def test_repeat_hit_served_from_disk(self, client):
+        upstream = fake_upstream(b'image data')
+        first = self._get(client, upstream)
+        second = self._get(client, upstream)
+
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content == b'image data'
+        assert second.headers["content-type"] == "image/jpeg"
+        assert second.headers["cache-control"] == "public, max-age=86400, must-revalidate"
+        assert "etag" in second.headers and "last-modified" in second.headers
+        assert len(upstream.requests) == 1
+
+    def test_if_none_match_returns_304(self, client):
+        upstream = fake_upstream(b'image data')
+        self._get(client, upstream)
+        etag = self._get(client, upstream).headers["etag"]
+
+        response = self._get(client, upstream, {"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers["etag"] == etag
+
+    def test_if_modified_since_returns_304(self, client):
+        upstream = fake_upstream(b'image data')
+        self._get(client, upstream)
+        last_modified = self._get(client, upstream).headers["last-modified"]
+
+        response = self._get(client, upstream, {"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+
+    def test_range_request(self, client):
+        upstream = fake_upstream(b'0123456789')
+        self._get(client, upstream)
+
+        response = self._get(client, upstream, {"Range": "bytes=2-5"})
+        assert response.status_code == 206
+        assert response.content == b'2345'
+        assert response.headers["content-range"] == "bytes 2-5/10"
+
+
+class TestImageProxyStreaming:
+    """Direct-proxy fallback streams images instead of buffering them"""
+
+    def _get(self, client, upstream, **config):
+        return proxy_from_upstream(client, upstream, **config)
+
+    def test_streamed_in_chunks(self, client):
+        content = bytes(range(256)) * 64
+        upstream = fake_upstream(content, "image/png")
+
+        response = self._get(client, upstream, IMAGE_PROXY_MAX_BYTES=len(content))
+        assert response.status_code == 200
+        assert response.content == content
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["content-length"] == str(len(content))
+
+    def test_declared_size_over_cap_refused(self, client):
+        upstream = fake_upstream(b'x' * 100)
+
+        response = self._get(client, upstream, IMAGE_PROXY_MAX_BYTES=99)
+        assert response.status_code == 502
+        assert "too large" in response.json()["detail"]
+
+    def test_undeclared_size_over_cap_cut_off_and_not_cached(self, client):
+        requests = []
+
+        async def body():
+            for _ in range(10):
+                yield b'x' * 1000
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=body(), headers={"content-type": "image/jpeg"})
+
+        upstream = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        first = self._get(client, upstream, IMAGE_PROXY_MAX_BYTES=2500)
+        assert first.status_code == 200
+        assert len(first.content) < 10000
+
+        self._get(client, upstream, IMAGE_PROXY_MAX_BYTES=2500)
+        assert len(requests) == 2
+
+    def test_buffered_mode(self, client):
+        upstream = fake_upstream(b'image data')
+
+        response = self._get(client, upstream, IMAGE_PROXY_STREAMING=False)
+        assert response.status_code == 200
+        assert response.content == b'image data'
@@ -2,7 +2,17 @@
 Tests for public API endpoints
 """
 from urllib.parse import urlparse
+
+import pytest
+
 from models import Game
+from services.catalogue_version import CatalogueVersion
+
+
+@pytest.fixture(autouse=True)
+def shared_catalogue_version(monkeypatch):
+    """Catalogue ETags are only issued while the version is shared between workers (Redis)"""
+    monkeypatch.setattr(CatalogueVersion, "shared", property(lambda self: True))
 
 
 class TestPublicGamesEndpoint:
@@ -139,6 +149,66 @@ class TestPublicGameDetailEndpoint:
         assert data["id"] == game_id
 
 
+
+class TestBatchGameDetailEndpoint:
+    """Tests for GET /api/public/games/batch"""
+
+    def _games(self, db_session):
+        base = Game(title="Base", status="OWNED")
+        db_session.add(base)
+        db_session.commit()
+        games = [
+            base,
+            Game(title="Expansion", status="OWNED", is_expansion=True, base_game_id=base.id),
+            Game(title="Wishlisted", status="WISHLIST"),
+        ]
+        db_session.add_all(games[1:])
+        db_session.commit()
+        return [game.id for game in games]
+
+    def test_returns_details_keyed_by_id(self, client, db_session):
+        base_id, expansion_id, wishlist_id = self._games(db_session)
+        response = client.get(f"/api/public/games/batch?ids={expansion_id},{base_id},{wishlist_id},99999")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert list(data["games"]) == [str(expansion_id), str(base_id)]
+        assert data["games"][str(base_id)] == client.get(f"/api/public/games/{base_id}").json()
+        assert [e["id"] for e in data["games"][str(base_id)]["expansions"]] == [expansion_id]
+        assert data["games"][str(expansion_id)]["base_game"]["id"] == base_id
+        assert data["missing"] == [wishlist_id, 99999]
+        assert "ETag" in response.headers
+
+    def test_shares_cache_with_single_detail(self, client, db_session):
+        """Games warmed by a batch are served by /games/{id} without a query, and vice versa"""
+        from unittest.mock import AsyncMock, patch
+
+        base_id, expansion_id, _ = self._games(db_session)
+        client.get(f"/api/public/games/batch?ids={base_id}")
+        client.get(f"/api/public/games/{expansion_id}")
+
+        with patch(
+            "api.routers.public.AsyncGameService.get_games_by_ids", new_callable=AsyncMock
+        ) as load:
+            assert client.get(f"/api/public/games/{base_id}").status_code == 200
+            response = client.get(f"/api/public/games/batch?ids={base_id},{expansion_id}")
+        load.assert_not_called()
+        assert len(response.json()["games"]) == 2
+
+    def test_invalid_ids(self, client):
+        assert client.get("/api/public/games/batch?ids=1,abc").status_code == 400
+        assert client.get("/api/public/games/batch?ids=,").status_code == 400
+        assert client.get("/api/public/games/batch").status_code == 422
+
+    def test_id_cap(self, client):
+        from config import PUBLIC_BATCH_MAX_IDS
+
+        too_many = ",".join(str(i) for i in range(1, PUBLIC_BATCH_MAX_IDS + 2))
+        assert client.get(f"/api/public/games/batch?ids={too_many}").status_code == 400
+        # Duplicates count once
+        duplicates = ",".join(["1"] * (PUBLIC_BATCH_MAX_IDS + 1))
+        assert client.get(f"/api/public/games/batch?ids={duplicates}").status_code == 200
+
 class TestCategoryCountsEndpoint:
     """Tests for GET /api/public/category-counts"""
 
@@ -413,6 +483,271 @@ class TestPublicGamesValidation:
         assert data["total"] == 2
 
 
+class TestPublicGamesCursorPagination:
+    """Tests for keyset (cursor) mode of GET /api/public/games"""
+
+    def test_cursor_walk_matches_offset(self, client, db_session, sample_games_list):
+        """Following next_cursor returns every game once, in offset order"""
+        for game_data in sample_games_list:
+            db_session.add(Game(**game_data))
+        db_session.commit()
+
+        offset = client.get("/api/public/games?sort=year_desc").json()
+        expected = [item["id"] for item in offset["items"]]
+
+        ids, cursor = [], ""
+        while cursor is not None:
+            response = client.get(
+                "/api/public/games",
+                params={"sort": "year_desc", "page_size": 3, "cursor": cursor},
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] is None
+            ids.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+
+        assert ids == expected
+
+    def test_cursor_include_total(self, client, db_session, sample_games_list):
+        """include_total adds the total count in cursor mode"""
+        for game_data in sample_games_list:
+            db_session.add(Game(**game_data))
+        db_session.commit()
+
+        response = client.get("/api/public/games?cursor=&page_size=1&include_total=true")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 4
+        assert len(data["items"]) == 1
+        assert data["next_cursor"]
+
+    def test_invalid_cursor(self, client):
+        """Malformed cursors are rejected with 400"""
+        response = client.get("/api/public/games?cursor=garbage!")
+        assert response.status_code == 400
+
+
+class TestRelevanceSearch:
+    """Full-text search ranking via sort=relevance"""
+
+    def test_relevance_orders_title_matches_first(self, client, db_session):
+        db_session.add_all([
+            Game(title="Atlantis", description="Ships sail to the harbour", status="OWNED"),
+            Game(title="Harbour", status="OWNED"),
+        ])
+        db_session.commit()
+
+        response = client.get("/api/public/games?q=harbour&sort=relevance")
+        assert response.status_code == 200
+        assert [item["title"] for item in response.json()["items"]] == ["Harbour", "Atlantis"]
+
+    def test_relevance_with_cursor_rejected(self, client):
+        response = client.get("/api/public/games?q=harbour&sort=relevance&cursor=")
+        assert response.status_code == 400
+
+
+class TestFacets:
+    """Faceted counts for the active filter set"""
+
+    def test_facets_follow_filters(self, client, db_session):
+        db_session.add_all([
+            Game(title="Duo", players_min=2, players_max=2, playtime_max=20, status="OWNED"),
+            Game(title="Crowd", players_min=4, players_max=8, playtime_max=45, status="OWNED"),
+        ])
+        db_session.commit()
+
+        response = client.get("/api/public/facets?players=4")
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 1
+        # Own filter ignored: every player bucket stays visible
+        assert body["players"]["2"] == 1 and body["players"]["4"] == 1
+        assert body["playtime"] == {"quick": 0, "mid": 1, "long": 0}
+        assert "ETag" in response.headers
+
+    def test_cached_until_catalogue_write(self, client, db_session):
+        from services import GameService
+
+        client.get("/api/public/facets")
+        GameService(db_session).create_game({"title": "New", "playtime_max": 10})
+        assert client.get("/api/public/facets").json()["playtime"]["quick"] == 1
+
+
+class TestSuggest:
+    """Typeahead suggestions"""
+
+    def test_prefix_and_typo_suggestions(self, client, db_session):
+        db_session.add_all([
+            Game(title="Wingspan", designers=["Elizabeth Hargrave"], bgg_rank=20, status="OWNED"),
+            Game(title="Wingspan Hidden", bgg_rank=1, status="WISHLIST"),
+        ])
+        db_session.commit()
+
+        response = client.get("/api/public/suggest?q=wing")
+        assert response.status_code == 200
+        assert [s["label"] for s in response.json()["suggestions"]] == ["Wingspan"]
+
+        typo = client.get("/api/public/suggest?q=wingspam").json()["suggestions"]
+        assert typo[0]["label"] == "Wingspan"
+
+        designer = client.get("/api/public/suggest?q=harg").json()["suggestions"]
+        assert designer == [
+            {"type": "designer", "label": "Elizabeth Hargrave", "game_id": None, "games": 1}
+        ]
+
+    def test_game_service_write_visible_without_reload(self, client, db_session):
+        from services import GameService
+        from services.suggest import suggest_index
+
+        client.get("/api/public/suggest?q=a")
+        GameService(db_session).create_game({"title": "Azul"})
+
+        suggestions = client.get("/api/public/suggest?q=az").json()["suggestions"]
+        assert [s["label"] for s in suggestions] == ["Azul"]
+        assert suggest_index.stats["full_loads"] == 1
+
+    def test_query_required(self, client):
+        assert client.get("/api/public/suggest").status_code == 422
+
+
+class TestCatalogueVersionCaching:
+    """Catalogue cache keys follow the catalogue version"""
+
+    def test_write_visible_immediately(self, client, db_session):
+        """A GameService update is served on the next request despite caching"""
+        from services import GameService
+
+        game = Game(title="Before", status="OWNED")
+        db_session.add(game)
+        db_session.commit()
+
+        first = client.get("/api/public/games")
+        assert first.json()["items"][0]["title"] == "Before"
+        version = int(first.headers["X-Catalogue-Version"])
+
+        GameService(db_session).update_game(game.id, {"title": "After"})
+
+        second = client.get("/api/public/games")
+        assert second.json()["items"][0]["title"] == "After"
+        assert int(second.headers["X-Catalogue-Version"]) > version
+
+    def test_category_counts_follow_version(self, client, db_session):
+        """Category counts are recomputed after a catalogue write"""
+        from services import GameService
+
+        assert client.get("/api/public/category-counts").json()["all"] == 0
+        GameService(db_session).create_game({"title": "New Game"})
+        assert client.get("/api/public/category-counts").json()["all"] == 1
+
+    def test_catalogue_version_endpoint(self, client, db_session):
+        """The version endpoint matches the header and increases on writes"""
+        from services import GameService
+
+        response = client.get("/api/public/catalogue-version")
+        assert response.status_code == 200
+        version = response.json()["version"]
+        assert client.get("/api/public/games").headers["X-Catalogue-Version"] == str(version)
+
+        GameService(db_session).create_game({"title": "New Game"})
+        assert client.get("/api/public/catalogue-version").json()["version"] > version
+
+    def test_catalogue_version_is_revalidated_not_cached(self, client, db_session):
+        """Caches must revalidate the version, so a poll never sees a stale one"""
+        from services import GameService
+
+        first = client.get("/api/public/catalogue-version")
+        assert first.headers["Cache-Control"] == "no-cache"
+
+        unchanged = client.get(
+            "/api/public/catalogue-version", headers={"If-None-Match": first.headers["ETag"]}
+        )
+        assert unchanged.status_code == 304
+        assert unchanged.headers["Cache-Control"] == "no-cache"
+
+        GameService(db_session).create_game({"title": "New Game"})
+        changed = client.get(
+            "/api/public/catalogue-version", headers={"If-None-Match": first.headers["ETag"]}
+        )
+        assert changed.status_code == 200
+        assert changed.json()["version"] > first.json()["version"]
+
+
+class TestConditionalRequests:
+    """ETag / If-None-Match support on catalogue endpoints"""
+
+    def test_games_etag_and_304(self, client, db_session):
+        """A matching If-None-Match returns 304 with no body"""
+        db_session.add(Game(title="Game", status="OWNED"))
+        db_session.commit()
+
+        first = client.get("/api/public/games?page_size=10")
+        etag = first.headers["ETag"]
+        assert etag.startswith('"v')
+
+        second = client.get(
+            "/api/public/games?page_size=10", headers={"If-None-Match": etag}
+        )
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+        assert "stale-while-revalidate" in second.headers["Cache-Control"]
+
+    def test_etag_depends_on_query(self, client):
+        """Different queries get different tags; parameter order does not matter"""
+        a = client.get("/api/public/games?page=1&sort=year_desc").headers["ETag"]
+        b = client.get("/api/public/games?sort=year_desc&page=1").headers["ETag"]
+        c = client.get("/api/public/games?page=2&sort=year_desc").headers["ETag"]
+        assert a == b
+        assert a != c
+
+    def test_etag_changes_after_write(self, client, db_session):
+        """A catalogue write invalidates previously issued tags"""
+        from services import GameService
+
+        etag = client.get("/api/public/category-counts").headers["ETag"]
+        GameService(db_session).create_game({"title": "New Game"})
+
+        response = client.get(
+            "/api/public/category-counts", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json()["all"] == 1
+        assert response.headers["ETag"] != etag
+
+    def test_game_detail_304_skips_database(self, client, db_session):
+        """Detail 304s are answered before the game is loaded"""
+        from unittest.mock import patch
+
+        game = Game(title="Detail", status="OWNED")
+        db_session.add(game)
+        db_session.commit()
+
+        etag = client.get(f"/api/public/games/{game.id}").headers["ETag"]
+        with patch("api.routers.public.AsyncGameService") as service:
+            response = client.get(
+                f"/api/public/games/{game.id}",
+                headers={"If-None-Match": f'W/{etag}, "other"'},
+            )
+        assert response.status_code == 304
+        service.assert_not_called()
+
+
+    def test_no_etag_without_a_shared_version(self, client, db_session, monkeypatch):
+        """A per-worker version cannot validate copies other workers' writes changed"""
+        monkeypatch.setattr(CatalogueVersion, "shared", property(lambda self: False))
+        db_session.add(Game(title="Game", status="OWNED"))
+        db_session.commit()
+
+        first = client.get("/api/public/games")
+        assert "ETag" not in first.headers
+        assert "X-Catalogue-Version" in first.headers
+
+        second = client.get("/api/public/games", headers={"If-None-Match": "*"})
+        assert second.status_code == 200
+        assert second.json()["items"][0]["title"] == "Game"
+
+
 class TestDesignerEndpoint:
     """Tests for designer-specific endpoint"""
 
@@ -441,6 +776,259 @@ class TestDesignerEndpoint:
         assert data["designer"] == "Unknown Designer"
         assert len(data["games"]) == 0
 
+    def test_get_games_by_designer_matches_whole_names(self, client, db_session):
+        """Names match case-insensitively but never as a fragment of another name"""
+        db_session.add_all([
+            Game(title="Game A", designers=["Ann Smith"], status="OWNED"),
+            Game(title="Game B", designers=["Joanna Smithers"], status="OWNED"),
+        ])
+        db_session.commit()
+
+        response = client.get("/api/public/games/by-designer/ann smith")
+        assert [g["title"] for g in response.json()["games"]] == ["Game A"]
+        response = client.get("/api/public/games/by-designer/Ann")
+        assert response.json()["games"] == []
+
+    def test_games_mechanic_and_publisher_filters(self, client, db_session):
+        """/games accepts mechanic= and publisher= alongside designer="""
+        db_session.add_all([
+            Game(title="Game A", designers=["Ann Smith"], mechanics=["Deck Building"],
+                 publishers=["Kiwi Games"], status="OWNED"),
+            Game(title="Game B", designers=["Ann Smith"], mechanics=["Deck Building"], status="OWNED"),
+            Game(title="Game C", mechanics=["Drafting"], publishers=["Kiwi Games"], status="OWNED"),
+        ])
+        db_session.commit()
+
+        response = client.get("/api/public/games?mechanic=deck building&designer=Ann Smith")
+        assert sorted(item["title"] for item in response.json()["items"]) == ["Game A", "Game B"]
+        response = client.get("/api/public/games?mechanic=Deck Building&publisher=Kiwi Games")
+        assert [item["title"] for item in response.json()["items"]] == ["Game A"]
+        response = client.get("/api/public/facets?publisher=Kiwi Games")
+        assert response.json()["total"] == 2
+
+
+
+
+class TestChangesEndpoint:
+    """Tests for /changes delta sync"""
+
+    def _sync(self, client, since=None, limit=500):
+        """Follow next tokens until caught up; returns (items by id, deleted ids, token)"""
+        items, deleted = {}, []
+        while True:
+            params = {"limit": limit}
+            if since is not None:
+                params["since"] = since
+            data = client.get("/api/public/changes", params=params).json()
+            items.update({item["id"]: item for item in data["items"]})
+            deleted += data["deleted"]
+            since = data["next"]
+            if not data["has_more"]:
+                return items, deleted, since
+
+    def test_snapshot(self, client, db_session):
+        db_session.add_all([
+            Game(title="Owned", status="OWNED"),
+            Game(title="Wishlisted", status="WISHLIST"),
+        ])
+        db_session.commit()
+
+        response = client.get("/api/public/changes")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["reset"] is True
+        assert data["since"] is None
+        assert data["has_more"] is False
+        assert [item["title"] for item in data["items"]] == ["Owned"]
+        assert data["deleted"] == []
+        assert "ETag" in response.headers
+
+    def test_snapshot_paging(self, client, db_session):
+        db_session.add_all([Game(title=f"Game {i}", status="OWNED") for i in range(5)])
+        db_session.commit()
+
+        first = client.get("/api/public/changes?limit=2").json()
+        assert first["has_more"] is True
+        assert len(first["items"]) == 2
+        items, _, _ = self._sync(client, first["next"], limit=2)
+        assert len(items) == 3
+
+    def test_delta_after_writes(self, client, db_session):
+        from services import GameService
+
+        service = GameService(db_session)
+        kept = service.create_game({"title": "Kept", "status": "OWNED"})
+        removed = service.create_game({"title": "Removed", "status": "OWNED"})
+        _, _, token = self._sync(client)
+
+        service.update_game(kept.id, {"title": "Kept (2nd edition)"})
+        added = service.create_game({"title": "Added", "status": "OWNED"})
+        service.delete_game(removed.id)
+
+        items, deleted, _ = self._sync(client, token)
+        assert items[kept.id]["title"] == "Kept (2nd edition)"
+        assert added.id in items
+        assert removed.id not in items
+        assert deleted == [removed.id]
+
+    def test_polls_are_revalidated_not_cached(self, client, db_session):
+        """An unchanged since token must not be answered from an HTTP cache"""
+        from services import GameService
+
+        first = client.get("/api/public/changes", params={"since": "0-0"})
+        assert first.headers["Cache-Control"] == "no-cache"
+
+        unchanged = client.get(
+            "/api/public/changes", params={"since": "0-0"}, headers={"If-None-Match": first.headers["ETag"]}
+        )
+        assert unchanged.status_code == 304
+        assert unchanged.headers["Cache-Control"] == "no-cache"
+
+        GameService(db_session).create_game({"title": "New Game", "status": "OWNED"})
+        changed = client.get(
+            "/api/public/changes", params={"since": "0-0"}, headers={"If-None-Match": first.headers["ETag"]}
+        )
+        assert changed.status_code == 200
+        assert [item["title"] for item in changed.json()["items"]] == ["New Game"]
+
+    def test_invalid_token(self, client):
+        assert client.get("/api/public/changes?since=yesterday").status_code == 400
+        assert client.get("/api/public/changes?limit=0").status_code == 422
+
+
+class TestCatalogueEventsEndpoint:
+    """Tests for the /events server-sent events stream"""
+
+    def _frames(self, client, headers=None, publish=None):
+        """Open a short-lived stream (optionally publishing mid-stream) and parse its frames"""
+        import threading
+        from unittest.mock import patch
+
+        timer = threading.Timer(0.2, publish) if publish else None
+        with patch("api.routers.public.CATALOGUE_STREAM_MAX_SECONDS", 0.6), \
+                patch("api.routers.public.CATALOGUE_STREAM_HEARTBEAT_SECONDS", 0.1):
+            if timer:
+                timer.start()
+            response = client.get("/api/public/events", headers=headers or {})
+        if timer:
+            timer.join()
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        return [frame for frame in response.text.split("\n\n") if frame]
+
+    def test_ready_heartbeat_and_change_events(self, client):
+        from services.catalogue_stream import catalogue_stream
+        from services.catalogue_version import catalogue_version
+
+        version = catalogue_version.current()
+        frames = self._frames(
+            client, publish=lambda: catalogue_stream.publish([42], "update", version + 1)
+        )
+
+        assert frames[0] == "retry: 5000"
+        assert frames[1] == f'event: ready\nid: {version}\ndata: {{"version":{version}}}'
+        assert ": keep-alive" in frames
+        changes = [frame for frame in frames if frame.startswith("event: change")]
+        assert changes == [
+            f'event: change\nid: {version + 1}\n'
+            f'data: {{"game_id":42,"version":{version + 1},"op":"update"}}'
+        ]
+        assert len(catalogue_stream) == 0
+
+    def test_reconnect_after_missed_change_resyncs(self, client):
+        from services.catalogue_version import catalogue_version
+
+        version = catalogue_version.current()
+        stale = self._frames(client, headers={"Last-Event-ID": str(version - 1)})
+        assert stale[2].startswith("event: resync")
+        current = self._frames(client, headers={"Last-Event-ID": str(version)})
+        assert not any(frame.startswith("event: resync") for frame in current)
+
+    def test_connection_limit(self, client):
+        from unittest.mock import patch
+        from services.catalogue_stream import catalogue_stream
+
+        with patch.object(catalogue_stream, "max_subscribers", 0):
+            response = client.get("/api/public/events")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "30"
+
+class TestSimilarGamesEndpoint:
+    """Tests for /games/{game_id}/similar"""
+
+    def _catalogue(self, db_session):
+        games = [
+            Game(title="Pandemic", mechanics=["Cooperative Game", "Hand Management"],
+                 designers=["Matt Leacock"], complexity=2.4, status="OWNED"),
+            Game(title="Forbidden Island", mechanics=["Cooperative Game", "Hand Management"],
+                 designers=["Matt Leacock"], complexity=1.7, status="OWNED"),
+            Game(title="Spirit Island", mechanics=["Cooperative Game"], complexity=4.0, status="OWNED"),
+            Game(title="Catan", mechanics=["Trading"], status="OWNED"),
+            Game(title="Wishlisted", mechanics=["Cooperative Game"], status="WISHLIST"),
+        ]
+        db_session.add_all(games)
+        db_session.commit()
+        from services.similar_games import recompute_all_similar_games
+        recompute_all_similar_games(db_session)
+        db_session.commit()
+        return {game.title: game.id for game in games}
+
+    def test_returns_most_similar_first(self, client, db_session):
+        ids = self._catalogue(db_session)
+        response = client.get(f"/api/public/games/{ids['Pandemic']}/similar")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["game_id"] == ids["Pandemic"]
+        assert [item["title"] for item in data["items"]] == ["Forbidden Island", "Spirit Island"]
+        assert "ETag" in response.headers
+
+    def test_limit(self, client, db_session):
+        ids = self._catalogue(db_session)
+        response = client.get(f"/api/public/games/{ids['Pandemic']}/similar?limit=1")
+        assert [item["title"] for item in response.json()["items"]] == ["Forbidden Island"]
+        response = client.get(f"/api/public/games/{ids['Pandemic']}/similar?limit=1000")
+        assert response.status_code == 422
+
+    def test_non_public_game_not_found(self, client, db_session):
+        ids = self._catalogue(db_session)
+        assert client.get(f"/api/public/games/{ids['Wishlisted']}/similar").status_code == 404
+        assert client.get("/api/public/games/99999/similar").status_code == 404
+
+    def test_request_racing_an_import_does_not_pin_a_stale_list(self, client, db_session, monkeypatch):
+        """/similar asked between the import commit and the list refresh is not cached for good"""
+        from services import GameService
+        from services import game_service as game_service_module
+
+        ids = self._catalogue(db_session)
+        refresh = game_service_module.refresh_similar_games
+        raced = []
+
+        def refresh_after_a_request(db, game_ids, *args, **kwargs):
+            game_ids = list(game_ids)
+            for game_id in game_ids:
+                raced.append(client.get(f"/api/public/games/{game_id}/similar").json()["items"])
+            return refresh(db, game_ids, *args, **kwargs)
+
+        monkeypatch.setattr(game_service_module, "refresh_similar_games", refresh_after_a_request)
+        game, _ = GameService(db_session).create_or_update_from_bgg(900, {
+            "title": "Pandemic Legacy",
+            "mechanics": ["Cooperative Game", "Hand Management"],
+            "designers": ["Matt Leacock"],
+            "complexity": 2.8,
+        })
+
+        assert raced == [[]]
+        response = client.get(f"/api/public/games/{game.id}/similar")
+        assert response.json()["items"][0]["title"] == "Pandemic"
+        neighbour = client.get(f"/api/public/games/{ids['Pandemic']}/similar?limit=1")
+        assert [item["id"] for item in neighbour.json()["items"]] == [game.id]
+
+    def test_designer_named_similar_still_routes_to_designer_endpoint(self, client, db_session):
+        db_session.add(Game(title="Game A", designers=["similar"], status="OWNED"))
+        db_session.commit()
+        response = client.get("/api/public/games/by-designer/similar")
+        assert response.status_code == 200
+        assert [g["title"] for g in response.json()["games"]] == ["Game A"]
 
 class TestImageProxyEndpoint:
     """Tests for image proxy endpoint"""
@@ -462,15 +1050,22 @@ class TestImageProxyEndpoint:
         """Test image proxy with BGG domain"""
         from unittest.mock import AsyncMock, Mock, patch
 
+        import httpx
+
+        from services.image_service import ImageStream
+
         # Mock the image service response
         mock_content = b"fake image data"
         mock_content_type = "image/jpeg"
-        mock_cache_control = "public, max-age=300"
 
         with patch("api.routers.public.ImageService") as mock_service_class:
             mock_service = Mock()
-            mock_service.proxy_image = AsyncMock(
-                return_value=(mock_content, mock_content_type, mock_cache_control)
+            mock_service.stream_image = AsyncMock(
+                return_value=ImageStream(
+                    httpx.Response(200, content=mock_content, headers={"content-type": mock_content_type}),
+                    max_bytes=1024,
+                    chunk_size=1024,
+                )
             )
             mock_service_class.return_value = mock_service
 
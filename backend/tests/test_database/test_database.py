@@ -187,6 +187,41 @@ class TestGetReadDb:
 
 
 # NOTE: Migration tests removed - now using Alembic for database migrations
+class TestAsyncDatabase:
+    """Test the async engine URL mapping and session dependencies"""
+
+    @pytest.mark.parametrize("url,expected", [
+        ("postgresql://u:p@host:5432/db", "postgresql+asyncpg://u:p@host:5432/db"),
+        ("postgresql+psycopg2://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+        ("postgresql://u:p@host/db?sslmode=require", "postgresql+asyncpg://u:p@host/db?ssl=require"),
+        ("sqlite:///./app.db", "sqlite+aiosqlite:///./app.db"),
+        ("sqlite+aiosqlite:///./app.db", "sqlite+aiosqlite:///./app.db"),
+    ])
+    def test_async_url(self, url, expected):
+        """Sync URLs map onto their async drivers"""
+        assert database._async_url(url) == expected
+
+    @pytest.mark.asyncio
+    async def test_get_async_read_db_yields_session(self, tmp_path):
+        """Async dependencies create engines lazily and yield AsyncSessions"""
+        from sqlalchemy import text
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        with patch('database.DATABASE_URL', f"sqlite:///{tmp_path / 'async.db'}"), \
+             patch('database.READ_REPLICA_URL', ''):
+            try:
+                gen = database.get_async_read_db()
+                session = await gen.__anext__()
+                assert isinstance(session, AsyncSession)
+                assert (await session.execute(text("SELECT 1"))).scalar() == 1
+                await gen.aclose()
+                assert database.AsyncReadSessionLocal is database.AsyncSessionLocal
+            finally:
+                await database.dispose_async_engines()
+
+        assert database.AsyncSessionLocal is None
+
+
 # The run_migrations() function has been removed from database.py
 # Migration testing is now handled by Alembic's built-in testing tools
 # See: backend/alembic/ for migration files
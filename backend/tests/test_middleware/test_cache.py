@@ -265,3 +265,27 @@ class TestCacheControlIntegration:
         # Verify we have both start and body
         assert len(sent_messages) >= 1
         assert any(msg.get("type") == "http.response.start" for msg in sent_messages)
+
+    @pytest.mark.asyncio
+    async def test_public_catalogue_allows_stale_while_revalidate(self):
+        """Public catalogue responses may be served stale while revalidating"""
+        async def app(scope, receive, send):
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [[b"etag", b'"v1-abc"']],
+            })
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = APICacheControlMiddleware(app)
+        scope = {"type": "http", "method": "GET", "path": "/api/public/games"}
+
+        sent_messages = []
+        async def send(message):
+            sent_messages.append(message)
+
+        await middleware(scope, AsyncMock(), send)
+
+        headers = dict(sent_messages[0]["headers"])
+        assert b"stale-while-revalidate=600" in headers[b"cache-control"]
+        assert headers[b"etag"] == b'"v1-abc"'
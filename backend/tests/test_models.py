@@ -20,7 +20,9 @@ from decimal import Decimal
 
 from models import (
     Base,
+    BggEntity,
     Game,
+    GameEntityLink,
     BuyListGame,
     PriceSnapshot,
     PriceOffer,
@@ -165,6 +167,78 @@ class TestGameModel:
         assert loaded_game.mechanics == ["Deck Building", "Worker Placement"]
         assert loaded_game.artists == ["Artist X"]
 
+    def test_image_hash_follows_image(self, session):
+        """image_hash is derived from the BGG image URL on every assignment"""
+        game = Game(title="Test", image="https://cf.geekdo-images.com/AbC-12_x__original/img/pic1.jpg")
+        session.add(game)
+        session.commit()
+        assert game.image_hash == "AbC-12_x"
+
+        game.image = "https://example.com/not-bgg.jpg"
+        session.commit()
+        assert session.query(Game).filter_by(id=game.id).one().image_hash is None
+
+    def test_quick_pick_flags_follow_attributes(self, session):
+        """quick_pick_* flags: NULL = no match, False = excluded, True = shown"""
+        game = Game(title="Test", complexity=1.2, min_age=8, excluded_quick_picks=["kids"])
+        session.add(game)
+        session.commit()
+        assert (game.quick_pick_first, game.quick_pick_kids) == (True, False)
+        assert (game.quick_pick_group, game.quick_pick_coop) == (None, None)
+
+        game.excluded_quick_picks = []
+        game.players_max = 6
+        game.mana_meeple_category = "COOP_ADVENTURE"
+        game.complexity = 2.5
+        session.commit()
+        loaded = session.query(Game).filter_by(id=game.id).one()
+        assert loaded.quick_pick_first is None
+        assert loaded.quick_pick_kids is None
+        assert loaded.quick_pick_group is True
+        assert loaded.quick_pick_coop is True
+
+
+class TestBggEntityModel:
+    """Test the normalized designer/mechanic/publisher/artist entities"""
+
+    def _linked(self, session, game):
+        return sorted(
+            (entity.kind, entity.name)
+            for entity in session.query(BggEntity)
+            .join(GameEntityLink, GameEntityLink.entity_id == BggEntity.id)
+            .filter(GameEntityLink.game_id == game.id)
+        )
+
+    def test_links_follow_json_columns(self, session):
+        """Links are created from, and kept in step with, the JSON name lists"""
+        game = Game(title="Test", designers=["Uwe Rosenberg"], mechanics=["Worker Placement"])
+        session.add(game)
+        session.commit()
+        assert self._linked(session, game) == [
+            ("designer", "Uwe Rosenberg"), ("mechanic", "Worker Placement"),
+        ]
+
+        game.designers = ["Uwe Rosenberg", "Ann Smith"]
+        game.mechanics = []
+        session.commit()
+        assert self._linked(session, game) == [("designer", "Ann Smith"), ("designer", "Uwe Rosenberg")]
+
+        session.delete(game)
+        session.commit()
+        assert session.query(GameEntityLink).count() == 0
+
+    def test_entities_are_shared_by_normalized_name(self, session):
+        """One entity per kind and case/whitespace-insensitive name"""
+        session.add_all([
+            Game(title="A", designers=["Ann Smith"], artists=["Ann Smith"]),
+            Game(title="B", designers=["ann  smith"]),
+        ])
+        session.commit()
+        assert sorted(
+            (entity.kind, entity.name, entity.name_key) for entity in session.query(BggEntity)
+        ) == [("artist", "Ann Smith", "ann smith"), ("designer", "Ann Smith", "ann smith")]
+        assert session.query(GameEntityLink).count() == 3
+
 
 class TestBuyListGameModel:
     """Test BuyListGame model"""
@@ -405,6 +405,102 @@ class TestRedisClientTTL:
         assert result is None
 
 
+class TestRedisClientPubSub:
+    """Test pattern delete and pub/sub operations"""
+
+    @patch('redis_client.redis.from_url')
+    def test_delete_pattern_success(self, mock_from_url):
+        """Test deleting keys matched by SCAN"""
+        mock_client = Mock()
+        mock_client.ping.return_value = True
+        mock_client.scan_iter.return_value = iter(["qcache:a", "qcache:b"])
+        mock_client.delete.return_value = 2
+        mock_from_url.return_value = mock_client
+
+        client = RedisClient("redis://localhost:6379/0")
+        result = client.delete_pattern("qcache:*")
+
+        assert result == 2
+        mock_client.scan_iter.assert_called_once_with(match="qcache:*", count=500)
+        mock_client.delete.assert_called_once_with("qcache:a", "qcache:b")
+
+    @patch('redis_client.redis.from_url')
+    def test_delete_pattern_redis_error(self, mock_from_url):
+        """Test pattern delete with Redis error"""
+        mock_client = Mock()
+        mock_client.ping.return_value = True
+        mock_client.scan_iter.side_effect = RedisError("SCAN failed")
+        mock_from_url.return_value = mock_client
+
+        client = RedisClient("redis://localhost:6379/0")
+
+        assert client.delete_pattern("qcache:*") == 0
+
+    @patch('redis_client.redis.from_url')
+    def test_acquire_lock(self, mock_from_url):
+        """Test lock acquisition uses SET NX with a millisecond expiry"""
+        mock_client = Mock()
+        mock_client.ping.return_value = True
+        mock_client.set.side_effect = [True, None]
+        mock_from_url.return_value = mock_client
+
+        client = RedisClient("redis://localhost:6379/0")
+
+        assert client.acquire_lock("lock", "token", 2.5) is True
+        assert client.acquire_lock("lock", "token", 2.5) is False
+        mock_client.set.assert_called_with("lock", "token", nx=True, px=2500)
+
+    @patch('redis_client.redis.from_url')
+    def test_release_lock_checks_token(self, mock_from_url):
+        """Test lock release only deletes a lock we still own"""
+        mock_client = Mock()
+        mock_client.ping.return_value = True
+        mock_client.eval.return_value = 0
+        mock_from_url.return_value = mock_client
+
+        client = RedisClient("redis://localhost:6379/0")
+
+        assert client.release_lock("lock", "stale-token") is False
+        assert mock_client.eval.call_args[0][1:] == (1, "lock", "stale-token")
+
+    @patch('redis_client.redis.from_url')
+    def test_publish_success(self, mock_from_url):
+        """Test successful publish"""
+        mock_client = Mock()
+        mock_client.ping.return_value = True
+        mock_from_url.return_value = mock_client
+
+        client = RedisClient("redis://localhost:6379/0")
+
+        assert client.publish("channel", "message") is True
+        mock_client.publish.assert_called_once_with("channel", "message")
+
+    @patch('redis_client.redis.from_url')
+    def test_subscribe_starts_thread(self, mock_from_url):
+        """Test subscribe registers the handler and starts a worker thread"""
+        mock_client = Mock()
+        mock_client.ping.return_value = True
+        mock_from_url.return_value = mock_client
+        handler = Mock()
+
+        client = RedisClient("redis://localhost:6379/0")
+        thread = client.subscribe("channel", handler)
+
+        pubsub = mock_client.pubsub.return_value
+        pubsub.subscribe.assert_called_once_with(channel=handler)
+        assert thread is pubsub.run_in_thread.return_value
+
+    @patch('redis_client.redis.from_url')
+    def test_publish_and_subscribe_when_unavailable(self, mock_from_url):
+        """Test pub/sub degrade gracefully when Redis is unavailable"""
+        mock_from_url.side_effect = RedisConnectionError("Failed")
+
+        client = RedisClient("redis://localhost:6379/0")
+
+        assert client.publish("channel", "message") is False
+        assert client.subscribe("channel", Mock()) is None
+
+
 class TestRedisClientPing:
     """Test Redis PING operations"""
 
@@ -475,6 +571,13 @@ class TestRedisClientFlushdb:
 class TestGlobalRedisClient:
     """Test global Redis client instance"""
 
+    def setup_method(self):
+        self._original_client = redis_client.redis_client
+
+    def teardown_method(self):
+        # reload() replaces the process-wide client with one bound to a mock connection
+        redis_client.redis_client = self._original_client
+
     @patch('redis_client.RedisClient')
     @patch.dict('os.environ', {'REDIS_URL': 'redis://testhost:6379/1'})
     def test_get_redis_client_returns_instance(self, mock_redis_client_class):
@@ -263,3 +263,25 @@ class TestBackfillCloudinaryUrlsScript:
             # Verify backfill was called with limit=10
             call_kwargs = mock_backfill.call_args[1]
             assert call_kwargs['limit'] == 10
+
+    def test_main_live_run_uses_resumable_engine(self):
+        """Test a live run goes through the resumable backfill engine"""
+        from unittest.mock import AsyncMock
+        from scripts.backfill_cloudinary_urls import main
+
+        test_args = ['script_name', '--retry-failed', '--concurrency', '8', '--limit', '100']
+        with patch('sys.argv', test_args), \
+             patch('builtins.input', return_value='y'), \
+             patch('scripts.backfill_cloudinary_urls.run_backfill', new_callable=AsyncMock) as mock_run, \
+             patch('scripts.backfill_cloudinary_urls.backfill_cloudinary_urls') as mock_serial, \
+             patch('scripts.backfill_cloudinary_urls.print_progress') as mock_print:
+
+            mock_run.return_value = {'status': 'completed'}
+
+            main()
+
+            mock_serial.assert_not_called()
+            mock_run.assert_awaited_once_with(
+                force=False, retry_failed=True, restart=False, limit=100, concurrency=8
+            )
+            mock_print.assert_called_once_with({'status': 'completed'})
@@ -0,0 +1,133 @@
+"""
+Tests for AsyncGameService.
+Each async read must return the same rows as its GameService counterpart.
+"""
+import pytest
+
+from models import Game, Sleeve
+from services import AsyncGameService, GameService
+
+
+def _ids(games):
+    return [g.id for g in games]
+
+
+class TestAsyncGameServiceReads:
+    """Async reads match the synchronous service"""
+
+    @pytest.mark.asyncio
+    async def test_get_game_by_id_loads_relationships(self, db_session, async_db_session):
+        base = Game(title="Base Game", status="OWNED")
+        db_session.add(base)
+        db_session.commit()
+        expansion = Game(
+            title="Big Box Expansion",
+            is_expansion=True,
+            base_game_id=base.id,
+            modifies_players_max=6,
+        )
+        db_session.add(expansion)
+        db_session.add(Sleeve(game_id=base.id, card_name="Deck", width_mm=63, height_mm=88, quantity=50))
+        db_session.commit()
+
+        game = await AsyncGameService(async_db_session).get_game_by_id(base.id, with_sleeves=True)
+
+        # Relationships must already be loaded - async sessions cannot lazy-load
+        assert _ids(game.expansions) == [expansion.id]
+        assert game.base_game is None
+        assert [s.card_name for s in game.sleeves] == ["Deck"]
+
+        child = await AsyncGameService(async_db_session).get_game_by_id(expansion.id)
+        assert child.base_game.id == base.id
+
+    @pytest.mark.asyncio
+    async def test_get_games_by_ids(self, db_session, async_db_session):
+        base = Game(title="Base Game", status="OWNED")
+        other = Game(title="Other Game", status="OWNED")
+        db_session.add_all([base, other])
+        db_session.commit()
+        expansion = Game(title="Expansion", is_expansion=True, base_game_id=base.id)
+        db_session.add(expansion)
+        db_session.commit()
+
+        ids = [expansion.id, 999999, other.id, base.id]
+        games = await AsyncGameService(async_db_session).get_games_by_ids(ids)
+
+        assert _ids(games) == [expansion.id, other.id, base.id]
+        assert _ids(games) == _ids(GameService(db_session).get_games_by_ids(ids))
+        assert games[0].base_game.id == base.id
+        assert _ids(games[2].expansions) == [expansion.id]
+        assert await AsyncGameService(async_db_session).get_games_by_ids([]) == []
+
+    def test_get_games_by_ids_query_count_is_constant(self, db_session):
+        """One query for the games plus one per eager-loaded relationship"""
+        from sqlalchemy import event
+
+        db_session.add_all([Game(title=f"Game {i}", status="OWNED") for i in range(20)])
+        db_session.commit()
+        ids = [game.id for game in db_session.query(Game).all()]
+        db_session.expunge_all()
+
+        statements = []
+        engine = db_session.get_bind()
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            games = GameService(db_session).get_games_by_ids(ids)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(games) == 20
+        assert len(statements) <= 3
+
+    @pytest.mark.asyncio
+    async def test_missing_game_returns_none(self, async_db_session):
+        service = AsyncGameService(async_db_session)
+        assert await service.get_game_by_id(999999) is None
+        assert await service.get_game_by_bgg_id(999999) is None
+
+    @pytest.mark.asyncio
+    async def test_get_game_by_bgg_id(self, sample_game, async_db_session):
+        game = await AsyncGameService(async_db_session).get_game_by_bgg_id(sample_game.bgg_id)
+        assert game.id == sample_game.id
+
+    @pytest.mark.asyncio
+    async def test_simple_readers_match_sync(self, db_session, async_db_session, varied_catalogue):
+        sync, service = GameService(db_session), AsyncGameService(async_db_session)
+
+        assert _ids(await service.get_all_games()) == _ids(sync.get_all_games())
+        assert _ids(await service.get_games_by_designer("smith")) == _ids(
+            sync.get_games_by_designer("smith")
+        )
+        for key in GameService.QUICK_PICK_KEYS:
+            assert _ids(await service.get_quick_pick_candidates(key)) == _ids(
+                sync.get_quick_pick_candidates(key)
+            )
+        assert await service.get_quick_pick_candidates("unknown") == []
+        assert await service.get_category_counts() == sync.get_category_counts()
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"category": "CORE_STRATEGY", "sort": "rating_desc"},
+        {"search": "castle", "players": 4},
+        {"quick_pick": "kids", "page": 2, "page_size": 5},
+    ])
+    @pytest.mark.asyncio
+    async def test_filtered_games_match_sync(self, db_session, async_db_session, varied_catalogue, filters):
+        games, total = await AsyncGameService(async_db_session).get_filtered_games(**filters)
+        expected, expected_total = GameService(db_session).get_filtered_games(**filters)
+        assert (_ids(games), total) == (_ids(expected), expected_total)
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_match_sync(self, db_session, async_db_session, varied_catalogue):
+        service = AsyncGameService(async_db_session)
+        games, cursor, total = await service.get_filtered_games_keyset(
+            sort="year_desc", page_size=10, include_total=True
+        )
+        expected, expected_cursor, expected_total = GameService(db_session).get_filtered_games_keyset(
+            sort="year_desc", page_size=10, include_total=True
+        )
+        assert (_ids(games), cursor, total) == (_ids(expected), expected_cursor, expected_total)
+
+        next_page, _, _ = await service.get_filtered_games_keyset(sort="year_desc", cursor=cursor, page_size=10)
+        assert not set(_ids(next_page)) & set(_ids(games))
@@ -0,0 +1,202 @@
+"""
+Tests for the in-memory columnar catalogue engine.
+Every query is checked for parity against the SQL path in GameService.
+"""
+import asyncio
+
+import pytest
+
+from services.catalogue_engine import CatalogueEngine
+from services.game_service import GameService
+
+SORTS = [
+    "title_asc",
+    "title_desc",
+    "year_asc",
+    "year_desc",
+    "date_added_asc",
+    "date_added_desc",
+    "rating_asc",
+    "rating_desc",
+    "time_asc",
+    "time_desc",
+]
+
+FILTER_CASES = [
+    {},
+    {"search": "dragon"},
+    {"search": "smith"},
+    {"search": "CASTLE"},
+    {"search": "no-such-game"},
+    {"designer": "Bob Jones"},
+    {"designer": "  alice   SMITH "},
+    {"designer": "jones"},
+    {"designer": "dénes kiwi"},
+    {"mechanic": "dice rolling"},
+    {"publisher": "Mana Games", "mechanic": "Worker Placement"},
+    {"nz_designer": True},
+    {"nz_designer": False},
+    {"players": 1},
+    {"players": 5},
+    {"players": 8},
+    {"complexity_min": 2.0},
+    {"complexity_max": 2.5},
+    {"complexity_min": 1.5, "complexity_max": 3.5},
+    {"playtime_max_min": 30, "playtime_max_max": 90},
+    {"playtime_max_max": 45},
+    {"quick_pick": "first"},
+    {"quick_pick": "kids"},
+    {"quick_pick": "group"},
+    {"quick_pick": "coop"},
+    {"recently_added_days": 30},
+    {"category": "CORE_STRATEGY"},
+    {"category": "KIDS_FAMILIES,PARTY_ICEBREAKERS"},
+    {"category": "uncategorized"},
+    {"category": "all"},
+    {"search": "castle", "players": 4, "category": "GATEWAY_STRATEGY,CORE_STRATEGY"},
+    {"quick_pick": "kids", "nz_designer": True, "complexity_max": 3.0},
+]
+
+
+def _sql_ids(db_session, **kwargs):
+    games, total = GameService(db_session).get_filtered_games(**kwargs)
+    return [g.id for g in games], total
+
+
+def _engine_for(db_session):
+    engine = CatalogueEngine(enabled=True, max_age_seconds=0)
+    engine.load(db_session)
+    return engine
+
+
+class TestCatalogueEngineParity:
+    """Engine results must match the SQL path exactly"""
+
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    def test_filters_match_sql(self, db_session, varied_catalogue, filters):
+        engine = _engine_for(db_session)
+        expected = _sql_ids(db_session, page_size=1000, **filters)
+        assert engine.query(page_size=1000, **filters) == expected
+
+    @pytest.mark.parametrize("sort", SORTS)
+    def test_sorts_match_sql(self, db_session, varied_catalogue, sort):
+        engine = _engine_for(db_session)
+        for page in (1, 2, 5):
+            expected = _sql_ids(db_session, sort=sort, page=page, page_size=24)
+            assert engine.query(sort=sort, page=page, page_size=24) == expected
+
+    def test_page_beyond_end_returns_total(self, db_session, varied_catalogue):
+        engine = _engine_for(db_session)
+        ids, total = engine.query(page=50, page_size=24)
+        assert ids == []
+        assert total == _sql_ids(db_session, page=50, page_size=24)[1]
+
+    def test_like_wildcards_match_sql(self, db_session, varied_catalogue):
+        engine = _engine_for(db_session)
+        for term in ("c_stle", "dra%on"):
+            assert engine.query(search=term, page_size=1000) == _sql_ids(
+                db_session, search=term, page_size=1000
+            )
+
+    @pytest.mark.parametrize("search", ["castle", "smith river", "dragn"])
+    def test_relevance_sort_matches_sql(self, db_session, varied_catalogue, search):
+        engine = _engine_for(db_session)
+        for page in (1, 2):
+            expected = _sql_ids(db_session, search=search, sort="relevance", page=page, page_size=10)
+            assert engine.query(search=search, sort="relevance", page=page, page_size=10) == expected
+
+    def test_empty_catalogue(self, db_session):
+        engine = _engine_for(db_session)
+        assert engine.query() == ([], 0)
+
+
+class TestCatalogueEngineIncremental:
+    """Incremental updates via GameService writes"""
+
+    @pytest.fixture
+    def enabled_engine(self, db_session, monkeypatch):
+        from services.catalogue_engine import catalogue_engine
+
+        catalogue_engine.reset()
+        monkeypatch.setattr(catalogue_engine, "enabled", True)
+        monkeypatch.setattr(catalogue_engine, "max_age_seconds", 0)
+        yield catalogue_engine
+        catalogue_engine.reset()
+
+    def test_service_uses_engine(self, db_session, varied_catalogue, enabled_engine):
+        expected = _sql_ids(db_session, page_size=1000)  # loads the engine
+        assert enabled_engine.stats["full_loads"] == 1
+        assert enabled_engine.stats["queries"] == 1
+        assert expected[1] > 0
+
+    def test_create_update_delete_are_applied(self, db_session, varied_catalogue, enabled_engine):
+        service = GameService(db_session)
+        service.get_filtered_games()
+        assert enabled_engine.stats["full_loads"] == 1
+
+        created = service.create_game({"title": "Zebra Zoo Unique", "players_min": 2, "players_max": 4})
+        ids, total = enabled_engine.query(search="zebra zoo")
+        assert ids == [created.id] and total == 1
+
+        service.update_game(created.id, {"title": "Quokka Quest Unique"})
+        assert enabled_engine.query(search="zebra zoo") == ([], 0)
+        assert enabled_engine.query(search="quokka")[0] == [created.id]
+
+        service.update_game(created.id, {"status": "WISHLIST"})
+        assert enabled_engine.query(search="quokka") == ([], 0)
+
+        service.update_game(created.id, {"status": "OWNED"})
+        service.delete_game(created.id)
+        assert enabled_engine.query(search="quokka") == ([], 0)
+
+        # No full reload was needed for any of the writes
+        assert enabled_engine.stats["full_loads"] == 1
+        assert enabled_engine.stats["incremental_updates"] >= 4
+
+    def test_incremental_state_matches_sql(self, db_session, varied_catalogue, enabled_engine):
+        service = GameService(db_session)
+        service.get_filtered_games()
+
+        for i, game in enumerate(varied_catalogue[:20]):
+            service.update_game(game.id, {"players_max": 9, "title": f"Aardvark {i}"})
+        for game in varied_catalogue[20:25]:
+            service.delete_game(game.id)
+        for i in range(300):  # forces the column arrays to grow
+            service.create_game({"title": f"Grown {i}", "players_min": 1, "players_max": 2})
+
+        for filters in ({}, {"players": 9}, {"search": "aardvark"}, {"players": 1}):
+            for sort in ("title_asc", "rating_desc", "time_asc"):
+                ids, total = enabled_engine.query(sort=sort, page_size=1000, **filters)
+                enabled_engine.enabled = False
+                try:
+                    assert (ids, total) == _sql_ids(db_session, sort=sort, page_size=1000, **filters)
+                finally:
+                    enabled_engine.enabled = True
+
+    def test_write_from_elsewhere_reloads_on_next_query(self, db_session, varied_catalogue, enabled_engine):
+        from services.catalogue_version import catalogue_version
+
+        service = GameService(db_session)
+        service.get_filtered_games()
+        service.create_game({"title": "Patched In Place"})
+        service.get_filtered_games()
+        assert enabled_engine.stats["full_loads"] == 1
+
+        catalogue_version.bump()  # e.g. another worker's write
+        service.get_filtered_games()
+        service.get_filtered_games()
+        assert enabled_engine.stats["full_loads"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_callers_share_one_reload(self, async_db_session, varied_catalogue):
+        engine = CatalogueEngine(enabled=True, max_age_seconds=0)
+
+        await asyncio.gather(*(engine.ensure_loaded_async(async_db_session) for _ in range(5)))
+
+        assert engine.stats["full_loads"] == 1
+        assert engine.query(page_size=1000)[1] > 0
+
+    def test_disabled_engine_ignores_changes(self, db_session, sample_game):
+        engine = CatalogueEngine(enabled=False)
+        engine.on_catalogue_change(db_session, [sample_game.id], "update")
+        assert engine.stats["incremental_updates"] == 0
@@ -0,0 +1,121 @@
+"""
+Tests for the live catalogue change stream (server-sent events fan-out).
+"""
+import asyncio
+import json
+
+import pytest
+
+from services.catalogue_events import OP_DELETE, OP_UPDATE
+from services.catalogue_stream import CHANNEL, CatalogueStream
+
+
+class FakeRedis:
+    """Minimal stand-in for redis_client.RedisClient"""
+
+    def __init__(self):
+        self.published = []
+        self.is_available = True
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return True
+
+
+def _stream(redis=None, **kwargs):
+    stream = CatalogueStream(use_redis=redis is not None, **kwargs)
+    stream._redis = lambda: redis
+    return stream
+
+
+async def _drain(subscription):
+    """Let call_soon_threadsafe deliveries run, then collect what is queued"""
+    await asyncio.sleep(0)
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    return events
+
+
+class TestCatalogueStream:
+    @pytest.mark.asyncio
+    async def test_local_subscribers_get_one_event_per_game(self):
+        stream = _stream()
+        first, second = stream.subscribe(), stream.subscribe()
+        stream.publish([1, 2], OP_UPDATE, 7)
+
+        expected = [
+            {"game_id": 1, "version": 7, "op": "update"},
+            {"game_id": 2, "version": 7, "op": "update"},
+        ]
+        assert await _drain(first) == expected
+        assert await _drain(second) == expected
+
+        stream.unsubscribe(first)
+        stream.publish([3], OP_DELETE, 8)
+        assert await _drain(first) == []
+        assert await _drain(second) == [{"game_id": 3, "version": 8, "op": "delete"}]
+
+    @pytest.mark.asyncio
+    async def test_changes_fan_out_through_redis(self):
+        redis = FakeRedis()
+        writer, reader = _stream(redis), _stream(redis)
+        local, remote = writer.subscribe(), reader.subscribe()
+
+        writer.publish([5], OP_UPDATE, 9)
+        assert [channel for channel, _ in redis.published] == [CHANNEL]
+        message = {"data": redis.published[0][1]}
+        # Every worker receives the message, including the one that sent it
+        writer._on_message(message)
+        reader._on_message(message)
+
+        assert await _drain(local) == [{"game_id": 5, "version": 9, "op": "update"}]
+        assert await _drain(remote) == [{"game_id": 5, "version": 9, "op": "update"}]
+        assert reader.stats["received"] == 1
+
+    @pytest.mark.asyncio
+    async def test_malformed_message_ignored(self):
+        stream = _stream(FakeRedis())
+        subscription = stream.subscribe()
+        stream._on_message({"data": "not json"})
+        stream._on_message({"data": json.dumps({"game_ids": ["x"], "op": "update", "version": 1})})
+        assert await _drain(subscription) == []
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_is_told_to_resync(self):
+        stream = _stream(max_queued=2)
+        subscription = stream.subscribe()
+        stream.publish([1, 2, 3], OP_UPDATE, 4)
+        await asyncio.sleep(0)
+
+        assert subscription.take_overflow() is True
+        assert subscription.queue.empty()
+        assert subscription.take_overflow() is False
+        stream.publish([4], OP_UPDATE, 5)
+        assert await _drain(subscription) == [{"game_id": 4, "version": 5, "op": "update"}]
+
+    @pytest.mark.asyncio
+    async def test_subscriber_limit(self):
+        stream = _stream(max_subscribers=1)
+        assert stream.subscribe() is not None
+        assert stream.subscribe() is None
+        assert stream.stats["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_next_event_times_out(self):
+        subscription = _stream().subscribe()
+        assert await subscription.next_event(0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_game_service_writes_are_streamed(self, db_session):
+        from services.catalogue_stream import catalogue_stream
+        from services.catalogue_version import catalogue_version
+        from services.game_service import GameService
+
+        subscription = catalogue_stream.subscribe()
+        try:
+            game = GameService(db_session).create_game({"title": "Streamed"})
+            events = await _drain(subscription)
+        finally:
+            catalogue_stream.unsubscribe(subscription)
+        assert events == [{"game_id": game.id, "version": catalogue_version.current(), "op": "create"}]
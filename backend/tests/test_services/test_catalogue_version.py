@@ -0,0 +1,85 @@
+"""
+Tests for the catalogue version counter.
+"""
+from services.catalogue_events import OP_UPDATE
+from services.catalogue_version import CHANNEL, REDIS_KEY, CatalogueVersion
+
+
+class FakeRedis:
+    """Minimal stand-in for redis_client.RedisClient"""
+
+    def __init__(self):
+        self.store = {}
+        self.published = []
+        self.is_available = True
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+        return int(self.store[key])
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return True
+
+
+def _shared(redis):
+    version = CatalogueVersion(use_redis=True, sync_seconds=60)
+    version._redis = lambda: redis
+    return version
+
+
+class TestCatalogueVersionLocal:
+    def test_bump_is_monotonic(self):
+        version = CatalogueVersion(use_redis=False)
+        start = version.current()
+        assert version.bump() == start + 1
+        assert version.bump() == start + 2
+        assert version.current() == start + 2
+        assert version.shared is False
+
+    def test_catalogue_change_bumps(self):
+        version = CatalogueVersion(use_redis=False)
+        start = version.current()
+        version.on_catalogue_change(None, [1, 2], OP_UPDATE)
+        assert version.current() == start + 1
+
+
+class TestCatalogueVersionShared:
+    def test_workers_share_version(self):
+        """A bump on one worker is seen by another after a message or resync"""
+        redis = FakeRedis()
+        worker_a, worker_b = _shared(redis), _shared(redis)
+        start = worker_a.current()
+        assert worker_b.current() == start
+
+        bumped = worker_a.bump()
+        assert bumped == start + 1
+        assert int(redis.store[REDIS_KEY]) == bumped
+        assert redis.published == [(CHANNEL, str(bumped))]
+
+        worker_b._on_message({"data": redis.published[0][1]})
+        assert worker_b.current() == bumped
+
+    def test_periodic_resync_catches_missed_messages(self):
+        redis = FakeRedis()
+        worker_a, worker_b = _shared(redis), _shared(redis)
+        worker_b.current()
+        bumped = worker_a.bump()
+
+        worker_b._synced_at = 0  # sync interval elapsed
+        assert worker_b.current() == bumped
+
+    def test_never_moves_backwards(self):
+        redis = FakeRedis()
+        version = _shared(redis)
+        current = version.current()
+        version._on_message({"data": str(current - 5)})
+        version._on_message({"data": "garbage"})
+        assert version.current() == current
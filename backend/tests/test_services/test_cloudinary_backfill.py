@@ -0,0 +1,331 @@
+"""
+Tests for the resumable Cloudinary backfill: adaptive concurrency, the
+persisted checkpoint, and stopping and resuming a run.
+
+Uploads go through the real Cloudinary SDK to a local stand-in upload
+endpoint (via the SDK's upload_prefix setting); BGG downloads are served by
+an httpx MockTransport.
+"""
+import asyncio
+import io
+import json
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cloudinary
+import cloudinary.exceptions
+import httpx
+import pytest
+from PIL import Image
+from sqlalchemy.orm import sessionmaker
+
+from models import BackfillCheckpoint, Game, utc_now
+from services import cloudinary_backfill as backfill_module
+from services.cloudinary_backfill import (
+    AdaptiveLimiter,
+    BackfillRunningError,
+    CloudinaryBackfill,
+    is_throttling,
+)
+from services.cloudinary_service import UploadQueueFullError
+
+CONFIG_KEYS = ("cloud_name", "api_key", "api_secret", "upload_prefix")
+
+
+class StandInUploadEndpoint:
+    """Local HTTP server answering Cloudinary uploads, throttling the first ones on request"""
+
+    def __init__(self, delay: float = 0.02, throttle_first: int = 0):
+        self.delay = delay
+        self.throttle_first = throttle_first
+        self.requests = 0
+        self.uploaded = []
+        self.concurrent = 0
+        self.max_concurrent = 0
+        self._lock = threading.Lock()
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                with endpoint._lock:
+                    endpoint.requests += 1
+                    throttled = endpoint.requests <= endpoint.throttle_first
+                    endpoint.concurrent += 1
+                    endpoint.max_concurrent = max(endpoint.max_concurrent, endpoint.concurrent)
+                time.sleep(endpoint.delay)
+                with endpoint._lock:
+                    endpoint.concurrent -= 1
+                if throttled:
+                    status, body = 429, {"error": {"message": "Rate limit exceeded"}}
+                else:
+                    status, body = 200, {"public_id": "boardgame-library/abc", "format": "png"}
+                    with endpoint._lock:
+                        endpoint.uploaded.append(self.path)
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def endpoint():
+    config = cloudinary.config()
+    previous = {key: getattr(config, key, None) for key in CONFIG_KEYS}
+    endpoint = StandInUploadEndpoint()
+    cloudinary.config(cloud_name="test", api_key="key", api_secret="secret", upload_prefix=endpoint.url)
+    yield endpoint
+    cloudinary.config(**previous)
+    endpoint.close()
+
+
+@pytest.fixture(autouse=True)
+def short_backoff(monkeypatch):
+    monkeypatch.setattr(backfill_module, "BASE_BACKOFF_SECONDS", 0.01)
+    monkeypatch.setattr(backfill_module, "MAX_BACKOFF_SECONDS", 0.05)
+
+
+@pytest.fixture
+def session_factory(db_engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+
+def _bgg_client(missing=()):
+    """httpx client serving a small PNG for every image URL except the missing ones"""
+    output = io.BytesIO()
+    Image.new("RGB", (8, 8), "red").save(output, format="PNG")
+    png = output.getvalue()
+
+    def handler(request):
+        if str(request.url) in missing:
+            return httpx.Response(404)
+        return httpx.Response(200, content=png, headers={"content-type": "image/png"})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _image(i):
+    return f"https://cf.geekdo-images.com/{i}__original/img/pic{i}.png"
+
+
+def _add_games(db_session, count, **fields):
+    games = [Game(title=f"Game {i}", bgg_id=5000 + i, image=_image(i), **fields) for i in range(count)]
+    db_session.add_all(games)
+    db_session.commit()
+    return [game.id for game in games]
+
+
+def _engine(session_factory, **options):
+    options.setdefault("http_client", _bgg_client())
+    options.setdefault("checkpoint_seconds", 0.05)
+    return CloudinaryBackfill(session_factory=session_factory, name="test", **options)
+
+
+class TestAdaptiveLimiter:
+    def test_throttling_halves_the_limit_once_per_pause(self):
+        limiter = AdaptiveLimiter(initial=8, minimum=1, maximum=16, base_backoff=10)
+
+        limiter.throttled()
+        limiter.throttled()  # In flight before the pause: no second halving
+
+        assert limiter.limit == 4
+        assert limiter.paused_for > 9
+        assert limiter.stats == {"throttled": 2, "decreases": 1, "increases": 0}
+
+    def test_successes_raise_the_limit_up_to_the_maximum(self):
+        limiter = AdaptiveLimiter(initial=2, minimum=1, maximum=3)
+
+        for _ in range(10):
+            limiter.succeeded()
+
+        assert limiter.limit == 3
+
+    def test_limit_never_drops_below_the_minimum(self):
+        limiter = AdaptiveLimiter(initial=2, minimum=2, maximum=8, base_backoff=0)
+
+        limiter.throttled()
+        limiter.throttled()
+
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_a_free_slot(self):
+        limiter = AdaptiveLimiter(initial=1, minimum=1, maximum=1)
+        await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+
+        limiter.release()
+        await asyncio.wait_for(waiting, 1)
+        assert limiter.active == 1
+
+
+class TestIsThrottling:
+    @pytest.mark.parametrize("exc, expected", [
+        (cloudinary.exceptions.RateLimited("slow down"), True),
+        (cloudinary.exceptions.GeneralError("server error"), True),
+        (cloudinary.exceptions.Error("Error parsing server response (502)"), True),
+        (cloudinary.exceptions.BadRequest("Invalid image file"), False),
+        (UploadQueueFullError("full"), True),
+        (httpx.ConnectTimeout("timed out"), True),
+        (ValueError("bug"), False),
+    ])
+    def test_classification(self, exc, expected):
+        assert is_throttling(exc) is expected
+
+    @pytest.mark.parametrize("status, expected", [(429, True), (503, True), (404, False)])
+    def test_download_status(self, status, expected):
+        request = httpx.Request("GET", _image(1))
+        exc = httpx.HTTPStatusError("", request=request, response=httpx.Response(status, request=request))
+        assert is_throttling(exc) is expected
+
+
+class TestCloudinaryBackfill:
+    @pytest.mark.asyncio
+    async def test_uploads_every_game_and_checkpoints_completion(self, endpoint, db_session, session_factory):
+        ids = _add_games(db_session, 12)
+        versions = {game.id: game.updated_at for game in db_session.query(Game).all()}
+        engine = _engine(session_factory, initial_concurrency=4, max_concurrency=4)
+
+        progress = await engine.run()
+
+        assert progress["status"] == "completed"
+        assert (progress["uploaded"], progress["failed"], progress["remaining"]) == (12, 0, 0)
+        assert progress["last_game_id"] == max(ids)
+        assert len(endpoint.uploaded) == 12
+        assert endpoint.max_concurrent > 1
+        db_session.expire_all()
+        for game in db_session.query(Game).all():
+            assert game.cloudinary_url == engine.service.generate_optimized_url(
+                game.image, width=800, height=800, quality="auto:best", format="auto"
+            )
+            assert game.updated_at > versions[game.id]  # Row version bumped for delta sync
+
+    @pytest.mark.asyncio
+    async def test_games_with_current_urls_are_skipped_unless_forced(self, endpoint, db_session, session_factory):
+        _add_games(db_session, 3)
+        await _engine(session_factory).run()
+
+        again = await _engine(session_factory).run()
+        assert (again["uploaded"], again["skipped"]) == (0, 3)
+        assert len(endpoint.uploaded) == 3
+
+        forced = await _engine(session_factory).run(force=True)
+        assert forced["uploaded"] == 3
+        assert len(endpoint.uploaded) == 6
+
+    @pytest.mark.asyncio
+    async def test_throttling_backs_off_and_retries(self, endpoint, db_session, session_factory):
+        endpoint.throttle_first = 6
+        _add_games(db_session, 10)
+        engine = _engine(session_factory, initial_concurrency=8, max_concurrency=8)
+
+        progress = await engine.run()
+
+        assert progress["status"] == "completed"
+        assert (progress["uploaded"], progress["failed"]) == (10, 0)
+        assert engine.limiter.stats["throttled"] >= 1
+        assert engine.limiter.stats["decreases"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_stopped_run_resumes_after_its_checkpoint(self, endpoint, db_session, session_factory):
+        ids = _add_games(db_session, 8)
+
+        first = await _engine(session_factory, max_concurrency=2).run(limit=3)
+        assert first["status"] == "stopped"
+        assert first["last_game_id"] == ids[2]
+        assert first["remaining"] == 5
+
+        second = await _engine(session_factory, max_concurrency=2).run()
+        assert second["status"] == "completed"
+        assert second["uploaded"] == 8
+        assert len(endpoint.uploaded) == 8  # Nothing uploaded twice
+
+    @pytest.mark.asyncio
+    async def test_cut_off_run_loses_no_games(self, endpoint, db_session, session_factory):
+        endpoint.delay = 0.05
+        _add_games(db_session, 20)
+        engine = _engine(session_factory, initial_concurrency=2, max_concurrency=2)
+
+        await engine.start()
+        await asyncio.sleep(0.2)
+        await engine.stop(interrupted=True)
+        interrupted = engine.progress()
+        assert interrupted["status"] == "interrupted"
+        assert 0 < interrupted["remaining"] < 20
+
+        resumed = await _engine(session_factory).run()
+        assert resumed["status"] == "completed"
+        db_session.expire_all()
+        assert db_session.query(Game).filter(Game.cloudinary_url.is_(None)).count() == 0
+
+    @pytest.mark.asyncio
+    async def test_database_work_runs_off_the_event_loop(self, endpoint, db_session, session_factory):
+        _add_games(db_session, 5)
+        engine = _engine(session_factory, page_size=2)
+        loop_thread = threading.get_ident()
+        threads = set()
+        fetch, write = engine._fetch, engine._write_checkpoint
+
+        def recording(fn):
+            def wrapper(*args):
+                threads.add(threading.get_ident())
+                return fn(*args)
+            return wrapper
+
+        engine._fetch = recording(fetch)
+        engine._write_checkpoint = recording(write)
+        progress = await engine.run()
+
+        assert progress["status"] == "completed"
+        assert threads and loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_failed_games_are_listed_and_retried_on_request(self, endpoint, db_session, session_factory):
+        ids = _add_games(db_session, 3)
+        broken = _image(1)
+
+        first = await _engine(session_factory, http_client=_bgg_client(missing={broken})).run()
+        assert first["status"] == "completed"
+        assert first["failed"] == 1
+        assert first["failures"][0]["game_id"] == ids[1]
+        assert "404" in first["failures"][0]["error"]
+
+        retried = await _engine(session_factory).run(retry_failed=True)
+        assert retried["failed"] == 0
+        assert retried["uploaded"] == 3
+
+    @pytest.mark.asyncio
+    async def test_live_lease_of_another_process_blocks_start(self, endpoint, db_session, session_factory):
+        db_session.add(BackfillCheckpoint(
+            name="test", status="running", force=False, last_game_id=0, processed=0,
+            uploaded=0, skipped=0, failed_games=[], owner="other-host:1", updated_at=utc_now(),
+        ))
+        db_session.commit()
+
+        with pytest.raises(BackfillRunningError):
+            await _engine(session_factory).start()
+
+        checkpoint = db_session.get(BackfillCheckpoint, "test")
+        checkpoint.updated_at = utc_now() - timedelta(seconds=backfill_module.LEASE_SECONDS + 1)
+        db_session.commit()
+        progress = await _engine(session_factory).run()
+        assert progress["status"] == "completed"
+        assert progress["owner"] != "other-host:1"
@@ -0,0 +1,160 @@
+"""
+Tests for the Cloudinary upload pool: blocking work runs off the event loop
+on a bounded pool, concurrent uploads of one URL share a single upload, and
+a full queue skips uploads instead of growing without bound.
+
+Uploads go through the real Cloudinary SDK to a local stand-in upload
+endpoint (via the SDK's upload_prefix setting).
+"""
+import asyncio
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cloudinary
+import httpx
+import pytest
+from PIL import Image
+
+from services.cloudinary_service import CloudinaryService
+
+CONFIG_KEYS = ("cloud_name", "api_key", "api_secret", "upload_prefix")
+
+
+class StandInUploadEndpoint:
+    """Local HTTP server answering Cloudinary upload requests after a delay"""
+
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self.uploads = 0
+        self.concurrent = 0
+        self.max_concurrent = 0
+        self._lock = threading.Lock()
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                with endpoint._lock:
+                    endpoint.uploads += 1
+                    endpoint.concurrent += 1
+                    endpoint.max_concurrent = max(endpoint.max_concurrent, endpoint.concurrent)
+                time.sleep(endpoint.delay)
+                with endpoint._lock:
+                    endpoint.concurrent -= 1
+                body = json.dumps({
+                    "public_id": "boardgame-library/abc",
+                    "secure_url": "https://res.cloudinary.com/test/image/upload/abc.png",
+                    "format": "png",
+                    "bytes": 100,
+                }).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def endpoint():
+    config = cloudinary.config()
+    previous = {key: getattr(config, key, None) for key in CONFIG_KEYS}
+    endpoint = StandInUploadEndpoint()
+    cloudinary.config(cloud_name="test", api_key="key", api_secret="secret", upload_prefix=endpoint.url)
+    yield endpoint
+    cloudinary.config(**previous)
+    endpoint.close()
+
+
+def _bgg_client():
+    """httpx client serving a small PNG for every image URL"""
+    output = io.BytesIO()
+    Image.new("RGB", (8, 8), "red").save(output, format="PNG")
+    png = output.getvalue()
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=png, headers={"content-type": "image/png"})
+        )
+    )
+
+
+class TestUploadPool:
+    @pytest.mark.asyncio
+    async def test_concurrent_uploads_of_one_url_share_one_upload(self, endpoint):
+        service = CloudinaryService(workers=2)
+        url = "https://cf.geekdo-images.com/same__md/img/pic1.png"
+
+        results = await asyncio.gather(*(
+            service.upload_from_url(url, _bgg_client()) for _ in range(10)
+        ))
+
+        assert endpoint.uploads == 1
+        assert all(result["format"] == "png" for result in results)
+        assert service.upload_stats["deduplicated"] == 9
+        assert service.upload_stats["uploads"] == 1
+        assert service.get_upload_stats()["in_flight_urls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_uploads_run_off_the_event_loop_on_a_bounded_pool(self, endpoint):
+        service = CloudinaryService(workers=2)
+        lags = []
+        done = asyncio.Event()
+
+        async def ticker():
+            loop = asyncio.get_running_loop()
+            while not done.is_set():
+                started = loop.time()
+                await asyncio.sleep(0.01)
+                lags.append(loop.time() - started - 0.01)
+
+        tick = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(
+            service.upload_from_url(f"https://cf.geekdo-images.com/{i}__md/img/pic.png", _bgg_client())
+            for i in range(4)
+        ))
+        done.set()
+        await tick
+
+        assert all(results)
+        assert endpoint.uploads == 4
+        assert endpoint.max_concurrent == 2
+        # Each upload blocks for 0.2s; none of that lands on the event loop
+        assert max(lags) < 0.1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_skips_upload_and_reports_depth(self, endpoint):
+        service = CloudinaryService(workers=1, max_queued=1)
+        client = _bgg_client()
+        first = asyncio.create_task(
+            service.upload_from_url("https://cf.geekdo-images.com/a__md/img/pic.png", client)
+        )
+        second = asyncio.create_task(
+            service.upload_from_url("https://cf.geekdo-images.com/b__md/img/pic.png", client)
+        )
+        while service.get_upload_stats()["queue_depth"] < 1:
+            await asyncio.sleep(0.01)
+
+        assert service.get_upload_stats()["running"] == 1
+        rejected_url = "https://cf.geekdo-images.com/c__md/img/pic.png"
+        assert await service.upload_from_url(rejected_url, client) is None
+        assert service.upload_stats["rejected"] == 1
+        # A skipped upload is retried later, not remembered as broken
+        assert rejected_url not in service._failed_uploads
+
+        assert all(await asyncio.gather(first, second))
+        stats = service.get_upload_stats()
+        assert (stats["queue_depth"], stats["running"], stats["uploads"]) == (0, 0, 2)
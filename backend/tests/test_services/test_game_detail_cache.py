@@ -0,0 +1,125 @@
+"""
+Tests for the per-game detail cache behind /api/public/games/{game_id}.
+A cached detail must be served until the game, its base game or one of its
+expansions changes.
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import update
+
+from models import Game
+from services.catalogue_events import OP_UPDATE
+from services.game_detail_cache import GameDetailCache, game_detail_cache
+from services.game_service import GameService
+
+
+@pytest.fixture
+def family(db_session):
+    base = Game(title="Base", status="OWNED")
+    db_session.add(base)
+    db_session.commit()
+    expansion = Game(title="Expansion", status="OWNED", is_expansion=True, base_game_id=base.id)
+    db_session.add(expansion)
+    db_session.commit()
+    return base, expansion
+
+
+def _detail(client, game_id):
+    response = client.get(f"/api/public/games/{game_id}")
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestGameDetailCache:
+    def test_hit_only_on_same_version(self):
+        cache = GameDetailCache()
+        cache.put(1, "v1", '{"id":1}')
+        assert cache.get(1, "v1") == '{"id":1}'
+        assert cache.get(1, "v2") is None
+        assert cache.get(2, "v1") is None
+        assert cache.stats == {"hits": 1, "misses": 2, "evictions": 0, "invalidations": 0}
+
+    def test_unversioned_rows_not_cached(self):
+        cache = GameDetailCache()
+        cache.put(1, None, "{}")
+        assert len(cache) == 0
+        assert cache.get(1, None) is None
+
+    def test_lru_eviction(self):
+        cache = GameDetailCache(max_entries=2)
+        for game_id in (1, 2, 3):
+            cache.put(game_id, "v", "{}")
+        assert len(cache) == 2
+        assert cache.get(1, "v") is None
+        assert cache.stats["evictions"] == 1
+
+    def test_change_drops_linked_games(self, db_session, family):
+        base, expansion = family
+        other = Game(title="Other", status="OWNED")
+        db_session.add(other)
+        db_session.commit()
+        cache = GameDetailCache()
+        for game_id in (base.id, expansion.id, other.id):
+            cache.put(game_id, "v", "{}")
+
+        cache.on_catalogue_change(db_session, [base.id], OP_UPDATE)
+        assert cache.get(other.id, "v") == "{}"
+        assert len(cache) == 1
+        assert cache.stats["invalidations"] == 2
+
+
+class TestDetailRoute:
+    def test_repeat_requests_skip_loading(self, client, family):
+        base, _ = family
+        first = _detail(client, base.id)
+
+        with patch(
+            "api.routers.public.AsyncGameService.get_games_by_ids", new_callable=AsyncMock
+        ) as load:
+            assert _detail(client, base.id) == first
+        load.assert_not_called()
+        assert game_detail_cache.stats["hits"] == 1
+
+    def test_expansion_write_refreshes_base_detail(self, client, db_session, family):
+        base, expansion = family
+        _detail(client, base.id)
+        GameService(db_session).update_game(expansion.id, {"title": "Renamed Expansion"})
+
+        assert [e["title"] for e in _detail(client, base.id)["expansions"]] == ["Renamed Expansion"]
+
+    def test_base_write_refreshes_expansion_detail(self, client, db_session, family):
+        base, expansion = family
+        _detail(client, expansion.id)
+        GameService(db_session).update_game(base.id, {"title": "Renamed Base"})
+
+        assert _detail(client, expansion.id)["base_game"]["title"] == "Renamed Base"
+
+    def test_new_and_deleted_expansions_refresh_base_detail(self, client, db_session, family):
+        base, expansion = family
+        service = GameService(db_session)
+        _detail(client, base.id)
+
+        added = service.create_game({"title": "Second Expansion", "status": "OWNED"})
+        service.update_game(added.id, {"is_expansion": True, "base_game_id": base.id})
+        assert len(_detail(client, base.id)["expansions"]) == 2
+
+        service.delete_game(expansion.id)
+        assert [e["title"] for e in _detail(client, base.id)["expansions"]] == ["Second Expansion"]
+
+    def test_write_outside_game_service_is_picked_up(self, client, db_session, family):
+        """No catalogue event: the row version alone must miss the cache"""
+        base, _ = family
+        _detail(client, base.id)
+        db_session.execute(update(Game).where(Game.id == base.id).values(title="Edited In Place"))
+        db_session.commit()
+
+        assert _detail(client, base.id)["title"] == "Edited In Place"
+
+    def test_hidden_game_not_served_from_cache(self, client, db_session, family):
+        base, _ = family
+        _detail(client, base.id)
+        db_session.execute(update(Game).where(Game.id == base.id).values(status="WISHLIST"))
+        db_session.commit()
+
+        assert client.get(f"/api/public/games/{base.id}").status_code == 404
@@ -340,9 +340,29 @@ class TestGameService:
         db_session.commit()
 
         service = GameService(db_session)
-        results, total = service.get_filtered_games(designer="Martin")
+        results, total = service.get_filtered_games(designer="martin wallace")
+        assert [g.title for g in results] == ["Game 1"]
+
+        # Whole names only: a fragment no longer matches by substring
+        _, total = service.get_filtered_games(designer="Martin")
+        assert total == 0
+
+    def test_get_filtered_games_by_mechanic_and_publisher(self, db_session):
+        """mechanic= and publisher= match normalized entity names"""
+        db_session.add_all([
+            Game(title="Game 1", mechanics=["Worker Placement"], publishers=["Lookout Games"], status="OWNED"),
+            Game(title="Game 2", mechanics=["Worker Placement", "Dice Rolling"], status="OWNED"),
+            Game(title="Game 3", mechanics=["Placement"], publishers=["Lookout"], status="OWNED"),
+        ])
+        db_session.commit()
 
-        assert total >= 0  # Implementation depends on JSON search
+        service = GameService(db_session)
+        results, _ = service.get_filtered_games(mechanic="worker placement")
+        assert [g.title for g in results] == ["Game 1", "Game 2"]
+        results, _ = service.get_filtered_games(mechanic="Worker Placement", publisher="LOOKOUT GAMES")
+        assert [g.title for g in results] == ["Game 1"]
+        results, _ = service.get_filtered_games(publisher="Lookout")
+        assert [g.title for g in results] == ["Game 3"]
 
     def test_get_filtered_games_combined_filters(self, db_session):
         """Test applying multiple filters together"""
@@ -950,6 +970,20 @@ class TestGameService:
         assert total == 1
         assert results[0].title == "Easy Game"
 
+    def test_quick_pick_exclusion_applies_on_update(self, db_session):
+        """Excluding (and re-including) a game via update_game is reflected immediately"""
+        game = Game(title="Easy Game", complexity=1.0, status="OWNED")
+        db_session.add(game)
+        db_session.commit()
+
+        service = GameService(db_session)
+        service.update_game(game.id, {"excluded_quick_picks": ["first"]})
+        assert service.get_filtered_games(quick_pick="first")[1] == 0
+        assert [g.title for g in service.get_quick_pick_candidates("first")] == ["Easy Game"]
+
+        service.update_game(game.id, {"excluded_quick_picks": None})
+        assert service.get_filtered_games(quick_pick="first")[1] == 1
+
     def test_get_quick_pick_candidates_ignores_exclusions(self, db_session):
         """The admin candidates list should show excluded games too, for review"""
         excluded = Game(title="Excluded Game", complexity=1.0, excluded_quick_picks=["first"], status="OWNED")
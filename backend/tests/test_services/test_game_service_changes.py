@@ -0,0 +1,99 @@
+"""
+Tests for GameService.get_catalogue_changes (delta sync behind /api/public/changes).
+Paging from any cursor must eventually deliver every change exactly as the
+catalogue stands, with tombstones for games that left it.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from models import Game, GameDeletion
+from services.game_service import GameService
+
+T0 = datetime(2026, 1, 1)
+
+
+def _at(db_session, game, seconds):
+    """Pin a game's row version"""
+    db_session.execute(
+        update(Game).where(Game.id == game.id).values(updated_at=T0 + timedelta(seconds=seconds))
+    )
+    db_session.commit()
+
+
+@pytest.fixture
+def catalogue(db_session):
+    games = [Game(title=f"Game {i}", status="OWNED") for i in range(5)]
+    db_session.add_all(games)
+    db_session.commit()
+    for offset, game in enumerate(games):
+        _at(db_session, game, offset)
+    return games
+
+
+def _sync(service, since, limit):
+    """Page until caught up; returns (upserted ids, deleted ids, final cursor)"""
+    upserts, deletes = [], []
+    while True:
+        games, deleted, since, has_more = service.get_catalogue_changes(since, limit)
+        upserts += [game.id for game in games]
+        deletes += deleted
+        if not has_more:
+            return upserts, deletes, since
+
+
+class TestCatalogueChanges:
+    def test_snapshot_pages_in_row_version_order(self, db_session, catalogue):
+        service = GameService(db_session)
+        games, deleted, cursor, has_more = service.get_catalogue_changes(None, 2)
+        assert [g.id for g in games] == [catalogue[0].id, catalogue[1].id]
+        assert deleted == []
+        assert has_more
+        assert cursor == (T0 + timedelta(seconds=1), catalogue[1].id)
+
+        assert _sync(service, None, 2)[0] == [game.id for game in catalogue]
+
+    def test_changes_after_cursor(self, db_session, catalogue):
+        service = GameService(db_session)
+        cursor = (T0 + timedelta(seconds=2), catalogue[2].id)
+        _at(db_session, catalogue[0], 10)
+
+        upserts, deletes, _ = _sync(service, cursor, 10)
+        assert upserts == [catalogue[3].id, catalogue[4].id, catalogue[0].id]
+        assert deletes == []
+
+    def test_rows_sharing_a_row_version_are_not_skipped(self, db_session, catalogue):
+        """Bulk updates stamp many rows with one timestamp; paging must split them safely"""
+        service = GameService(db_session)
+        db_session.execute(update(Game).values(updated_at=T0 + timedelta(seconds=30)))
+        db_session.commit()
+
+        upserts, _, _ = _sync(service, (T0 + timedelta(seconds=20), 0), 2)
+        assert sorted(upserts) == sorted(game.id for game in catalogue)
+        assert len(upserts) == len(catalogue)
+
+    def test_hidden_and_deleted_games_become_tombstones(self, db_session, catalogue):
+        service = GameService(db_session)
+        cursor = (T0 + timedelta(seconds=10), 0)
+        hidden, deleted = catalogue[1], catalogue[2]
+        service.update_game(hidden.id, {"status": "WISHLIST"})
+        service.delete_game(deleted.id)
+
+        assert db_session.execute(select(GameDeletion.game_id)).scalars().all() == [deleted.id]
+        upserts, deletes, _ = _sync(service, cursor, 10)
+        assert hidden.id not in upserts
+        assert sorted(deletes) == sorted([hidden.id, deleted.id])
+
+    def test_snapshot_skips_hidden_games(self, db_session, catalogue):
+        service = GameService(db_session)
+        service.update_game(catalogue[0].id, {"status": "BUY_LIST"})
+        upserts, deletes, _ = _sync(service, None, 10)
+        assert catalogue[0].id not in upserts
+        assert deletes == []
+
+    def test_caught_up_cursor_returns_nothing(self, db_session, catalogue):
+        service = GameService(db_session)
+        _, _, cursor = _sync(service, None, 10)
+        games, deleted, next_cursor, has_more = service.get_catalogue_changes(cursor, 10)
+        assert (games, deleted, next_cursor, has_more) == ([], [], cursor, False)
@@ -568,7 +568,7 @@ class TestGamesByDesigner:
         db_session.commit()
 
         service = GameService(db_session)
-        games = service.get_games_by_designer("Stegmaier")
+        games = service.get_games_by_designer("Jamey Stegmaier")
 
         assert len(games) == 1
         assert games[0].title == "Game 1"
@@ -688,8 +688,8 @@ class TestGameServiceByDesigner:
         assert len(games) == 1
         assert games[0].title == "Game 1"
 
-    def test_find_games_partial_match(self, db_session):
-        """Should find games with partial designer match"""
+    def test_partial_name_does_not_match(self, db_session):
+        """Designer names match whole, not as a fragment"""
         game = Game(title="Game", bgg_id=6600, designers=["Matt Leacock"], status="OWNED")
         db_session.add(game)
         db_session.commit()
@@ -697,7 +697,7 @@ class TestGameServiceByDesigner:
         service = GameService(db_session)
         games = service.get_games_by_designer("Leacock")
 
-        assert len(games) == 1
+        assert games == []
 
     def test_find_games_case_insensitive(self, db_session):
         """Should find games case-insensitively"""
@@ -0,0 +1,106 @@
+"""
+Tests for the materialized expansion-aware player range in GameService.
+effective_players_min/max must follow every write to a game or its expansions.
+"""
+import pytest
+from sqlalchemy import update
+
+from models import Game
+from services.game_service import GameService
+
+
+@pytest.fixture
+def base_game(db_session):
+    game = Game(title="Base", bgg_id=100, players_min=2, players_max=4, status="OWNED")
+    db_session.add(game)
+    db_session.commit()
+    return game
+
+
+def _effective(db_session, game):
+    db_session.refresh(game)
+    return game.effective_players_min, game.effective_players_max
+
+
+def _add_expansion(service, base, **fields):
+    expansion = service.create_game(
+        {"title": "Expansion", "players_min": 3, "players_max": 4, "status": "OWNED"}
+    )
+    return service.update_game(
+        expansion.id,
+        {"is_expansion": True, "expansion_type": "both", "base_game_id": base.id, **fields},
+    )
+
+
+def test_direct_insert_defaults_to_own_range(db_session, base_game):
+    assert _effective(db_session, base_game) == (2, 4)
+
+
+def test_bgg_import_of_expansion_widens_base(db_session, base_game):
+    service = GameService(db_session)
+    service.create_or_update_from_bgg(200, {
+        "title": "Big Box",
+        "is_expansion": True,
+        "expansion_type": "both",
+        "base_game_bgg_id": 100,
+        "modifies_players_min": 1,
+        "modifies_players_max": 6,
+    })
+    assert _effective(db_session, base_game) == (1, 6)
+
+
+def test_update_expansion_modifiers_refreshes_base(db_session, base_game):
+    service = GameService(db_session)
+    expansion = _add_expansion(service, base_game, modifies_players_max=5)
+    assert _effective(db_session, base_game) == (2, 5)
+
+    service.update_game(expansion.id, {"modifies_players_max": 7})
+    assert _effective(db_session, base_game) == (2, 7)
+
+
+def test_relinking_expansion_refreshes_old_and_new_base(db_session, base_game):
+    service = GameService(db_session)
+    other = service.create_game({"title": "Other", "players_min": 3, "players_max": 4})
+    expansion = _add_expansion(service, base_game, modifies_players_max=6)
+
+    service.update_game(expansion.id, {"base_game_id": other.id})
+    assert _effective(db_session, base_game) == (2, 4)
+    assert _effective(db_session, other) == (3, 6)
+
+
+def test_deleting_expansion_narrows_base(db_session, base_game):
+    service = GameService(db_session)
+    expansion = _add_expansion(service, base_game, modifies_players_max=6)
+    service.delete_game(expansion.id)
+    assert _effective(db_session, base_game) == (2, 4)
+
+
+def test_expansion_without_modifiers_keeps_base_range(db_session, base_game):
+    service = GameService(db_session)
+    _add_expansion(service, base_game, modifies_players_min=None)
+    assert _effective(db_session, base_game) == (2, 4)
+    _, total = service.get_filtered_games(players=6)
+    assert total == 0
+
+
+def test_players_filter_uses_effective_range(db_session, base_game):
+    service = GameService(db_session)
+    _add_expansion(service, base_game, modifies_players_max=6)
+    games, _ = service.get_filtered_games(players=6)
+    assert [g.title for g in games] == ["Base"]
+    games, _ = service.get_filtered_games(players=1)
+    assert games == []
+
+
+def test_consistency_check_finds_and_fixes_direct_writes(db_session, base_game):
+    service = GameService(db_session)
+    assert service.find_stale_effective_players() == []
+
+    db_session.execute(update(Game).where(Game.id == base_game.id).values(players_max=8))
+    db_session.commit()
+    assert service.find_stale_effective_players() == [base_game.id]
+
+    service.refresh_effective_players([base_game.id])
+    db_session.commit()
+    assert service.find_stale_effective_players() == []
+    assert _effective(db_session, base_game) == (2, 8)
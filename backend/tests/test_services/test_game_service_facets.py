@@ -0,0 +1,106 @@
+"""
+Tests for faceted counts in GameService.
+Every bucket count must equal the total get_filtered_games returns when that
+bucket is chosen in place of the facet's own filter.
+"""
+import pytest
+
+from models import Game
+from services.game_service import GameService
+
+
+@pytest.fixture
+def catalogue(db_session):
+    base = Game(
+        title="Base", players_min=2, players_max=4, complexity=2.5, playtime_max=90,
+        mana_meeple_category="CORE_STRATEGY", nz_designer=True, status="OWNED",
+    )
+    db_session.add(base)
+    db_session.flush()
+    db_session.add_all([
+        # Stand-alone expansion that lets the base game seat 5-6
+        Game(
+            title="Big Box", is_expansion=True, expansion_type="both", base_game_id=base.id,
+            modifies_players_min=5, modifies_players_max=6, status="OWNED",
+        ),
+        Game(
+            title="Tiny", players_min=1, players_max=2, complexity=1.2, playtime_max=20,
+            mana_meeple_category="KIDS_FAMILIES", min_age=6, nz_designer=False, status="OWNED",
+        ),
+        Game(
+            title="Party", players_min=4, players_max=10, complexity=1.1, playtime_max=30,
+            mana_meeple_category="PARTY_ICEBREAKERS", excluded_quick_picks=["first"], status="OWNED",
+        ),
+        Game(
+            title="Team", players_min=1, players_max=5, complexity=3.4, playtime_max=60,
+            is_cooperative=True, status="OWNED",
+        ),
+        Game(title="Hidden", players_min=1, players_max=8, status="WISHLIST"),
+    ])
+    # Inserted directly, so materialize the base game's expansion-aware range
+    GameService(db_session).refresh_effective_players([base.id])
+    db_session.commit()
+
+
+def _bucket_filters(facet, label):
+    """get_filtered_games arguments selecting one facet bucket"""
+    if facet == "categories":
+        return {"category": None if label == "all" else label}
+    if facet == "players":
+        return {"players": GameService.PLAYER_BUCKETS[label]}
+    if facet == "complexity":
+        low, high = GameService.COMPLEXITY_BUCKETS[label]
+        return {"complexity_min": low, "complexity_max": None if high is None else high - 0.0001}
+    if facet == "playtime":
+        low, high = GameService.PLAYTIME_BUCKETS[label]
+        return {"playtime_max_min": low, "playtime_max_max": None if high is None else high - 1}
+    if facet == "quick_picks":
+        return {"quick_pick": label}
+    return {"nz_designer": label == "true"}
+
+
+OWN_FILTERS = {
+    "categories": ("category",),
+    "players": ("players",),
+    "complexity": ("complexity_min", "complexity_max"),
+    "playtime": ("playtime_max_min", "playtime_max_max"),
+    "quick_picks": ("quick_pick",),
+    "nz_designer": ("nz_designer",),
+}
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"players": 4},
+        {"players": 6, "playtime_max_max": 60},
+        {"category": "KIDS_FAMILIES,PARTY_ICEBREAKERS", "quick_pick": "kids"},
+        {"complexity_max": 1.4999, "search": "party"},
+        {"nz_designer": True, "designer": "nobody"},
+    ],
+)
+def test_bucket_counts_match_filtered_totals(db_session, catalogue, filters):
+    service = GameService(db_session)
+    facets = service.get_facet_counts(**filters)
+
+    assert facets["total"] == service.get_filtered_games(**filters)[1]
+    for facet in GameService.FACET_NAMES:
+        for label, count in facets[facet].items():
+            others = {k: v for k, v in filters.items() if k not in OWN_FILTERS[facet]}
+            _, total = service.get_filtered_games(**others, **_bucket_filters(facet, label))
+            assert count == total, (facet, label)
+
+
+def test_counts_without_filters(db_session, catalogue):
+    facets = GameService(db_session).get_facet_counts()
+    assert facets["total"] == 5
+    # Big Box has no player counts (fits any table); Base seats 5-6 through it
+    assert facets["players"] == {"1": 3, "2": 4, "3": 3, "4": 4, "5": 4, "6+": 3}
+    assert facets["complexity"] == {"easy": 2, "light": 0, "medium": 1, "deep": 1}
+    assert facets["playtime"] == {"quick": 2, "mid": 1, "long": 1}
+    # Party is excluded from "first" by an admin
+    assert facets["quick_picks"] == {"first": 1, "kids": 1, "group": 1, "coop": 1}
+    assert facets["nz_designer"] == {"true": 1, "false": 4}  # Column defaults to False
+    assert facets["categories"]["all"] == 5
+    assert facets["categories"]["uncategorized"] == 2
@@ -0,0 +1,101 @@
+"""
+Tests for keyset (cursor) pagination in GameService.
+Walking every cursor page must reproduce the offset-paginated ordering exactly.
+"""
+import pytest
+
+from exceptions import ValidationError
+from services.game_service import GameService, _encode_cursor
+
+SORTS = [
+    "title_asc",
+    "title_desc",
+    "year_asc",
+    "year_desc",
+    "date_added_asc",
+    "date_added_desc",
+    "rating_asc",
+    "rating_desc",
+    "time_asc",
+    "time_desc",
+]
+
+
+def _offset_ids(service, **kwargs):
+    games, _ = service.get_filtered_games(page_size=1000, **kwargs)
+    return [g.id for g in games]
+
+
+def _walk_cursor_ids(service, page_size, **kwargs):
+    ids, cursor, pages = [], None, 0
+    while True:
+        games, cursor, total = service.get_filtered_games_keyset(
+            cursor=cursor, page_size=page_size, **kwargs
+        )
+        assert total is None  # Only computed on request
+        assert len(games) <= page_size
+        ids.extend(g.id for g in games)
+        pages += 1
+        if cursor is None:
+            return ids, pages
+        assert pages < 1000, "cursor pagination did not terminate"
+
+
+class TestKeysetPagination:
+    """Cursor pages must concatenate to the offset ordering"""
+
+    @pytest.mark.parametrize("sort", SORTS)
+    def test_every_sort_matches_offset_order(self, db_session, varied_catalogue, sort):
+        service = GameService(db_session)
+        expected = _offset_ids(service, sort=sort)
+        ids, pages = _walk_cursor_ids(service, page_size=7, sort=sort)
+        assert ids == expected
+        assert pages == -(-len(expected) // 7)
+
+    @pytest.mark.parametrize("filters", [
+        {"category": "CORE_STRATEGY"},
+        {"players": 5, "sort": "rating_desc"},
+        {"search": "castle", "sort": "year_asc"},
+        {"quick_pick": "kids", "sort": "time_desc"},
+    ])
+    def test_filters_match_offset_order(self, db_session, varied_catalogue, filters):
+        service = GameService(db_session)
+        ids, _ = _walk_cursor_ids(service, page_size=5, **filters)
+        assert ids == _offset_ids(service, **filters)
+
+    def test_include_total(self, db_session, varied_catalogue):
+        service = GameService(db_session)
+        _, expected_total = service.get_filtered_games(category="KIDS_FAMILIES")
+        games, _, total = service.get_filtered_games_keyset(
+            category="KIDS_FAMILIES", page_size=3, include_total=True
+        )
+        assert total == expected_total
+        assert len(games) == min(3, expected_total)
+
+    def test_empty_result_has_no_cursor(self, db_session, varied_catalogue):
+        service = GameService(db_session)
+        games, cursor, total = service.get_filtered_games_keyset(
+            search="no-such-game", include_total=True
+        )
+        assert games == [] and cursor is None and total == 0
+
+    def test_exact_final_page_has_no_cursor(self, db_session, sample_game):
+        service = GameService(db_session)
+        games, cursor, _ = service.get_filtered_games_keyset(page_size=1)
+        assert [g.id for g in games] == [sample_game.id]
+        assert cursor is None
+
+    def test_cursor_rejected_for_other_sort(self, db_session, varied_catalogue):
+        service = GameService(db_session)
+        _, cursor, _ = service.get_filtered_games_keyset(sort="year_desc", page_size=2)
+        with pytest.raises(ValidationError):
+            service.get_filtered_games_keyset(sort="title_asc", cursor=cursor)
+
+    @pytest.mark.parametrize("cursor", [
+        "not-base64-!!",
+        "e30",  # {}
+        _encode_cursor("year_desc", "not-a-number", "Title", 1),
+    ])
+    def test_malformed_cursor(self, db_session, cursor):
+        with pytest.raises(ValidationError):
+            GameService(db_session).get_filtered_games_keyset(sort="year_desc", cursor=cursor)
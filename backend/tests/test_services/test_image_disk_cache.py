@@ -0,0 +1,159 @@
+"""
+Tests for the image proxy's local disk cache: content-addressed files, an
+index that survives restarts and LRU eviction within the size budget.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from services.image_disk_cache import ImageDiskCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ImageDiskCache(directory=str(tmp_path), max_bytes=1000)
+    yield cache
+    cache.close()
+
+
+class TestImageDiskCache:
+    def test_store_and_hit(self, cache):
+        stored = cache.put("https://img/a.jpg", b"abc", "image/jpeg")
+        hit = cache.get("https://img/a.jpg")
+
+        assert hit is not None and hit.digest == stored.digest
+        assert hit.content_type == "image/jpeg"
+        with open(hit.path, "rb") as f:
+            assert f.read() == b"abc"
+        assert cache.get("https://img/b.jpg") is None
+        assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+    def test_identical_images_share_one_file(self, cache):
+        first = cache.put("https://img/a.jpg", b"same", "image/jpeg")
+        second = cache.put("https://img/b.jpg", b"same", "image/jpeg")
+
+        assert first.path == second.path
+        assert cache.usage()["entries"] == 2
+        assert cache.usage()["bytes"] == 4
+
+    def test_index_survives_restart(self, cache, tmp_path):
+        cache.put("https://img/a.jpg", b"abc", "image/png")
+        cache.close()
+
+        reopened = ImageDiskCache(directory=str(tmp_path), max_bytes=1000)
+        hit = reopened.get("https://img/a.jpg")
+        reopened.close()
+        assert hit is not None and hit.content_type == "image/png"
+
+    def test_lru_eviction_keeps_recently_used(self, cache):
+        cache.put("https://img/a.jpg", b"a" * 400, "image/jpeg")
+        evicted = cache.put("https://img/b.jpg", b"b" * 400, "image/jpeg")
+        # b is the least recently used entry
+        cache._conn.execute("UPDATE entries SET accessed_at = 0 WHERE url = 'https://img/b.jpg'")
+
+        cache.put("https://img/c.jpg", b"c" * 400, "image/jpeg")
+
+        assert cache.get("https://img/b.jpg") is None
+        assert not os.path.exists(evicted.path)
+        assert cache.get("https://img/a.jpg") is not None
+        assert cache.get("https://img/c.jpg") is not None
+        assert cache.usage()["bytes"] == 800
+        assert cache.stats["evictions"] == 1
+
+    def test_shared_file_kept_while_referenced(self, cache):
+        cache.put("https://img/a.jpg", b"x" * 400, "image/jpeg")
+        shared = cache.put("https://img/b.jpg", b"x" * 400, "image/jpeg")
+        cache.put("https://img/e.jpg", b"e" * 200, "image/jpeg")
+        cache._conn.execute("UPDATE entries SET accessed_at = 0 WHERE url = 'https://img/a.jpg'")
+        cache._conn.execute("UPDATE entries SET accessed_at = 1 WHERE url = 'https://img/e.jpg'")
+
+        cache.put("https://img/c.jpg", b"c" * 500, "image/jpeg")
+
+        # Dropping a frees nothing (b still uses the file), so e goes too
+        assert cache.get("https://img/a.jpg") is None
+        assert cache.get("https://img/e.jpg") is None
+        assert cache.get("https://img/b.jpg").path == shared.path
+        assert os.path.exists(shared.path)
+        assert cache.usage()["bytes"] == 900
+
+    def test_oversized_image_not_stored(self, cache):
+        assert cache.put("https://img/huge.jpg", b"x" * 1001, "image/jpeg") is None
+        assert cache.usage()["entries"] == 0
+
+    def test_missing_file_is_a_miss(self, cache):
+        stored = cache.put("https://img/a.jpg", b"abc", "image/jpeg")
+        os.unlink(stored.path)
+
+        assert cache.get("https://img/a.jpg") is None
+        assert cache.usage()["entries"] == 0
+
+    def test_writer_stores_chunked_image(self, cache):
+        writer = cache.writer("https://img/a.jpg", "image/jpeg")
+        for chunk in (b"ab", b"cd", b"e"):
+            writer.write(chunk)
+        stored = writer.commit()
+
+        assert stored.size == 5
+        assert stored.digest == cache.put("https://img/b.jpg", b"abcde", "image/jpeg").digest
+        assert cache.get("https://img/a.jpg").path == stored.path
+
+    def test_aborted_writer_leaves_nothing(self, cache, tmp_path):
+        writer = cache.writer("https://img/a.jpg", "image/jpeg")
+        writer.write(b"partial")
+        writer.abort()
+
+        assert cache.get("https://img/a.jpg") is None
+        assert not list((tmp_path / "objects").glob("*.tmp"))
+
+    def test_stale_temp_files_are_swept(self, cache, tmp_path):
+        running = cache.writer("https://img/a.jpg", "image/jpeg")
+        running.write(b"still downloading")
+        stale = tmp_path / "objects" / "killed.tmp"
+        stale.write_bytes(b"partial")
+        old = time.time() - 2 * 3600
+        os.utime(stale, (old, old))
+
+        assert cache.sweep_temp_files() == 1
+
+        assert not stale.exists()
+        assert running.commit() is not None  # A live writer's file is kept
+
+    def test_store_waits_for_another_workers_eviction(self, cache, tmp_path):
+        cache.usage()  # Opens the index
+        other = sqlite3.connect(str(tmp_path / "index.sqlite3"), isolation_level=None)
+        digest = hashlib.sha256(b"abc").hexdigest()
+        # Another worker mid-eviction holds the index's write lock
+        other.execute("BEGIN IMMEDIATE")
+        stored = []
+        store = threading.Thread(
+            target=lambda: stored.append(cache.put("https://img/a.jpg", b"abc", "image/jpeg"))
+        )
+        store.start()
+        time.sleep(0.2)
+
+        # The object is not moved into place, so it cannot be unlinked under the new entry
+        assert store.is_alive()
+        assert not os.path.exists(cache._object_path(digest))
+
+        other.execute("COMMIT")
+        store.join()
+        other.close()
+        assert stored[0] is not None and os.path.exists(stored[0].path)
+
+    def test_writer_over_budget_not_stored(self, cache):
+        writer = cache.writer("https://img/a.jpg", "image/jpeg")
+        writer.write(b"x" * 600)
+        writer.write(b"x" * 600)
+
+        assert writer.commit() is None
+        assert cache.usage()["entries"] == 0
+
+    def test_disabled_with_zero_budget(self, tmp_path):
+        cache = ImageDiskCache(directory=str(tmp_path / "off"), max_bytes=0)
+        assert cache.put("https://img/a.jpg", b"abc", "image/jpeg") is None
+        assert cache.get("https://img/a.jpg") is None
+        assert not os.path.exists(tmp_path / "off")
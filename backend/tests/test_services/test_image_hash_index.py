@@ -0,0 +1,42 @@
+"""
+Tests for the in-process image hash -> Cloudinary URL map.
+"""
+from services.catalogue_events import OP_CREATE, OP_DELETE, OP_UPDATE
+from services.image_hash_index import ImageHashIndex
+
+
+class TestImageHashIndex:
+    def test_lru_eviction(self):
+        index = ImageHashIndex(max_entries=2)
+        index.put("a", 1, "url-a")
+        index.put("b", 2, "url-b")
+        assert index.get("a") == (1, "url-a")  # "b" is now least recently used
+        index.put("c", 3, "url-c")
+
+        assert index.get("b") is None
+        assert index.get("a") == (1, "url-a")
+        assert index.get("c") == (3, "url-c")
+        assert index.stats["evictions"] == 1
+
+    def test_ignores_empty_values_and_disabled_size(self):
+        index = ImageHashIndex(max_entries=10)
+        index.put("", 1, "url")
+        index.put("a", 1, None)
+        assert len(index) == 0
+
+        disabled = ImageHashIndex(max_entries=0)
+        disabled.put("a", 1, "url")
+        assert disabled.get("a") is None
+
+    def test_updates_and_deletes_invalidate(self):
+        index = ImageHashIndex()
+        index.put("a", 1, "url-a")
+        index.put("b", 1, "url-b")
+        index.put("c", 2, "url-c")
+
+        index.on_catalogue_change(None, [1], OP_CREATE)
+        assert len(index) == 3
+        index.on_catalogue_change(None, [1], OP_UPDATE)
+        assert index.get("a") is None and index.get("b") is None
+        index.on_catalogue_change(None, [2], OP_DELETE)
+        assert len(index) == 0
@@ -4,7 +4,7 @@ from unittest.mock import Mock, AsyncMock, MagicMock, patch, mock_open
 from urllib.parse import urlparse
 import httpx
 
-from services.image_service import ImageService
+from services.image_service import ImageService, ImageTooLargeError
 from models import Game
 
 
@@ -789,5 +789,83 @@ class TestProxyImageNetworkErrors:
             await service.proxy_image("https://slow.example.com/image.jpg")
 
 
+class TestStreamImage:
+    """Tests for stream_image (chunked proxying with a byte cap)"""
+
+    @staticmethod
+    def _client(handler):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    @pytest.mark.asyncio
+    async def test_streams_in_chunks(self, db_session):
+        """The body arrives in chunks no larger than chunk_size"""
+        content = b"0123456789" * 10
+        client = self._client(
+            lambda request: httpx.Response(200, content=content, headers={"content-type": "image/png"})
+        )
+        service = ImageService(db_session, http_client=client)
+
+        stream = await service.stream_image("https://example.com/img.png", max_bytes=100, chunk_size=32)
+        chunks = [chunk async for chunk in stream.iter_chunks()]
+        await stream.aclose()
+
+        assert b"".join(chunks) == content
+        assert max(len(chunk) for chunk in chunks) <= 32
+        assert stream.content_type == "image/png"
+        assert stream.content_length == 100
+
+    @pytest.mark.asyncio
+    async def test_sends_browser_headers(self, db_session):
+        """stream_image sends the same browser headers as proxy_image"""
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(200, content=b"data")
+
+        service = ImageService(db_session, http_client=self._client(handler))
+        stream = await service.stream_image("https://cf.geekdo-images.com/test.jpg")
+        await stream.aclose()
+
+        assert "Mozilla" in seen["user-agent"]
+        assert urlparse(seen["referer"]).hostname == "boardgamegeek.com"
+
+    @pytest.mark.asyncio
+    async def test_declared_length_over_cap(self, db_session):
+        """A Content-Length over the cap is refused before the body is read"""
+        client = self._client(lambda request: httpx.Response(200, content=b"x" * 101))
+        service = ImageService(db_session, http_client=client)
+
+        with pytest.raises(ImageTooLargeError):
+            await service.stream_image("https://example.com/big.jpg", max_bytes=100)
+
+    @pytest.mark.asyncio
+    async def test_undeclared_length_over_cap(self, db_session):
+        """Without a Content-Length the body is cut off once it passes the cap"""
+        async def body():
+            for _ in range(5):
+                yield b"x" * 40
+
+        client = self._client(lambda request: httpx.Response(200, content=body()))
+        service = ImageService(db_session, http_client=client)
+
+        stream = await service.stream_image("https://example.com/big.jpg", max_bytes=100)
+        received = []
+        with pytest.raises(ImageTooLargeError):
+            async for chunk in stream.iter_chunks():
+                received.append(chunk)
+        await stream.aclose()
+        assert sum(len(chunk) for chunk in received) <= 100
+
+    @pytest.mark.asyncio
+    async def test_http_error(self, db_session):
+        """Upstream errors raise before any streaming starts"""
+        client = self._client(lambda request: httpx.Response(404))
+        service = ImageService(db_session, http_client=client)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await service.stream_image("https://example.com/missing.jpg")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,59 @@
+"""
+Tests for the pre-serialized list-item fragment cache.
+"""
+import json
+from datetime import datetime, timedelta
+
+from models import Game
+from schemas import GameListItemResponse
+from services.catalogue_events import OP_CREATE, OP_UPDATE
+from services.list_item_fragments import ListItemFragmentCache
+
+T0 = datetime(2026, 1, 1)
+
+
+def _game(game_id, title="Game", updated_at=T0):
+    return Game(id=game_id, title=title, designers=["Ann"], status="OWNED", updated_at=updated_at)
+
+
+class TestListItemFragmentCache:
+    def test_fragment_matches_schema_serialization(self):
+        cache = ListItemFragmentCache()
+        game = _game(1)
+        expected = GameListItemResponse.model_validate(game).model_dump(mode="json")
+        assert json.loads(cache.fragment(game)) == expected
+
+    def test_hit_on_same_row_version(self):
+        cache = ListItemFragmentCache()
+        cache.fragment(_game(1))
+        # Same id and version: served from cache even if the object differs
+        assert json.loads(cache.fragment(_game(1, title="Other")))["title"] == "Game"
+        assert cache.stats == {"hits": 1, "misses": 1, "evictions": 0}
+
+    def test_new_row_version_reserializes(self):
+        cache = ListItemFragmentCache()
+        cache.fragment(_game(1))
+        changed = _game(1, title="Renamed", updated_at=T0 + timedelta(seconds=1))
+        assert json.loads(cache.fragment(changed))["title"] == "Renamed"
+        assert cache.stats["hits"] == 0
+
+    def test_unversioned_rows_not_cached(self):
+        cache = ListItemFragmentCache()
+        cache.fragment(_game(1, updated_at=None))
+        assert len(cache) == 0
+
+    def test_render_and_lru_eviction(self):
+        cache = ListItemFragmentCache(max_entries=2)
+        items = json.loads(cache.render([_game(1), _game(2), _game(3)]))
+        assert [item["id"] for item in items] == [1, 2, 3]
+        assert len(cache) == 2
+        assert cache.stats["evictions"] == 1
+        assert json.loads(cache.render([])) == []
+
+    def test_updates_invalidate(self):
+        cache = ListItemFragmentCache()
+        cache.fragment(_game(1))
+        cache.on_catalogue_change(None, [1], OP_CREATE)
+        assert len(cache) == 1
+        cache.on_catalogue_change(None, [1], OP_UPDATE)
+        assert len(cache) == 0
@@ -0,0 +1,197 @@
+"""
+Tests for catalogue full-text search (services/search.py)
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+
+from exceptions import ValidationError
+from models import Game
+from services import search as search_module
+from services.game_service import GameService
+from services.search import (
+    CatalogueSearchIndex,
+    SearchIndex,
+    catalogue_search,
+    detect_fuzzy_search,
+    pg_search_condition,
+    pg_search_rank,
+    query_terms,
+    tokenize,
+)
+
+
+def _index(**docs):
+    index = SearchIndex()
+    for doc_id, fields in docs.items():
+        index.add(int(doc_id.lstrip("d")), fields)
+    return index
+
+
+class TestTokenizer:
+    def test_normalizes_case_accents_and_punctuation(self):
+        assert tokenize("Vlaada Chvátil: 7 Wonders!") == ["vlaada", "chvatil", "7", "wonders"]
+
+    def test_query_terms_drop_stopwords_unless_nothing_else(self):
+        assert query_terms("The Castle of the Dragon") == ["castle", "dragon"]
+        assert query_terms("the") == ["the"]
+        assert query_terms("   ") == []
+
+
+class TestSearchIndex:
+    def test_all_terms_must_match(self):
+        index = _index(d1={"title": "Dragon Castle"}, d2={"title": "Dragon River"})
+        assert set(index.search("dragon castle")) == {1}
+        assert set(index.search("dragon")) == {1, 2}
+        assert index.search("dragon zebra") == {}
+
+    def test_field_weights(self):
+        """A title hit outranks designers, mechanics, then description"""
+        index = _index(
+            d1={"title": "Quest", "description": "A game about harbours"},
+            d2={"title": "Quest", "mechanics": ["Harbour Building"]},
+            d3={"title": "Quest", "designers": ["Ann Harbour"]},
+            d4={"title": "Harbour"},
+        )
+        scores = index.search("harbour")
+        assert scores[4] > scores[3] > scores[2] > scores[1]
+
+    def test_prefix_matching(self):
+        index = _index(d1={"title": "Wingspan"}, d2={"title": "Gloomhaven"})
+        assert set(index.search("wing")) == {1}
+        assert set(index.search("g")) == {2}
+
+    def test_exact_match_beats_prefix_match(self):
+        index = _index(d1={"title": "Castles of Burgundy"}, d2={"title": "Castle Panic"})
+        scores = index.search("castle")
+        assert scores[2] > scores[1]
+
+    def test_typo_tolerance_only_without_exact_match(self):
+        index = _index(d1={"title": "Pandemic"}, d2={"title": "Wingspan"})
+        assert set(index.search("pandemik")) == {1}
+        assert set(index.search("wingspam")) == {2}
+        assert set(index.search("pan")) == {1}
+        assert index.search("xyz") == {}
+
+    def test_readd_and_remove(self):
+        index = _index(d1={"title": "Dragon"})
+        index.add(1, {"title": "Castle"})
+        assert index.search("dragon") == {}
+        assert set(index.search("castle")) == {1}
+        index.remove(1)
+        assert index.search("castle") == {}
+        assert len(index) == 0
+
+
+class TestCatalogueSearchIndex:
+    def test_picks_up_writes_that_bypass_game_service(self, db_session):
+        index = CatalogueSearchIndex()
+        db_session.add(Game(title="Azul", status="OWNED"))
+        db_session.commit()
+        assert len(index.search_catalogue(db_session, "azul")) == 1
+
+        db_session.add(Game(title="Azul Summer Pavilion", status="OWNED"))
+        db_session.commit()
+        assert len(index.search_catalogue(db_session, "azul")) == 2
+        assert index.stats["full_loads"] == 2
+
+    def test_game_service_writes_applied_incrementally(self, db_session):
+        catalogue_search.reset()
+        service = GameService(db_session)
+        game = service.create_game({"title": "Zebra Zoo"})
+        assert list(catalogue_search.search_catalogue(db_session, "zebra")) == [game.id]
+
+        service.update_game(game.id, {"title": "Quokka Quest"})
+        assert catalogue_search.search_catalogue(db_session, "zebra") == {}
+        assert list(catalogue_search.search_catalogue(db_session, "quokka")) == [game.id]
+
+        service.delete_game(game.id)
+        assert catalogue_search.search_catalogue(db_session, "quokka") == {}
+        assert catalogue_search.stats["full_loads"] == 1
+
+
+class TestGameServiceSearch:
+    @pytest.fixture
+    def games(self, db_session):
+        games = [
+            Game(title="Harbour", status="OWNED"),
+            Game(title="Quest", designers=["Ann Harbour"], status="OWNED"),
+            Game(title="Atlantis", description="Build a harbour", status="OWNED"),
+            Game(title="Harbour Hidden", status="WISHLIST"),
+        ]
+        db_session.add_all(games)
+        db_session.commit()
+        return games
+
+    def test_relevance_sort(self, db_session, games):
+        results, total = GameService(db_session).get_filtered_games(
+            search="harbour", sort="relevance"
+        )
+        assert total == 3
+        assert [g.title for g in results] == ["Harbour", "Quest", "Atlantis"]
+
+    def test_relevance_sort_paginates(self, db_session, games):
+        service = GameService(db_session)
+        page2, total = service.get_filtered_games(
+            search="harbour", sort="relevance", page=2, page_size=2
+        )
+        assert total == 3
+        assert [g.title for g in page2] == ["Atlantis"]
+
+    def test_relevance_without_search_sorts_by_title(self, db_session, games):
+        results, _ = GameService(db_session).get_filtered_games(sort="relevance")
+        assert [g.title for g in results] == ["Atlantis", "Harbour", "Quest"]
+
+    def test_relevance_rejected_for_cursor_pagination(self, db_session, games):
+        with pytest.raises(ValidationError):
+            GameService(db_session).get_filtered_games_keyset(
+                search="harbour", sort="relevance"
+            )
+
+
+class TestPostgresBackend:
+    def _sql(self, clause):
+        return str(clause.compile(dialect=postgresql.dialect()))
+
+    def test_condition_uses_tsvector_and_trigram(self):
+        sql = self._sql(pg_search_condition("The Wing"))
+        assert "boardgames.search_vector @@ to_tsquery" in sql
+        assert "<%" in sql
+
+    def test_rank_combines_ts_rank_and_similarity(self):
+        sql = self._sql(pg_search_rank("wing"))
+        assert "ts_rank_cd(boardgames.search_vector" in sql
+        assert "word_similarity" in sql
+
+    @pytest.fixture
+    def fuzzy_state(self, monkeypatch):
+        # Restores the module flag detect_fuzzy_search sets
+        monkeypatch.setattr(search_module, "SEARCH_FUZZY_ENABLED", True)
+        monkeypatch.setattr(search_module, "_fuzzy_enabled", True)
+
+    def _postgres(self, extension_row=None, error=None):
+        bind = MagicMock()
+        bind.dialect.name = "postgresql"
+        conn = bind.connect.return_value.__enter__.return_value
+        if error is not None:
+            conn.execute.side_effect = error
+        else:
+            conn.execute.return_value.first.return_value = extension_row
+        return bind
+
+    def test_fuzzy_kept_when_pg_trgm_is_installed(self, fuzzy_state):
+        assert detect_fuzzy_search(self._postgres(extension_row=(1,))) is True
+        assert "<%" in self._sql(pg_search_condition("wing"))
+
+    @pytest.mark.parametrize("failure", [
+        {"extension_row": None},
+        {"error": OperationalError("SELECT", {}, Exception("connection lost"))},
+    ])
+    def test_fuzzy_disabled_without_pg_trgm(self, fuzzy_state, failure):
+        assert detect_fuzzy_search(self._postgres(**failure)) is False
+
+        assert "<%" not in self._sql(pg_search_condition("The Wing"))
+        assert "boardgames.search_vector @@ to_tsquery" in self._sql(pg_search_condition("The Wing"))
+        assert "word_similarity" not in self._sql(pg_search_rank("wing"))
@@ -0,0 +1,211 @@
+"""
+Tests for the precomputed similar-games lists (services/similar_games.py)
+and how GameService keeps them current.
+"""
+import math
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+from models import Game, GameSimilarity
+from services.game_service import GameService
+from services.similar_games import (
+    SimilarityMatrix,
+    game_features,
+    recompute_all_similar_games,
+    refresh_similar_games,
+)
+
+
+def _row(game_id, **fields):
+    values = {
+        "id": game_id,
+        "status": "OWNED",
+        "is_expansion": False,
+        "expansion_type": None,
+        "base_game_id": None,
+        "mechanics": None,
+        "categories": None,
+        "mana_meeple_category": None,
+        "designers": None,
+        "complexity": None,
+        "players_min": None,
+        "players_max": None,
+        "playtime_max": None,
+    }
+    values.update(fields)
+    return SimpleNamespace(**values)
+
+
+def _stored(db_session):
+    lists = {}
+    for row in db_session.execute(
+        select(GameSimilarity).order_by(GameSimilarity.game_id, GameSimilarity.rank)
+    ).scalars():
+        lists.setdefault(row.game_id, []).append((row.similar_game_id, round(row.score, 5)))
+    return lists
+
+
+@pytest.fixture
+def catalogue(db_session):
+    games = [
+        Game(title="Pandemic", mechanics=["Cooperative Game", "Hand Management"],
+             designers=["Matt Leacock"], complexity=2.4, players_min=2, players_max=4,
+             playtime_max=45, mana_meeple_category="COOP_ADVENTURE", status="OWNED"),
+        Game(title="Forbidden Island", mechanics=["Cooperative Game", "Set Collection"],
+             designers=["Matt Leacock"], complexity=1.7, players_min=2, players_max=4,
+             playtime_max=30, mana_meeple_category="COOP_ADVENTURE", status="OWNED"),
+        Game(title="Spirit Island", mechanics=["Cooperative Game", "Area Control"],
+             complexity=4.0, players_min=1, players_max=4, playtime_max=120,
+             mana_meeple_category="COOP_ADVENTURE", status="OWNED"),
+        Game(title="Catan", mechanics=["Trading", "Dice Rolling"], complexity=2.3,
+             players_min=3, players_max=4, playtime_max=120,
+             mana_meeple_category="GATEWAY_STRATEGY", status="OWNED"),
+        Game(title="Wishlisted Coop", mechanics=["Cooperative Game", "Hand Management"],
+             designers=["Matt Leacock"], complexity=2.4, players_min=2, players_max=4,
+             playtime_max=45, status="WISHLIST"),
+    ]
+    db_session.add_all(games)
+    db_session.commit()
+    return {game.title: game for game in games}
+
+
+class TestGameFeatures:
+    def test_vector_is_unit_length(self):
+        features = game_features(_row(
+            1, mechanics=["Deck Building"], designers=["Ann Smith"], complexity=2.5,
+            players_min=2, players_max=4, playtime_max=60,
+        ))
+        assert math.isclose(math.sqrt(sum(w * w for w in features.values())), 1.0)
+
+    def test_names_are_normalized(self):
+        a = game_features(_row(1, mechanics=["Deck  Building"]))
+        b = game_features(_row(2, mechanics=["deck building"]))
+        assert a == b
+
+    def test_long_mechanics_list_does_not_dominate(self):
+        """Each group is normalized, so the mechanic group carries the same weight either way"""
+        few = game_features(_row(1, mechanics=["A"], complexity=3.0))
+        many = game_features(_row(2, mechanics=list("ABCDEFGH"), complexity=3.0))
+        complexity = lambda f: sum(w * w for k, w in f.items() if k.startswith("complexity:"))  # noqa: E731
+        assert math.isclose(complexity(few), complexity(many))
+
+    def test_game_without_attributes_has_no_features(self):
+        assert game_features(_row(1)) == {}
+
+
+class TestSimilarityMatrix:
+    def test_top_k_orders_by_score_then_id(self):
+        matrix = SimilarityMatrix([
+            _row(1, mechanics=["A", "B"]),
+            _row(2, mechanics=["A", "B"]),
+            _row(3, mechanics=["A", "C"]),
+            _row(4, mechanics=["A", "B"]),
+            _row(5, mechanics=["Z"]),
+        ])
+        top = matrix.top_k(1, 3)
+        assert [game_id for game_id, _ in top] == [2, 4, 3]
+        assert top[0][1] == pytest.approx(1.0)
+        assert top[2][1] == pytest.approx(0.5)
+
+    def test_zero_scores_are_not_recommended(self):
+        matrix = SimilarityMatrix([_row(1, mechanics=["A"]), _row(2, mechanics=["B"])])
+        assert matrix.top_k(1, 5) == []
+
+    def test_same_family_and_non_public_games_are_excluded(self):
+        matrix = SimilarityMatrix([
+            _row(1, mechanics=["A"]),
+            _row(2, mechanics=["A"], is_expansion=True, expansion_type="both", base_game_id=1),
+            _row(3, mechanics=["A"], is_expansion=True, expansion_type="both", base_game_id=1),
+            _row(4, mechanics=["A"], status="WISHLIST"),
+            _row(5, mechanics=["A"]),
+        ])
+        assert [game_id for game_id, _ in matrix.top_k(1, 5)] == [5]
+        assert [game_id for game_id, _ in matrix.top_k(2, 5)] == [5]
+
+
+class TestStoredLists:
+    def test_recompute_covers_public_games(self, db_session, catalogue):
+        count = recompute_all_similar_games(db_session, k=2)
+        db_session.commit()
+        lists = _stored(db_session)
+
+        assert count == 4
+        assert catalogue["Wishlisted Coop"].id not in lists
+        assert lists[catalogue["Pandemic"].id][0][0] == catalogue["Forbidden Island"].id
+        assert all(len(top) <= 2 for top in lists.values())
+
+    def test_incremental_refresh_matches_full_rebuild(self, db_session, catalogue):
+        recompute_all_similar_games(db_session, k=2)
+        db_session.commit()
+
+        game = Game(title="The Captain Is Dead", mechanics=["Cooperative Game", "Hand Management"],
+                    complexity=2.5, players_min=2, players_max=4, playtime_max=45,
+                    mana_meeple_category="COOP_ADVENTURE", status="OWNED")
+        db_session.add(game)
+        catalogue["Catan"].mechanics = ["Cooperative Game", "Set Collection"]
+        db_session.commit()
+        refresh_similar_games(db_session, [game.id, catalogue["Catan"].id], k=2)
+        db_session.commit()
+        incremental = _stored(db_session)
+
+        recompute_all_similar_games(db_session, k=2)
+        db_session.commit()
+        assert incremental == _stored(db_session)
+
+    def test_refresh_drops_list_of_game_leaving_catalogue(self, db_session, catalogue):
+        recompute_all_similar_games(db_session, k=3)
+        db_session.commit()
+        pandemic = catalogue["Pandemic"]
+        pandemic.status = "WISHLIST"
+        db_session.commit()
+
+        refresh_similar_games(db_session, [pandemic.id], k=3)
+        db_session.commit()
+        lists = _stored(db_session)
+        assert pandemic.id not in lists
+        assert all(pandemic.id not in [game_id for game_id, _ in top] for top in lists.values())
+
+
+class TestGameServiceSimilarGames:
+    def test_bgg_import_refreshes_lists(self, db_session, catalogue):
+        service = GameService(db_session)
+        game, _ = service.create_or_update_from_bgg(900, {
+            "title": "Pandemic Legacy",
+            "mechanics": ["Cooperative Game", "Hand Management"],
+            "designers": ["Matt Leacock"],
+            "complexity": 2.8,
+            "players_min": 2,
+            "players_max": 4,
+            "playtime_max": 60,
+        })
+
+        similar = service.get_similar_games(game.id)
+        assert similar[0].title == "Pandemic"
+        assert [g.id for g in service.get_similar_games(catalogue["Pandemic"].id, 1)] == [game.id]
+
+    def test_non_public_game_has_no_similar_games(self, db_session, catalogue):
+        service = GameService(db_session)
+        assert service.get_similar_games(catalogue["Wishlisted Coop"].id) is None
+        assert service.get_similar_games(99999) is None
+
+    def test_hidden_neighbours_are_filtered_on_read(self, db_session, catalogue):
+        recompute_all_similar_games(db_session)
+        db_session.commit()
+        forbidden = catalogue["Forbidden Island"]
+        forbidden.status = "WISHLIST"
+        db_session.commit()
+
+        titles = [g.title for g in GameService(db_session).get_similar_games(catalogue["Pandemic"].id)]
+        assert "Forbidden Island" not in titles
+
+    def test_delete_removes_lists(self, db_session, catalogue):
+        recompute_all_similar_games(db_session)
+        db_session.commit()
+        pandemic_id = catalogue["Pandemic"].id
+
+        GameService(db_session).delete_game(pandemic_id)
+        remaining = db_session.execute(select(GameSimilarity)).scalars().all()
+        assert remaining
+        assert all(pandemic_id not in (row.game_id, row.similar_game_id) for row in remaining)
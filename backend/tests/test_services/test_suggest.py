@@ -0,0 +1,106 @@
+"""
+Tests for typeahead suggestions (services/suggest.py)
+"""
+from models import Game
+from services.catalogue_version import catalogue_version
+from services.game_service import GameService
+from services.suggest import SuggestIndex, suggest_index
+
+
+def _index(db_session, *games):
+    db_session.add_all(games)
+    db_session.commit()
+    index = SuggestIndex()
+    index.load(db_session)
+    return index
+
+
+def _labels(index, query, limit=8):
+    return [s["label"] for s in index.suggest(query, limit)]
+
+
+class TestSuggestIndex:
+    def test_matches_any_word_prefix(self, db_session):
+        index = _index(db_session, Game(title="Ticket to Ride", status="OWNED"))
+        assert _labels(index, "tick") == ["Ticket to Ride"]
+        assert _labels(index, "ride") == ["Ticket to Ride"]
+        assert _labels(index, "to ri") == []  # No keys start at a stopword
+        assert _labels(index, "icket") == []
+
+    def test_ranked_by_phrase_start_then_popularity(self, db_session):
+        index = _index(
+            db_session,
+            Game(title="Castle Panic", bgg_rank=900, status="OWNED"),
+            Game(title="Castles of Burgundy", bgg_rank=20, status="OWNED"),
+            Game(title="Dragon Castle", bgg_rank=1, status="OWNED"),
+            Game(title="Castle Combo", users_rated=50, status="OWNED"),
+            Game(title="Castle Rush", users_rated=500, status="OWNED"),
+        )
+        assert _labels(index, "castle") == [
+            "Castles of Burgundy", "Castle Panic", "Castle Rush", "Castle Combo", "Dragon Castle",
+        ]
+        assert _labels(index, "castle", limit=2) == ["Castles of Burgundy", "Castle Panic"]
+
+    def test_designers_and_mechanics_grouped_by_name(self, db_session):
+        index = _index(
+            db_session,
+            Game(title="Agricola", designers=["Uwe Rosenberg"], mechanics=["Worker Placement"], status="OWNED"),
+            Game(title="Caverna", designers=["Uwe Rosenberg"], mechanics=["Worker Placement"], status="OWNED"),
+        )
+        assert index.suggest("uwe") == [
+            {"type": "designer", "label": "Uwe Rosenberg", "game_id": None, "games": 2}
+        ]
+        assert index.suggest("worker")[0]["games"] == 2
+
+    def test_typo_tolerance(self, db_session):
+        index = _index(
+            db_session,
+            Game(title="Pandemic Legacy", status="OWNED"),
+            Game(title="Wingspan", status="OWNED"),
+        )
+        assert _labels(index, "pandemik") == ["Pandemic Legacy"]
+        assert _labels(index, "wimg") == ["Wingspan"]
+        # Short inputs and first-letter typos are not corrected
+        assert _labels(index, "wim") == []
+        assert _labels(index, "qingspan") == []
+
+    def test_hidden_games_excluded(self, db_session):
+        index = _index(
+            db_session,
+            Game(title="Wishlisted", status="WISHLIST"),
+            Game(title="Wish Expansion", is_expansion=True, expansion_type="requires_base", status="OWNED"),
+        )
+        assert _labels(index, "wish") == []
+
+
+class TestIncrementalUpdates:
+    def test_game_service_writes_applied_without_reload(self, db_session):
+        suggest_index.load(db_session)
+        service = GameService(db_session)
+        game = service.create_game({"title": "Zebra Zoo"})
+        assert _labels(suggest_index, "zeb") == ["Zebra Zoo"]
+
+        service.update_game(game.id, {"title": "Quokka Quest"})
+        assert _labels(suggest_index, "zeb") == []
+        assert _labels(suggest_index, "quo") == ["Quokka Quest"]
+
+        service.delete_game(game.id)
+        assert _labels(suggest_index, "quo") == []
+        assert suggest_index.stats["full_loads"] == 1
+        assert not suggest_index.needs_load(catalogue_version.current())
+
+    def test_version_bumped_elsewhere_needs_load(self, db_session):
+        suggest_index.load(db_session)
+        catalogue_version.bump()
+        assert suggest_index.needs_load(catalogue_version.current())
+
+    def test_memoized_results_dropped_on_change(self, db_session):
+        suggest_index.load(db_session)
+        service = GameService(db_session)
+        service.create_game({"title": "Kingdomino"})
+        assert _labels(suggest_index, "king") == ["Kingdomino"]
+        assert _labels(suggest_index, "king") == ["Kingdomino"]
+        assert suggest_index.stats["memo_hits"] == 1
+
+        service.create_game({"title": "King of Tokyo", "bgg_rank": 5})
+        assert _labels(suggest_index, "king") == ["King of Tokyo", "Kingdomino"]
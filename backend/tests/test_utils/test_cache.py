@@ -2,15 +2,18 @@
 Tests for caching utilities (utils/cache.py)
 Target: Increase coverage from 55% to 95%+
 """
+import json
 import pytest
 import time
+from unittest.mock import Mock, patch
 from utils.cache import (
     make_cache_key,
     cached_query,
     clear_cache,
     get_cache_stats,
-    _cache_store,
-    _cache_timestamps,
+    query_cache,
+    QueryCache,
+    L2_KEY_PREFIX,
 )
 
 
@@ -322,15 +325,13 @@ class TestClearCache:
         test_func(3)
 
         # Verify cache has entries
-        assert len(_cache_store) > 0
-        assert len(_cache_timestamps) > 0
+        assert len(query_cache) > 0
 
         # Clear cache
         clear_cache()
 
         # Verify cache is empty
-        assert len(_cache_store) == 0
-        assert len(_cache_timestamps) == 0
+        assert len(query_cache) == 0
 
     def test_clear_cache_affects_subsequent_calls(self):
         """Test clearing cache causes re-execution"""
@@ -358,8 +359,7 @@ class TestClearCache:
         clear_cache()
         clear_cache()  # Should not raise error
 
-        assert len(_cache_store) == 0
-        assert len(_cache_timestamps) == 0
+        assert len(query_cache) == 0
 
 
 class TestGetCacheStats:
@@ -517,3 +517,87 @@ class TestIntegration:
         assert len(db_queries) == 2  # Only 2 actual queries
         assert db_queries == [1, 2]
         assert user1 == user1_again == user1_third
+
+
+class FakeRedis:
+    """Minimal stand-in for redis_client.RedisClient"""
+
+    def __init__(self):
+        self.store = {}
+        self.is_available = True
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+
+class TestQueryCacheL1:
+    """Test the bounded in-process tier"""
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted once max_entries is reached"""
+        cache = QueryCache(max_entries=2, l2_enabled=False)
+        cache.set("a", 1, 10)
+        cache.set("b", 2, 10)
+        assert cache.get("a")[0] == 1  # "b" is now least recently used
+        cache.set("c", 3, 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a")[0] == 1
+        assert cache.get("c")[0] == 3
+        assert cache.stats["evictions"] == 1
+
+
+class TestQueryCacheL2:
+    """Test the shared Redis tier"""
+
+    def _cache(self, redis):
+        cache = QueryCache(l2_enabled=True)
+        cache._redis = lambda: redis
+        return cache
+
+    def test_value_shared_between_workers(self):
+        """A value set by one worker is served to another from Redis with its original age"""
+        redis = FakeRedis()
+        worker_a, worker_b = self._cache(redis), self._cache(redis)
+
+        worker_a.set("games_query:x", [[{"id": 1}], 1], 30)
+        value, stored_at = worker_b.get("games_query:x")
+
+        assert value == [[{"id": 1}], 1]
+        assert stored_at == json.loads(redis.store[L2_KEY_PREFIX + "games_query:x"])["t"]
+        assert worker_b.stats["l2_hits"] == 1
+        # Now promoted into worker B's L1
+        assert worker_b.get("games_query:x", shared=False)[0] == [[{"id": 1}], 1]
+
+    def test_expired_l1_entry_picks_up_fresher_l2_value(self):
+        """An L1 entry older than max_age is replaced by a newer value from Redis"""
+        redis = FakeRedis()
+        cache = self._cache(redis)
+        cache.set("k", "old", 10)
+        cache._entries["k"] = (time.time() - 60, "old")
+        redis.store[L2_KEY_PREFIX + "k"] = json.dumps({"t": time.time(), "v": "new"})
+
+        assert cache.get("k", max_age=10)[0] == "new"
+
+    def test_unserializable_values_stay_local(self):
+        """Values that cannot be JSON-encoded are cached in L1 only"""
+        redis = FakeRedis()
+        cache = self._cache(redis)
+        value = object()
+        cache.set("k", value, 10)
+
+        assert redis.store == {}
+        assert cache.get("k")[0] is value
+
+    def test_falls_back_to_l1_without_redis(self):
+        """With Redis unavailable the cache still works per worker"""
+        unavailable = Mock(is_available=False)
+        with patch("redis_client.get_redis_client", return_value=unavailable):
+            cache = QueryCache(l2_enabled=True)
+            cache.set("k", 1, 10)
+            assert cache.get("k")[0] == 1
+        unavailable.set.assert_not_called()
@@ -0,0 +1,125 @@
+"""
+Tests for memory-bounded image preprocessing (utils/image_preprocess.py)
+"""
+import io
+
+import pytest
+from PIL import Image
+
+from utils.image_preprocess import (
+    PixelBudgetExceededError,
+    prepare_for_upload,
+    probe_image,
+    shutdown_preprocess_pool,
+    uncompressed_size,
+)
+
+
+def _encode(size, format, mode="RGB", **options):
+    # Noise, so the file does not compress to nothing
+    image = Image.effect_noise(size, 60).convert(mode)
+    output = io.BytesIO()
+    image.save(output, format=format, **options)
+    return output.getvalue()
+
+
+def _size(data):
+    with Image.open(io.BytesIO(data)) as image:
+        return image.size, image.format
+
+
+class TestProbe:
+    def test_reads_dimensions_from_the_header_alone(self):
+        data = _encode((3000, 2000), "JPEG")
+
+        # The first few KB hold the header; no pixel data is needed
+        info = probe_image(data[:4096])
+
+        assert (info.width, info.height, info.mode, info.format) == (3000, 2000, "RGB", "JPEG")
+        assert info.uncompressed_bytes == uncompressed_size(3000, 2000, "RGB")
+
+    def test_unreadable_data(self):
+        assert probe_image(b"not an image") is None
+
+    @pytest.mark.parametrize("mode, row_bytes", [
+        ("RGB", 301), ("RGBA", 401), ("L", 101), ("P", 101), ("1", 14), ("I;16", 201),
+    ])
+    def test_uncompressed_size_matches_png_rows(self, mode, row_bytes):
+        assert uncompressed_size(100, 10, mode) == 10 * row_bytes
+
+
+class TestPrepareForUpload:
+    def test_images_within_the_limit_are_not_touched(self):
+        data = _encode((800, 600), "PNG")
+
+        prepared = prepare_for_upload(data)
+
+        assert prepared.data is data
+        assert not prepared.resized
+        assert prepared.decoded_pixels == 0
+
+    def test_unreadable_data_is_uploaded_as_is(self):
+        prepared = prepare_for_upload(b"not an image")
+
+        assert prepared.data == b"not an image"
+        assert prepared.info is None
+
+    def test_large_jpeg_is_decoded_at_reduced_scale(self):
+        data = _encode((4800, 3200), "JPEG", quality=95)
+
+        prepared = prepare_for_upload(data, max_bytes=4 * 1024 * 1024)
+
+        assert prepared.resized
+        assert _size(prepared.data) == ((1200, 800), "WEBP")
+        # Draft mode decoded at 1/2 scale: 2400x1600, twice the target
+        assert prepared.decoded_pixels == 2400 * 1600
+
+    def test_png_over_the_uncompressed_limit_is_shrunk(self):
+        # Compresses to a few KB but is 12MB as pixel data
+        output = io.BytesIO()
+        Image.new("RGB", (2000, 2000), "red").save(output, format="PNG")
+        data = output.getvalue()
+
+        prepared = prepare_for_upload(data)
+
+        assert prepared.resized
+        assert _size(prepared.data) == ((1200, 1200), "WEBP")
+        assert prepared.decoded_pixels == 2000 * 2000
+
+    def test_pixel_budget_refuses_png_but_not_a_reducible_jpeg(self):
+        budget = 6_000_000
+        png = _encode((5000, 4000), "PNG")
+        jpeg = _encode((5000, 4000), "JPEG")
+
+        with pytest.raises(PixelBudgetExceededError):
+            prepare_for_upload(png, max_bytes=1024 * 1024, max_pixels=budget)
+
+        # Decoded at 1/2 scale, within the budget
+        prepared = prepare_for_upload(jpeg, max_bytes=1024 * 1024, max_pixels=budget)
+        assert prepared.decoded_pixels == 2500 * 2000
+
+    def test_none_when_even_the_fallback_is_too_large(self):
+        data = _encode((1500, 1500), "PNG")
+
+        assert prepare_for_upload(data, max_bytes=1000) is None
+
+
+class TestPreprocessPool:
+    @pytest.fixture(autouse=True)
+    def pool(self):
+        yield
+        shutdown_preprocess_pool()
+
+    def test_shrinks_in_a_worker_process(self):
+        data = _encode((4800, 3200), "JPEG", quality=95)
+
+        in_thread = prepare_for_upload(data, max_bytes=4 * 1024 * 1024)
+        in_worker = prepare_for_upload(data, max_bytes=4 * 1024 * 1024, workers=1, max_tasks_per_worker=1)
+
+        assert in_worker == in_thread
+
+    def test_budget_errors_cross_the_process_boundary(self):
+        data = _encode((2500, 2000), "JPEG")
+
+        with pytest.raises(PixelBudgetExceededError):
+            prepare_for_upload(data, max_bytes=1024 * 1024, max_pixels=1000, workers=1)
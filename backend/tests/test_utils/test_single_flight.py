@@ -0,0 +1,215 @@
+"""
+Tests for single-flight request coalescing (utils/single_flight.py)
+"""
+import asyncio
+import time
+
+import pytest
+
+from utils.single_flight import LOCK_PREFIX, PENDING, SingleFlight
+
+
+class FakeLockRedis:
+    """Minimal stand-in for redis_client.RedisClient lock operations"""
+
+    def __init__(self, held_by_other=False):
+        self.locks = {"qlock:key": "other"} if held_by_other else {}
+        self.is_available = True
+
+    def acquire_lock(self, key, token, ttl_seconds):
+        if key in self.locks:
+            return False
+        self.locks[key] = token
+        return True
+
+    def release_lock(self, key, token):
+        if self.locks.get(key) == token:
+            del self.locks[key]
+            return True
+        return False
+
+
+def _with_redis(redis, **kwargs):
+    flight = SingleFlight(redis_lock_enabled=True, poll_interval=0.01, **kwargs)
+    flight._redis = lambda: redis
+    return flight
+
+
+class TestLocalCoalescing:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight(redis_lock_enabled=False)
+        calls = 0
+
+        async def query():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"total": 1}
+
+        results = await asyncio.gather(*(flight.do("key", query) for _ in range(10)))
+
+        assert calls == 1
+        assert all(result == {"total": 1} for result in results)
+        assert flight.stats["executions"] == 1
+        assert flight.stats["coalesced"] == 9
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight(redis_lock_enabled=False)
+
+        async def query(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            flight.do("a", lambda: query("a")),
+            flight.do("b", lambda: query("b")),
+        )
+        assert results == ["a", "b"]
+        assert flight.stats["executions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_coalesced(self):
+        """Only in-flight work is shared - results are not cached"""
+        flight = SingleFlight(redis_lock_enabled=False)
+        calls = 0
+
+        async def query():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("key", query) == 1
+        assert await flight.do("key", query) == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_waiters(self):
+        flight = SingleFlight(redis_lock_enabled=False)
+
+        async def failing():
+            await asyncio.sleep(0.02)
+            raise ValueError("database down")
+
+        results = await asyncio.gather(
+            *(flight.do("key", failing) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_lets_follower_retry(self):
+        flight = SingleFlight(redis_lock_enabled=False)
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def fast():
+            return "ok"
+
+        leader = asyncio.create_task(flight.do("key", slow))
+        await started.wait()
+        follower = asyncio.create_task(flight.do("key", fast))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "ok"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+
+class TestCrossWorkerCoalescing:
+    @pytest.mark.asyncio
+    async def test_lock_taken_and_released(self):
+        redis = FakeLockRedis()
+        flight = _with_redis(redis)
+
+        async def query():
+            assert LOCK_PREFIX + "key" in redis.locks
+            return "fresh"
+
+        assert await flight.do("key", query, probe=lambda: PENDING) == "fresh"
+        assert redis.locks == {}
+
+    @pytest.mark.asyncio
+    async def test_waits_for_other_worker_result(self):
+        redis = FakeLockRedis(held_by_other=True)
+        flight = _with_redis(redis)
+        published = []
+
+        async def query():
+            raise AssertionError("should use the other worker's result")
+
+        async def other_worker():
+            await asyncio.sleep(0.03)
+            published.append("from other worker")
+
+        _, result = await asyncio.gather(
+            other_worker(),
+            flight.do("key", query, probe=lambda: published[0] if published else PENDING),
+        )
+        assert result == "from other worker"
+        assert flight.stats["remote_coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lock_wait_timeout_falls_back_to_query(self):
+        redis = FakeLockRedis(held_by_other=True)
+        flight = _with_redis(redis, wait_seconds=0.05)
+
+        async def query():
+            return "computed locally"
+
+        assert await flight.do("key", query, probe=lambda: PENDING) == "computed locally"
+        assert flight.stats["lock_timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_none_result_from_other_worker_is_used(self):
+        """A published None (e.g. "not found") ends the wait instead of timing out"""
+        redis = FakeLockRedis(held_by_other=True)
+        flight = _with_redis(redis, wait_seconds=5)
+
+        async def query():
+            raise AssertionError("should use the other worker's result")
+
+        started = time.monotonic()
+        assert await flight.do("key", query, probe=lambda: None) is None
+        assert time.monotonic() - started < 1
+        assert flight.stats["remote_coalesced"] == 1
+        assert flight.stats["lock_timeouts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_waiting_runs_redis_calls_off_the_loop_with_backoff(self):
+        import threading
+
+        redis = FakeLockRedis(held_by_other=True)
+        flight = _with_redis(redis, wait_seconds=0.5, max_poll_interval=0.08)
+        loop_thread = threading.get_ident()
+        probes = []
+
+        def probe():
+            probes.append((time.monotonic(), threading.get_ident()))
+            return PENDING
+
+        async def query():
+            return "computed locally"
+
+        await flight.do("key", probe=probe, fn=query)
+
+        assert all(thread != loop_thread for _, thread in probes)
+        gaps = [later - earlier for (earlier, _), (later, _) in zip(probes, probes[1:])]
+        assert max(gaps) > 2 * gaps[0]
+        # 0.01, 0.02, 0.04, then 0.08 until the deadline: far fewer than 50 polls
+        assert len(probes) < 12
+
+    @pytest.mark.asyncio
+    async def test_no_probe_skips_redis_lock(self):
+        redis = FakeLockRedis(held_by_other=True)
+        flight = _with_redis(redis)
+
+        async def query():
+            return "local only"
+
+        assert await flight.do("key", query) == "local only"
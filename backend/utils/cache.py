@@ -1,30 +1,41 @@
 # utils/cache.py
 """
-Simple TTL-based caching for database query results.
+Two-tier TTL caching for database query results.
 Sprint 12: Performance Optimization
-Phase 1 Performance: Added automatic cache cleanup to prevent memory leaks
+
+L1 is a bounded, per-worker LRU holding Python objects. L2 is Redis, shared
+by every uvicorn worker, holding JSON-serialized results so a query computed
+by one worker warms all the others. Entries are never invalidated in place:
+catalogue queries embed the catalogue version in their keys
+(services/catalogue_version.py), so a write makes every worker miss and
+recompute, and stale entries age out of the LRU and Redis TTLs.
+
+Redis is optional: when it is disabled or unreachable the cache degrades to
+the per-worker L1 only.
 """
 import time
+import json
+import math
 import hashlib
 import logging
-from typing import Any, Callable
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
 from functools import wraps
 
-logger = logging.getLogger(__name__)
+from config import (
+    QUERY_CACHE_L2_ENABLED,
+    QUERY_CACHE_MAX_ENTRIES,
+    REDIS_ENABLED,
+)
 
-# Simple in-memory cache with TTL
-_cache_store = {}
-_cache_timestamps = {}
+logger = logging.getLogger(__name__)
 
 # Default TTL: 5 seconds (good for load tests, prevents stale data in production)
 DEFAULT_TTL_SECONDS = 5
 
-# Cache cleanup configuration
-# Maximum number of entries before forcing cleanup
-MAX_CACHE_ENTRIES = 10000
-# Cleanup check interval (only cleanup every N cache operations to reduce overhead)
-_cleanup_counter = 0
-CLEANUP_CHECK_INTERVAL = 100
+# Redis key namespace for the shared (L2) tier
+L2_KEY_PREFIX = "qcache:"
 
 
 def make_cache_key(*args, **kwargs) -> str:
@@ -47,12 +58,142 @@ def make_cache_key(*args, **kwargs) -> str:
     return hashlib.md5(key_string.encode()).hexdigest()
 
 
-def cached_query(ttl_seconds: int = DEFAULT_TTL_SECONDS):
+class QueryCache:
+    """
+    Bounded LRU (L1) in front of an optional shared Redis tier (L2).
+
+    Entries are stored with the time they were computed, and get() returns
+    that timestamp so callers can apply their own expiry policy (plain TTL or
+    probabilistic early expiration). The timestamp travels with the value
+    through Redis, so an entry fetched from L2 keeps its original age.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = QUERY_CACHE_MAX_ENTRIES,
+        l2_enabled: bool = QUERY_CACHE_L2_ENABLED and REDIS_ENABLED,
+    ):
+        self.max_entries = max_entries
+        self.l2_enabled = l2_enabled
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        return {"l1_hits": 0, "l2_hits": 0, "misses": 0, "evictions": 0}
+
+    def _redis(self):
+        """Return the shared Redis client, or None when L2 is off or unreachable"""
+        if not self.l2_enabled:
+            return None
+        from redis_client import get_redis_client
+        client = get_redis_client()
+        return client if client.is_available else None
+
+    def _store_local(self, key: str, stored_at: float, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (stored_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def get(
+        self, key: str, max_age: Optional[float] = None, shared: bool = True
+    ) -> Optional[Tuple[Any, float]]:
+        """
+        Look up key in L1, then (if shared) in L2.
+
+        Args:
+            key: Cache key
+            max_age: L1 entries older than this also consult L2, in case
+                another worker has refreshed the value since
+            shared: Whether to consult the Redis tier
+
+        Returns:
+            (value, stored_at) of the freshest entry found, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            local = self._entries.get(key)
+            if local is not None:
+                self._entries.move_to_end(key)
+
+        if local is not None and (max_age is None or now - local[0] < max_age):
+            self.stats["l1_hits"] += 1
+            return local[1], local[0]
+
+        client = self._redis() if shared else None
+        if client is not None:
+            raw = client.get(L2_KEY_PREFIX + key)
+            if raw:
+                try:
+                    payload = json.loads(raw)
+                    stored_at, value = float(payload["t"]), payload["v"]
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"Discarding unreadable L2 cache entry {key}: {e}")
+                else:
+                    if local is None or stored_at > local[0]:
+                        self._store_local(key, stored_at, value)
+                        self.stats["l2_hits"] += 1
+                        return value, stored_at
+
+        if local is not None:
+            self.stats["l1_hits"] += 1
+            return local[1], local[0]
+
+        self.stats["misses"] += 1
+        return None
+
+    def set(self, key: str, value: Any, ttl_seconds: float, shared: bool = True) -> None:
+        """
+        Store value in L1 and (if shared) in L2 with the given TTL.
+
+        Shared values must be JSON-serializable; values that are not are kept
+        in L1 only.
+        """
+        stored_at = time.time()
+        self._store_local(key, stored_at, value)
+
+        client = self._redis() if shared else None
+        if client is None:
+            return
+        try:
+            payload = json.dumps({"t": stored_at, "v": value})
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not sharing cache entry {key} via Redis: {e}")
+            return
+        client.set(L2_KEY_PREFIX + key, payload, ex=max(1, math.ceil(ttl_seconds)))
+
+    def clear(self) -> None:
+        """Clear this worker's L1 and reset statistics (L2 is left untouched)"""
+        with self._lock:
+            self._entries.clear()
+        self.stats = self._empty_stats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def oldest_entry_age(self) -> float:
+        with self._lock:
+            if not self._entries:
+                return 0
+            return time.time() - min(stored_at for stored_at, _ in self._entries.values())
+
+
+# Process-wide query cache
+query_cache = QueryCache()
+
+
+def cached_query(ttl_seconds: int = DEFAULT_TTL_SECONDS, shared: bool = False):
     """
     Decorator to cache query results with TTL.
 
     Args:
         ttl_seconds: Time to live for cache entries in seconds
+        shared: Also share results between workers via Redis
+            (results must then be JSON-serializable)
 
     Usage:
         @cached_query(ttl_seconds=10)
@@ -66,91 +207,32 @@ def cached_query(ttl_seconds: int = DEFAULT_TTL_SECONDS):
             cache_key = f"{func.__module__}.{func.__name__}:{make_cache_key(*args, **kwargs)}"
 
             # Check if we have a valid cached result
-            current_time = time.time()
-            if cache_key in _cache_store and cache_key in _cache_timestamps:
-                if current_time - _cache_timestamps[cache_key] < ttl_seconds:
-                    # Cache hit - return cached result
-                    return _cache_store[cache_key]
+            cached = query_cache.get(cache_key, max_age=ttl_seconds, shared=shared)
+            if cached is not None and time.time() - cached[1] < ttl_seconds:
+                # Cache hit - return cached result
+                return cached[0]
 
             # Cache miss or expired - execute function
             result = func(*args, **kwargs)
-
-            # Store in cache
-            _cache_store[cache_key] = result
-            _cache_timestamps[cache_key] = current_time
-
-            # Periodic cleanup to prevent unbounded growth (Phase 1 Performance)
-            cleanup_expired_entries(force=False)
-
+            query_cache.set(cache_key, result, ttl_seconds, shared=shared)
             return result
 
         return wrapper
     return decorator
 
 
-def cleanup_expired_entries(force: bool = False):
-    """
-    Remove expired cache entries to prevent unbounded growth.
-    Phase 1 Performance: Prevents memory leak from unbounded cache dictionary.
-
-    Args:
-        force: If True, cleanup regardless of counter. If False, only cleanup periodically.
-    """
-    global _cleanup_counter
-
-    # Only run cleanup periodically to reduce overhead
-    if not force:
-        _cleanup_counter += 1
-        if _cleanup_counter % CLEANUP_CHECK_INTERVAL != 0:
-            return
-
-    current_time = time.time()
-    expired_keys = []
-
-    # Find all expired keys
-    for key, timestamp in _cache_timestamps.items():
-        # Use a conservative TTL of 60 seconds for cleanup (2x the max expected TTL)
-        # This ensures we don't delete entries that might still be valid
-        if current_time - timestamp > 60:
-            expired_keys.append(key)
-
-    # Remove expired entries
-    if expired_keys:
-        for key in expired_keys:
-            _cache_store.pop(key, None)
-            _cache_timestamps.pop(key, None)
-        logger.debug(f"Cache cleanup: removed {len(expired_keys)} expired entries")
-
-    # If cache is still too large, remove oldest entries (LRU eviction)
-    if len(_cache_store) > MAX_CACHE_ENTRIES:
-        # Sort by timestamp and remove oldest entries
-        sorted_keys = sorted(_cache_timestamps.items(), key=lambda x: x[1])
-        num_to_remove = len(_cache_store) - (MAX_CACHE_ENTRIES // 2)  # Remove half
-
-        for key, _ in sorted_keys[:num_to_remove]:
-            _cache_store.pop(key, None)
-            _cache_timestamps.pop(key, None)
-
-        logger.warning(
-            f"Cache size exceeded {MAX_CACHE_ENTRIES} entries, "
-            f"evicted {num_to_remove} oldest entries"
-        )
-
-
 def clear_cache():
-    """Clear all cached entries"""
-    _cache_store.clear()
-    _cache_timestamps.clear()
+    """Clear this worker's cached entries"""
+    query_cache.clear()
     logger.info("Cache cleared manually")
 
 
 def get_cache_stats() -> dict:
     """Get cache statistics"""
     return {
-        "entries": len(_cache_store),
-        "oldest_entry_age": (
-            time.time() - min(_cache_timestamps.values())
-            if _cache_timestamps
-            else 0
-        ),
+        "entries": len(query_cache),
+        "max_entries": query_cache.max_entries,
+        "oldest_entry_age": query_cache.oldest_entry_age(),
+        "l2_enabled": query_cache.l2_enabled,
+        **query_cache.stats,
     }
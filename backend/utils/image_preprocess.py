@@ -0,0 +1,275 @@
+# utils/image_preprocess.py
+"""
+Memory-bounded preparation of images for Cloudinary upload.
+
+Cloudinary rejects images over 10 MB, measured both as the file and as
+uncompressed pixel data. Checking that used to mean decoding every image in
+full and re-encoding it as an uncompressed PNG, which for large BGG originals
+allocates hundreds of MB per upload. Instead:
+
+- Width, height and mode are read from the file header (Image.open does not
+  decode pixels), so the uncompressed size is computed, and images within the
+  limits are uploaded as they are without ever being decoded.
+- Images that must shrink are decoded at reduced scale: JPEG draft mode has
+  the decoder emit 1/2, 1/4 or 1/8 scale directly, and Image.reduce
+  box-downsamples by an integer factor before the final Lanczos resize.
+- max_pixels caps the pixels decoded for one image. Formats without a
+  reduced-scale decode (PNG, GIF, WebP) are refused above it rather than
+  decoded in full.
+
+Shrinking runs in a small pool of worker processes (see prepare_for_upload),
+so the large, short-lived allocations of decoding are returned to the OS when
+a worker is recycled instead of fragmenting the app's own heap. This module
+only depends on Pillow to keep worker start-up cheap.
+"""
+import io
+import logging
+import multiprocessing
+import threading
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Optional
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # Cloudinary's limit, compressed and uncompressed
+DEFAULT_MAX_PIXELS = 50_000_000
+# Longest side tried when shrinking, largest first, and the WebP qualities tried at each
+MAX_DIMENSIONS = (1200, 1000, 800, 600, 400)
+WEBP_QUALITIES = (90, 85, 80, 75, 70, 65)
+FALLBACK_DIMENSION = 400
+FALLBACK_QUALITY = 60
+# Reduced-scale decoding stops at this multiple of the target size, leaving the
+# rest to Lanczos so quality matches a full-size resize (as Image.thumbnail does)
+REDUCING_GAP = 2.0
+
+
+class PixelBudgetExceededError(ValueError):
+    """Shrinking the image would decode more pixels than the per-image budget allows"""
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    """What the file header says about an image"""
+
+    width: int
+    height: int
+    mode: str
+    format: Optional[str]
+    uncompressed_bytes: int
+
+
+@dataclass(frozen=True)
+class PreparedImage:
+    """Bytes to upload, with what was done to them"""
+
+    data: bytes
+    info: Optional[ImageInfo]  # Of the original; None when Pillow could not read it
+    resized: bool = False
+    width: Optional[int] = None
+    height: Optional[int] = None
+    quality: Optional[int] = None
+    decoded_pixels: int = 0
+
+
+def uncompressed_size(width: int, height: int, mode: str) -> int:
+    """Bytes of pixel data in an uncompressed PNG of this size and mode (one filter byte per row)"""
+    if mode == "1":
+        bits = 1
+    elif mode in ("I", "F"):
+        bits = 32
+    elif mode.startswith("I;16"):
+        bits = 16
+    else:
+        bits = 8 * Image.getmodebands(mode)
+    return height * ((width * bits + 7) // 8 + 1)
+
+
+def probe_image(data: bytes) -> Optional[ImageInfo]:
+    """
+    Read an image's dimensions and mode from its header, without decoding it.
+    Returns None when Pillow cannot identify the data.
+    Raises PixelBudgetExceededError for images past Pillow's decompression bomb limit.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+            with Image.open(io.BytesIO(data)) as image:
+                width, height = image.size
+                return ImageInfo(width, height, image.mode, image.format,
+                                 uncompressed_size(width, height, image.mode))
+    except Image.DecompressionBombError as e:
+        raise PixelBudgetExceededError(str(e)) from e
+    except Exception as e:
+        logger.debug(f"Could not identify image: {e}")
+        return None
+
+
+def needs_shrinking(data: bytes, info: ImageInfo, max_bytes: int = MAX_UPLOAD_BYTES) -> bool:
+    """Whether the image is over the upload limit, as a file or as pixel data"""
+    return len(data) > max_bytes or info.uncompressed_bytes > max_bytes
+
+
+def _fit(size, max_dimension: int):
+    """size scaled down so its longer side is max_dimension (unchanged if already smaller)"""
+    width, height = size
+    if max(width, height) <= max_dimension:
+        return width, height
+    ratio = max_dimension / max(width, height)
+    return max(1, int(width * ratio)), max(1, int(height * ratio))
+
+
+def _decode_reduced(image: Image.Image, max_dimension: int, max_pixels: int):
+    """
+    Decode image at the smallest scale that still leaves REDUCING_GAP times
+    max_dimension for the final resize. Returns the image and the pixels decoded.
+    """
+    target = _fit(image.size, max_dimension)
+    wanted = (int(target[0] * REDUCING_GAP + 0.5), int(target[1] * REDUCING_GAP + 0.5))
+    # JPEG only: the decoder scales by 1/2, 1/4 or 1/8, never below `wanted`
+    image.draft(None, wanted)
+
+    width, height = image.size
+    if width * height > max_pixels:
+        raise PixelBudgetExceededError(
+            f"{image.format} image needs {width}x{height} = {width * height:,} pixels decoded, "
+            f"budget is {max_pixels:,}"
+        )
+    image.load()
+    decoded_pixels = width * height
+
+    # Same conversions as before: keep transparency, WebP takes RGB(A) or L
+    if image.mode == "P":
+        image = image.convert("RGBA")
+    elif image.mode not in ("RGB", "RGBA", "L", "LA"):
+        image = image.convert("RGB")
+
+    factor = int(min(image.width / wanted[0], image.height / wanted[1]))
+    if factor > 1:
+        image = image.reduce(factor)
+    return image, decoded_pixels
+
+
+def _encode_webp(image: Image.Image, quality: int) -> bytes:
+    output = io.BytesIO()
+    image.save(output, format="WEBP", quality=quality, method=6)
+    return output.getvalue()
+
+
+def shrink_image(
+    data: bytes,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    max_pixels: int = DEFAULT_MAX_PIXELS,
+) -> Optional[PreparedImage]:
+    """
+    Re-encode an image as WebP within max_bytes (compressed and uncompressed),
+    trying MAX_DIMENSIONS x WEBP_QUALITIES, then FALLBACK_DIMENSION at
+    FALLBACK_QUALITY. Returns None if even that is too large.
+
+    Decodes once, at reduced scale where the format allows, and resizes the
+    decoded image for each dimension tried. Raises PixelBudgetExceededError
+    when that decode would exceed max_pixels.
+    """
+    info = probe_image(data)
+    if info is None:
+        raise ValueError("Not an image Pillow can read")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+        with Image.open(io.BytesIO(data)) as image:
+            base, decoded_pixels = _decode_reduced(image, MAX_DIMENSIONS[0], max_pixels)
+
+    def attempt(max_dimension, qualities):
+        size = _fit(base.size, max_dimension)
+        if uncompressed_size(size[0], size[1], base.mode) > max_bytes:
+            return None
+        resized = base.resize(size, Image.Resampling.LANCZOS) if size != base.size else base
+        for quality in qualities:
+            output = _encode_webp(resized, quality)
+            if len(output) <= max_bytes:
+                return PreparedImage(output, info, True, size[0], size[1], quality, decoded_pixels)
+        return None
+
+    for max_dimension in MAX_DIMENSIONS:
+        prepared = attempt(max_dimension, WEBP_QUALITIES)
+        if prepared is not None:
+            return prepared
+    return attempt(FALLBACK_DIMENSION, (FALLBACK_QUALITY,))
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _preprocess_pool(workers: int, max_tasks_per_worker: Optional[int]) -> ProcessPoolExecutor:
+    """The shared worker-process pool, created on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: forking a process with running threads and an event loop
+            # is unsafe, and a fresh interpreter only imports Pillow and this module
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=max_tasks_per_worker or None,
+            )
+        return _pool
+
+
+def shutdown_preprocess_pool() -> None:
+    """Stop the worker processes (a later call to prepare_for_upload starts new ones)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def prepare_for_upload(
+    data: bytes,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    max_pixels: int = DEFAULT_MAX_PIXELS,
+    workers: int = 0,
+    max_tasks_per_worker: Optional[int] = None,
+) -> Optional[PreparedImage]:
+    """
+    Bytes to upload for an image: the original when it is within max_bytes (or
+    not an image Pillow can read - Cloudinary has the final say), otherwise a
+    shrunk WebP (see shrink_image), or None when it cannot be shrunk enough.
+
+    Blocking. The header is read in the calling thread; shrinking runs on a
+    pool of `workers` processes, each replaced after max_tasks_per_worker
+    images, or in the calling thread when workers is 0. If a worker dies (e.g.
+    killed for memory) the pool is replaced and BrokenProcessPool raised.
+    """
+    info = probe_image(data)
+    if info is None or not needs_shrinking(data, info, max_bytes):
+        return PreparedImage(data, info)
+
+    # Nothing gained by shipping an image to a worker only to refuse it there
+    if info.format != "JPEG" and info.width * info.height > max_pixels:
+        raise PixelBudgetExceededError(
+            f"{info.format} image is {info.width}x{info.height} = {info.width * info.height:,} pixels, "
+            f"budget is {max_pixels:,}"
+        )
+
+    if workers <= 0:
+        return shrink_image(data, max_bytes, max_pixels)
+    pool = _preprocess_pool(workers, max_tasks_per_worker)
+    try:
+        return pool.submit(shrink_image, data, max_bytes, max_pixels).result()
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise
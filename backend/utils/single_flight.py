@@ -0,0 +1,171 @@
+# utils/single_flight.py
+"""
+Single-flight request coalescing for expensive cached queries.
+
+When a popular cache entry expires, every concurrent request for it would
+otherwise fall through to the database at once. SingleFlight lets the first
+request (the leader) run the query while identical concurrent requests on the
+same worker await the leader's result instead of issuing their own.
+
+Optionally the leader also takes a short Redis lock, so that only one worker
+recomputes a key: leaders on other workers poll the shared cache for the
+result (via a caller-supplied probe) instead of querying the database.
+Lock calls and probes are blocking Redis round trips, so they run in a
+thread, and the poll interval doubles while waiting so slow computations are
+not polled 20 times a second. Without Redis this degrades to per-worker
+coalescing.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from config import (
+    REDIS_ENABLED,
+    SINGLE_FLIGHT_LOCK_TTL_SECONDS,
+    SINGLE_FLIGHT_REDIS_LOCK_ENABLED,
+    SINGLE_FLIGHT_WAIT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+LOCK_PREFIX = "qlock:"
+
+
+class _Pending:
+    """Type of PENDING"""
+
+    def __repr__(self) -> str:
+        return "PENDING"
+
+
+# Returned by a probe while the other worker's result is not published yet
+# (None is a valid result, e.g. "not found")
+PENDING = _Pending()
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution"""
+
+    def __init__(
+        self,
+        redis_lock_enabled: bool = SINGLE_FLIGHT_REDIS_LOCK_ENABLED and REDIS_ENABLED,
+        lock_ttl_seconds: float = SINGLE_FLIGHT_LOCK_TTL_SECONDS,
+        wait_seconds: float = SINGLE_FLIGHT_WAIT_SECONDS,
+        poll_interval: float = 0.05,
+        max_poll_interval: float = 0.5,
+    ):
+        self.redis_lock_enabled = redis_lock_enabled
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self.wait_seconds = wait_seconds
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        # executions: leader ran the query itself
+        # coalesced: awaited another request's in-flight query on this worker
+        # remote_coalesced: picked up a result computed by another worker
+        # lock_timeouts: gave up waiting for another worker and queried anyway
+        return {"executions": 0, "coalesced": 0, "remote_coalesced": 0, "lock_timeouts": 0}
+
+    def _redis(self):
+        """Return the shared Redis client, or None when locking is off or Redis unreachable"""
+        if not self.redis_lock_enabled:
+            return None
+        from redis_client import get_redis_client
+        client = get_redis_client()
+        return client if client.is_available else None
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        probe: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """
+        Return fn()'s result, sharing one execution between concurrent callers.
+
+        Args:
+            key: Identity of the computation (e.g. the cache key)
+            fn: Async callable performing the work; it should also store the
+                result wherever probe looks for it
+            probe: Enables cross-worker coalescing. Called (in a thread)
+                while another worker holds the lock; returns the result once
+                that worker has published it, or PENDING if it is not
+                available yet
+
+        Returns:
+            The (possibly shared) result
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if inflight.cancelled():
+                    # The leader was cancelled (client went away), not us - retry
+                    return await self.do(key, fn, probe)
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._lead(key, fn, probe)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved: there may be no followers
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _lead(self, key: str, fn, probe) -> Any:
+        client = await asyncio.to_thread(self._redis) if probe is not None else None
+        if client is None:
+            self.stats["executions"] += 1
+            return await fn()
+
+        lock_key = LOCK_PREFIX + key
+        token = uuid.uuid4().hex
+        if await asyncio.to_thread(client.acquire_lock, lock_key, token, self.lock_ttl_seconds):
+            try:
+                self.stats["executions"] += 1
+                return await fn()
+            finally:
+                await asyncio.to_thread(client.release_lock, lock_key, token)
+
+        # Another worker is computing this key - wait for it to publish the result
+        deadline = time.monotonic() + self.wait_seconds
+        interval = self.poll_interval
+        while time.monotonic() < deadline:
+            await asyncio.sleep(min(interval, max(deadline - time.monotonic(), 0)))
+            interval = min(interval * 2, self.max_poll_interval)
+            result = await asyncio.to_thread(probe)
+            if result is not PENDING:
+                self.stats["remote_coalesced"] += 1
+                return result
+
+        self.stats["lock_timeouts"] += 1
+        logger.warning(f"Timed out waiting for another worker to compute {key}, querying directly")
+        self.stats["executions"] += 1
+        return await fn()
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def reset_stats(self) -> None:
+        self.stats = self._empty_stats()
+
+
+# Process-wide coalescer for catalogue queries
+single_flight = SingleFlight()
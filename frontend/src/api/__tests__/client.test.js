@@ -240,16 +240,11 @@ describe('API Client', () => {
       expect(result).toEqual(mockResponse.data);
     });
 
-    test('backfillCloudinaryUrls backfills Cloudinary URLs', async () => {
+    test('backfillCloudinaryUrls starts the Cloudinary backfill', async () => {
       const mockResponse = {
         data: {
-          message: 'Backfill complete: 50 games updated',
-          total: 50,
-          updated: 50,
-          skipped: 0,
-          failed: 0,
-          errors: [],
-          cloudinary_enabled: true
+          message: 'Backfill started',
+          progress: { status: 'running', remaining: 50, processed: 0, failed: 0, failures: [] }
         }
       };
       mockAxiosInstance.post.mockResolvedValue(mockResponse);
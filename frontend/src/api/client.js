@@ -288,9 +288,9 @@ export async function fetchAllSleeveData() {
 }
 
 /**
- * Backfill Cloudinary URLs for all games with images
- * Pre-generates optimized Cloudinary URLs to eliminate redirect overhead
- * @returns {Promise<Object>} Backfill results with counts and errors
+ * Start (or resume) the Cloudinary backfill for all games with images
+ * Uploads images and stores optimized Cloudinary URLs in the background
+ * @returns {Promise<Object>} Message and backfill progress (remaining, processed, failed)
  */
 export async function backfillCloudinaryUrls() {
   const r = await api.post("/admin/backfill-cloudinary-urls", {});
@@ -147,26 +147,26 @@ export function AdminToolsPanel({ onToast, onLibraryReload }) {
   }, [onToast]);
 
   const handleBackfillCloudinary = useCallback(async () => {
-    if (!window.confirm("This will pre-generate Cloudinary URLs for all games with images. This improves image load times by ~50-150ms per image. Continue?")) {
+    if (!window.confirm("This will upload images to Cloudinary and store optimized URLs for all games with images, in the background. An interrupted backfill resumes where it stopped. Continue?")) {
       return;
     }
 
     setIsLoading(true);
-    onToast("Backfilling Cloudinary URLs...", "info", 3000);
 
     try {
       const result = await backfillCloudinaryUrls();
-      const cloudinaryStatus = result.cloudinary_enabled ? "enabled" : "disabled (using fallback URLs)";
+      const { progress } = result;
       onToast(
-        `Backfill complete! Updated: ${result.updated}, Skipped: ${result.skipped}, Failed: ${result.failed}. Cloudinary: ${cloudinaryStatus}`,
+        `${result.message}: ${progress.remaining} games to go (done: ${progress.processed}, failed: ${progress.failed})`,
         "success",
         5000
       );
-      if (result.errors && result.errors.length > 0) {
-        console.warn("Cloudinary backfill errors:", result.errors);
+      if (progress.failures && progress.failures.length > 0) {
+        console.warn("Cloudinary backfill failures:", progress.failures);
       }
     } catch (error) {
-      onToast("Cloudinary URL backfill failed", "error");
+      const detail = error.response?.data?.detail;
+      onToast(detail ? `Cloudinary backfill: ${detail}` : "Cloudinary URL backfill failed", "error");
     } finally {
       setIsLoading(false);
     }
@@ -337,7 +337,7 @@ export function AdminToolsPanel({ onToast, onLibraryReload }) {
         </div>
         <SleeveFetchStatus pollToken={sleeveFetchPollToken} />
         <p className="text-sm text-gray-600 mt-2">
-          Re-import will fetch latest BGG data for all games. Fetch Sleeve Data will scrape sleeve information only. Fix Sequence resolves "duplicate key" errors when adding games. Export creates a CSV backup. Backfill Cloudinary URLs pre-generates optimized image URLs for faster loading.
+          Re-import will fetch latest BGG data for all games. Fetch Sleeve Data will scrape sleeve information only. Fix Sequence resolves "duplicate key" errors when adding games. Export creates a CSV backup. Backfill Cloudinary URLs uploads images and stores optimized URLs in the background, resuming where it left off.
         </p>
       </div>
 
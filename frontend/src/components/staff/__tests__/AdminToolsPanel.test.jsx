@@ -220,11 +220,13 @@ describe('AdminToolsPanel', () => {
 
     test('backfills Cloudinary URLs', async () => {
       apiClient.backfillCloudinaryUrls.mockResolvedValue({
-        updated: 50,
-        skipped: 10,
-        failed: 2,
-        cloudinary_enabled: true,
-        errors: ['Error 1', 'Error 2'],
+        message: 'Backfill started',
+        progress: {
+          remaining: 50,
+          processed: 10,
+          failed: 2,
+          failures: [{ game_id: 1, error: 'Error 1' }, { game_id: 2, error: 'Error 2' }],
+        },
       });
 
       render(<AdminToolsPanel onToast={mockToast} onLibraryReload={mockLibraryReload} />);
@@ -236,7 +238,7 @@ describe('AdminToolsPanel', () => {
         expect(global.confirm).toHaveBeenCalled();
         expect(apiClient.backfillCloudinaryUrls).toHaveBeenCalled();
         expect(mockToast).toHaveBeenCalledWith(
-          expect.stringContaining('Updated: 50'),
+          expect.stringContaining('Backfill started: 50 games to go'),
           'success',
           5000
         );